@@ -0,0 +1,129 @@
+"""
+Local stand-in for the Nylas API used by the benchmarks in this directory.
+
+The server answers every request with a canned JSON payload so the benchmarks measure
+SDK and transport overhead rather than real API latency.
+"""
+
+import datetime
+import gzip
+import json
+import os
+import ssl
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+
+
+def _write_self_signed_cert(directory: str):
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.DNSName("localhost")]), critical=False
+        )
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.TraditionalOpenSSL,
+                serialization.NoEncryption(),
+            )
+        )
+    return cert_path, key_path
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    payload = b"{}"
+    gzipped_payload = None
+    latency = 0.0
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        if self.latency:
+            time.sleep(self.latency)
+        body = self.payload
+        accepted = self.headers.get("Accept-Encoding") or ""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if self.gzipped_payload is not None and "gzip" in accepted:
+            body = self.gzipped_payload
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class LocalApiServer:
+    """
+    A threaded HTTPS server on localhost that returns the same JSON body for every request.
+
+    Args:
+        payload: The JSON body to answer with.
+        latency: Seconds to wait before answering, to simulate network and API latency.
+        compress: Whether to gzip the body for requests that accept it.
+
+    Attributes:
+        url: The base URL of the running server.
+        cert_path: The path to the self-signed certificate, usable as a `verify` bundle.
+    """
+
+    def __init__(
+        self, payload: dict = None, latency: float = 0.0, compress: bool = False
+    ):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.cert_path, key_path = _write_self_signed_cert(self._tmpdir.name)
+        body = json.dumps(payload or {"request_id": "bench", "data": {}}).encode()
+        handler = type(
+            "Handler",
+            (_Handler,),
+            {
+                "payload": body,
+                "gzipped_payload": gzip.compress(body) if compress else None,
+                "latency": latency,
+            },
+        )
+        self._server = ThreadingHTTPServer(("localhost", 0), handler)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(self.cert_path, key_path)
+        self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self.url = f"https://localhost:{self._server.server_address[1]}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+        self._tmpdir.cleanup()
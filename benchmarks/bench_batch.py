@@ -0,0 +1,60 @@
+"""
+Compare the wall-clock time of fetching many messages one after another with running the
+same calls in a `client.batch()`, using a local HTTPS stand-in for the Nylas API that adds
+a fixed latency to every request.
+
+Usage:
+    python benchmarks/bench_batch.py [calls]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks._server import LocalApiServer  # noqa: E402
+from benchmarks.bench_model_decoding import _MESSAGE  # noqa: E402
+from nylas import Client  # noqa: E402
+
+LATENCY = 0.02
+
+
+def _sequential(client: Client, calls: int) -> float:
+    start = time.perf_counter()
+    for index in range(calls):
+        client.messages.find("bench", f"message-{index}")
+    return time.perf_counter() - start
+
+
+def _batched(client: Client, calls: int, max_concurrency: int) -> float:
+    start = time.perf_counter()
+    batch = client.batch(max_concurrency=max_concurrency)
+    for index in range(calls):
+        batch.add(client.messages.find, "bench", f"message-{index}")
+    results = batch.run()
+    elapsed = time.perf_counter() - start
+    assert all(result.ok for result in results)
+    return elapsed
+
+
+def main(calls: int = 200):
+    with LocalApiServer(
+        {"request_id": "bench", "data": _MESSAGE}, latency=LATENCY
+    ) as server:
+        os.environ["REQUESTS_CA_BUNDLE"] = server.cert_path
+        with Client("bench-key", api_uri=server.url, pool_maxsize=20) as client:
+            sequential = _sequential(client, calls)
+            batched = {
+                concurrency: _batched(client, calls, concurrency)
+                for concurrency in (10, 20)
+            }
+
+    print(f"{calls} messages.find calls, {LATENCY * 1000:.0f} ms latency per request")
+    print(f"{'sequential loop':<28} {sequential:6.2f} s")
+    for concurrency, elapsed in batched.items():
+        print(f"{f'batch, max_concurrency={concurrency}':<28} {elapsed:6.2f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
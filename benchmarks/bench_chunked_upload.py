@@ -0,0 +1,99 @@
+"""
+Compare the peak memory of uploading a large file to an attachment upload session by
+reading it whole and sending it in one PUT against `attachments.upload_file()`, which reads
+and sends it one chunk at a time.
+
+Requests are answered in memory by a LocalTransport, which discards the uploaded bytes.
+
+Usage:
+    python benchmarks/bench_chunked_upload.py [size_mib]
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nylas import Client  # noqa: E402
+from nylas.handler.transport import LocalResponse, LocalTransport  # noqa: E402
+
+_SESSION = {
+    "request_id": "bench",
+    "data": {
+        "attachment_id": "upload",
+        "method": "PUT",
+        "url": "https://storage.example.com/upload/upload",
+        "headers": {},
+    },
+}
+
+
+def _put(request):
+    # "bytes {start}-{end}/{size}"; a PUT without a range sends the whole file.
+    content_range = request.headers.get("Content-Range")
+    if content_range is None:
+        return LocalResponse(201)
+    span, size = content_range.split(" ", 1)[1].split("/")
+    last = int(span.split("-")[1])
+    return LocalResponse(201 if last == int(size) - 1 else 202)
+
+
+def _whole(client: Client, path: str) -> None:
+    session = client.attachments.create_upload_session(
+        "grant", {"filename": "file.bin", "content_type": "application/octet-stream"}
+    ).data
+    with open(path, "rb") as f:
+        data = f.read()
+    client.http_client.session.put(session.url, data=data, headers=session.headers)
+    client.attachments.complete_upload_session("grant", session.attachment_id)
+
+
+def _chunked(client: Client, path: str) -> None:
+    client.attachments.upload_file("grant", path)
+
+
+def _measure(upload, client: Client, path: str):
+    # Tracing allocations slows them down, so the time is measured separately.
+    started = time.perf_counter()
+    upload(client, path)
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    tracemalloc.start()
+    upload(client, path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def main(size_mib: int = 100):
+    transport = LocalTransport(
+        [
+            ("POST", "/v3/grants/{grant_id}/attachment-uploads", lambda r: _SESSION),
+            ("PUT", "/upload/{attachment_id}", _put),
+            (
+                "POST",
+                "/v3/grants/{grant_id}/attachment-uploads/{attachment_id}/complete",
+                lambda r: {"request_id": "bench", "data": {"status": "ready"}},
+            ),
+        ]
+    )
+    client = Client(api_key="bench-key", transport=transport)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "file.bin")
+        with open(path, "wb") as f:
+            for _ in range(size_mib):
+                f.write(os.urandom(2**20))
+        print(f"upload of a {size_mib} MiB file")
+        for name, upload in (("whole file", _whole), ("upload_file", _chunked)):
+            peak, elapsed = _measure(upload, client, path)
+            print(
+                f"  {name:<12} peak {peak / 2**20:8.1f} MiB   {elapsed * 1000:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
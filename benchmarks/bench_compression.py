@@ -0,0 +1,74 @@
+"""
+Measure the bytes received for a 200-message list page with and without compressed
+responses, using a local HTTPS stand-in for the Nylas API that gzips its answers, and the
+size of a large send-message body before and after request compression.
+
+Usage:
+    python benchmarks/bench_compression.py [iterations]
+"""
+
+import base64
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks._server import LocalApiServer  # noqa: E402
+from benchmarks.bench_model_decoding import PAGE_SIZE, _MESSAGE  # noqa: E402
+from nylas.handler.compression import Compression  # noqa: E402
+from nylas.handler.http_client import HttpClient  # noqa: E402
+from nylas.handler.json_codec import StdlibJsonCodec  # noqa: E402
+
+
+def _fetch_pages(server, compression, headers, iterations: int):
+    http_client = HttpClient(server.url, "bench-key", 10, compression=compression)
+    http_client.session.verify = server.cert_path
+    samples = []
+    with http_client:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            http_client._execute(
+                "GET", "/v3/grants/bench/messages", headers=dict(headers)
+            )
+            samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(iterations: int = 50):
+    page = {"request_id": "bench", "data": [_MESSAGE] * PAGE_SIZE, "next_cursor": "abc"}
+    with LocalApiServer(page, compress=True) as server:
+        os.environ["REQUESTS_CA_BUNDLE"] = server.cert_path
+        print(f"{PAGE_SIZE}-message page over {iterations} requests")
+        for label, headers in (
+            ("identity", {"Accept-Encoding": "identity"}),
+            ("compressed", {}),
+        ):
+            compression = Compression()
+            elapsed = _fetch_pages(server, compression, headers, iterations)
+            wire = compression.response_wire_bytes / iterations
+            decoded = compression.response_decoded_bytes / iterations
+            print(
+                f"  {label:<11} {wire / 1024:8.1f} KiB received"
+                f"   {decoded / 1024:8.1f} KiB decoded   p50 {elapsed:6.2f} ms"
+            )
+
+    attachment = base64.b64encode(os.urandom(256 * 1024)).decode()
+    body = StdlibJsonCodec().dumps(
+        {
+            "subject": "Quarterly report",
+            "body": "<p>Please find the report attached.</p>" * 200,
+            "to": [{"email": "leyah@example.com"}],
+            "attachments": [{"filename": "report.pdf", "content": attachment}],
+        }
+    )
+    compressed = Compression(compress_requests=True).compress(body)
+    print(
+        f"send-message body with a 256 KiB attachment: {len(body) / 1024:.1f} KiB,"
+        f" {len(compressed) / 1024:.1f} KiB gzipped"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
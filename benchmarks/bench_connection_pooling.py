@@ -0,0 +1,61 @@
+"""
+Compare per-call latency of a fresh `requests.request` per call against the pooled
+session owned by `HttpClient`, using a local HTTPS stand-in for the Nylas API.
+
+Usage:
+    python benchmarks/bench_connection_pooling.py [iterations]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks._server import LocalApiServer  # noqa: E402
+from nylas.handler.http_client import HttpClient  # noqa: E402
+
+
+def _time_calls(fn, iterations: int):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(label: str, samples):
+    print(
+        f"{label:<28} mean {statistics.mean(samples):7.2f} ms"
+        f"   p50 {statistics.median(samples):7.2f} ms"
+        f"   max {max(samples):7.2f} ms"
+    )
+
+
+def main(iterations: int = 200):
+    with LocalApiServer() as server:
+        os.environ["REQUESTS_CA_BUNDLE"] = server.cert_path
+        url = f"{server.url}/v3/grants/bench"
+
+        unpooled = _time_calls(
+            lambda: requests.request("GET", url, timeout=10).json(), iterations
+        )
+
+        http_client = HttpClient(server.url, "bench-key", 10)
+        http_client.session.verify = server.cert_path
+        with http_client:
+            pooled = _time_calls(
+                lambda: http_client._execute("GET", "/v3/grants/bench"), iterations
+            )
+
+    print(f"{iterations} GET calls against {server.url}")
+    _report("requests.request per call", unpooled)
+    _report("HttpClient pooled session", pooled)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
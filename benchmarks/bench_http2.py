@@ -0,0 +1,61 @@
+"""
+Compare throughput of many concurrent requests over HTTP/1.1 and over HTTP/2, against a local
+HTTPS stand-in for the Nylas API that answers every request after a fixed latency.
+
+The HTTP/1.1 baseline is the default requests transport, which carries one request at a time
+per connection and opens (and then discards) extra connections once its `pool_maxsize` are
+busy. The HTTP/2 transport multiplexes up to `http2_max_streams` requests over a single
+connection.
+
+Usage:
+    python benchmarks/bench_http2.py [requests] [workers]
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nylas.handler.http_client import HttpClient  # noqa: E402
+from tests.h2_server import LocalH2Server  # noqa: E402
+
+LATENCY = 0.05
+POOL_MAXSIZE = 4
+_GRANT = {"request_id": "bench", "data": {"id": "grant-1", "provider": "google"}}
+
+
+def _throughput(http2: bool, requests: int, workers: int) -> float:
+    with LocalH2Server(_GRANT, latency=LATENCY, http2=http2) as server:
+        os.environ["REQUESTS_CA_BUNDLE"] = server.cert_path
+        http_client = HttpClient(
+            server.url, "bench-key", 10, pool_maxsize=POOL_MAXSIZE, http2=http2
+        )
+        with http_client, ThreadPoolExecutor(max_workers=workers) as pool:
+            http_client._execute("GET", "/v3/grants/grant-1")
+            start = time.perf_counter()
+            list(
+                pool.map(
+                    lambda i: http_client._execute("GET", f"/v3/grants/grant-{i}"),
+                    range(requests),
+                )
+            )
+            elapsed = time.perf_counter() - start
+    return requests / elapsed
+
+
+def main(requests: int = 400, workers: int = 50):
+    print(
+        f"{requests} GETs from {workers} threads, {LATENCY * 1000:.0f} ms server latency,"
+        f" {POOL_MAXSIZE} connections"
+    )
+    http1 = _throughput(False, requests, workers)
+    http2 = _throughput(True, requests, workers)
+    print(f"  HTTP/1.1  {http1:8.1f} req/s")
+    print(f"  HTTP/2    {http2:8.1f} req/s")
+    print(f"  speedup   {http2 / http1:8.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,65 @@
+"""
+Measure the cold-start import cost of the SDK with `python -X importtime`.
+
+Each scenario runs in a fresh interpreter; the reported time and module count are what the
+scenario adds on top of a bare interpreter's startup imports.
+
+Usage:
+    python benchmarks/bench_import_time.py [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = [
+    ("import nylas", "import nylas"),
+    ("import nylas.models.webhooks", "import nylas.models.webhooks"),
+    ("Client()", "from nylas import Client\nClient('key')"),
+    ("Client().messages", "from nylas import Client\nClient('key').messages"),
+    (
+        "every resource",
+        "from nylas import Client\nc = Client('key')\n"
+        "for name in [n for n, v in vars(Client).items() if isinstance(v, property)]:\n"
+        "    getattr(c, name)",
+    ),
+]
+
+
+def _run(code: str):
+    script = f"{code}\nimport sys\nprint(len(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name[1:].startswith(" "):
+            # Top-level imports only; their cumulative time includes their children.
+            total_us += int(cumulative)
+    return total_us / 1000, int(result.stdout.split()[-1])
+
+
+def main(runs: int = 5):
+    baseline = [_run("pass") for _ in range(runs)]
+    baseline_ms = statistics.median(ms for ms, _ in baseline)
+    baseline_modules = baseline[0][1]
+    print(f"Median cumulative import time over {runs} fresh interpreters")
+    for label, code in SCENARIOS:
+        samples = [_run(code) for _ in range(runs)]
+        elapsed = statistics.median(ms for ms, _ in samples) - baseline_ms
+        modules = samples[0][1] - baseline_modules
+        print(f"  {label:<30} {elapsed:8.1f} ms   {modules:4d} modules")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
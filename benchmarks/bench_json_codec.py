@@ -0,0 +1,65 @@
+"""
+Compare the JSON codecs available to `HttpClient`: parsing a 200-message list page and
+encoding a send-message request body with the stdlib codec and, if installed, orjson.
+
+Usage:
+    python benchmarks/bench_json_codec.py [iterations]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_model_decoding import PAGE_SIZE, _MESSAGE  # noqa: E402
+from nylas.handler.json_codec import (  # noqa: E402
+    OrjsonJsonCodec,
+    StdlibJsonCodec,
+    orjson,
+)
+
+_REQUEST_BODY = {
+    "subject": "Réunion d'équipe — ordre du jour",
+    "body": "<p>Bonjour à tous, voici l'ordre du jour de la réunion.</p>" * 20,
+    "to": [{"email": "leyah@example.com", "name": "Leyah Miller"}] * 5,
+    "cc": [{"email": "nyla@example.com", "name": "Nyla"}] * 5,
+    "tracking_options": {"opens": True, "links": True, "label": "planning"},
+}
+
+
+def _median_ms(fn, arg, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn(arg)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(iterations: int = 50):
+    codecs = [StdlibJsonCodec()]
+    if orjson is not None:
+        codecs.append(OrjsonJsonCodec())
+    else:
+        print("orjson is not installed; only the stdlib codec is measured")
+
+    page = StdlibJsonCodec().dumps(
+        {"request_id": "bench", "data": [_MESSAGE] * PAGE_SIZE, "next_cursor": "abc"}
+    )
+    print(f"Median times over {iterations} runs")
+    print(f"  parse {PAGE_SIZE}-message page ({len(page) / 1024:.0f} KiB)")
+    for codec in codecs:
+        print(
+            f"    {codec.name:<8} {_median_ms(codec.loads, page, iterations):8.3f} ms"
+        )
+
+    print("  encode send-message body")
+    for codec in codecs:
+        elapsed = _median_ms(codec.dumps, _REQUEST_BODY, iterations)
+        print(f"    {codec.name:<8} {elapsed:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,150 @@
+"""
+Compare decoding a 200-item list page with dataclasses_json's reflective `from_dict`
+against the compiled per-model decoders used by `ListResponse.from_dict`.
+
+Usage:
+    python benchmarks/bench_model_decoding.py [iterations]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nylas.models.contacts import Contact  # noqa: E402
+from nylas.models.events import Event  # noqa: E402
+from nylas.models.messages import Message  # noqa: E402
+from nylas.models.threads import Thread  # noqa: E402
+from nylas.utils.decoder import get_decoder  # noqa: E402
+
+PAGE_SIZE = 200
+
+_EMAIL = {"email": "leyah@example.com", "name": "Leyah Miller"}
+
+_MESSAGE = {
+    "id": "5d3qmne77v32r8l4phyuksl2x",
+    "grant_id": "41009df5-bf11-4c97-aa18-b285b5f2e386",
+    "object": "message",
+    "thread_id": "1t8tv3890q4vgmwq6pmdwm8qgsaer",
+    "subject": "Hello from Nylas!",
+    "snippet": "Hello, I just sent a message using Nylas!",
+    "body": "<p>Hello, I just sent a message using Nylas!</p>" * 4,
+    "from": [_EMAIL],
+    "to": [_EMAIL, _EMAIL],
+    "cc": [_EMAIL],
+    "reply_to": [_EMAIL],
+    "folders": ["INBOX", "UNREAD"],
+    "headers": [{"name": "X-Mailer", "value": "Nylas"}],
+    "attachments": [
+        {
+            "id": "185e56cb50e12e82",
+            "grant_id": "41009df5-bf11-4c97-aa18-b285b5f2e386",
+            "filename": "invite.ics",
+            "content_type": "text/calendar",
+            "size": 2048,
+            "is_inline": False,
+        }
+    ],
+    "unread": True,
+    "starred": False,
+    "date": 1705084926,
+    "created_at": 1705084926,
+}
+
+_EVENT = {
+    "id": "5d3qmne77v32r8l4phyuksl2x",
+    "grant_id": "41009df5-bf11-4c97-aa18-b285b5f2e386",
+    "calendar_id": "primary",
+    "busy": True,
+    "object": "event",
+    "title": "Planning",
+    "description": "Quarterly planning session",
+    "participants": [
+        {"email": "leyah@example.com", "name": "Leyah Miller", "status": "yes"},
+        {"email": "nyla@example.com", "name": "Nyla", "status": "maybe"},
+    ],
+    "when": {
+        "object": "timespan",
+        "start_time": 1661874192,
+        "end_time": 1661877792,
+        "start_timezone": "America/New_York",
+        "end_timezone": "America/New_York",
+    },
+    "conferencing": {
+        "provider": "Google Meet",
+        "details": {"url": "https://meet.google.com/abc-defg-hij"},
+    },
+    "organizer": _EMAIL,
+    "reminders": {"use_default": False, "overrides": [{"reminder_minutes": 10}]},
+    "metadata": {"key": "value"},
+    "status": "confirmed",
+    "visibility": "public",
+}
+
+_THREAD = {
+    "id": "7ml84jdmfnw20sq59f30hirhe",
+    "grant_id": "41009df5-bf11-4c97-aa18-b285b5f2e386",
+    "object": "thread",
+    "has_drafts": False,
+    "starred": False,
+    "unread": True,
+    "has_attachments": True,
+    "message_ids": ["njeb79kFFzuwxbb3zkvuqxkwc", "njeb79kFFzuwxbb3zkvuqxkwd"],
+    "folders": ["INBOX"],
+    "participants": [_EMAIL, _EMAIL],
+    "latest_draft_or_message": _MESSAGE,
+    "subject": "Hello from Nylas!",
+    "snippet": "Hello, I just sent a message using Nylas!",
+}
+
+_CONTACT = {
+    "id": "5d3qmne77v32r8l4phyuksl2x",
+    "grant_id": "41009df5-bf11-4c97-aa18-b285b5f2e386",
+    "object": "contact",
+    "given_name": "Leyah",
+    "surname": "Miller",
+    "source": "address_book",
+    "emails": [{"email": "leyah@example.com", "type": "work"}],
+    "phone_numbers": [{"number": "+1-555-555-5555", "type": "work"}],
+    "groups": [{"id": "starred"}],
+    "web_pages": [{"url": "https://www.nylas.com", "type": "work"}],
+}
+
+_MODELS = [
+    (Message, _MESSAGE),
+    (Event, _EVENT),
+    (Thread, _THREAD),
+    (Contact, _CONTACT),
+]
+
+
+def _time_page(decode_item, page, iterations: int):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        for item in page:
+            decode_item(item)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(iterations: int = 20):
+    print(f"Median time to decode a page of {PAGE_SIZE} items ({iterations} runs)")
+    for model, payload in _MODELS:
+        page = [dict(payload) for _ in range(PAGE_SIZE)]
+        reflective = _time_page(
+            lambda item, model=model: model.from_dict(item, infer_missing=True),
+            page,
+            iterations,
+        )
+        compiled = _time_page(get_decoder(model, infer_missing=True), page, iterations)
+        print(
+            f"{model.__name__:<10} from_dict {reflective:8.2f} ms"
+            f"   compiled {compiled:7.2f} ms   {reflective / compiled:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,58 @@
+"""
+Compare the wall-clock time of walking a paginated list endpoint with and without
+background page prefetching, using a local HTTPS stand-in for the Nylas API that adds a
+fixed latency to every page and a consumer that spends time processing each item.
+
+Usage:
+    python benchmarks/bench_prefetch_pagination.py [pages]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks._server import LocalApiServer  # noqa: E402
+from nylas import Client  # noqa: E402
+
+PAGE_SIZE = 50
+LATENCY = 0.05
+PROCESSING_PER_ITEM = 0.001
+
+_PAGE = {
+    "request_id": "bench",
+    "data": [
+        {"id": f"message-{i}", "grant_id": "bench", "object": "message"}
+        for i in range(PAGE_SIZE)
+    ],
+    "next_cursor": "next-page",
+}
+
+
+def _export(client: Client, pages: int, prefetch: int) -> float:
+    start = time.perf_counter()
+    for _ in client.messages.list_all(
+        "bench", max_items=pages * PAGE_SIZE, limit=PAGE_SIZE, prefetch=prefetch
+    ):
+        time.sleep(PROCESSING_PER_ITEM)
+    return time.perf_counter() - start
+
+
+def main(pages: int = 20):
+    with LocalApiServer(_PAGE, latency=LATENCY) as server:
+        os.environ["REQUESTS_CA_BUNDLE"] = server.cert_path
+        with Client("bench-key", api_uri=server.url) as client:
+            sequential = _export(client, pages, prefetch=0)
+            prefetched = _export(client, pages, prefetch=2)
+
+    print(
+        f"{pages} pages of {PAGE_SIZE} messages, {LATENCY * 1000:.0f} ms latency per page,"
+        f" {PROCESSING_PER_ITEM * 1000:.0f} ms processing per message"
+    )
+    print(f"{'sequential cursor loop':<28} {sequential:6.2f} s")
+    print(f"{'prefetch=2':<28} {prefetched:6.2f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
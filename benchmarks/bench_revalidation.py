@@ -0,0 +1,72 @@
+"""
+Compare polling an unchanged 200-event list page with and without a RevalidationCache: the
+bytes the API sends for each poll, and the client-side time of each poll. With the cache,
+polls are sent with If-None-Match and the API answers 304 Not Modified without a body, which
+is served from a copy of the result the stored body was decoded into.
+
+Requests are answered in memory by a LocalTransport, so the times exclude the network.
+
+Usage:
+    python benchmarks/bench_revalidation.py [iterations]
+"""
+
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_model_decoding import PAGE_SIZE, _EVENT  # noqa: E402
+from nylas import Client  # noqa: E402
+from nylas.handler.revalidation import RevalidationCache  # noqa: E402
+from nylas.handler.transport import LocalResponse, LocalTransport  # noqa: E402
+
+_ETAG = '"v1"'
+
+
+def _poll(revalidation_cache, body: bytes, iterations: int):
+    sent = []
+
+    def list_events(request):
+        if request.headers.get("If-None-Match") == _ETAG:
+            sent.append(0)
+            return LocalResponse(304, headers={"ETag": _ETAG})
+        sent.append(len(body))
+        return LocalResponse(
+            200,
+            content=body,
+            headers={"ETag": _ETAG, "Content-Type": "application/json"},
+        )
+
+    client = Client(
+        api_key="bench-key",
+        transport=LocalTransport(
+            [("GET", "/v3/grants/{grant_id}/events", list_events)]
+        ),
+        revalidation_cache=revalidation_cache,
+    )
+    query_params = {"calendar_id": "primary"}
+    client.events.list("bench", query_params=query_params)
+    sent.clear()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        client.events.list("bench", query_params=query_params)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), sum(sent) / len(sent)
+
+
+def main(iterations: int = 50):
+    body = json.dumps(
+        {"request_id": "bench", "data": [_EVENT] * PAGE_SIZE, "next_cursor": "abc"}
+    ).encode()
+    print(f"Polling an unchanged {PAGE_SIZE}-event page {iterations} times")
+    for name, cache in (("no cache", None), ("revalidated", RevalidationCache())):
+        elapsed, sent = _poll(cache, body, iterations)
+        print(f"  {name:<12} {sent / 1024:8.1f} KiB sent per poll   {elapsed:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,84 @@
+"""
+Measure the SDK's own per-call overhead with no network: requests are answered in memory by
+a LocalTransport, so the time is spent building and validating requests, encoding and
+parsing JSON and decoding models. The last rows repeat `events.find` with a no-op hook
+registered, to show the cost of the timing instrumentation.
+
+Usage:
+    python benchmarks/bench_sdk_overhead.py [iterations]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_model_decoding import PAGE_SIZE, _EVENT  # noqa: E402
+from nylas import Client  # noqa: E402
+from nylas.handler.transport import LocalTransport  # noqa: E402
+from nylas.handler.json_codec import StdlibJsonCodec  # noqa: E402
+
+
+def _median_us(fn, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+def main(iterations: int = 500):
+    codec = StdlibJsonCodec()
+    event = codec.dumps({"request_id": "bench", "data": _EVENT})
+    page = codec.dumps(
+        {"request_id": "bench", "data": [_EVENT] * PAGE_SIZE, "next_cursor": "abc"}
+    )
+    transport = LocalTransport(
+        [
+            ("GET", "/v3/grants/{grant_id}/events/{event_id}", lambda r: event),
+            ("GET", "/v3/grants/{grant_id}/events", lambda r: page),
+            (
+                "DELETE",
+                "/v3/grants/{grant_id}/events/{event_id}",
+                lambda r: {"request_id": "bench"},
+            ),
+        ]
+    )
+    client = Client(api_key="bench-key", transport=transport)
+    calls = [
+        (
+            "events.find",
+            lambda: client.events.find("grant", "event", {"calendar_id": "c"}),
+        ),
+        (
+            f"events.list ({PAGE_SIZE})",
+            lambda: client.events.list("grant", {"calendar_id": "c"}),
+        ),
+        (
+            f"events.list raw ({PAGE_SIZE})",
+            lambda: client.events.list(
+                "grant", {"calendar_id": "c"}, overrides={"response_format": "raw"}
+            ),
+        ),
+        (
+            "events.destroy",
+            lambda: client.events.destroy("grant", "event", {"calendar_id": "c"}),
+        ),
+    ]
+
+    print(f"Median SDK time per call over {iterations} in-memory requests")
+    for label, call in calls:
+        call()
+        print(f"  {label:<24} {_median_us(call, iterations):9.1f} us")
+
+    find = calls[0][1]
+    client.on_response(lambda info: None)
+    find()
+    print(f"  {'events.find with hooks':<24} {_median_us(find, iterations):9.1f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
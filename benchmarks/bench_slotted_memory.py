@@ -0,0 +1,60 @@
+"""
+Compare the memory held by 100k decoded messages with the regular models against their
+slotted variants (`response_format="slotted"`, `nylas.utils.slots`).
+
+The JSON is parsed up front; only the memory allocated while decoding it into models (the
+model objects, their nested models and lists) is measured, since the parsed strings are
+shared by both variants. Note that CPython 3.11+ already stores instance attributes
+compactly until `__dict__` is accessed, so the savings are larger on older versions.
+
+Usage:
+    python benchmarks/bench_slotted_memory.py [count]
+"""
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_model_decoding import _MESSAGE  # noqa: E402
+from nylas.models.messages import Message  # noqa: E402
+from nylas.utils.decoder import get_decoder  # noqa: E402
+from nylas.utils.slots import slotted  # noqa: E402
+
+
+def _payload(count: int) -> bytes:
+    items = [dict(_MESSAGE, id=f"message-{i}") for i in range(count)]
+    return json.dumps({"request_id": "bench", "data": items}).encode()
+
+
+def _retained_bytes(model, payload: bytes) -> int:
+    decode = get_decoder(model, infer_missing=True)
+    items = json.loads(payload)["data"]
+    gc.collect()
+    tracemalloc.start()
+    messages = [decode(item) for item in items]
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(messages) and type(messages[0]) is model
+    return retained
+
+
+def main(count: int = 100_000):
+    payload = _payload(count)
+    print(f"Memory allocated for {count:,} decoded messages")
+    results = []
+    for label, model in (("model", Message), ("slotted", slotted(Message))):
+        retained = _retained_bytes(model, payload)
+        results.append(retained)
+        print(
+            f"  {label:<8} {retained / 2**20:8.1f} MiB   {retained / count:7.0f} bytes/message"
+        )
+    print(f"  saved    {(results[0] - results[1]) / results[0]:8.1%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,82 @@
+"""
+Compare the peak memory and time of listing a page of large messages with the default
+response format against the "stream" format, which decodes the items one at a time while
+the body is read.
+
+Requests are answered in memory by a LocalTransport. Each message of the page carries a
+large body and a list of headers, like a `messages.list` with `fields=include_headers`, and
+each one is dropped as soon as it has been processed, as when exporting a mailbox.
+
+Usage:
+    python benchmarks/bench_streaming_list.py [body_kib]
+"""
+
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_model_decoding import PAGE_SIZE, _MESSAGE  # noqa: E402
+from nylas import Client  # noqa: E402
+from nylas.handler.transport import LocalResponse, LocalTransport  # noqa: E402
+
+
+def _payload(body_kib: int) -> bytes:
+    headers = [{"name": f"X-Header-{i}", "value": "v" * 80} for i in range(40)]
+    items = [
+        dict(_MESSAGE, id=f"message-{i}", body="b" * body_kib * 1024, headers=headers)
+        for i in range(PAGE_SIZE)
+    ]
+    return json.dumps(
+        {"request_id": "bench", "data": items, "next_cursor": "abc"}
+    ).encode()
+
+
+def _list(client: Client, response_format: str) -> None:
+    page = client.messages.list("grant", overrides={"response_format": response_format})
+    count = sum(1 for _ in page.data)
+    assert count == PAGE_SIZE and page.next_cursor == "abc"
+
+
+def _measure(client: Client, response_format: str):
+    # Tracing allocations slows them down, so the time is measured separately.
+    _list(client, response_format)
+    started = time.perf_counter()
+    _list(client, response_format)
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    tracemalloc.start()
+    _list(client, response_format)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def main(body_kib: int = 50):
+    payload = _payload(body_kib)
+    transport = LocalTransport(
+        [
+            (
+                "GET",
+                "/v3/grants/{grant_id}/messages",
+                lambda r: LocalResponse(content=payload),
+            )
+        ]
+    )
+    client = Client(api_key="bench-key", transport=transport)
+    print(
+        f"messages.list of {PAGE_SIZE} messages, {len(payload) / 2**20:.1f} MiB of JSON"
+    )
+    for response_format in ("model", "stream"):
+        peak, elapsed = _measure(client, response_format)
+        print(
+            f"  {response_format:<7} peak {peak / 2**20:8.1f} MiB   {elapsed * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,69 @@
+"""
+Compare the memory retained by decoded event pages with and without a StringInterner, and
+the decoding time it adds.
+
+Every page is parsed from its own JSON body, as it would be when read from the API, so
+repeated values such as grant and calendar IDs are separate strings unless interned.
+
+Usage:
+    python benchmarks/bench_string_interning.py [pages]
+"""
+
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_model_decoding import PAGE_SIZE, _EVENT  # noqa: E402
+from nylas.models.events import Event  # noqa: E402
+from nylas.models.response import ListResponse  # noqa: E402
+from nylas.utils.interning import StringInterner  # noqa: E402
+
+
+def _page_body(page: int) -> bytes:
+    items = [
+        dict(_EVENT, id=f"event-{page}-{i}", calendar_id=f"calendar-{i % 5}")
+        for i in range(PAGE_SIZE)
+    ]
+    return json.dumps({"request_id": f"bench-{page}", "data": items}).encode()
+
+
+def _decode_pages(bodies, interner):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    pages = [
+        ListResponse.from_dict(json.loads(body), Event, interner=interner)
+        for body in bodies
+    ]
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(pages) == len(bodies)
+    return retained, elapsed
+
+
+def main(pages: int = 50):
+    bodies = [_page_body(page) for page in range(pages)]
+    count = pages * PAGE_SIZE
+    print(f"Memory retained by {pages} pages of {PAGE_SIZE} events ({count:,} events)")
+    plain, plain_time = _decode_pages(bodies, None)
+    interned, interned_time = _decode_pages(bodies, StringInterner())
+    for label, retained, elapsed in (
+        ("plain", plain, plain_time),
+        ("interned", interned, interned_time),
+    ):
+        print(
+            f"  {label:<9} {retained / 2**20:7.1f} MiB   {retained / count:6.0f} bytes/event"
+            f"   decoded in {elapsed:6.2f} s (traced)"
+        )
+    print(f"  saved     {(plain - interned) / plain:7.1%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
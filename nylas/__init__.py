@@ -1,3 +1,28 @@
-from nylas.client import Client
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = ["Client"]
+if TYPE_CHECKING:
+    from nylas.client import Client
+    from nylas.async_client import AsyncClient
+
+__all__ = ["Client", "AsyncClient"]
+
+# The clients are imported on first access (PEP 562) so that importing a submodule, e.g.
+# nylas.models.webhooks in a webhook handler, does not pay for the HTTP stack.
+_LAZY_ATTRIBUTES = {
+    "Client": "nylas.client",
+    "AsyncClient": "nylas.async_client",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
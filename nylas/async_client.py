@@ -0,0 +1,144 @@
+from typing import Optional
+
+from nylas.client import Client
+from nylas.config import (
+    DEFAULT_SERVER_URL,
+    DEFAULT_RESPONSE_FORMAT,
+    ResponseFormat,
+)
+from nylas.handler.async_http_client import AsyncHttpClient, DEFAULT_MAX_CONNECTIONS
+from nylas.handler.batch import AsyncBatch
+from nylas.handler.compression import Compression
+from nylas.handler.hooks import Hooks
+from nylas.handler.http2 import DEFAULT_MAX_STREAMS
+from nylas.handler.invalid_grants import InvalidGrantCache
+from nylas.handler.rate_limiter import RateLimiter
+from nylas.handler.response_cache import ResponseCache
+from nylas.handler.revalidation import RevalidationCache
+from nylas.handler.single_flight import SingleFlight
+from nylas.handler.retry import RetryPolicy
+from nylas.utils.interning import StringInterner
+
+# pylint: disable=invalid-overridden-method
+
+
+class AsyncClient(Client):
+    """
+    Asyncio API client for the Nylas API.
+
+    Exposes the same resources as Client (`messages`, `events`, `grants`, …) and returns the
+    same models and Response/ListResponse types, but every API method is a coroutine that
+    must be awaited. Requests share one pooled, non-blocking connection pool, so many calls
+    can be in flight at once from a single event loop.
+
+    Attributes:
+        api_key: The Nylas API key to use for authentication
+        api_uri: The URL to use for communicating with the Nylas API
+        http_client: The async HTTP client to use for requests to the Nylas API
+    """
+
+    # pylint: disable=super-init-not-called
+    def __init__(
+        self,
+        api_key: str,
+        api_uri: str = DEFAULT_SERVER_URL,
+        timeout: int = 90,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_format: ResponseFormat = DEFAULT_RESPONSE_FORMAT,
+        json_codec=None,
+        string_interner: Optional[StringInterner] = None,
+        response_cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        revalidation_cache: Optional[RevalidationCache] = None,
+        compression: Optional[Compression] = None,
+        http2: bool = False,
+        http2_max_streams: int = DEFAULT_MAX_STREAMS,
+        transport=None,
+        hooks: Optional[Hooks] = None,
+        invalid_grant_cache: Optional[InvalidGrantCache] = None,
+    ):
+        """
+        Initialize the async Nylas API client.
+
+        Args:
+            api_key: The Nylas API key to use for authentication
+            api_uri: The URL to use for communicating with the Nylas API
+            timeout: The timeout for requests to the Nylas API, in seconds
+            max_connections: The maximum number of concurrent connections to the API
+            retry_policy: The policy for retrying failed requests; requests are not retried if unset
+            rate_limiter: The client-side rate limiter to pace requests with; unlimited if unset
+            response_format: How to decode responses by default; "lazy" decodes list items on access
+            json_codec: The JSON codec for request and response bodies; orjson if installed
+            string_interner: Deduplicates repeated strings in decoded responses; off if unset
+            response_cache: Caches GET responses of slow-changing resources; off if unset
+            single_flight: Coalesces concurrent identical GETs into one request; off if unset
+            revalidation_cache: Revalidates repeated GETs with ETags and reuses unchanged responses
+            compression: Compresses large request bodies and counts body sizes; off if unset
+            http2: Whether to multiplex requests over HTTP/2; requires `pip install nylas[http2]`
+            http2_max_streams: The maximum number of concurrent requests per HTTP/2 connection
+            transport: An httpx async transport to send every request with, e.g. a LocalTransport
+            hooks: Callbacks called as requests are sent, answered, retried or fail; see on_response
+            invalid_grant_cache: Fails requests for grants that recently failed as invalid; off if unset
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        self.api_key = api_key
+        self.api_uri = api_uri
+        self.http_client = AsyncHttpClient(
+            self.api_uri,
+            self.api_key,
+            timeout,
+            max_connections=max_connections,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            response_format=response_format,
+            json_codec=json_codec,
+            string_interner=string_interner,
+            response_cache=response_cache,
+            single_flight=single_flight,
+            revalidation_cache=revalidation_cache,
+            compression=compression,
+            http2=http2,
+            http2_max_streams=http2_max_streams,
+            transport=transport,
+            hooks=hooks,
+            invalid_grant_cache=invalid_grant_cache,
+        )
+
+    def batch(self, calls=(), max_concurrency: Optional[int] = None) -> AsyncBatch:
+        """
+        Create a batch of independent calls that run concurrently as tasks.
+
+        As with Client.batch(), but iterate over `batch.results()` with `async for`, or
+        await `batch.run()`.
+
+        Args:
+            calls: Callables without arguments returning the coroutines to run.
+            max_concurrency: The maximum number of calls in flight at once. Defaults to
+                the client's `max_connections`.
+
+        Returns:
+            The batch.
+        """
+        if max_concurrency is None:
+            max_concurrency = self.http_client.max_connections
+        return AsyncBatch(calls, max_concurrency)
+
+    async def close(self) -> None:
+        """
+        Close the underlying HTTP session and release any pooled connections.
+        """
+        await self.http_client.close()
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with AsyncClient")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
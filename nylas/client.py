@@ -1,32 +1,61 @@
-from nylas.config import DEFAULT_SERVER_URL
-from nylas.handler.http_client import HttpClient
-from nylas.resources.applications import Applications
-from nylas.resources.attachments import Attachments
-from nylas.resources.auth import Auth
-from nylas.resources.calendars import Calendars
-from nylas.resources.connectors import Connectors
-from nylas.resources.events import Events
-from nylas.resources.folders import Folders
-from nylas.resources.messages import Messages
-from nylas.resources.lists import Lists
-from nylas.resources.threads import Threads
-from nylas.resources.transactional_send import TransactionalSend
-from nylas.resources.webhooks import Webhooks
-from nylas.resources.contacts import Contacts
-from nylas.resources.drafts import Drafts
-from nylas.resources.domains import Domains
-from nylas.resources.grants import Grants
-from nylas.resources.policies import Policies
-from nylas.resources.scheduler import Scheduler
-from nylas.resources.notetakers import Notetakers
-from nylas.resources.rules import Rules
-from nylas.resources.workspaces import Workspaces
-
-
-class Client:
+import importlib
+from typing import TYPE_CHECKING, Optional
+
+from requests.adapters import BaseAdapter
+
+from nylas.config import (
+    DEFAULT_SERVER_URL,
+    DEFAULT_RESPONSE_FORMAT,
+    ResponseFormat,
+)
+from nylas.handler.http_client import (
+    HttpClient,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+)
+from nylas.handler.batch import Batch
+from nylas.handler.compression import Compression
+from nylas.handler.hooks import Hook, Hooks
+from nylas.handler.http2 import DEFAULT_MAX_STREAMS
+from nylas.handler.invalid_grants import InvalidGrantCache
+from nylas.handler.rate_limiter import RateLimiter
+from nylas.handler.response_cache import ResponseCache
+from nylas.handler.revalidation import RevalidationCache
+from nylas.handler.single_flight import SingleFlight
+from nylas.handler.retry import RetryPolicy
+from nylas.utils.interning import StringInterner
+
+if TYPE_CHECKING:
+    from nylas.resources.applications import Applications
+    from nylas.resources.attachments import Attachments
+    from nylas.resources.auth import Auth
+    from nylas.resources.calendars import Calendars
+    from nylas.resources.connectors import Connectors
+    from nylas.resources.events import Events
+    from nylas.resources.folders import Folders
+    from nylas.resources.messages import Messages
+    from nylas.resources.lists import Lists
+    from nylas.resources.threads import Threads
+    from nylas.resources.transactional_send import TransactionalSend
+    from nylas.resources.webhooks import Webhooks
+    from nylas.resources.contacts import Contacts
+    from nylas.resources.drafts import Drafts
+    from nylas.resources.domains import Domains
+    from nylas.resources.grants import Grants
+    from nylas.resources.policies import Policies
+    from nylas.resources.scheduler import Scheduler
+    from nylas.resources.notetakers import Notetakers
+    from nylas.resources.rules import Rules
+    from nylas.resources.workspaces import Workspaces
+
+
+class Client:  # pylint: disable=too-many-public-methods
     """
     API client for the Nylas API.
 
+    Resource modules and their models are imported the first time a resource is accessed,
+    and each client reuses one instance per resource.
+
     Attributes:
         api_key: The Nylas API key to use for authentication
         api_uri: The URL to use for communicating with the Nylas API
@@ -34,7 +63,26 @@ class Client:
     """
 
     def __init__(
-        self, api_key: str, api_uri: str = DEFAULT_SERVER_URL, timeout: int = 90
+        self,
+        api_key: str,
+        api_uri: str = DEFAULT_SERVER_URL,
+        timeout: int = 90,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_format: ResponseFormat = DEFAULT_RESPONSE_FORMAT,
+        json_codec=None,
+        string_interner: Optional[StringInterner] = None,
+        response_cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        revalidation_cache: Optional[RevalidationCache] = None,
+        compression: Optional[Compression] = None,
+        http2: bool = False,
+        http2_max_streams: int = DEFAULT_MAX_STREAMS,
+        transport: Optional[BaseAdapter] = None,
+        hooks: Optional[Hooks] = None,
+        invalid_grant_cache: Optional[InvalidGrantCache] = None,
     ):
         """
         Initialize the Nylas API client.
@@ -43,217 +91,365 @@ class Client:
             api_key: The Nylas API key to use for authentication
             api_uri: The URL to use for communicating with the Nylas API
             timeout: The timeout for requests to the Nylas API, in seconds
-        """
+            pool_connections: The number of per-host connection pools to keep
+            pool_maxsize: The maximum number of keep-alive connections to keep per host
+            retry_policy: The policy for retrying failed requests; requests are not retried if unset
+            rate_limiter: The client-side rate limiter to pace requests with; unlimited if unset
+            response_format: How to decode responses by default; "lazy" decodes list items on access
+            json_codec: The JSON codec for request and response bodies; orjson if installed
+            string_interner: Deduplicates repeated strings in decoded responses; off if unset
+            response_cache: Caches GET responses of slow-changing resources; off if unset
+            single_flight: Coalesces concurrent identical GETs into one request; off if unset
+            revalidation_cache: Revalidates repeated GETs with ETags and reuses unchanged responses
+            compression: Compresses large request bodies and counts body sizes; off if unset
+            http2: Whether to multiplex requests over HTTP/2; requires `pip install nylas[http2]`
+            http2_max_streams: The maximum number of concurrent requests per HTTP/2 connection
+            transport: The transport adapter to send requests with, e.g. a LocalTransport; pooled if unset
+            hooks: Callbacks called as requests are sent, answered, retried or fail; see on_response
+            invalid_grant_cache: Fails requests for grants that recently failed as invalid; off if unset
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
         self.api_key = api_key
         self.api_uri = api_uri
-        self.http_client = HttpClient(self.api_uri, self.api_key, timeout)
+        self.http_client = HttpClient(
+            self.api_uri,
+            self.api_key,
+            timeout,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            response_format=response_format,
+            json_codec=json_codec,
+            string_interner=string_interner,
+            response_cache=response_cache,
+            single_flight=single_flight,
+            revalidation_cache=revalidation_cache,
+            compression=compression,
+            http2=http2,
+            http2_max_streams=http2_max_streams,
+            transport=transport,
+            hooks=hooks,
+            invalid_grant_cache=invalid_grant_cache,
+        )
+
+    @property
+    def hooks(self) -> Hooks:
+        """The callbacks called as the client sends requests."""
+        return self.http_client.hooks
+
+    def on_request(self, callback: Hook) -> Hook:
+        """
+        Call a callback with the RequestInfo of each request before it is sent.
+
+        Can be used as a decorator. See nylas.handler.hooks for what is reported.
+
+        Args:
+            callback: The callback to call.
+
+        Returns:
+            The callback.
+        """
+        return self.hooks.on_request(callback)
+
+    def on_response(self, callback: Hook) -> Hook:
+        """
+        Call a callback with the RequestInfo of each request once its response has been
+        received and decoded, with its status, sizes and timings.
+
+        Args:
+            callback: The callback to call.
+
+        Returns:
+            The callback.
+        """
+        return self.hooks.on_response(callback)
+
+    def on_error(self, callback: Hook) -> Hook:
+        """
+        Call a callback with the RequestInfo of each request that fails, with its `error`.
+
+        Args:
+            callback: The callback to call.
+
+        Returns:
+            The callback.
+        """
+        return self.hooks.on_error(callback)
+
+    def on_retry(self, callback: Hook) -> Hook:
+        """
+        Call a callback with the RequestInfo of a request before a failed attempt is retried.
+
+        Args:
+            callback: The callback to call.
+
+        Returns:
+            The callback.
+        """
+        return self.hooks.on_retry(callback)
+
+    def batch(self, calls=(), max_concurrency: Optional[int] = None) -> Batch:
+        """
+        Create a batch of independent calls that run concurrently over the client's
+        connection pool.
+
+        Add calls with `batch.add(client.messages.find, grant_id, message_id)`, then iterate
+        over `batch.results()` for each call's BatchResult as it completes, or call
+        `batch.run()` for all of them in order. A failing call does not stop the others.
+
+        Args:
+            calls: Callables without arguments to run, e.g. functools.partial objects.
+            max_concurrency: The maximum number of calls in flight at once. Defaults to
+                the client's `pool_maxsize`.
+
+        Returns:
+            The batch.
+        """
+        if max_concurrency is None:
+            max_concurrency = self.http_client.pool_maxsize
+        return Batch(calls, max_concurrency)
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and release any pooled connections.
+        """
+        self.http_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _resource(self, module: str, name: str):
+        """
+        Get the client's instance of a resource, importing its module on first use.
+
+        Instances are cached per client and rebuilt if `http_client` is replaced.
+
+        Args:
+            module: The module that defines the resource.
+            name: The class name of the resource.
+
+        Returns:
+            The resource instance.
+        """
+        resources = self.__dict__.setdefault("_resources", {})
+        resource = resources.get(name)
+        # pylint: disable-next=protected-access
+        if resource is None or resource._http_client is not self.http_client:
+            resource_class = getattr(importlib.import_module(module), name)
+            resource = resource_class(self.http_client)
+            resources[name] = resource
+        return resource
 
     @property
-    def auth(self) -> Auth:
+    def auth(self) -> "Auth":
         """
         Access the Auth API.
 
         Returns:
             The Auth API.
         """
-        return Auth(self.http_client)
+        return self._resource("nylas.resources.auth", "Auth")
 
     @property
-    def applications(self) -> Applications:
+    def applications(self) -> "Applications":
         """
         Access the Applications API.
 
         Returns:
             The Applications API.
         """
-        return Applications(self.http_client)
+        return self._resource("nylas.resources.applications", "Applications")
 
     @property
-    def attachments(self) -> Attachments:
+    def attachments(self) -> "Attachments":
         """
         Access the Attachments API.
 
         Returns:
             The Attachments API.
         """
-        return Attachments(self.http_client)
+        return self._resource("nylas.resources.attachments", "Attachments")
 
     @property
-    def connectors(self) -> Connectors:
+    def connectors(self) -> "Connectors":
         """
         Access the Connectors API.
 
         Returns:
             The Connectors API.
         """
-        return Connectors(self.http_client)
+        return self._resource("nylas.resources.connectors", "Connectors")
 
     @property
-    def calendars(self) -> Calendars:
+    def calendars(self) -> "Calendars":
         """
         Access the Calendars API.
 
         Returns:
             The Calendars API.
         """
-        return Calendars(self.http_client)
+        return self._resource("nylas.resources.calendars", "Calendars")
 
     @property
-    def contacts(self) -> Contacts:
+    def contacts(self) -> "Contacts":
         """
         Access the Contacts API.
 
         Returns:
             The Contacts API.
         """
-        return Contacts(self.http_client)
+        return self._resource("nylas.resources.contacts", "Contacts")
 
     @property
-    def drafts(self) -> Drafts:
+    def drafts(self) -> "Drafts":
         """
         Access the Drafts API.
 
         Returns:
             The Drafts API.
         """
-        return Drafts(self.http_client)
+        return self._resource("nylas.resources.drafts", "Drafts")
 
     @property
-    def domains(self) -> Domains:
+    def domains(self) -> "Domains":
         """
         Access the Manage Domains API.
 
         Returns:
             The Manage Domains API.
         """
-        return Domains(self.http_client)
+        return self._resource("nylas.resources.domains", "Domains")
 
     @property
-    def events(self) -> Events:
+    def events(self) -> "Events":
         """
         Access the Events API.
 
         Returns:
             The Events API.
         """
-        return Events(self.http_client)
+        return self._resource("nylas.resources.events", "Events")
 
     @property
-    def folders(self) -> Folders:
+    def folders(self) -> "Folders":
         """
         Access the Folders API.
 
         Returns:
             The Folders API.
         """
-        return Folders(self.http_client)
+        return self._resource("nylas.resources.folders", "Folders")
 
     @property
-    def grants(self) -> Grants:
+    def grants(self) -> "Grants":
         """
         Access the Grants API.
 
         Returns:
             The Grants API.
         """
-        return Grants(self.http_client)
+        return self._resource("nylas.resources.grants", "Grants")
 
     @property
-    def policies(self) -> Policies:
+    def policies(self) -> "Policies":
         """
         Access the Policies API.
 
         Returns:
             The Policies API.
         """
-        return Policies(self.http_client)
+        return self._resource("nylas.resources.policies", "Policies")
 
     @property
-    def rules(self) -> Rules:
+    def rules(self) -> "Rules":
         """
         Access the Rules API.
 
         Returns:
             The Rules API.
         """
-        return Rules(self.http_client)
+        return self._resource("nylas.resources.rules", "Rules")
 
     @property
-    def messages(self) -> Messages:
+    def messages(self) -> "Messages":
         """
         Access the Messages API.
 
         Returns:
             The Messages API.
         """
-        return Messages(self.http_client)
+        return self._resource("nylas.resources.messages", "Messages")
 
     @property
-    def lists(self) -> Lists:
+    def lists(self) -> "Lists":
         """
         Access the Lists API.
 
         Returns:
             The Lists API.
         """
-        return Lists(self.http_client)
+        return self._resource("nylas.resources.lists", "Lists")
 
     @property
-    def threads(self) -> Threads:
+    def threads(self) -> "Threads":
         """
         Access the Threads API.
 
         Returns:
             The Threads API.
         """
-        return Threads(self.http_client)
+        return self._resource("nylas.resources.threads", "Threads")
 
     @property
-    def transactional_send(self) -> TransactionalSend:
+    def transactional_send(self) -> "TransactionalSend":
         """
         Access the Transactional Send API.
 
         Returns:
             The Transactional Send API.
         """
-        return TransactionalSend(self.http_client)
+        return self._resource("nylas.resources.transactional_send", "TransactionalSend")
 
     @property
-    def webhooks(self) -> Webhooks:
+    def webhooks(self) -> "Webhooks":
         """
         Access the Webhooks API.
 
         Returns:
             The Webhooks API.
         """
-        return Webhooks(self.http_client)
+        return self._resource("nylas.resources.webhooks", "Webhooks")
 
     @property
-    def scheduler(self) -> Scheduler:
+    def scheduler(self) -> "Scheduler":
         """
         Access the Scheduler API.
 
         Returns:
             The Scheduler API.
         """
-        return Scheduler(self.http_client)
+        return self._resource("nylas.resources.scheduler", "Scheduler")
 
     @property
-    def notetakers(self) -> Notetakers:
+    def notetakers(self) -> "Notetakers":
         """
         Access the Notetakers API.
 
         Returns:
             The Notetakers API.
         """
-        return Notetakers(self.http_client)
+        return self._resource("nylas.resources.notetakers", "Notetakers")
 
     @property
-    def workspaces(self) -> Workspaces:
+    def workspaces(self) -> "Workspaces":
         """
         Access the Workspaces API.
 
         Returns:
             The Workspaces API.
         """
-        return Workspaces(self.http_client)
+        return self._resource("nylas.resources.workspaces", "Workspaces")
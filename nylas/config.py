@@ -1,7 +1,23 @@
 from enum import Enum
 from typing import TypedDict
 
-from typing_extensions import NotRequired
+from typing_extensions import Literal, NotRequired
+
+ResponseFormat = Literal["model", "lazy", "raw", "slotted", "stream"]
+"""
+Literal representing how responses are decoded.
+
+"model" decodes every object into its model up front. "lazy" keeps the raw JSON of list
+items and decodes each item into its model the first time it is accessed. "raw" skips
+model construction entirely and returns the parsed JSON objects as the response data.
+"slotted" decodes into memory-compact `__slots__` variants of the models (see
+`nylas.utils.slots`), for holding very large numbers of objects at once. "stream" makes
+`list()` read the response body incrementally and decode its items one at a time (see
+`StreamedListResponse`); other requests are decoded as with "model".
+"""
+
+DEFAULT_RESPONSE_FORMAT = "model"
+""" The default response format. """
 
 
 class Region(str, Enum):
@@ -24,6 +40,7 @@ class RequestOverrides(TypedDict):
         headers: Additional headers to include in the request.
         skip_auth: Suppress the default bearer Authorization header for endpoints
             that use a different authentication mechanism.
+        response_format: How to decode the response, overriding the client's default.
     """
 
     api_key: NotRequired[str]
@@ -31,6 +48,7 @@ class RequestOverrides(TypedDict):
     timeout: NotRequired[int]
     headers: NotRequired[dict]
     skip_auth: NotRequired[bool]
+    response_format: NotRequired[ResponseFormat]
 
 
 DEFAULT_REGION = Region.US
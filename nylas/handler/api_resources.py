@@ -1,10 +1,70 @@
 from __future__ import annotations
 
-from nylas.models.response import Response, ListResponse, DeleteResponse
-from nylas.resources.resource import Resource
+import functools
+import inspect
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+from nylas.handler.json_stream import CHUNK_SIZE, JsonListParser
+from nylas.handler.prefetch import aprefetching, prefetching
+from nylas.models.response import (
+    AsyncStreamedListResponse,
+    DeleteResponse,
+    ListResponse,
+    Response,
+    StreamedListResponse,
+)
+from nylas.utils.decoder import get_decoder
+from nylas.resources.resource import Resource, list_response_decoder
 
 # pylint: disable=too-few-public-methods,missing-class-docstring,missing-function-docstring
 
+MAX_PAGE_SIZE = 200
+"""The largest page size the Nylas API accepts for the `limit` query parameter."""
+
+
+@functools.lru_cache(maxsize=256)
+def _stream_item_decoder(response_type, interner=None):
+    decode_item = get_decoder(response_type, infer_missing=True)
+    if interner is None:
+        return decode_item
+    return lambda item: decode_item(interner.intern_item(item))
+
+
+async def _astream(response, parser, decode_item) -> AsyncStreamedListResponse:
+    response = await response
+    return AsyncStreamedListResponse(
+        response.aiter_bytes(CHUNK_SIZE),
+        parser,
+        decode_item,
+        response.headers,
+        aclose=response.aclose,
+    )
+
+
+async def _aitems(page) -> AsyncIterator[Any]:
+    if isinstance(page, AsyncStreamedListResponse):
+        async for item in page:
+            yield item
+    else:
+        for item in page.data:
+            yield item
+
+
+def _first_page_params(query_params: Optional[dict], limit: Optional[int]) -> dict:
+    params = dict(query_params or {})
+    if limit is not None:
+        params["limit"] = max(1, min(limit, MAX_PAGE_SIZE))
+    return params
+
+
+def _limit_for(max_items: Optional[int], kwargs: dict) -> Optional[int]:
+    limit = kwargs.pop("limit", None)
+    if limit is None and max_items is not None:
+        # Avoid downloading a full default-sized page when only a few items are wanted.
+        page_size = (kwargs.get("query_params") or {}).get("limit", MAX_PAGE_SIZE)
+        limit = min(page_size, max_items)
+    return limit
+
 
 class ListableApiResource(Resource):
     def list(
@@ -16,11 +76,227 @@ class ListableApiResource(Resource):
         request_body=None,
         overrides=None,
     ) -> ListResponse:
-        response_json, response_headers = self._http_client._execute(
-            "GET", path, headers, query_params, request_body, overrides=overrides
+        response_format = self._response_format(overrides)
+        if response_format == "stream":
+            return self._stream(path, response_type, headers, query_params, overrides)
+        return self._request(
+            list_response_decoder(
+                response_format,
+                response_type,
+                self._string_interner(),
+            ),
+            "GET",
+            path,
+            headers,
+            query_params,
+            request_body,
+            overrides=overrides,
+        )
+
+    def _stream(self, path, response_type, headers, query_params, overrides):
+        """
+        List with the "stream" response format, reading the items from the response body
+        as it arrives.
+
+        Returns:
+            A StreamedListResponse, or a coroutine resolving to an AsyncStreamedListResponse
+            for async clients.
+        """
+        parser = JsonListParser(loads=self._http_client.json_codec.loads)
+        decode_item = _stream_item_decoder(response_type, self._string_interner())
+        response = self._http_client._execute_stream(
+            path, headers, query_params, overrides
+        )
+        if inspect.isawaitable(response):
+            return _astream(response, parser, decode_item)
+        return StreamedListResponse(
+            response.iter_content(CHUNK_SIZE),
+            parser,
+            decode_item,
+            response.headers,
+            close=response.close,
+        )
+
+    def iter_pages(
+        self,
+        *args,
+        query_params: Optional[dict] = None,
+        limit: Optional[int] = None,
+        list_method: Optional[Callable[..., Any]] = None,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[ListResponse]:
+        """
+        Lazily fetch every page of a list endpoint, following the response cursors.
+
+        By default only one page is held at a time: the next page is requested after the
+        caller is done with the current one. With `prefetch`, upcoming pages are requested in
+        a background thread while the caller processes the current one, buffering at most
+        `prefetch` pages ahead. With the "stream" response format, each page is a
+        StreamedListResponse whose unread items are skipped once the next page is requested;
+        prefetching is not supported then.
+
+        Args:
+            *args: Positional arguments for the list method, e.g. the grant identifier.
+            query_params: The query parameters of the first page.
+            limit: The page size to request, capped at MAX_PAGE_SIZE.
+            list_method: The list method to paginate, e.g. `client.lists.list_items`.
+                Defaults to this resource's `list` method.
+            prefetch: The number of pages to fetch ahead of the caller. Defaults to 0,
+                which disables prefetching.
+            **kwargs: Keyword arguments for the list method, e.g. overrides.
+
+        Returns:
+            An iterator over the ListResponse of each page.
+        """
+        pages = self._pages(
+            list_method if list_method is not None else self.list,
+            args,
+            kwargs,
+            _first_page_params(query_params, limit),
+        )
+        if prefetch:
+            self._check_prefetch(kwargs)
+            return prefetching(pages, prefetch)
+        return pages
+
+    def list_all(
+        self, *args, max_items: Optional[int] = None, **kwargs
+    ) -> Iterator[Any]:
+        """
+        Lazily iterate over every item of a list endpoint across all of its pages.
+
+        Args:
+            *args: Positional arguments for the list method, e.g. the grant identifier.
+            max_items: The maximum number of items to yield. Defaults to all of them.
+            **kwargs: Keyword arguments for iter_pages(), e.g. query_params, limit,
+                list_method, prefetch or overrides.
+
+        Returns:
+            An iterator over the items.
+        """
+        if max_items is not None and max_items <= 0:
+            return
+        count = 0
+        limit = _limit_for(max_items, kwargs)
+        pages = self.iter_pages(*args, limit=limit, **kwargs)
+        try:
+            for page in pages:
+                for item in page.data:
+                    yield item
+                    count += 1
+                    if max_items is not None and count >= max_items:
+                        return
+        finally:
+            pages.close()
+
+    def aiter_pages(
+        self,
+        *args,
+        query_params: Optional[dict] = None,
+        limit: Optional[int] = None,
+        list_method: Optional[Callable[..., Any]] = None,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> AsyncIterator[ListResponse]:
+        """
+        Async version of iter_pages() for resources of an AsyncClient.
+
+        Prefetched pages are requested in a background task instead of a thread.
+
+        Returns:
+            An async iterator over the ListResponse of each page.
+        """
+        pages = self._apages(
+            list_method if list_method is not None else self.list,
+            args,
+            kwargs,
+            _first_page_params(query_params, limit),
         )
+        if prefetch:
+            self._check_prefetch(kwargs)
+            return aprefetching(pages, prefetch)
+        return pages
+
+    async def alist_all(
+        self, *args, max_items: Optional[int] = None, **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        Async version of list_all() for resources of an AsyncClient.
+
+        Returns:
+            An async iterator over the items.
+        """
+        if max_items is not None and max_items <= 0:
+            return
+        count = 0
+        limit = _limit_for(max_items, kwargs)
+        pages = self.aiter_pages(*args, limit=limit, **kwargs)
+        try:
+            async for page in pages:
+                async for item in _aitems(page):
+                    yield item
+                    count += 1
+                    if max_items is not None and count >= max_items:
+                        return
+        finally:
+            await pages.aclose()
+
+    def _pages(self, list_method, args, kwargs, params) -> Iterator[ListResponse]:
+        while params is not None:
+            if params:
+                kwargs["query_params"] = dict(params)
+            page = list_method(*args, **kwargs)
+            streamed = isinstance(page, StreamedListResponse)
+            try:
+                yield page
+            except GeneratorExit:
+                if streamed:
+                    page.close()
+                raise
+            if streamed:
+                # The cursor follows the items, which the caller may not have read.
+                page.finish()
+            params = self._next_page_params(page, params)
+            del page
+
+    async def _apages(self, list_method, args, kwargs, params) -> AsyncIterator[ListResponse]:
+        while params is not None:
+            if params:
+                kwargs["query_params"] = dict(params)
+            page = await list_method(*args, **kwargs)
+            streamed = isinstance(page, AsyncStreamedListResponse)
+            try:
+                yield page
+            except GeneratorExit:
+                if streamed:
+                    await page.aclose()
+                raise
+            if streamed:
+                await page.finish()
+            params = self._next_page_params(page, params)
+            del page
+
+    def _check_prefetch(self, kwargs: dict) -> None:
+        # A streamed page is read while the caller iterates over it, so the cursor of the
+        # next page is not known ahead of time.
+        if self._response_format(kwargs.get("overrides")) == "stream":
+            raise ValueError("prefetch cannot be used with the stream response format")
 
-        return ListResponse.from_dict(response_json, response_type, response_headers)
+    def _next_page_params(self, page: ListResponse, params: dict) -> Optional[dict]:
+        """
+        Get the query parameters of the page following the given one.
+
+        Args:
+            page: The page that was just fetched.
+            params: The query parameters it was fetched with.
+
+        Returns:
+            The query parameters of the next page, or None if this was the last page.
+        """
+        if not page.next_cursor:
+            return None
+        return {**params, "page_token": page.next_cursor}
 
 
 class FindableApiResource(Resource):
@@ -33,12 +309,16 @@ class FindableApiResource(Resource):
         request_body=None,
         overrides=None,
     ) -> Response:
-        response_json, response_headers = self._http_client._execute(
-            "GET", path, headers, query_params, request_body, overrides=overrides
+        return self._request(
+            self._decoder(response_type, overrides),
+            "GET",
+            path,
+            headers,
+            query_params,
+            request_body,
+            overrides=overrides,
         )
 
-        return Response.from_dict(response_json, response_type, response_headers)
-
 
 class CreatableApiResource(Resource):
     def create(
@@ -55,12 +335,16 @@ class CreatableApiResource(Resource):
         kwargs = {"overrides": overrides}
         if serialized_json_body is not None:
             kwargs["serialized_json_body"] = serialized_json_body
-        response_json, response_headers = self._http_client._execute(
-            "POST", path, headers, query_params, request_body, **kwargs
+        return self._request(
+            self._decoder(response_type, overrides),
+            "POST",
+            path,
+            headers,
+            query_params,
+            request_body,
+            **kwargs,
         )
 
-        return Response.from_dict(response_json, response_type, response_headers)
-
 
 class UpdatableApiResource(Resource):
     def update(
@@ -77,12 +361,16 @@ class UpdatableApiResource(Resource):
         kwargs = {"overrides": overrides}
         if serialized_json_body is not None:
             kwargs["serialized_json_body"] = serialized_json_body
-        response_json, response_headers = self._http_client._execute(
-            method, path, headers, query_params, request_body, **kwargs
+        return self._request(
+            self._decoder(response_type, overrides),
+            method,
+            path,
+            headers,
+            query_params,
+            request_body,
+            **kwargs,
         )
 
-        return Response.from_dict(response_json, response_type, response_headers)
-
 
 class UpdatablePatchApiResource(Resource):
     def patch(
@@ -99,12 +387,16 @@ class UpdatablePatchApiResource(Resource):
         kwargs = {"overrides": overrides}
         if serialized_json_body is not None:
             kwargs["serialized_json_body"] = serialized_json_body
-        response_json, response_headers = self._http_client._execute(
-            method, path, headers, query_params, request_body, **kwargs
+        return self._request(
+            self._decoder(response_type, overrides),
+            method,
+            path,
+            headers,
+            query_params,
+            request_body,
+            **kwargs,
         )
 
-        return Response.from_dict(response_json, response_type, response_headers)
-
 
 class DestroyableApiResource(Resource):
     def destroy(
@@ -119,11 +411,22 @@ class DestroyableApiResource(Resource):
         if response_type is None:
             response_type = DeleteResponse
 
-        response_json, response_headers = self._http_client._execute(
-            "DELETE", path, headers, query_params, request_body, overrides=overrides
-        )
-
         # Check if the response type is a dataclass_json class
-        if hasattr(response_type, "from_dict") and not hasattr(response_type, "headers"):
-            return response_type.from_dict(response_json)
-        return response_type.from_dict(response_json, headers=response_headers)
+        if hasattr(response_type, "from_dict") and not hasattr(
+            response_type, "headers"
+        ):
+            decode = self._model_decoder(response_type, overrides)
+        else:
+
+            def decode(response_json, response_headers):
+                return response_type.from_dict(response_json, headers=response_headers)
+
+        return self._request(
+            decode,
+            "DELETE",
+            path,
+            headers,
+            query_params,
+            request_body,
+            overrides=overrides,
+        )
@@ -0,0 +1,343 @@
+import asyncio
+import functools
+import time
+from urllib.parse import urlparse
+from typing import Union, Tuple, Dict, Optional
+
+from nylas.config import DEFAULT_RESPONSE_FORMAT, ResponseFormat
+from nylas.handler.http_client import (
+    HttpClient,
+    _NoCookiesPolicy,
+    _body_size,
+    _validate_response,
+    _encode_json_body,
+)
+from nylas.handler.compression import Compression
+from nylas.handler.hooks import AsyncTrace, Hooks, current_request
+from nylas.handler.http2 import DEFAULT_MAX_STREAMS, require_http2
+from nylas.handler.invalid_grants import InvalidGrantCache
+from nylas.handler.json_codec import default_json_codec
+from nylas.handler.rate_limiter import RateLimiter
+from nylas.handler.response_cache import ResponseCache
+from nylas.handler.retry import RetryPolicy, RETRY_COUNT_HEADER
+from nylas.handler.revalidation import RevalidationCache
+from nylas.handler.single_flight import SingleFlight
+from nylas.models.errors import NylasSdkTimeoutError
+from nylas.utils.interning import StringInterner
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    httpx = None
+
+
+# pylint: disable=invalid-overridden-method
+
+DEFAULT_MAX_CONNECTIONS = 100
+"""The default number of concurrent connections the async client keeps open."""
+
+
+def _build_async_session(max_connections: int, http2: bool = False, transport=None):
+    if httpx is None:
+        raise ImportError(
+            "The Nylas AsyncClient requires httpx. Install it with `pip install nylas[async]`."
+        )
+    if http2:
+        require_http2()
+
+    limits = httpx.Limits(
+        max_connections=max_connections, max_keepalive_connections=max_connections
+    )
+    client = httpx.AsyncClient(limits=limits, http2=http2, transport=transport)
+    client.cookies.jar.set_policy(_NoCookiesPolicy())
+    return client
+
+
+class AsyncHttpClient(HttpClient):
+    """
+    Non-blocking HTTP client for the Nylas API.
+
+    Request building and response validation are shared with HttpClient; requests are sent
+    over a pooled httpx.AsyncClient, so `_execute`, `_execute_download_request` and
+    `_execute_stream` are coroutines. Await close() when the client is no longer needed. With `http2`, requests are
+    multiplexed over HTTP/2 connections, falling back to HTTP/1.1 for hosts without it. A
+    `transport` (an httpx async transport, such as nylas.handler.transport.LocalTransport)
+    replaces the connection pool and sends every request. Callbacks registered on `hooks`
+    are called with the timings of every request, and an InvalidGrantCache fails requests
+    for invalid grants, as with HttpClient.
+    """
+
+    # pylint: disable=super-init-not-called
+    def __init__(
+        self,
+        api_server,
+        api_key,
+        timeout,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_format: ResponseFormat = DEFAULT_RESPONSE_FORMAT,
+        json_codec=None,
+        string_interner: Optional[StringInterner] = None,
+        response_cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        revalidation_cache: Optional[RevalidationCache] = None,
+        compression: Optional[Compression] = None,
+        http2: bool = False,
+        http2_max_streams: int = DEFAULT_MAX_STREAMS,
+        transport=None,
+        hooks: Optional[Hooks] = None,
+        invalid_grant_cache: Optional[InvalidGrantCache] = None,
+    ):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        self.api_server = api_server
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.response_format = response_format
+        self.json_codec = json_codec if json_codec is not None else default_json_codec()
+        self.string_interner = string_interner
+        self.response_cache = response_cache
+        self.single_flight = single_flight
+        self.revalidation_cache = revalidation_cache
+        self.compression = compression
+        self.http2 = http2
+        self.http2_max_streams = http2_max_streams
+        self._streams: Dict[Tuple[str, str], asyncio.Semaphore] = {}
+        self.hooks = hooks if hooks is not None else Hooks()
+        self.invalid_grant_cache = invalid_grant_cache
+        self.session = _build_async_session(max_connections, http2, transport)
+
+    async def close(self) -> None:
+        """Close the pooled session and release any open connections."""
+        await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _execute(
+        self,
+        method,
+        path,
+        headers=None,
+        query_params=None,
+        request_body=None,
+        data=None,
+        overrides=None,
+        serialized_json_body=None,
+    ) -> Tuple[Dict, Dict]:
+        # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        request = self._build_request(
+            method,
+            path,
+            headers,
+            query_params,
+            request_body,
+            data,
+            overrides,
+            serialized_json_body=serialized_json_body,
+        )
+
+        self._add_idempotency_key(request)
+
+        cache_key, cached = self._cache_lookup(method, path, request)
+        if cached is not None:
+            return self._cached_response(cached)
+
+        with self._guard_grant(path), self._observe(method, path, request) as info:
+            revalidation = self._revalidation_lookup(method, request)
+
+            timeout = self._resolve_timeout(overrides)
+            content = self._compress_body(
+                request,
+                _encode_json_body(
+                    request_body, data, serialized_json_body, self.json_codec
+                ),
+                signed=serialized_json_body is not None,
+            )
+            if data is not None:
+                # Multipart encoders are file-like; httpx needs the encoded bytes.
+                content = data.to_string() if hasattr(data, "to_string") else data
+            if info is not None:
+                info.bytes_out = _body_size(content)
+            send = functools.partial(self._send, request, timeout, content=content)
+            flight_key = self._flight_key(method, request)
+            try:
+                response = await (
+                    send()
+                    if flight_key is None
+                    else self.single_flight.ado(flight_key, send)
+                )
+            finally:
+                self._cache_invalidate(method, path)
+
+            result = self._resolve_observed(info, response, revalidation)
+            self._cache_store(cache_key, path, response)
+            self._record_grant(path, result)
+        if info is not None:
+            self.hooks.finish(info)
+        return result
+
+    async def _execute_download_request(
+        self,
+        path,
+        headers=None,
+        query_params=None,
+        stream=False,
+        overrides=None,
+    ) -> Union[bytes, "httpx.Response", dict]:
+        request = self._build_request("GET", path, headers, query_params, overrides)
+
+        with self._guard_grant(path), self._observe("GET", path, request) as info:
+            timeout = self._resolve_timeout(overrides)
+            response = await self._send(request, timeout, stream=stream)
+
+            if not response.is_success:
+                await response.aread()
+                await response.aclose()
+                result = _validate_response(response, self.json_codec)
+            # If we stream return the response for async iteration, otherwise the entire
+            # byte array
+            elif stream:
+                result = response
+            else:
+                result = response.content if response.content else None
+            if info is not None:
+                self._observe_response(info, response, stream)
+        if info is not None:
+            self.hooks.finish(info)
+        return result
+
+    async def _execute_stream(
+        self,
+        path,
+        headers=None,
+        query_params=None,
+        overrides=None,
+    ) -> "httpx.Response":
+        request = self._build_request(
+            "GET", path, headers, query_params, overrides=overrides
+        )
+
+        with self._guard_grant(path), self._observe("GET", path, request) as info:
+            timeout = self._resolve_timeout(overrides)
+            response = await self._send(request, timeout, stream=True)
+            if info is not None:
+                self._observe_response(info, response, stream=True)
+            if response.status_code >= 400:
+                await response.aread()
+                await response.aclose()
+                _validate_response(response, self.json_codec)
+        if info is not None:
+            self.hooks.finish(info)
+        return response
+
+    def _wire_size(self, response) -> int:
+        return response.num_bytes_downloaded
+
+    async def _send_once(
+        self, request: dict, timeout, stream=False, trace=None, **kwargs
+    ) -> "httpx.Response":
+        streams = self._http2_streams(request["url"])
+        if streams is not None:
+            try:
+                await asyncio.wait_for(streams.acquire(), timeout)
+            except asyncio.TimeoutError as exc:
+                raise httpx.PoolTimeout(
+                    "Timed out waiting for an HTTP/2 stream"
+                ) from exc
+        try:
+            return await self.session.send(
+                self.session.build_request(
+                    request["method"],
+                    request["url"],
+                    headers=request["headers"],
+                    timeout=timeout,
+                    extensions={"trace": trace} if trace is not None else None,
+                    **kwargs,
+                ),
+                stream=stream,
+            )
+        finally:
+            if streams is not None:
+                streams.release()
+
+    def _http2_streams(self, url: str) -> Optional[asyncio.Semaphore]:
+        # Caps the requests in flight to a host at http2_max_streams. httpx multiplexes all
+        # of a host's requests over one HTTP/2 connection while it is usable, so this caps
+        # the streams of that connection; httpx also honors the server's
+        # SETTINGS_MAX_CONCURRENT_STREAMS. Created lazily, inside the event loop.
+        if not self.http2:
+            return None
+        parsed = urlparse(url)
+        origin = (parsed.scheme, parsed.netloc)
+        streams = self._streams.get(origin)
+        if streams is None:
+            streams = self._streams[origin] = asyncio.Semaphore(self.http2_max_streams)
+        return streams
+
+    async def _send(
+        self, request: dict, timeout, replayable=True, stream=False, **kwargs
+    ) -> "httpx.Response":
+        # pylint: disable=too-many-branches,too-many-locals
+        policy = self.retry_policy
+        retryable = (
+            policy is not None
+            and replayable
+            and policy.is_retryable_request(request["method"], request["headers"])
+        )
+        limiter = self.rate_limiter
+        path = urlparse(request["url"]).path
+        info = current_request() if self.hooks else None
+        trace = None
+        started_at = time.monotonic()
+        retries = 0
+        while True:
+            if limiter is not None:
+                wait = limiter.reserve(path)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            if info is not None:
+                info.connect = info.tls = info.ttfb = None
+                trace = AsyncTrace(info)
+            try:
+                response = await self._send_once(
+                    request, timeout, stream, trace, **kwargs
+                )
+            except httpx.TimeoutException as exc:
+                raise NylasSdkTimeoutError(url=request["url"], timeout=timeout) from exc
+            except (httpx.NetworkError, httpx.RemoteProtocolError) as exc:
+                delay = (
+                    policy.next_delay(retries + 1, started_at) if retryable else None
+                )
+                if delay is None:
+                    raise
+                if info is not None:
+                    self.hooks.retry(info, delay, error=exc)
+            else:
+                if limiter is not None:
+                    limiter.update(path, response.status_code, response.headers)
+                delay = None
+                if retryable and response.status_code in policy.retry_statuses:
+                    delay = policy.next_delay(
+                        retries + 1, started_at, response.headers.get("Retry-After")
+                    )
+                if delay is None:
+                    if policy is not None:
+                        response.headers[RETRY_COUNT_HEADER] = str(retries)
+                    if not stream:
+                        self._record_response_size(response)
+                    if trace is not None:
+                        trace.complete(stream)
+                    return response
+                if info is not None:
+                    self.hooks.retry(info, delay, status_code=response.status_code)
+                await response.aclose()
+
+            retries += 1
+            await asyncio.sleep(delay)
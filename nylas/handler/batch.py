@@ -0,0 +1,305 @@
+"""
+Bounded-concurrency execution of many independent SDK calls.
+
+A `Batch` runs the calls added to it in a thread pool, keeping at most `max_concurrency` of
+them in flight, and yields a `BatchResult` for each call as it completes or in the order the
+calls were added. A failing call does not stop the others: its exception is returned in its
+result. `AsyncBatch` does the same with tasks for the coroutines of an AsyncClient.
+
+The calls go through the client as usual, so they share its connection pool and its rate
+limiter and retry policy apply. Only `max_concurrency` calls are submitted at a time, so
+thousands of calls do not queue up thousands of requests or results.
+"""
+
+import collections
+import functools
+import inspect
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from nylas.handler.http_client import DEFAULT_POOL_MAXSIZE
+
+T = TypeVar("T")
+
+
+class BatchResult(Generic[T]):
+    """
+    The outcome of one call of a batch.
+
+    Attributes:
+        index: The position of the call in the batch.
+        value: The value returned by the call, or None if it failed.
+        error: The exception raised by the call, or None if it succeeded.
+    """
+
+    __slots__ = ("index", "value", "error")
+
+    def __init__(
+        self, index: int, value: Optional[T] = None, error: Optional[Exception] = None
+    ):
+        self.index = index
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
+
+    def unwrap(self) -> T:
+        """
+        Get the value of the call, raising its exception if it failed.
+
+        Returns:
+            The value returned by the call.
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def __repr__(self) -> str:
+        outcome = f"value={self.value!r}" if self.ok else f"error={self.error!r}"
+        return f"BatchResult(index={self.index}, {outcome})"
+
+
+class _Calls:
+    # The calls shared by Batch and AsyncBatch.
+
+    def __init__(
+        self,
+        calls: Iterable[Callable[[], Any]] = (),
+        max_concurrency: int = DEFAULT_POOL_MAXSIZE,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._calls: List[Callable[[], Any]] = list(calls)
+
+    def add(self, function: Callable[..., Any], *args, **kwargs) -> int:
+        """
+        Add a call to the batch.
+
+        Args:
+            function: The function to call, e.g. `client.messages.find`.
+            *args: Positional arguments to call it with.
+            **kwargs: Keyword arguments to call it with.
+
+        Returns:
+            The index of the call, which its BatchResult carries.
+        """
+        self._calls.append(functools.partial(function, *args, **kwargs))
+        return len(self._calls) - 1
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+def _call(index: int, call: Callable[[], Any]) -> BatchResult:
+    try:
+        return BatchResult(index, call())
+    except Exception as exc:  # pylint: disable=broad-except
+        return BatchResult(index, error=exc)
+
+
+async def _acall(index: int, call: Callable[[], Any]) -> BatchResult:
+    try:
+        value = call()
+        if inspect.isawaitable(value):
+            value = await value
+        return BatchResult(index, value)
+    except Exception as exc:  # pylint: disable=broad-except
+        return BatchResult(index, error=exc)
+
+
+class Batch(_Calls):
+    """
+    Runs many independent calls in a thread pool with bounded concurrency.
+
+    Create one with `client.batch()`, add calls with add(), then iterate over results() or
+    call run(). Each of these runs all of the calls again.
+
+    Args:
+        calls: Callables without arguments to run, in addition to those added with add().
+        max_concurrency: The maximum number of calls in flight at once. Keep it at most
+            the client's `pool_maxsize`, or requests will open connections the pool
+            cannot keep. Defaults to the default `pool_maxsize`.
+    """
+
+    def results(self, ordered: bool = False) -> Iterator[BatchResult]:
+        """
+        Run the calls, yielding the result of each one.
+
+        Closing the iterator early cancels the calls that have not started.
+
+        Args:
+            ordered: Whether to yield the results in the order the calls were added,
+                rather than as they complete. A slow call then holds back the results
+                after it, though the calls after it keep running.
+
+        Returns:
+            An iterator over the BatchResult of each call.
+        """
+        return _run_bounded(self._calls, self.max_concurrency, ordered)
+
+    def run(self) -> List[BatchResult]:
+        """
+        Run the calls and wait for all of them.
+
+        Returns:
+            The BatchResult of each call, in the order the calls were added.
+        """
+        return list(self.results(ordered=True))
+
+
+class AsyncBatch(_Calls):
+    """
+    Async version of Batch for an AsyncClient: the calls return coroutines, which run as
+    tasks on the current event loop. Create one with `client.batch()`, then iterate over
+    results() with `async for` or await run().
+
+    Args:
+        calls: Callables without arguments to run, in addition to those added with add().
+        max_concurrency: The maximum number of calls in flight at once.
+    """
+
+    async def results(self, ordered: bool = False) -> AsyncIterator[BatchResult]:
+        """
+        Run the calls, yielding the result of each one.
+
+        Closing the iterator early cancels the calls in flight.
+
+        Args:
+            ordered: Whether to yield the results in the order the calls were added,
+                rather than as they complete.
+
+        Returns:
+            An async iterator over the BatchResult of each call.
+        """
+        async for result in _arun_bounded(self._calls, self.max_concurrency, ordered):
+            yield result
+
+    async def run(self) -> List[BatchResult]:
+        """
+        Run the calls and wait for all of them.
+
+        Returns:
+            The BatchResult of each call, in the order the calls were added.
+        """
+        return [result async for result in self.results(ordered=True)]
+
+
+def _index(result: BatchResult) -> int:
+    return result.index
+
+
+def _run_bounded(
+    calls: Iterable[Callable[[], Any]], max_concurrency: int, ordered: bool = False
+) -> Iterator[BatchResult]:
+    # Runs the calls in a thread pool, taking the next one from the iterable only once a
+    # slot is free, so that it can be a lazy stream of calls.
+    calls = enumerate(calls)
+    in_flight = collections.deque() if ordered else set()
+    executor = ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="nylas-batch"
+    )
+
+    def submit() -> None:
+        entry = next(calls, None)
+        if entry is None:
+            return
+        future = executor.submit(_call, *entry)
+        if ordered:
+            in_flight.append(future)
+        else:
+            in_flight.add(future)
+
+    try:
+        for _ in range(max_concurrency):
+            submit()
+        while in_flight:
+            if ordered:
+                done = [in_flight.popleft()]
+            else:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                in_flight.difference_update(done)
+            results = sorted((future.result() for future in done), key=_index)
+            for result in results:
+                submit()
+                yield result
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def _arun_bounded(
+    calls: Union[Iterable[Callable[[], Any]], AsyncIterable[Callable[[], Any]]],
+    max_concurrency: int,
+    ordered: bool = False,
+) -> AsyncIterator[BatchResult]:
+    # Async version of _run_bounded(); the calls can also come from an async iterable.
+    # Imported here so that synchronous users do not pay for importing asyncio.
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    calls = _aenumerate(calls)
+    in_flight = collections.deque() if ordered else set()
+
+    async def submit() -> None:
+        try:
+            entry = await calls.__anext__()  # pylint: disable=unnecessary-dunder-call
+        except StopAsyncIteration:
+            return
+        task = asyncio.ensure_future(_acall(*entry))
+        if ordered:
+            in_flight.append(task)
+        else:
+            in_flight.add(task)
+
+    try:
+        for _ in range(max_concurrency):
+            await submit()
+        while in_flight:
+            if ordered:
+                done = [in_flight.popleft()]
+                await done[0]
+            else:
+                done, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                in_flight.difference_update(done)
+            results = sorted((task.result() for task in done), key=_index)
+            for result in results:
+                await submit()
+                yield result
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        await calls.aclose()
+
+
+async def _aenumerate(calls) -> AsyncIterator[Tuple[int, Callable[[], Any]]]:
+    # Enumerates a sync or async iterable.
+    index = 0
+    if hasattr(calls, "__aiter__"):
+        async for call in calls:
+            yield index, call
+            index += 1
+    else:
+        for call in calls:
+            yield index, call
+            index += 1
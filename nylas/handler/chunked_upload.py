@@ -0,0 +1,351 @@
+"""
+Uploading large files to attachment upload sessions in chunks.
+
+The bytes of a file are PUT to the pre-signed URL of an upload session one chunk at a time,
+each with a `Content-Range` header, so only one chunk is held in memory whatever the size of
+the file. A chunk that fails with a retryable status or a connection error is sent again
+according to a RetryPolicy. When the upload URL answers with `nextExpectedRanges`, the
+upload resumes from the first byte it expects; if it keeps expecting the same bytes the
+upload fails instead of sending them forever. The upload URL expects the ranges in order,
+so chunks are sent one after another.
+
+The file is hashed with SHA-256 as it is read, and the number of bytes read is checked
+against the declared size, so a file that changes or ends early is detected before the
+session is completed.
+"""
+
+import hashlib
+import json
+import mimetypes
+import os
+import time
+from typing import IO, Callable, Optional, Union
+
+from nylas.handler.retry import RetryPolicy
+from nylas.models.errors import NylasUploadError
+
+CHUNK_ALIGNMENT = 320 * 1024
+"""Chunk sizes must be a multiple of this many bytes, except for the last chunk."""
+
+DEFAULT_CHUNK_SIZE = 10 * CHUNK_ALIGNMENT
+"""The default number of bytes sent per chunk."""
+
+MAX_UPLOAD_SIZE = 157_286_400
+"""The largest file an upload session accepts, in bytes (150 MB)."""
+
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+"""The content type of files whose type cannot be guessed from their name."""
+
+MAX_STALLED_CHUNKS = 5
+"""How many chunks in a row the upload URL may accept without expecting any later byte."""
+
+# Progress callbacks receive the number of bytes the upload URL has and the file size.
+ProgressCallback = Callable[[int, int], None]
+
+
+class ChunkedUpload:
+    """
+    The upload of one file to an attachment upload session, in chunks.
+
+    Use it as a context manager: a file opened from a path is closed on exit. Create the
+    upload session with session_request(), then call run(), or await arun() with an async
+    HTTP client, with the session.
+
+    Args:
+        http_client: The HTTP client whose session sends the chunks.
+        file: The path of the file, or a binary file object read from its current position.
+        filename: The name of the attachment. Defaults to the name of the file.
+        content_type: The MIME type of the attachment. Guessed from its name by default.
+        size: The number of bytes to upload. Defaults to the rest of the file, and is
+            required for file objects that cannot seek.
+        chunk_size: The number of bytes per chunk, rounded down to a multiple of
+            CHUNK_ALIGNMENT.
+        sha256: The expected SHA-256 hex digest of the file.
+        on_progress: Called with the number of bytes uploaded and the size after each chunk.
+        timeout: The timeout of each chunk request, in seconds.
+
+    Attributes:
+        sha256: The SHA-256 hex digest of the uploaded bytes, once the upload is complete.
+    """
+
+    def __init__(
+        self,
+        http_client,
+        file: Union[str, os.PathLike, IO[bytes]],
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        size: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        sha256: Optional[str] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        timeout: Optional[float] = None,
+    ):
+        if chunk_size < CHUNK_ALIGNMENT:
+            raise ValueError(f"chunk_size must be at least {CHUNK_ALIGNMENT} bytes")
+        self.chunk_size = chunk_size - chunk_size % CHUNK_ALIGNMENT
+        self.expected_sha256 = sha256.lower() if sha256 else None
+        self.on_progress = on_progress
+        self.timeout = timeout if timeout is not None else http_client.timeout
+        self.retry_policy = http_client.retry_policy or RetryPolicy()
+        self.sha256: Optional[str] = None
+        self._http_client = http_client
+        self._owns_file = isinstance(file, (str, os.PathLike))
+        self._file = (
+            open(file, "rb")  # pylint: disable=consider-using-with
+            if self._owns_file
+            else file
+        )
+        try:
+            self.filename = filename or os.path.basename(
+                str(getattr(self._file, "name", "") or "")
+            )
+            if not self.filename:
+                raise ValueError("filename is required for file objects without a name")
+            self.content_type = (
+                content_type
+                or mimetypes.guess_type(self.filename)[0]
+                or DEFAULT_CONTENT_TYPE
+            )
+            self._base = self._file.tell() if self._file.seekable() else 0
+            self.size = size if size is not None else self._remaining_size()
+            if self.size > MAX_UPLOAD_SIZE:
+                raise ValueError(
+                    f"The file is {self.size} bytes; upload sessions accept at most "
+                    f"{MAX_UPLOAD_SIZE} bytes"
+                )
+        except BaseException:
+            self.close()
+            raise
+        self._position = 0
+        self._hash = hashlib.sha256()
+        self._hashed = 0
+        self._stalled = 0
+
+    def _remaining_size(self) -> int:
+        if not self._file.seekable():
+            raise ValueError("size is required for file objects that cannot seek")
+        size = self._file.seek(0, os.SEEK_END) - self._base
+        self._file.seek(self._base)
+        return size
+
+    def session_request(self) -> dict:
+        """
+        Build the request body to create the upload session with.
+
+        Returns:
+            The CreateAttachmentUploadSessionRequest for the file.
+        """
+        return {
+            "filename": self.filename,
+            "content_type": self.content_type,
+            "size": self.size,
+        }
+
+    def run(self, session) -> None:
+        """
+        Upload the file to an upload session.
+
+        Args:
+            session: The AttachmentUploadSession to upload to.
+
+        Raises:
+            NylasUploadError: A chunk could not be uploaded, or the file does not match its
+                declared size or SHA-256 digest.
+        """
+        offset = 0
+        while offset < self.size:
+            end = min(offset + self.chunk_size, self.size)
+            chunk = self._read(session, offset, end - offset)
+            headers = _chunk_headers(session, offset, end, self.size)
+            started_at = time.monotonic()
+            retries = 0
+            while True:
+                try:
+                    response = self._http_client.session.put(
+                        session.url, data=chunk, headers=headers, timeout=self.timeout
+                    )
+                except OSError as exc:
+                    # requests' connection errors and timeouts are IOErrors.
+                    delay = self._retry_delay(session, retries, started_at, offset, exc)
+                else:
+                    if response.status_code < 300:
+                        break
+                    delay = self._retry_delay(
+                        session, retries, started_at, offset, response=response
+                    )
+                retries += 1
+                time.sleep(delay)
+            offset = self._advance(
+                session, response.status_code, response.content, offset, end
+            )
+        self._verify(session)
+
+    async def arun(self, session) -> None:
+        """
+        Async version of run() for an async HTTP client.
+
+        Args:
+            session: The AttachmentUploadSession to upload to.
+        """
+        # Imported here so that synchronous users do not pay for importing asyncio.
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        import httpx  # pylint: disable=import-outside-toplevel
+
+        offset = 0
+        while offset < self.size:
+            end = min(offset + self.chunk_size, self.size)
+            chunk = self._read(session, offset, end - offset)
+            headers = _chunk_headers(session, offset, end, self.size)
+            started_at = time.monotonic()
+            retries = 0
+            while True:
+                try:
+                    response = await self._http_client.session.put(
+                        session.url,
+                        content=chunk,
+                        headers=headers,
+                        timeout=self.timeout,
+                    )
+                except httpx.TransportError as exc:
+                    delay = self._retry_delay(session, retries, started_at, offset, exc)
+                else:
+                    if response.status_code < 300:
+                        break
+                    delay = self._retry_delay(
+                        session, retries, started_at, offset, response=response
+                    )
+                retries += 1
+                await asyncio.sleep(delay)
+            offset = self._advance(
+                session, response.status_code, response.content, offset, end
+            )
+        self._verify(session)
+
+    def _read(self, session, offset: int, length: int) -> bytes:
+        # Read a chunk, hashing the bytes that have not been hashed yet.
+        if offset != self._position:
+            if not self._file.seekable():
+                raise NylasUploadError(
+                    "The upload URL asked for bytes that were already read from a file "
+                    "object that cannot seek",
+                    session.attachment_id,
+                    offset,
+                )
+            self._file.seek(self._base + offset)
+        parts = []
+        remaining = length
+        while remaining:
+            part = self._file.read(remaining)
+            if not part:
+                break
+            parts.append(part)
+            remaining -= len(part)
+        data = b"".join(parts) if len(parts) != 1 else parts[0]
+        self._position = offset + len(data)
+        if remaining:
+            raise NylasUploadError(
+                f"The file ended after {self._position} bytes; expected {self.size}",
+                session.attachment_id,
+                offset,
+            )
+        if offset <= self._hashed < self._position:
+            self._hash.update(memoryview(data)[self._hashed - offset :])
+            self._hashed = self._position
+        return data
+
+    def _retry_delay(
+        self, session, retries, started_at, offset, error=None, response=None
+    ) -> float:
+        # The time to wait before sending a failed chunk again, raising if it is not retried.
+        status_code = response.status_code if response is not None else None
+        delay = None
+        if status_code is None or _is_retryable(self.retry_policy, status_code):
+            delay = self.retry_policy.next_delay(
+                retries + 1,
+                started_at,
+                response.headers.get("Retry-After") if response is not None else None,
+            )
+        if delay is not None:
+            return delay
+        reason = f"status {status_code}" if status_code is not None else repr(error)
+        raise NylasUploadError(
+            f"Uploading bytes {offset}+ of the attachment failed with {reason}",
+            session.attachment_id,
+            offset,
+            status_code,
+        ) from error
+
+    def _advance(
+        self, session, status_code: int, content: bytes, start: int, end: int
+    ) -> int:
+        # The offset of the next chunk: where the upload URL asks to continue from, if it
+        # says, or the end of the chunk just sent.
+        if status_code != 202:
+            return max(end, self._position)
+        expected = _next_expected_offset(content)
+        offset = end if expected is None else expected
+        if offset > start:
+            self._stalled = 0
+        else:
+            self._stalled += 1
+            if self._stalled >= MAX_STALLED_CHUNKS:
+                raise NylasUploadError(
+                    f"The upload URL expected bytes {offset}+ again after "
+                    f"{self._stalled} chunks starting at byte {start}",
+                    session.attachment_id,
+                    start,
+                )
+        if self.on_progress is not None:
+            self.on_progress(offset, self.size)
+        return offset
+
+    def _verify(self, session) -> None:
+        if self._hashed != self.size:
+            raise NylasUploadError(
+                f"Only {self._hashed} of {self.size} bytes were read from the file",
+                session.attachment_id,
+                self._hashed,
+            )
+        self.sha256 = self._hash.hexdigest()
+        if self.expected_sha256 is not None and self.sha256 != self.expected_sha256:
+            raise NylasUploadError(
+                f"The uploaded file has SHA-256 {self.sha256}; expected "
+                f"{self.expected_sha256}",
+                session.attachment_id,
+                self.size,
+            )
+        if self.on_progress is not None:
+            self.on_progress(self.size, self.size)
+
+    def close(self) -> None:
+        """Close the file if it was opened from a path."""
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _chunk_headers(session, offset: int, end: int, size: int) -> dict:
+    return {
+        **(session.headers or {}),
+        "Content-Length": str(end - offset),
+        "Content-Range": f"bytes {offset}-{end - 1}/{size}",
+    }
+
+
+def _is_retryable(policy: RetryPolicy, status_code: int) -> bool:
+    return status_code >= 500 or status_code in policy.retry_statuses
+
+
+def _next_expected_offset(content: bytes) -> Optional[int]:
+    # The first byte of the ranges the upload URL still expects, e.g. ["26-"] or ["0-9"].
+    try:
+        ranges = json.loads(content).get("nextExpectedRanges")
+        return min(int(expected.split("-", 1)[0]) for expected in ranges)
+    except (AttributeError, TypeError, ValueError):
+        return None
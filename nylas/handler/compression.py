@@ -0,0 +1,124 @@
+"""
+Compression of request and response bodies.
+
+Responses are decompressed by the HTTP library while the body is read, so the decoded body
+is handed straight to the JSON codec. Brotli is only negotiated when a brotli decoder the
+HTTP library supports is installed (`pip install nylas[brotli]`); gzip and deflate are
+always available.
+"""
+
+import gzip
+import threading
+from typing import Optional
+
+try:
+    import brotli  # noqa: F401 pylint: disable=unused-import
+except ImportError:  # pragma: no cover - depends on the installed extras
+    try:
+        import brotlicffi as brotli  # noqa: F401 pylint: disable=unused-import
+    except ImportError:
+        brotli = None
+
+DEFAULT_MIN_REQUEST_SIZE = 8192
+"""The default minimum size in bytes of a request body worth compressing."""
+
+DEFAULT_COMPRESSION_LEVEL = 6
+"""The default gzip level request bodies are compressed with."""
+
+
+def accept_encoding() -> str:
+    """
+    Get the content codings the client can decode, best first.
+
+    Returns:
+        The value of the Accept-Encoding request header.
+    """
+    return "br, gzip, deflate" if brotli is not None else "gzip, deflate"
+
+
+class Compression:
+    """
+    Compression settings and byte-size instrumentation for an HTTP client.
+
+    Every request asks for a compressed response with an explicit Accept-Encoding header.
+    With `compress_requests`, JSON request bodies of at least `min_request_size` bytes are
+    gzipped and sent with a `Content-Encoding: gzip` header; bodies passed as
+    `serialized_json_body` are always sent as-is, since they may be signed.
+
+    The counters accumulate the body sizes of every request sent and response received with
+    these settings, before and after compression, so the savings can be verified. A
+    Compression can be shared by several clients and is thread-safe.
+
+    Args:
+        compress_requests: Whether to gzip large JSON request bodies. Only enable this for
+            endpoints that accept compressed bodies.
+        min_request_size: The minimum size in bytes of a request body to compress.
+        level: The gzip compression level, from 1 (fastest) to 9 (smallest).
+
+    Attributes:
+        request_bytes: The total size of the request bodies before compression.
+        request_wire_bytes: The total size of the request bodies as sent.
+        response_wire_bytes: The total size of the response bodies as received.
+        response_decoded_bytes: The total size of the response bodies after decompression.
+    """
+
+    def __init__(
+        self,
+        compress_requests: bool = False,
+        min_request_size: int = DEFAULT_MIN_REQUEST_SIZE,
+        level: int = DEFAULT_COMPRESSION_LEVEL,
+    ):
+        self.compress_requests = compress_requests
+        self.min_request_size = min_request_size
+        self.level = level
+        self.accept_encoding = accept_encoding()
+        self.request_bytes = 0
+        self.request_wire_bytes = 0
+        self.response_wire_bytes = 0
+        self.response_decoded_bytes = 0
+        self._lock = threading.Lock()
+
+    def compress(self, body: bytes) -> Optional[bytes]:
+        """
+        Compress a JSON request body if it is worth it.
+
+        Args:
+            body: The encoded request body.
+
+        Returns:
+            The gzipped body, or None if it should be sent uncompressed.
+        """
+        if not self.compress_requests or len(body) < self.min_request_size:
+            return None
+        return gzip.compress(body, compresslevel=self.level, mtime=0)
+
+    def record_request(self, size: int, wire_size: int) -> None:
+        """
+        Count a request body.
+
+        Args:
+            size: The size of the body before compression.
+            wire_size: The size of the body as sent.
+        """
+        with self._lock:
+            self.request_bytes += size
+            self.request_wire_bytes += wire_size
+
+    def record_response(self, wire_size: int, decoded_size: int) -> None:
+        """
+        Count a response body.
+
+        Args:
+            wire_size: The size of the body as received.
+            decoded_size: The size of the body after decompression.
+        """
+        with self._lock:
+            self.response_wire_bytes += wire_size
+            self.response_decoded_bytes += decoded_size
+
+    @property
+    def response_ratio(self) -> Optional[float]:
+        """The received response bytes relative to their decoded size, or None if none."""
+        if not self.response_decoded_bytes:
+            return None
+        return self.response_wire_bytes / self.response_decoded_bytes
@@ -0,0 +1,365 @@
+"""
+Running an operation across every grant of an application.
+
+A `GrantFanOut` lists the grants page by page with auto-pagination, filters them, and calls
+an operation with each grant in a thread pool, keeping at most `max_concurrency` grants in
+flight (`AsyncGrantFanOut` runs them as tasks). Grants are pulled from the listing only as
+slots free up, so tens of thousands of grants are never held at once. Each grant is handled
+by a single call of the operation; combine with a RateLimiter's per-grant buckets to pace
+the requests that call makes.
+
+A failing grant does not stop the run: its exception is reported in its result and in the
+final `FanOutReport`. With a checkpoint, grants are recorded as they succeed and skipped by
+later runs, so a run that crashed can be started again and resume where it stopped.
+"""
+
+import functools
+import itertools
+import os
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Set,
+)
+
+from nylas.handler.batch import BatchResult, _arun_bounded, _run_bounded
+from nylas.handler.http_client import DEFAULT_POOL_MAXSIZE
+
+DEFAULT_PAGE_SIZE = 200
+"""The number of grants to list per page."""
+
+
+class FileCheckpoint:
+    """
+    Records the grants a fan-out has processed in a file, so that a later run over the same
+    file skips them.
+
+    Grant IDs are appended one per line and flushed as each grant succeeds, so the file stays
+    valid if the process crashes. Delete the file to start over. Any object with the same
+    `__contains__` and `mark_done` methods can be used as a checkpoint instead.
+
+    Args:
+        path: The path of the checkpoint file. It is created if it does not exist.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+        self._done: Set[str] = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self._done.update(line.strip() for line in f if line.strip())
+
+    def __contains__(self, grant_id: str) -> bool:
+        return grant_id in self._done
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def mark_done(self, grant_id: str) -> None:
+        """
+        Record that a grant has been processed.
+
+        Args:
+            grant_id: The ID of the grant.
+        """
+        with self._lock:
+            if grant_id in self._done:
+                return
+            if self._file is None:
+                self._file = open(  # pylint: disable=consider-using-with
+                    self.path, "a", encoding="utf-8"
+                )
+            self._file.write(f"{grant_id}\n")
+            self._file.flush()
+            self._done.add(grant_id)
+
+    def close(self) -> None:
+        """Close the checkpoint file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class FanOutProgress:
+    """
+    The progress of a fan-out, passed to its `on_progress` callback after each grant.
+
+    Attributes:
+        listed: The grants listed so far.
+        filtered: The grants excluded by the `where` filter.
+        skipped: The grants skipped because the checkpoint has them.
+        succeeded: The grants the operation succeeded for.
+        failed: The grants the operation failed for.
+        in_flight: The grants being processed.
+        elapsed: The seconds since the fan-out started.
+    """
+
+    __slots__ = (
+        "listed",
+        "filtered",
+        "skipped",
+        "succeeded",
+        "failed",
+        "in_flight",
+        "_started",
+    )
+
+    def __init__(self):
+        self.listed = 0
+        self.filtered = 0
+        self.skipped = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.in_flight = 0
+        self._started = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        """The seconds since the fan-out started."""
+        return time.monotonic() - self._started
+
+    def __repr__(self) -> str:
+        return (
+            f"FanOutProgress(listed={self.listed}, succeeded={self.succeeded}, "
+            f"failed={self.failed}, skipped={self.skipped}, filtered={self.filtered}, "
+            f"in_flight={self.in_flight}, elapsed={self.elapsed:.1f})"
+        )
+
+
+class FanOutReport:
+    """
+    The outcome of a whole fan-out.
+
+    Attributes:
+        succeeded: The number of grants the operation succeeded for.
+        errors: The exception raised for each grant the operation failed for, by grant ID.
+        skipped: The number of grants skipped because the checkpoint has them.
+        filtered: The number of grants excluded by the `where` filter.
+        elapsed: The seconds the fan-out took.
+    """
+
+    def __init__(self, progress: FanOutProgress, errors: Dict[str, Exception]):
+        self.succeeded = progress.succeeded
+        self.errors = errors
+        self.skipped = progress.skipped
+        self.filtered = progress.filtered
+        self.elapsed = progress.elapsed
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded for every grant."""
+        return not self.errors
+
+    def __repr__(self) -> str:
+        return (
+            f"FanOutReport(succeeded={self.succeeded}, failed={len(self.errors)}, "
+            f"skipped={self.skipped}, filtered={self.filtered}, "
+            f"elapsed={self.elapsed:.1f})"
+        )
+
+
+class GrantResult(BatchResult):
+    """
+    The outcome of the operation for one grant.
+
+    Attributes:
+        grant: The grant.
+        index: The position of the grant among those the operation was called with.
+        value: The value returned by the operation, or None if it failed.
+        error: The exception raised by the operation, or None if it succeeded.
+    """
+
+    __slots__ = ("grant",)
+
+    def __init__(self, grant, result: BatchResult):
+        super().__init__(result.index, result.value, result.error)
+        self.grant = grant
+
+
+class _FanOut:
+    # The configuration and bookkeeping shared by GrantFanOut and AsyncGrantFanOut.
+
+    def __init__(
+        self,
+        grants,
+        operation: Callable[[Any], Any],
+        grant_status: Optional[str] = None,
+        provider: Optional[str] = None,
+        query_params: Optional[dict] = None,
+        where: Optional[Callable[[Any], bool]] = None,
+        max_concurrency: int = DEFAULT_POOL_MAXSIZE,
+        checkpoint=None,
+        on_progress: Optional[Callable[[FanOutProgress], None]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        overrides: Optional[dict] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.operation = operation
+        self.where = where
+        self.max_concurrency = max_concurrency
+        self.checkpoint = checkpoint
+        self.on_progress = on_progress
+        self.page_size = page_size
+        self.progress: Optional[FanOutProgress] = None
+        self._grants = grants
+        # The grants are always decoded into models, whatever the client's response format:
+        # streamed pages cannot be prefetched, and the grants' IDs are read as attributes.
+        self._overrides = {**(overrides or {}), "response_format": "model"}
+        self._query_params = dict(query_params or {})
+        if grant_status is not None:
+            self._query_params["grant_status"] = grant_status
+        if provider is not None:
+            self._query_params["provider"] = provider
+
+    def _list_kwargs(self) -> dict:
+        return {
+            "query_params": self._query_params,
+            "limit": self.page_size,
+            "prefetch": 1,
+            "overrides": self._overrides,
+        }
+
+    def _admit(self, grant) -> bool:
+        # Whether to call the operation with a listed grant.
+        progress = self.progress
+        progress.listed += 1
+        if self.where is not None and not self.where(grant):
+            progress.filtered += 1
+            return False
+        if self.checkpoint is not None and grant.id in self.checkpoint:
+            progress.skipped += 1
+            return False
+        progress.in_flight += 1
+        return True
+
+    def _record(self, grant, result: BatchResult) -> GrantResult:
+        progress = self.progress
+        progress.in_flight -= 1
+        if result.ok:
+            progress.succeeded += 1
+            if self.checkpoint is not None:
+                self.checkpoint.mark_done(grant.id)
+        else:
+            progress.failed += 1
+        if self.on_progress is not None:
+            self.on_progress(progress)
+        return GrantResult(grant, result)
+
+
+class GrantFanOut(_FanOut):
+    """
+    Calls an operation with every grant of the application, in a thread pool.
+
+    Create one with `client.grants.fan_out()`, then iterate over results() or call run().
+
+    Args:
+        grants: The Grants resource to list the grants with.
+        operation: Called with each Grant; its return value is the grant's result value.
+        grant_status: Only process grants with this status, e.g. "valid".
+        provider: Only process grants of this provider, e.g. "google".
+        query_params: Other query parameters to list the grants with.
+        where: Called with each listed Grant; grants it returns False for are skipped.
+        max_concurrency: The maximum number of grants processed at once.
+        checkpoint: A FileCheckpoint recording the grants that succeeded, which are
+            skipped when it already has them.
+        on_progress: Called with the FanOutProgress after each grant is processed.
+        page_size: The number of grants to list per page.
+        overrides: The request overrides to list the grants with.
+
+    Attributes:
+        progress: The FanOutProgress of the current or latest run.
+    """
+
+    def results(self) -> Iterator[GrantResult]:
+        """
+        Run the operation across the grants, yielding the result of each grant as it
+        completes.
+
+        Closing the iterator early cancels the grants that have not started.
+
+        Returns:
+            An iterator over the GrantResult of each grant processed.
+        """
+        self.progress = FanOutProgress()
+        pending: Dict[int, Any] = {}
+        indexes = itertools.count()
+
+        def calls():
+            for grant in self._grants.list_all(**self._list_kwargs()):
+                if self._admit(grant):
+                    pending[next(indexes)] = grant
+                    yield functools.partial(self.operation, grant)
+
+        for result in _run_bounded(calls(), self.max_concurrency):
+            yield self._record(pending.pop(result.index), result)
+
+    def run(self) -> FanOutReport:
+        """
+        Run the operation across the grants and wait for all of them.
+
+        Returns:
+            The FanOutReport, with the error of each grant that failed.
+        """
+        errors = {
+            result.grant.id: result.error for result in self.results() if not result.ok
+        }
+        return FanOutReport(self.progress, errors)
+
+
+class AsyncGrantFanOut(_FanOut):
+    """
+    Async version of GrantFanOut for an AsyncClient. The operation may be a coroutine
+    function; the grants are processed as tasks on the current event loop. Iterate over
+    results() with `async for` or await run().
+    """
+
+    async def results(self) -> AsyncIterator[GrantResult]:
+        """
+        Run the operation across the grants, yielding the result of each grant as it
+        completes.
+
+        Returns:
+            An async iterator over the GrantResult of each grant processed.
+        """
+        self.progress = FanOutProgress()
+        pending: Dict[int, Any] = {}
+        indexes = itertools.count()
+
+        async def calls():
+            async for grant in self._grants.alist_all(**self._list_kwargs()):
+                if self._admit(grant):
+                    pending[next(indexes)] = grant
+                    yield functools.partial(self.operation, grant)
+
+        async for result in _arun_bounded(calls(), self.max_concurrency):
+            yield self._record(pending.pop(result.index), result)
+
+    async def run(self) -> FanOutReport:
+        """
+        Run the operation across the grants and wait for all of them.
+
+        Returns:
+            The FanOutReport, with the error of each grant that failed.
+        """
+        errors = {
+            result.grant.id: result.error
+            async for result in self.results()
+            if not result.ok
+        }
+        return FanOutReport(self.progress, errors)
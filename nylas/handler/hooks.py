@@ -0,0 +1,512 @@
+"""
+Request hooks and timing instrumentation for the HTTP clients.
+
+Callbacks registered on a client's `Hooks` are called with a `RequestInfo` as each request
+is sent, retried, answered or fails. The info carries the method, the path with identifiers
+templated out (`/v3/grants/{id}/messages`), the status, the request ID, the body sizes and the
+time spent in each phase: connecting, the TLS handshake, waiting for the first byte,
+downloading the body, parsing the JSON and decoding it into models. While no callbacks are
+registered the clients skip all of this work.
+
+Ready-made adapters for Prometheus and OpenTelemetry are in `nylas.handler.telemetry`.
+"""
+
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional
+
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from requests.adapters import HTTPAdapter
+
+# Literal segments of the API paths the SDK calls; any other segment is an identifier.
+_STATIC_SEGMENTS = frozenset(
+    {
+        "v3",
+        "admin",
+        "applications",
+        "attachment-uploads",
+        "attachments",
+        "auto-group",
+        "availability",
+        "bookings",
+        "calendars",
+        "cancel",
+        "clean",
+        "complete",
+        "configurations",
+        "connect",
+        "connectors",
+        "contacts",
+        "creds",
+        "custom",
+        "detect",
+        "domains",
+        "download",
+        "drafts",
+        "events",
+        "folders",
+        "free-busy",
+        "grants",
+        "groups",
+        "import",
+        "info",
+        "ip-addresses",
+        "items",
+        "leave",
+        "lists",
+        "manual-assign",
+        "me",
+        "media",
+        "messages",
+        "notetakers",
+        "policies",
+        "providers",
+        "redirect-uris",
+        "revoke",
+        "rotate-secret",
+        "rule-evaluations",
+        "rules",
+        "schedules",
+        "scheduling",
+        "send",
+        "send-rsvp",
+        "sessions",
+        "smart-compose",
+        "threads",
+        "token",
+        "tokeninfo",
+        "verify",
+        "webhooks",
+        "workspaces",
+    }
+)
+
+_current_request: ContextVar[Optional["RequestInfo"]] = ContextVar(
+    "nylas_current_request", default=None
+)
+_pending_decode: ContextVar[Optional[list]] = ContextVar(
+    "nylas_pending_decode", default=None
+)
+
+
+def template_path(path: str) -> str:
+    """
+    Replace the identifiers in an API path with `{id}`, so that requests to the same
+    endpoint share a label.
+
+    Args:
+        path: The request path, e.g. `/v3/grants/abc/messages/123`.
+
+    Returns:
+        The templated path, e.g. `/v3/grants/{id}/messages/{id}`.
+    """
+    return "/".join(
+        segment if not segment or segment in _STATIC_SEGMENTS else "{id}"
+        for segment in path.split("/")
+    )
+
+
+def current_request() -> Optional["RequestInfo"]:
+    """
+    Get the request being sent in the current thread or task.
+
+    Returns:
+        The RequestInfo of the request, or None if it is not observed by any hooks.
+    """
+    return _current_request.get()
+
+
+class RequestInfo:
+    """
+    What is known about a request, passed to every hook.
+
+    Timings are in seconds and are None when a phase did not happen or could not be
+    measured: `connect` and `tls` are only set when a new connection was opened, and requests
+    that share another request's response through a SingleFlight have no transport timings.
+
+    Attributes:
+        method: The HTTP method.
+        url: The full request URL.
+        path: The request path with identifiers replaced by `{id}`.
+        status_code: The status code of the response, once received.
+        request_id: The Nylas request ID of the response, once received.
+        bytes_out: The size of the request body as sent.
+        bytes_in: The size of the response body as received.
+        connect: The time to resolve the host and open a TCP connection.
+        tls: The time of the TLS handshake.
+        ttfb: The time from sending the request to receiving the response headers, without
+            the connection setup.
+        download: The time to receive the response body.
+        parse: The time to parse the JSON response body.
+        decode: The time to decode the parsed JSON into the returned models.
+        duration: The total time of the request, once it completed or failed.
+        retries: The number of retries so far.
+        retry_delay: The delay before the upcoming retry, in on_retry hooks.
+        error: The exception the request failed with, if any.
+        state: A dict hooks can keep their own per-request state in.
+    """
+
+    __slots__ = (
+        "method",
+        "url",
+        "path",
+        "status_code",
+        "request_id",
+        "bytes_out",
+        "bytes_in",
+        "connect",
+        "tls",
+        "ttfb",
+        "download",
+        "parse",
+        "decode",
+        "duration",
+        "retries",
+        "retry_delay",
+        "error",
+        "state",
+        "started_at",
+        "_hooks",
+    )
+
+    def __init__(self, hooks: "Hooks", method: str, url: str, path: str):
+        self.method = method.upper()
+        self.url = url
+        self.path = template_path(path)
+        self.status_code = None
+        self.request_id = None
+        self.bytes_out = 0
+        self.bytes_in = None
+        self.connect = None
+        self.tls = None
+        self.ttfb = None
+        self.download = None
+        self.parse = None
+        self.decode = None
+        self.duration = None
+        self.retries = 0
+        self.retry_delay = None
+        self.error = None
+        self.state = {}
+        self.started_at = time.perf_counter()
+        self._hooks = hooks
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        """The time spent in each measured phase, by phase name."""
+        phases = ("connect", "tls", "ttfb", "download", "parse", "decode")
+        return {
+            phase: getattr(self, phase)
+            for phase in phases
+            if getattr(self, phase) is not None
+        }
+
+
+Hook = Callable[[RequestInfo], None]
+
+
+class Hooks:
+    """
+    Callbacks called as an HTTP client sends requests.
+
+    Each callback receives the RequestInfo of the request:
+
+    * on_request hooks are called before a request is sent.
+    * on_retry hooks are called before a failed attempt is retried, with `retries`,
+      `retry_delay` and the `status_code` or `error` of the failed attempt set.
+    * on_response hooks are called once the response has been received and decoded.
+    * on_error hooks are called when the request fails, with `error` set.
+
+    Responses served from a ResponseCache are not reported. Callbacks are called
+    synchronously in the thread (or task) that makes the request and should be fast;
+    exceptions they raise propagate to the caller. The registration methods return the
+    callback, so they can be used as decorators.
+    """
+
+    def __init__(self):
+        self._request: List[Hook] = []
+        self._response: List[Hook] = []
+        self._error: List[Hook] = []
+        self._retry: List[Hook] = []
+
+    def __bool__(self) -> bool:
+        return bool(self._request or self._response or self._error or self._retry)
+
+    def on_request(self, callback: Hook) -> Hook:
+        """Call a callback before each request is sent."""
+        self._request.append(callback)
+        return callback
+
+    def on_response(self, callback: Hook) -> Hook:
+        """Call a callback after each response is received and decoded."""
+        self._response.append(callback)
+        return callback
+
+    def on_error(self, callback: Hook) -> Hook:
+        """Call a callback when a request fails."""
+        self._error.append(callback)
+        return callback
+
+    def on_retry(self, callback: Hook) -> Hook:
+        """Call a callback before a failed attempt is retried."""
+        self._retry.append(callback)
+        return callback
+
+    def observe(self, method: str, url: str, path: str) -> "_Observation":
+        """
+        Observe a request: call the on_request hooks and make it the current request until
+        the returned context manager exits, calling the on_error hooks if it exits with an
+        exception.
+
+        Args:
+            method: The HTTP method.
+            url: The full request URL.
+            path: The request path.
+
+        Returns:
+            A context manager that enters into the request's RequestInfo.
+        """
+        return _Observation(self, RequestInfo(self, method, url, path))
+
+    def retry(self, info: RequestInfo, delay: float, status_code=None, error=None):
+        """
+        Report that a failed attempt will be retried.
+
+        Args:
+            info: The request.
+            delay: The delay before the retry, in seconds.
+            status_code: The status code of the failed attempt, if it got a response.
+            error: The exception of the failed attempt, if it raised one.
+        """
+        info.retries += 1
+        info.retry_delay = delay
+        info.status_code = status_code
+        info.error = error
+        for callback in self._retry:
+            callback(info)
+
+    def finish(self, info: RequestInfo) -> None:
+        """
+        Report that a request completed, unless its caller will decode the response and
+        report it then.
+
+        Args:
+            info: The request.
+        """
+        pending = _pending_decode.get()
+        if pending is not None and not pending:
+            pending.append(info)
+            return
+        self._respond(info)
+
+    def fail(self, info: RequestInfo, error: BaseException) -> None:
+        """
+        Report that a request failed.
+
+        Args:
+            info: The request.
+            error: The exception the request failed with.
+        """
+        info.error = error
+        info.retry_delay = None
+        if info.request_id is None:
+            info.request_id = getattr(error, "request_id", None)
+        if info.status_code is None:
+            info.status_code = getattr(error, "status_code", None)
+        info.duration = time.perf_counter() - info.started_at
+        for callback in self._error:
+            callback(info)
+
+    def _respond(self, info: RequestInfo) -> None:
+        info.error = None
+        info.retry_delay = None
+        info.duration = time.perf_counter() - info.started_at
+        for callback in self._response:
+            callback(info)
+
+
+class _Observation:
+    __slots__ = ("_hooks", "_info", "_token")
+
+    def __init__(self, hooks: Hooks, info: RequestInfo):
+        self._hooks = hooks
+        self._info = info
+        self._token = None
+
+    def __enter__(self) -> RequestInfo:
+        self._token = _current_request.set(self._info)
+        for callback in self._hooks._request:  # pylint: disable=protected-access
+            callback(self._info)
+        return self._info
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _current_request.reset(self._token)
+        if exc_value is not None and not isinstance(exc_value, GeneratorExit):
+            self._hooks.fail(self._info, exc_value)
+
+
+class PendingDecode:
+    """
+    Context manager under which observed requests wait for their response to be decoded
+    before they are reported, so that the decode time is included.
+
+    Enters into a list that receives the RequestInfo of the request made under it, if it is
+    observed; pass it with the decoding to decode_observed().
+    """
+
+    __slots__ = ("_token", "_pending")
+
+    def __init__(self):
+        self._pending = []
+        self._token = None
+
+    def __enter__(self) -> list:
+        self._token = _pending_decode.set(self._pending)
+        return self._pending
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _pending_decode.reset(self._token)
+
+
+def decode_observed(pending: list, decoding: Callable):
+    """
+    Decode a response, then report its request with the decode time.
+
+    Args:
+        pending: The list entered into by PendingDecode.
+        decoding: Callable without arguments that decodes the response.
+
+    Returns:
+        The decoded response.
+    """
+    if not pending:
+        return decoding()
+    info = pending[0]
+    hooks = info._hooks  # pylint: disable=protected-access
+    started = time.perf_counter()
+    try:
+        result = decoding()
+    except Exception as exc:
+        hooks.fail(info, exc)
+        raise
+    info.decode = time.perf_counter() - started
+    hooks._respond(info)  # pylint: disable=protected-access
+    return result
+
+
+class _TimedConnection(HTTPConnection):
+    """
+    HTTP connection that reports how long it took to connect to the current request.
+    Connections made while no request is observed are not timed.
+    """
+
+    def connect(self):
+        info = _current_request.get()
+        if info is None:
+            super().connect()
+            return
+        started = time.perf_counter()
+        super().connect()
+        info.connect = time.perf_counter() - started
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    """
+    HTTPS connection that reports how long it took to connect and to complete the TLS
+    handshake to the current request. Connections made while no request is observed are
+    not timed.
+    """
+
+    # pylint: disable=no-member
+
+    _tcp_time = None
+
+    def _new_conn(self):
+        if _current_request.get() is None:
+            return super()._new_conn()
+        started = time.perf_counter()
+        sock = super()._new_conn()
+        self._tcp_time = time.perf_counter() - started
+        return sock
+
+    def connect(self):
+        info = _current_request.get()
+        if info is None:
+            super().connect()
+            return
+        self._tcp_time = None
+        started = time.perf_counter()
+        super().connect()
+        if self._tcp_time is not None:
+            info.connect = self._tcp_time
+            info.tls = time.perf_counter() - started - self._tcp_time
+
+
+class _TimedConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    requests' pooled HTTPAdapter, with connections that report their connect and TLS
+    handshake times to the request being observed by hooks. It stays mounted so that hooks
+    registered after the client is built see these times; without hooks, connections are
+    made exactly as HTTPAdapter makes them.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+class AsyncTrace:
+    """
+    httpcore trace callback that records the connect, TLS and time-to-first-byte timings of
+    an httpx request.
+
+    Args:
+        info: The request to record the timings on.
+    """
+
+    __slots__ = ("_info", "_started", "_sent_at", "headers_at")
+
+    def __init__(self, info: RequestInfo):
+        self._info = info
+        self._started = {}
+        self._sent_at = None
+        self.headers_at = None
+
+    async def __call__(self, event_name: str, _info: dict) -> None:
+        name, _, phase = event_name.rpartition(".")
+        now = time.perf_counter()
+        if phase == "started":
+            self._started[name] = now
+            if name.endswith("send_request_headers"):
+                self._sent_at = now
+        elif phase == "complete":
+            if name == "connection.connect_tcp":
+                self._info.connect = now - self._started.get(name, now)
+            elif name == "connection.start_tls":
+                self._info.tls = now - self._started.get(name, now)
+            elif name.endswith("receive_response_headers"):
+                self.headers_at = now
+                if self._sent_at is not None:
+                    self._info.ttfb = now - self._sent_at
+
+    def complete(self, stream: bool) -> None:
+        """
+        Record the download time of a response that has been received.
+
+        Args:
+            stream: Whether the body is streamed, and so not downloaded yet.
+        """
+        if not stream and self.headers_at is not None:
+            self._info.download = time.perf_counter() - self.headers_at
@@ -0,0 +1,357 @@
+"""
+HTTP/2 transport for the HTTP clients.
+
+`HTTP2Adapter` is a requests transport adapter that sends requests over httpx's HTTP/2
+connection pool, so `HttpClient` keeps its request building, retries and error handling while
+many concurrent requests are multiplexed as streams over a few connections. The pool is driven
+by an event loop on a private thread: httpcore's synchronous HTTP/2 connection is not safe to
+share between threads, while its asyncio one serializes all connection state on the loop. The protocol is
+negotiated with ALPN: hosts that do not offer HTTP/2 are talked to over HTTP/1.1 on the same
+pool. Requires the optional `httpx` and `h2` dependencies (`pip install nylas[http2]`),
+which are only imported once an adapter is created.
+"""
+
+import importlib.util
+import os
+import ssl
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import (
+    DEFAULT_CA_BUNDLE_PATH,
+    get_encoding_from_headers,
+    select_proxy,
+)
+
+from nylas.models.errors import NylasSdkTimeoutError
+
+DEFAULT_MAX_STREAMS = 100
+"""The default maximum number of concurrent requests (streams) per HTTP/2 connection."""
+
+# Connection-specific headers are forbidden in HTTP/2 (RFC 9113, section 8.2.2).
+_HOP_BY_HOP_HEADERS = frozenset(
+    {"connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"}
+)
+
+
+def require_http2() -> None:
+    """
+    Check that the optional HTTP/2 dependencies are installed.
+
+    Raises:
+        ImportError: If httpx or h2 is missing.
+    """
+    if (
+        importlib.util.find_spec("httpx") is None
+        or importlib.util.find_spec("h2") is None
+    ):
+        raise ImportError(
+            "HTTP/2 support requires httpx and h2. Install them with `pip install nylas[http2]`."
+        )
+
+
+def _ssl_context(verify, cert) -> ssl.SSLContext:
+    if verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    else:
+        bundle = verify if isinstance(verify, str) else DEFAULT_CA_BUNDLE_PATH
+        if os.path.isdir(bundle):
+            context = ssl.create_default_context(capath=bundle)
+        else:
+            context = ssl.create_default_context(cafile=bundle)
+    if cert:
+        if isinstance(cert, (tuple, list)):
+            context.load_cert_chain(*cert)
+        else:
+            context.load_cert_chain(cert)
+    return context
+
+
+def _timeout(timeout) -> "httpx.Timeout":
+    import httpx  # pylint: disable=import-outside-toplevel
+
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+def _wait_timeout(timeout) -> Optional[float]:
+    # How long to wait for a free stream: as long as for a connection to be made.
+    if isinstance(timeout, tuple):
+        return timeout[0]
+    return timeout
+
+
+def _origin(url: str) -> Tuple[str, Optional[str], Optional[int]]:
+    parts = urlsplit(url)
+    return parts.scheme, parts.hostname, parts.port
+
+
+class _StreamedBody:
+    """
+    File-like body of an HTTP/2 response, standing in for urllib3's response as
+    `requests.Response.raw`.
+
+    Attributes:
+        version: The HTTP version the response was received with, 20 or 11, as in urllib3.
+    """
+
+    def __init__(self, response: "httpx.Response", run, release):
+        self._response = response
+        self._run = run
+        self._release = release
+        if response.is_closed:
+            self._chunks = None
+            self._content = response.content
+        else:
+            self._chunks = response.aiter_bytes()
+            self._content = None
+        # Bytes received but not read yet. Reading from the front of a bytearray does not
+        # move the rest, so a body is read in linear time whatever the sizes of the reads.
+        self._buffer = bytearray()
+        self._position = 0
+        self.version = 20 if response.http_version == "HTTP/2" else 11
+
+    def read(self, amt: Optional[int] = None, **_) -> bytes:
+        """
+        Read decoded bytes from the response body.
+
+        Args:
+            amt: The maximum number of bytes to read. Reads the rest of the body if unset.
+
+        Returns:
+            The bytes read, or an empty bytes object at the end of the body.
+        """
+        import httpx  # pylint: disable=import-outside-toplevel
+
+        if self._content is not None:
+            return self._read_content(amt)
+        try:
+            while self._chunks is not None and (amt is None or len(self._buffer) < amt):
+                chunk = self._run(self._next_chunk())
+                if chunk is None:
+                    self.close()
+                    break
+                self._buffer += chunk
+        except httpx.TimeoutException as exc:
+            self.close()
+            raise requests.exceptions.ReadTimeout(exc) from exc
+        except httpx.TransportError as exc:
+            self.close()
+            raise requests.exceptions.ConnectionError(exc) from exc
+        data = bytes(self._buffer if amt is None else self._buffer[:amt])
+        del self._buffer[: len(data)]
+        return data
+
+    def _read_content(self, amt: Optional[int]) -> bytes:
+        # Read from the body of a response that was received whole.
+        content, start = self._content, self._position
+        if amt is None and start == 0:
+            data = content
+        else:
+            data = content[start:] if amt is None else content[start : start + amt]
+        self._position = start + len(data)
+        return data
+
+    def tell(self) -> int:
+        """Get the number of bytes received so far, before decompression."""
+        return self._response.num_bytes_downloaded
+
+    def close(self) -> None:
+        """Close the response and free its stream."""
+        chunks, self._chunks = self._chunks, None
+        if chunks is not None:
+            self._run(self._response.aclose())
+        release, self._release = self._release, None
+        if release is not None:
+            release()
+
+    async def _next_chunk(self) -> Optional[bytes]:
+        # pylint: disable=unnecessary-dunder-call
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return None
+
+
+class HTTP2Adapter(BaseAdapter):
+    """
+    requests transport adapter that sends requests over HTTP/2 with httpx.
+
+    Each host gets its own pool of at most `max_connections` connections. httpx multiplexes
+    all of a host's requests over one HTTP/2 connection while it is usable, so at most
+    `max_streams` requests to a host are in flight at once, which bounds the streams of every
+    connection to it; the server's own SETTINGS_MAX_CONCURRENT_STREAMS is honored when it is
+    lower. A request that waits longer than its connect timeout for a free stream raises
+    NylasSdkTimeoutError.
+    Connections to hosts without HTTP/2 fall back to HTTP/1.1, and requests that would be
+    sent through a proxy are sent over HTTP/1.1 by the `fallback` adapter.
+
+    Args:
+        max_connections: The maximum number of connections to keep open per host.
+        max_streams: The maximum number of concurrent requests per connection.
+        fallback: The adapter that sends proxied requests. Defaults to an HTTPAdapter with
+            `max_connections` connections per host.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 10,
+        max_streams: int = DEFAULT_MAX_STREAMS,
+        fallback: Optional[BaseAdapter] = None,
+    ):
+        require_http2()
+        super().__init__()
+        self.max_connections = max_connections
+        self.max_streams = max_streams
+        self.fallback = (
+            fallback
+            if fallback is not None
+            else HTTPAdapter(pool_maxsize=max_connections)
+        )
+        self._clients: Dict[Tuple, "httpx.AsyncClient"] = {}
+        self._lock = threading.Lock()
+        self._streams: Dict[Tuple, threading.BoundedSemaphore] = {}
+        self._loop: Optional["asyncio.AbstractEventLoop"] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ) -> requests.Response:
+        # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        # pylint: disable=unused-argument
+        import httpx  # pylint: disable=import-outside-toplevel
+
+        if proxies and select_proxy(request.url, proxies):
+            return self.fallback.send(
+                request,
+                stream=stream,
+                timeout=timeout,
+                verify=verify,
+                cert=cert,
+                proxies=proxies,
+            )
+        origin = _origin(request.url)
+        client = self._client(verify, cert, origin)
+        body = request.body
+        if hasattr(body, "read"):
+            body = body.read()
+        headers = {
+            name: value
+            for name, value in request.headers.items()
+            if name.lower() not in _HOP_BY_HOP_HEADERS
+        }
+        outgoing = client.build_request(
+            request.method,
+            request.url,
+            headers=headers,
+            content=body,
+            timeout=_timeout(timeout),
+        )
+        streams = self._host_streams(origin)
+        if not streams.acquire(timeout=_wait_timeout(timeout)):
+            raise NylasSdkTimeoutError(url=request.url, timeout=timeout)
+        try:
+            response = self._run(self._send(client, outgoing, stream))
+        except httpx.TimeoutException as exc:
+            streams.release()
+            raise requests.exceptions.Timeout(exc, request=request) from exc
+        except httpx.TransportError as exc:
+            streams.release()
+            raise requests.exceptions.ConnectionError(exc, request=request) from exc
+
+        raw = _StreamedBody(response, self._run, streams.release)
+        built = self._build_response(request, response, raw)
+        if not stream:
+            try:
+                built.content  # pylint: disable=pointless-statement
+            finally:
+                raw.close()
+        return built
+
+    def close(self) -> None:
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        self.fallback.close()
+        with self._lock:
+            clients, self._clients = self._clients, {}
+            loop, self._loop = self._loop, None
+            thread, self._thread = self._thread, None
+        if loop is None:
+            return
+        for client in clients.values():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def _run(self, coroutine):
+        """Run a coroutine on the adapter's event loop and wait for its result."""
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="nylas-http2", daemon=True
+                )
+                self._thread.start()
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    @staticmethod
+    async def _send(client, request, stream) -> "httpx.Response":
+        response = await client.send(request, stream=True)
+        if not stream:
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+        return response
+
+    def _host_streams(self, origin: Tuple) -> threading.BoundedSemaphore:
+        with self._lock:
+            streams = self._streams.get(origin)
+            if streams is None:
+                streams = self._streams[origin] = threading.BoundedSemaphore(
+                    self.max_streams
+                )
+            return streams
+
+    def _client(self, verify, cert, origin: Tuple) -> "httpx.AsyncClient":
+        import httpx  # pylint: disable=import-outside-toplevel
+
+        # One pool per host, since httpx's connection limit applies to the whole pool.
+        key = (verify, cert if not isinstance(cert, list) else tuple(cert), origin)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = httpx.AsyncClient(
+                    http2=True,
+                    verify=_ssl_context(verify, cert),
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                    trust_env=False,
+                )
+            return client
+
+    def _build_response(self, request, response, raw) -> requests.Response:
+        built = requests.Response()
+        built.status_code = response.status_code
+        built.headers = CaseInsensitiveDict(response.headers.items())
+        built.encoding = get_encoding_from_headers(built.headers)
+        built.reason = response.reason_phrase
+        built.raw = raw
+        built.url = request.url
+        built.request = request
+        built.connection = self
+        return built
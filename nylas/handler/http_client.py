@@ -1,13 +1,34 @@
-import json
+import contextlib
+import datetime
+import functools
 import sys
-from typing import Union, Tuple, Dict
+import time
+import uuid
+from http.cookiejar import DefaultCookiePolicy
+from typing import Union, Tuple, Dict, Optional
 from urllib.parse import urlparse, quote
 
 import requests
 from requests import Response
+from requests.adapters import BaseAdapter
 from requests.structures import CaseInsensitiveDict
 
 from nylas._client_sdk_version import __VERSION__
+from nylas.config import DEFAULT_RESPONSE_FORMAT, ResponseFormat
+from nylas.handler.compression import Compression
+from nylas.handler.hooks import Hooks, RequestInfo, TimedHTTPAdapter, current_request
+from nylas.handler.http2 import DEFAULT_MAX_STREAMS, HTTP2Adapter
+from nylas.handler.invalid_grants import InvalidGrantCache
+from nylas.handler.json_codec import StdlibJsonCodec, default_json_codec
+from nylas.handler.rate_limiter import RateLimiter
+from nylas.handler.response_cache import (
+    CACHE_STATUS_HEADER,
+    ResponseCache,
+    request_key,
+)
+from nylas.handler.retry import RetryPolicy, RETRY_COUNT_HEADER
+from nylas.handler.revalidation import RevalidationCache
+from nylas.handler.single_flight import SingleFlight
 from nylas.models.errors import (
     NylasApiError,
     NylasApiErrorResponse,
@@ -16,12 +37,32 @@ from nylas.models.errors import (
     NylasOAuthErrorResponse,
     NylasApiErrorResponseData,
 )
+from nylas.utils.interning import StringInterner
+
+_STDLIB_CODEC = StdlibJsonCodec()
+
+# Entered instead of a hooks observation while no hooks are registered.
+_UNOBSERVED = contextlib.nullcontext()
+
 
+def _loads_body(response: Response, json_codec=_STDLIB_CODEC):
+    try:
+        return json_codec.loads(response.content)
+    except ValueError as exc:
+        # Raised as requests' JSONDecodeError, as response.json() does.
+        raise requests.exceptions.JSONDecodeError(
+            getattr(exc, "msg", str(exc)),
+            getattr(exc, "doc", ""),
+            getattr(exc, "pos", 0),
+        ) from exc
 
-def _validate_response(response: Response) -> Tuple[Dict, CaseInsensitiveDict]:
-    response_data = response.json()
+
+def _validate_response(
+    response: Response, json_codec=_STDLIB_CODEC
+) -> Tuple[Dict, CaseInsensitiveDict]:
+    response_data = _loads_body(response, json_codec)
     if response.status_code >= 400:
-        parsed_url = urlparse(response.url)
+        parsed_url = urlparse(str(response.url))
         try:
             if (
                 "connect/token" in parsed_url.path
@@ -66,14 +107,197 @@ def _build_query_params(base_url: str, query_params: dict = None) -> str:
     return f"{base_url}?{query_string}"
 
 
-# pylint: disable=too-few-public-methods
+def _encode_json_body(
+    request_body=None, data=None, serialized_json_body=None, json_codec=_STDLIB_CODEC
+):
+    # Serialize request_body to UTF-8 JSON bytes with the client's codec. Codecs keep
+    # non-ASCII characters unescaped and support NaN/Infinity values (matching default
+    # json.dumps behavior); bytes avoid Latin-1 encoding errors with special characters.
+    # When serialized_json_body is set (e.g. Nylas service account signing), send those exact
+    # bytes so the wire body matches the payload that was signed.
+    if data is not None:
+        return None
+    if serialized_json_body is not None:
+        return serialized_json_body
+    if request_body is not None:
+        return json_codec.dumps(request_body)
+    return None
+
+
+def _body_size(body) -> int:
+    if isinstance(body, (bytes, str)):
+        return len(body)
+    # Multipart encoders know their encoded length.
+    size = getattr(body, "len", 0)
+    return size if isinstance(size, int) else 0
+
+
+def _observe_timing(info: RequestInfo, sent_at: float, response, stream) -> None:
+    # requests measures the time to the response headers, including any connection setup.
+    elapsed = getattr(response, "elapsed", None)
+    if not isinstance(elapsed, datetime.timedelta):
+        return
+    elapsed = elapsed.total_seconds()
+    info.ttfb = max(0.0, elapsed - (info.connect or 0.0) - (info.tls or 0.0))
+    if not stream:
+        info.download = max(0.0, time.perf_counter() - sent_at - elapsed)
+
+
+@contextlib.contextmanager
+def _grant_guarded(cache: InvalidGrantCache, path: str):
+    cache.check(path)
+    try:
+        yield
+    except NylasApiError as exc:
+        cache.record_error(path, exc)
+        raise
+
+
+DEFAULT_POOL_CONNECTIONS = 10
+"""The default number of per-host connection pools to keep."""
+
+DEFAULT_POOL_MAXSIZE = 10
+"""The default number of keep-alive connections to keep in each per-host pool."""
+
+
+class _NoCookiesPolicy(DefaultCookiePolicy):
+    """
+    A cookie policy that neither stores nor sends cookies.
+
+    The API authenticates each request by its api_key, so cookies set by one response must
+    not be sent with later requests of the pooled session, which may use another api_key.
+    """
+
+    def set_ok(self, cookie, request):
+        return False
+
+    def return_ok(self, cookie, request):
+        return False
+
+
+def _build_session(
+    pool_connections: int,
+    pool_maxsize: int,
+    http2: bool = False,
+    http2_max_streams: int = DEFAULT_MAX_STREAMS,
+    transport: Optional[BaseAdapter] = None,
+) -> requests.Session:
+    """
+    Build a requests session backed by a keep-alive connection pool, that keeps no cookies.
+
+    Args:
+        pool_connections: The number of per-host connection pools to cache.
+        pool_maxsize: The maximum number of connections to keep in each pool.
+        http2: Whether to send HTTPS requests over HTTP/2.
+        http2_max_streams: The maximum number of concurrent requests per HTTP/2 connection.
+        transport: A transport adapter to send every request with instead.
+
+    Returns:
+        The configured session.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(_NoCookiesPolicy())
+    if transport is not None:
+        session.mount("https://", transport)
+        session.mount("http://", transport)
+        return session
+    adapter = TimedHTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if http2:
+        session.mount(
+            "https://",
+            HTTP2Adapter(
+                max_connections=pool_maxsize,
+                max_streams=http2_max_streams,
+                fallback=adapter,
+            ),
+        )
+    return session
+
+
 class HttpClient:
-    """HTTP client for the Nylas API."""
+    """
+    HTTP client for the Nylas API.
+
+    The client owns a single pooled session, so TCP and TLS connections to the API host are
+    kept alive and reused across calls. Call close() when the client is no longer needed.
+
+    When a RetryPolicy is set, retryable failures are retried transparently and the number
+    of retries is reported in the RETRY_COUNT_HEADER of the response headers. When a
+    RateLimiter is set, every attempt waits for a token before it is sent.
+
+    Request and response bodies are encoded and parsed with `json_codec`, which defaults to
+    orjson when it is installed and the standard library's json module otherwise. When a
+    ResponseCache is set, GETs of the resources it covers are served from it while fresh.
+    When a SingleFlight is set, concurrent identical GETs share one in-flight request. When a
+    RevalidationCache is set, repeated GETs are sent as conditional requests and unchanged
+    responses are served from it without being parsed again. When a Compression is set,
+    compressed responses are negotiated explicitly, large JSON request bodies can be gzipped,
+    and body sizes before and after compression are counted. With `http2`, HTTPS requests
+    are multiplexed over HTTP/2 connections, falling back to HTTP/1.1 for hosts without it.
+    A `transport` (a requests transport adapter, see nylas.handler.transport) replaces the
+    connection pool and HTTP/2 settings, and sends every request. Callbacks registered on
+    `hooks` are called with the timings of every request as it is sent, retried, answered or
+    fails. When an InvalidGrantCache is set, grants that fail as invalid are remembered and
+    requests for them fail without being sent.
+    """
 
-    def __init__(self, api_server, api_key, timeout):
+    def __init__(
+        self,
+        api_server,
+        api_key,
+        timeout,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_format: ResponseFormat = DEFAULT_RESPONSE_FORMAT,
+        json_codec=None,
+        string_interner: Optional[StringInterner] = None,
+        response_cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        revalidation_cache: Optional[RevalidationCache] = None,
+        compression: Optional[Compression] = None,
+        http2: bool = False,
+        http2_max_streams: int = DEFAULT_MAX_STREAMS,
+        transport: Optional[BaseAdapter] = None,
+        hooks: Optional[Hooks] = None,
+        invalid_grant_cache: Optional[InvalidGrantCache] = None,
+    ):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
         self.api_server = api_server
         self.api_key = api_key
         self.timeout = timeout
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.response_format = response_format
+        self.json_codec = json_codec if json_codec is not None else default_json_codec()
+        self.string_interner = string_interner
+        self.response_cache = response_cache
+        self.single_flight = single_flight
+        self.revalidation_cache = revalidation_cache
+        self.compression = compression
+        self.http2 = http2
+        self.hooks = hooks if hooks is not None else Hooks()
+        self.invalid_grant_cache = invalid_grant_cache
+        self.session = _build_session(
+            pool_connections, pool_maxsize, http2, http2_max_streams, transport
+        )
+
+    def close(self) -> None:
+        """Close the pooled session and release any open connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _execute(
         self,
@@ -86,6 +310,7 @@ class HttpClient:
         overrides=None,
         serialized_json_body=None,
     ) -> dict:
+        # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
         request = self._build_request(
             method,
             path,
@@ -97,34 +322,45 @@ class HttpClient:
             serialized_json_body=serialized_json_body,
         )
 
-        timeout = self.timeout
-        if overrides and overrides.get("timeout"):
-            timeout = overrides["timeout"]
-
-        # Serialize request_body to JSON with ensure_ascii=False to preserve UTF-8 characters
-        # and allow_nan=True to support NaN/Infinity values (matching default json.dumps behavior).
-        # Encode as UTF-8 bytes to avoid Latin-1 encoding errors with special characters.
-        # When serialized_json_body is set (e.g. Nylas service account signing), send those exact
-        # bytes so the wire body matches the payload that was signed.
-        json_data = None
-        if serialized_json_body is not None and data is None:
-            json_data = serialized_json_body
-        elif request_body is not None and data is None:
-            json_data = json.dumps(
-                request_body, ensure_ascii=False, allow_nan=True
-            ).encode("utf-8")
-        try:
-            response = requests.request(
-                request["method"],
-                request["url"],
-                headers=request["headers"],
-                data=json_data if json_data is not None else data,
-                timeout=timeout,
+        self._add_idempotency_key(request)
+
+        cache_key, cached = self._cache_lookup(method, path, request)
+        if cached is not None:
+            return self._cached_response(cached)
+
+        with self._guard_grant(path), self._observe(method, path, request) as info:
+            revalidation = self._revalidation_lookup(method, request)
+
+            timeout = self._resolve_timeout(overrides)
+            json_data = self._compress_body(
+                request,
+                _encode_json_body(
+                    request_body, data, serialized_json_body, self.json_codec
+                ),
+                signed=serialized_json_body is not None,
+            )
+            body = json_data if json_data is not None else data
+            if info is not None:
+                info.bytes_out = _body_size(body)
+            send = functools.partial(
+                self._send, request, timeout, replayable=data is None, data=body
             )
-        except requests.exceptions.Timeout as exc:
-            raise NylasSdkTimeoutError(url=request["url"], timeout=timeout) from exc
+            flight_key = self._flight_key(method, request)
+            try:
+                response = (
+                    send()
+                    if flight_key is None
+                    else self.single_flight.do(flight_key, send)
+                )
+            finally:
+                self._cache_invalidate(method, path)
 
-        return _validate_response(response)
+            result = self._resolve_observed(info, response, revalidation)
+            self._cache_store(cache_key, path, response)
+            self._record_grant(path, result)
+        if info is not None:
+            self.hooks.finish(info)
+        return result
 
     def _execute_download_request(
         self,
@@ -136,28 +372,351 @@ class HttpClient:
     ) -> Union[bytes, Response, dict]:
         request = self._build_request("GET", path, headers, query_params, overrides)
 
-        timeout = self.timeout
-        if overrides and overrides.get("timeout"):
-            timeout = overrides["timeout"]
-        try:
-            response = requests.request(
-                request["method"],
-                request["url"],
-                headers=request["headers"],
-                timeout=timeout,
-                stream=stream,
-            )
+        with self._guard_grant(path), self._observe("GET", path, request) as info:
+            timeout = self._resolve_timeout(overrides)
+            response = self._send(request, timeout, stream=stream)
+            if info is not None:
+                self._observe_response(info, response, stream)
 
             if not response.ok:
-                return _validate_response(response)
+                result = _validate_response(response, self.json_codec)
+            # If we stream an iterator for streaming the content, otherwise return the entire
+            # byte array
+            elif stream:
+                result = response
+            else:
+                result = response.content if response.content else None
+        if info is not None:
+            self.hooks.finish(info)
+        return result
 
-            # If we stream an iterator for streaming the content, otherwise return the entire byte array
-            if stream:
-                return response
+    def _execute_stream(
+        self,
+        path,
+        headers=None,
+        query_params=None,
+        overrides=None,
+    ) -> Response:
+        """
+        Send a GET request whose JSON response body is read incrementally by the caller.
 
-            return response.content if response.content else None
-        except requests.exceptions.Timeout as exc:
-            raise NylasSdkTimeoutError(url=request["url"], timeout=timeout) from exc
+        The response cache, conditional requests and request coalescing do not apply, since
+        the body is never held in full. Error responses are read and raised as usual.
+
+        Args:
+            path: The request path.
+            headers: Additional headers to send.
+            query_params: The query parameters to send.
+            overrides: The request overrides.
+
+        Returns:
+            The response, with its body not yet read. Close it once done with the body.
+        """
+        request = self._build_request(
+            "GET", path, headers, query_params, overrides=overrides
+        )
+
+        with self._guard_grant(path), self._observe("GET", path, request) as info:
+            timeout = self._resolve_timeout(overrides)
+            response = self._send(request, timeout, stream=True)
+            if info is not None:
+                self._observe_response(info, response, stream=True)
+            if response.status_code >= 400:
+                with response:
+                    _validate_response(response, self.json_codec)
+        if info is not None:
+            self.hooks.finish(info)
+        return response
+
+    def _cache_lookup(self, method: str, path: str, request: dict):
+        """
+        Look a request up in the response cache.
+
+        Args:
+            method: The HTTP method.
+            path: The request path.
+            request: The request built by _build_request().
+
+        Returns:
+            The cache key of the request, or None if it is not cacheable, and the cached
+            response, or None on a miss.
+        """
+        cache = self.response_cache
+        if cache is None or method.upper() != "GET" or cache.ttl_for(path) is None:
+            return None, None
+        key = cache.key(method, request["url"], request["headers"].get("Authorization"))
+        return key, cache.get(key)
+
+    def _cached_response(self, entry) -> Tuple[Dict, CaseInsensitiveDict]:
+        body, headers = entry
+        headers = CaseInsensitiveDict(headers)
+        headers[CACHE_STATUS_HEADER] = "hit"
+        return self.json_codec.loads(body), headers
+
+    def _cache_store(self, key: Optional[str], path: str, response) -> None:
+        if key is not None and response.status_code < 300:
+            self.response_cache.set(
+                key, path, (response.content, dict(response.headers))
+            )
+
+    def _cache_invalidate(self, method: str, path: str) -> None:
+        if self.response_cache is not None and method.upper() != "GET":
+            self.response_cache.invalidate(path)
+
+    def _guard_grant(self, path: str):
+        """
+        Guard a request with the invalid grant cache.
+
+        Args:
+            path: The request path.
+
+        Returns:
+            A context manager that raises a NylasInvalidGrantError on entry if the request's
+            grant is remembered as invalid, and remembers the grant if the request fails
+            because it is invalid.
+        """
+        if self.invalid_grant_cache is None:
+            return _UNOBSERVED
+        return _grant_guarded(self.invalid_grant_cache, path)
+
+    def _record_grant(self, path: str, result) -> None:
+        if self.invalid_grant_cache is not None:
+            self.invalid_grant_cache.record_response(path, result[0])
+
+    def _revalidation_lookup(self, method: str, request: dict):
+        """
+        Look a request up in the revalidation cache, making it conditional on the stored
+        response.
+
+        Args:
+            method: The HTTP method.
+            request: The request built by _build_request(). Its headers are updated.
+
+        Returns:
+            The request key and the stored response, or None, if the request is revalidated;
+            None otherwise.
+        """
+        if self.revalidation_cache is None or method.upper() != "GET":
+            return None
+        headers = request["headers"]
+        key = request_key(method, request["url"], headers.get("Authorization"))
+        stored = self.revalidation_cache.get(key)
+        if stored is not None:
+            for name, value in self.revalidation_cache.conditional_headers(
+                stored
+            ).items():
+                headers.setdefault(name, value)
+        return key, stored
+
+    def _observe(self, method: str, path: str, request: dict):
+        """
+        Observe a request with the client's hooks.
+
+        Args:
+            method: The HTTP method.
+            path: The request path.
+            request: The request built by _build_request().
+
+        Returns:
+            A context manager that enters into the RequestInfo of the request, or into None
+            if no hooks are registered.
+        """
+        if not self.hooks:
+            return _UNOBSERVED
+        return self.hooks.observe(method, request["url"], path)
+
+    def _observe_response(self, info: RequestInfo, response, stream=False) -> None:
+        info.status_code = response.status_code
+        info.request_id = response.headers.get("X-Request-Id")
+        if not stream:
+            info.bytes_in = self._wire_size(response)
+
+    def _resolve_observed(self, info: Optional[RequestInfo], response, revalidation):
+        """
+        Resolve a response with _resolve_response(), recording it on the request's info.
+
+        Args:
+            info: The RequestInfo of the request, or None if it is not observed.
+            response: The response to the request.
+            revalidation: The key and stored response returned by _revalidation_lookup().
+
+        Returns:
+            The response JSON and headers.
+        """
+        if info is None:
+            return self._resolve_response(response, revalidation)
+        self._observe_response(info, response)
+        started = time.perf_counter()
+        result = self._resolve_response(response, revalidation)
+        info.parse = time.perf_counter() - started
+        if isinstance(result[0], dict) and result[0].get("request_id"):
+            info.request_id = result[0]["request_id"]
+        return result
+
+    def _resolve_response(self, response, revalidation=None):
+        """
+        Validate and parse a response, or resolve it to the stored response if unchanged.
+
+        Args:
+            response: The response to a request.
+            revalidation: The key and stored response returned by _revalidation_lookup().
+
+        Returns:
+            The response JSON and headers.
+        """
+        if revalidation is None:
+            return _validate_response(response, self.json_codec)
+        key, stored = revalidation
+        return self.revalidation_cache.resolve(
+            key,
+            stored,
+            response.status_code,
+            response.content,
+            response.headers,
+            lambda: _validate_response(response, self.json_codec),
+            self.json_codec.loads,
+        )
+
+    def _compress_body(self, request: dict, body: Optional[bytes], signed=False):
+        """
+        Negotiate a compressed response and compress the request body if configured to.
+
+        Args:
+            request: The request built by _build_request(). Its headers are updated.
+            body: The encoded JSON request body, if any.
+            signed: Whether the body must be sent byte-for-byte.
+
+        Returns:
+            The request body to send.
+        """
+        compression = self.compression
+        if compression is None:
+            return body
+        request["headers"].setdefault("Accept-Encoding", compression.accept_encoding)
+        if body is None:
+            return None
+        compressed = None if signed else compression.compress(body)
+        if compressed is None:
+            compression.record_request(len(body), len(body))
+            return body
+        request["headers"]["Content-Encoding"] = "gzip"
+        compression.record_request(len(body), len(compressed))
+        return compressed
+
+    def _record_response_size(self, response) -> None:
+        if self.compression is not None:
+            content = response.content or b""
+            self.compression.record_response(self._wire_size(response), len(content))
+
+    def _wire_size(self, response) -> int:
+        # urllib3 counts the bytes read from the connection, before decompression.
+        tell = getattr(response.raw, "tell", None)
+        size = tell() if tell is not None else None
+        return size if isinstance(size, int) else len(response.content or b"")
+
+    def _flight_key(self, method: str, request: dict) -> Optional[str]:
+        """
+        Get the key concurrent identical requests are coalesced by.
+
+        Args:
+            method: The HTTP method.
+            request: The request built by _build_request().
+
+        Returns:
+            The key, or None if the request is not coalesced.
+        """
+        if self.single_flight is None or method.upper() != "GET":
+            return None
+        return request_key(
+            method, request["url"], request["headers"].get("Authorization")
+        )
+
+    def _send(self, request: dict, timeout, replayable=True, **kwargs) -> Response:
+        """
+        Send a built request, retrying it according to the retry policy.
+
+        Args:
+            request: The request built by _build_request().
+            timeout: The timeout for each attempt, in seconds.
+            replayable: Whether the request body can be sent more than once.
+            **kwargs: Additional arguments for the session's request method.
+
+        Returns:
+            The final response.
+        """
+        # pylint: disable=too-many-branches,too-many-locals
+        policy = self.retry_policy
+        retryable = (
+            policy is not None
+            and replayable
+            and policy.is_retryable_request(request["method"], request["headers"])
+        )
+        limiter = self.rate_limiter
+        path = urlparse(request["url"]).path
+        info = current_request() if self.hooks else None
+        started_at = time.monotonic()
+        retries = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire(path)
+            if info is not None:
+                info.connect = info.tls = None
+                sent_at = time.perf_counter()
+            try:
+                response = self.session.request(
+                    request["method"],
+                    request["url"],
+                    headers=request["headers"],
+                    timeout=timeout,
+                    **kwargs,
+                )
+            except requests.exceptions.Timeout as exc:
+                raise NylasSdkTimeoutError(url=request["url"], timeout=timeout) from exc
+            except requests.exceptions.ConnectionError as exc:
+                delay = (
+                    policy.next_delay(retries + 1, started_at) if retryable else None
+                )
+                if delay is None:
+                    raise
+                if info is not None:
+                    self.hooks.retry(info, delay, error=exc)
+            else:
+                if limiter is not None:
+                    limiter.update(path, response.status_code, response.headers)
+                delay = None
+                if retryable and response.status_code in policy.retry_statuses:
+                    delay = policy.next_delay(
+                        retries + 1, started_at, response.headers.get("Retry-After")
+                    )
+                if delay is None:
+                    if policy is not None:
+                        response.headers[RETRY_COUNT_HEADER] = str(retries)
+                    if not kwargs.get("stream"):
+                        self._record_response_size(response)
+                    if info is not None:
+                        _observe_timing(info, sent_at, response, kwargs.get("stream"))
+                    return response
+                if info is not None:
+                    self.hooks.retry(info, delay, status_code=response.status_code)
+                response.close()
+
+            retries += 1
+            time.sleep(delay)
+
+    def _add_idempotency_key(self, request: dict) -> None:
+        policy = self.retry_policy
+        if (
+            policy is not None
+            and policy.retry_post
+            and request["method"].upper() == "POST"
+            and policy.idempotency_header not in request["headers"]
+        ):
+            request["headers"][policy.idempotency_header] = str(uuid.uuid4())
+
+    def _resolve_timeout(self, overrides=None):
+        if overrides and overrides.get("timeout"):
+            return overrides["timeout"]
+        return self.timeout
 
     def _build_request(
         self,
@@ -0,0 +1,228 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import FrozenSet, Iterable, Optional, Tuple
+
+from nylas.models.errors import (
+    NylasApiError,
+    NylasApiErrorResponse,
+    NylasApiErrorResponseData,
+    NylasInvalidGrantError,
+)
+
+DEFAULT_INVALID_GRANT_TYPES: FrozenSet[str] = frozenset(
+    {
+        "grant.expired",
+        "grant.invalid",
+        "grant.not_found",
+        "invalid_grant",
+    }
+)
+"""The API error types that mean a grant can no longer be used until it is re-authenticated."""
+
+DEFAULT_INVALID_GRANT_TTL = 300.0
+"""The default number of seconds a grant is remembered as invalid."""
+
+DEFAULT_MAX_GRANTS = 10_000
+"""The default maximum number of invalid grants remembered."""
+
+_GRANT_PATH = re.compile(r"^/v3/grants/([^/]+)(/.*)?$")
+
+# Grants addressed as "me" are resolved from the access token, so they are never remembered.
+_ME = "me"
+
+# A remembered grant: the error type, message, provider error and status code it failed with.
+_Failure = Tuple[str, str, Optional[dict], Optional[int]]
+
+
+def _grant_path(path: str) -> Tuple[Optional[str], bool]:
+    # The grant a request path belongs to, and whether it is below /v3/grants/{id}.
+    match = _GRANT_PATH.match(path)
+    if match is None or match.group(1) == _ME:
+        return None, False
+    return match.group(1), bool(match.group(2) and match.group(2) != "/")
+
+
+class InvalidGrantCache:
+    """
+    Remembers grants the API reported as invalid, so that further requests for them fail
+    locally instead of reaching the API.
+
+    When a request fails with a NylasApiError whose type is one of `error_types`, its grant
+    is remembered for `ttl` seconds. Until then, requests to paths below /v3/grants/{id}
+    raise a NylasInvalidGrantError with the same type and message without being sent.
+    Requests to /v3/grants/{id} itself are always sent, and a grant they return with a
+    "valid" grant_status is forgotten, as is the grant of a `grant.updated` webhook passed
+    to handle_webhook(). An InvalidGrantCache can be shared by several clients and is
+    thread-safe.
+
+    Args:
+        ttl: How long a grant is remembered as invalid, in seconds.
+        max_grants: The maximum number of grants remembered; the oldest are forgotten first.
+        error_types: The API error types that mark a grant as invalid.
+
+    Attributes:
+        short_circuited: The number of requests that failed without being sent.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_INVALID_GRANT_TTL,
+        max_grants: int = DEFAULT_MAX_GRANTS,
+        error_types: Iterable[str] = DEFAULT_INVALID_GRANT_TYPES,
+    ):
+        self.ttl = ttl
+        self.max_grants = max_grants
+        self.error_types = frozenset(error_types)
+        self.short_circuited = 0
+        self._grants: "OrderedDict[str, Tuple[_Failure, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, grant_id: str) -> bool:
+        return self._failure(grant_id) is not None
+
+    def __len__(self) -> int:
+        return len(self._grants)
+
+    def check(self, path: str) -> None:
+        """
+        Fail a request locally if its grant is remembered as invalid.
+
+        Args:
+            path: The request path.
+
+        Raises:
+            NylasInvalidGrantError: The request is below /v3/grants/{id} and the grant is
+                remembered as invalid.
+        """
+        if not self._grants:
+            return
+        grant_id, below = _grant_path(path)
+        if not below:
+            return
+        failure = self._failure(grant_id)
+        if failure is None:
+            return
+        with self._lock:
+            self.short_circuited += 1
+        error_type, message, provider_error, status_code = failure
+        raise NylasInvalidGrantError(
+            grant_id,
+            NylasApiErrorResponse(
+                None, NylasApiErrorResponseData(error_type, message, provider_error)
+            ),
+            status_code,
+        )
+
+    def record_error(self, path: str, error: NylasApiError) -> None:
+        """
+        Remember the grant of a failed request if the error means it is invalid.
+
+        Args:
+            path: The request path.
+            error: The error the request failed with.
+        """
+        if error.type not in self.error_types or isinstance(
+            error, NylasInvalidGrantError
+        ):
+            return
+        grant_id, _ = _grant_path(path)
+        if grant_id is not None:
+            self.mark_invalid(
+                grant_id,
+                error.type,
+                str(error),
+                error.provider_error,
+                error.status_code,
+            )
+
+    def record_response(self, path: str, response_json) -> None:
+        """
+        Forget a grant if a response for /v3/grants/{id} shows that it is valid.
+
+        Args:
+            path: The request path.
+            response_json: The parsed response body.
+        """
+        if not self._grants:
+            return
+        grant_id, below = _grant_path(path)
+        if grant_id is None or below or not isinstance(response_json, dict):
+            return
+        data = response_json.get("data")
+        if isinstance(data, dict) and data.get("grant_status") == "valid":
+            self.forget(grant_id)
+
+    def handle_webhook(self, notification: dict) -> None:
+        """
+        Update the cache from a webhook notification.
+
+        A `grant.updated` notification forgets its grant, since it is sent when a grant is
+        re-authenticated; a `grant.expired` notification remembers its grant as invalid.
+        Other notifications are ignored.
+
+        Args:
+            notification: The parsed JSON body of the webhook request.
+        """
+        data = notification.get("data") or {}
+        grant = data.get("object") or {}
+        grant_id = grant.get("grant_id") or grant.get("id")
+        if not grant_id:
+            return
+        if notification.get("type") == "grant.updated":
+            self.forget(grant_id)
+        elif notification.get("type") == "grant.expired":
+            self.mark_invalid(
+                grant_id, "grant.expired", f"Grant {grant_id} has expired."
+            )
+
+    def mark_invalid(
+        self,
+        grant_id: str,
+        error_type: str,
+        message: str,
+        provider_error: Optional[dict] = None,
+        status_code: Optional[int] = None,
+    ) -> None:
+        """
+        Remember a grant as invalid.
+
+        Args:
+            grant_id: The ID of the grant.
+            error_type: The error type requests for the grant fail with.
+            message: The error message requests for the grant fail with.
+            provider_error: The provider error requests for the grant fail with.
+            status_code: The HTTP status code requests for the grant fail with.
+        """
+        failure = (error_type, message, provider_error, status_code)
+        with self._lock:
+            self._grants[grant_id] = (failure, time.monotonic() + self.ttl)
+            self._grants.move_to_end(grant_id)
+            while len(self._grants) > self.max_grants:
+                self._grants.popitem(last=False)
+
+    def forget(self, grant_id: str) -> None:
+        """
+        Forget a grant, so that requests for it are sent again.
+
+        Args:
+            grant_id: The ID of the grant.
+        """
+        with self._lock:
+            self._grants.pop(grant_id, None)
+
+    def clear(self) -> None:
+        """Forget every grant."""
+        with self._lock:
+            self._grants.clear()
+
+    def _failure(self, grant_id: Optional[str]) -> Optional[_Failure]:
+        with self._lock:
+            stored = self._grants.get(grant_id)
+            if stored is None:
+                return None
+            if stored[1] <= time.monotonic():
+                del self._grants[grant_id]
+                return None
+            return stored[0]
@@ -0,0 +1,115 @@
+"""
+JSON codecs used by the HTTP clients to encode request bodies and parse responses.
+
+A codec is any object with a `dumps(obj) -> bytes` method that encodes to UTF-8 and a
+`loads(data: bytes)` method. `default_json_codec()` picks orjson when it is installed and
+the standard library otherwise. Bodies passed as `serialized_json_body` (e.g. the canonical
+payloads signed by `ServiceAccountSigner`) are always sent as-is and never re-encoded.
+"""
+
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None
+
+
+class StdlibJsonCodec:
+    """
+    JSON codec backed by the standard library's json module.
+
+    Non-ASCII characters are kept as UTF-8 rather than escaped, and NaN/Infinity are
+    encoded as-is, matching the default `json.dumps` behavior.
+    """
+
+    name = "stdlib"
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode a value as a UTF-8 JSON document.
+
+        Args:
+            obj: The value to encode.
+
+        Returns:
+            The encoded JSON.
+        """
+        return json.dumps(obj, ensure_ascii=False, allow_nan=True).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Parse a JSON document.
+
+        Args:
+            data: The JSON document.
+
+        Returns:
+            The parsed value.
+        """
+        return json.loads(data)
+
+
+class OrjsonJsonCodec(StdlibJsonCodec):
+    """
+    JSON codec backed by orjson, falling back to the standard library for inputs orjson
+    does not accept, so both codecs encode and parse the same values.
+
+    Encoded bodies are compact (no whitespace after separators) but otherwise equivalent to
+    the stdlib codec's. Requires the `orjson` extra (`pip install nylas[orjson]`).
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError(
+                "OrjsonJsonCodec requires orjson. Install it with `pip install nylas[orjson]`."
+            )
+
+    def dumps(self, obj: Any) -> bytes:
+        if _has_non_finite(obj):
+            # orjson encodes NaN and Infinity as null; keep them as the stdlib would.
+            return super().dumps(obj)
+        try:
+            # pylint: disable-next=no-member
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:  # pylint: disable=no-member
+            # E.g. integers wider than 64 bits.
+            return super().dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return orjson.loads(data)  # pylint: disable=no-member
+        except orjson.JSONDecodeError:  # pylint: disable=no-member
+            # E.g. NaN literals or non-UTF-8 encodings, which the stdlib parser accepts.
+            return super().loads(data)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    # Whether a value contains a NaN or infinite float, without recursing.
+    pending = [obj]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            pending.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            pending.extend(value)
+    return False
+
+
+def default_json_codec() -> StdlibJsonCodec:
+    """
+    Get the fastest JSON codec available.
+
+    Returns:
+        An OrjsonJsonCodec if orjson is installed, otherwise a StdlibJsonCodec.
+    """
+    if orjson is not None:
+        return OrjsonJsonCodec()
+    return StdlibJsonCodec()
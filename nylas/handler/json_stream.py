@@ -0,0 +1,231 @@
+"""
+Incremental parsing of JSON list responses.
+
+List responses are a JSON object whose `data` member is an array of items. Instead of
+parsing the whole body at once, `JsonListParser` is fed the body chunk by chunk as it is
+read from the connection and hands each item back as soon as its closing bracket arrives, so
+only the item being read is held in memory rather than the whole page. The other members,
+such as `request_id` and `next_cursor`, are parsed as they appear.
+
+The parser only locates the boundaries of the items and members; each one is then parsed
+with the client's JSON codec.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+from nylas.handler.json_codec import default_json_codec
+
+CHUNK_SIZE = 64 * 1024
+"""The number of bytes of a streamed response body read at a time."""
+
+# The characters delimiting members and items. Whitespace, numbers, booleans and null are
+# skipped over.
+_TOKEN = re.compile(rb'[{}\[\],:"]')
+
+# Inside an item or a member value, only brackets matter: skips everything else up to the
+# next bracket or quote, including short strings without escapes. Longer strings are
+# skipped with _string_end(), which is much faster for them than a regular expression.
+_NESTED = re.compile(rb'(?:[^"\[\]{}]+|"[^"\\]{0,64}")*')
+
+_QUOTE = ord('"')
+_OPEN_OBJECT = ord("{")
+_CLOSE_OBJECT = ord("}")
+_OPEN_ARRAY = ord("[")
+_CLOSE_ARRAY = ord("]")
+_COMMA = ord(",")
+_COLON = ord(":")
+_BACKSLASH = ord("\\")
+
+
+def _string_end(buffer: bytearray, pos: int) -> int:
+    # The index after the closing quote of the string containing pos, or -1 if it has not
+    # arrived yet. The opening quote stops the scan for escaping backslashes.
+    while True:
+        quote = buffer.find(b'"', pos)
+        if quote < 0:
+            return -1
+        escape = quote - 1
+        while buffer[escape] == _BACKSLASH:
+            escape -= 1
+        if (quote - escape) % 2:
+            return quote + 1
+        pos = quote + 1
+
+
+class JsonListParser:
+    """
+    Incrementally parses a JSON object, splitting the items of one of its array members
+    out as they arrive.
+
+    Feed the body to feed() in chunks of any size; each call returns the items completed by
+    that chunk. Members other than the item array are parsed into `fields` as soon as they
+    are complete. If the item member is not an array (e.g. an object holding the items), it
+    is parsed into `fields` whole.
+
+    Args:
+        key: The name of the array member to split into items.
+        loads: The function parsing JSON bytes, e.g. a JSON codec's `loads`.
+        parse_items: Whether to parse the items. If False, feed() returns the raw JSON bytes
+            of each item, which is cheaper when the items are skipped.
+
+    Attributes:
+        fields: The members parsed so far, other than the item array.
+        done: Whether the whole object has been read.
+    """
+
+    def __init__(
+        self,
+        key: str = "data",
+        loads: Optional[Callable[[bytes], Any]] = None,
+        parse_items: bool = True,
+    ):
+        self.key = key
+        self.loads = loads if loads is not None else default_json_codec().loads
+        self.parse_items = parse_items
+        self.fields: Dict[str, Any] = {}
+        self.done = False
+        self._buffer = bytearray()
+        self._pos = 0
+        self._string_start: Optional[int] = None
+        self._depth = 0
+        self._expect_key = False
+        self._member: Optional[str] = None
+        self._value_start: Optional[int] = None
+        self._item_start: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Parse the next chunk of the body.
+
+        Args:
+            chunk: The next bytes of the body.
+
+        Returns:
+            The items completed by this chunk, in order.
+
+        Raises:
+            ValueError: If the body is not a JSON object.
+        """
+        if self.done:
+            if chunk.strip():
+                raise ValueError("Unexpected data after the end of the JSON object")
+            return []
+        self._buffer += chunk
+        items = []
+        self._scan(items)
+        self._compact()
+        return items
+
+    def close(self) -> None:
+        """
+        Check that the whole object has been read once the body is exhausted.
+
+        Raises:
+            ValueError: If the body ended before the object was complete.
+        """
+        if not self.done:
+            raise ValueError("The JSON response ended before it was complete")
+
+    def _scan(self, items: list) -> None:
+        # pylint: disable=too-many-branches,too-many-statements
+        buffer = self._buffer
+        size = len(buffer)
+        pos = self._pos
+        while True:
+            if self._string_start is not None:
+                end = _string_end(buffer, pos)
+                if end < 0:
+                    pos = size
+                    break
+                self._end_string(buffer, self._string_start, end)
+                self._string_start = None
+                pos = end
+                continue
+            if self._depth > 2 or (self._depth == 2 and self._item_start is None):
+                start = _NESTED.match(buffer, pos).end()
+                if start == size:
+                    pos = size
+                    break
+            else:
+                match = _TOKEN.search(buffer, pos)
+                if match is None:
+                    pos = size
+                    break
+                start = match.start()
+            pos = start + 1
+            first = buffer[start]
+            if first == _QUOTE:
+                self._string_start = start
+            elif first in (_OPEN_OBJECT, _OPEN_ARRAY):
+                if self._depth == 0:
+                    if first != _OPEN_OBJECT:
+                        raise ValueError("Expected a JSON object")
+                    self._expect_key = True
+                elif (
+                    self._depth == 1
+                    and first == _OPEN_ARRAY
+                    and self._member == self.key
+                    and not buffer[self._value_start : start].strip()
+                ):
+                    self._value_start = None
+                    self._item_start = pos
+                self._depth += 1
+            elif first in (_CLOSE_OBJECT, _CLOSE_ARRAY):
+                if self._item_start is not None and self._depth == 2:
+                    self._end_item(buffer, start, items)
+                    self._item_start = None
+                self._depth -= 1
+                if self._depth == 0:
+                    self._end_member(buffer, start)
+                    self.done = True
+                    if buffer[pos:].strip():
+                        raise ValueError(
+                            "Unexpected data after the end of the JSON object"
+                        )
+                    break
+            elif first == _COMMA:
+                if self._item_start is not None:
+                    self._end_item(buffer, start, items)
+                    self._item_start = pos
+                elif self._depth == 1:
+                    self._end_member(buffer, start)
+                    self._expect_key = True
+            elif first == _COLON and self._depth == 1:
+                self._value_start = pos
+        self._pos = pos
+
+    def _end_string(self, buffer: bytearray, start: int, end: int) -> None:
+        if self._depth == 1 and self._expect_key:
+            self._member = self.loads(bytes(buffer[start:end]))
+            self._expect_key = False
+
+    def _end_item(self, buffer: bytearray, end: int, items: list) -> None:
+        raw = bytes(buffer[self._item_start : end])
+        if raw.strip():
+            items.append(self.loads(raw) if self.parse_items else raw)
+
+    def _end_member(self, buffer: bytearray, end: int) -> None:
+        if self._value_start is not None:
+            self.fields[self._member] = self.loads(
+                bytes(buffer[self._value_start : end])
+            )
+        self._member = None
+        self._value_start = None
+
+    def _compact(self) -> None:
+        # Drop what has been consumed, keeping the item or member value being read.
+        keep = self._pos
+        for start in (self._item_start, self._value_start, self._string_start):
+            if start is not None and start < keep:
+                keep = start
+        if not keep:
+            return
+        del self._buffer[:keep]
+        self._pos -= keep
+        if self._item_start is not None:
+            self._item_start -= keep
+        if self._value_start is not None:
+            self._value_start -= keep
+        if self._string_start is not None:
+            self._string_start -= keep
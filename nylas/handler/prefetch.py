@@ -0,0 +1,121 @@
+import queue
+import threading
+from typing import AsyncIterator, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_ITEM, _ERROR, _DONE = range(3)
+
+# How often a blocked producer checks whether the consumer went away, in seconds.
+_POLL_INTERVAL = 0.1
+
+
+def prefetching(iterator: Iterator[T], lookahead: int = 1) -> Iterator[T]:
+    """
+    Consume an iterator in a background thread, staying ahead of the caller.
+
+    The thread fetches the next value as soon as the previous one is handed over and blocks
+    once `lookahead` values are waiting, so at most `lookahead` values are buffered on top
+    of the one being fetched. Exceptions raised by the iterator are re-raised to the caller.
+    Closing the returned generator stops the background thread after its current fetch, and
+    the thread then closes the iterator so that it can release what it holds.
+
+    Args:
+        iterator: The iterator to consume, e.g. a paginator.
+        lookahead: The maximum number of values to buffer ahead of the caller.
+
+    Returns:
+        An iterator over the same values.
+    """
+    if lookahead < 1:
+        raise ValueError("lookahead must be at least 1")
+
+    buffer: "queue.Queue" = queue.Queue(maxsize=lookahead)
+    stopped = threading.Event()
+
+    def put(entry) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(entry, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for value in iterator:
+                if not put((_ITEM, value)):
+                    return
+        except Exception as exc:  # pylint: disable=broad-except
+            put((_ERROR, exc))
+        else:
+            put((_DONE, None))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=produce, name="nylas-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            kind, value = buffer.get()
+            if kind == _DONE:
+                return
+            if kind == _ERROR:
+                raise value
+            yield value
+    finally:
+        stopped.set()
+
+
+async def aprefetching(
+    iterator: AsyncIterator[T], lookahead: int = 1
+) -> AsyncIterator[T]:
+    """
+    Async version of prefetching() that consumes the iterator in a background task.
+
+    Args:
+        iterator: The async iterator to consume, e.g. an async paginator.
+        lookahead: The maximum number of values to buffer ahead of the caller.
+
+    Returns:
+        An async iterator over the same values.
+    """
+    # Imported here so that synchronous users do not pay for importing asyncio.
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    if lookahead < 1:
+        raise ValueError("lookahead must be at least 1")
+
+    buffer: "asyncio.Queue" = asyncio.Queue(maxsize=lookahead)
+
+    async def produce():
+        try:
+            async for value in iterator:
+                await buffer.put((_ITEM, value))
+        except Exception as exc:  # pylint: disable=broad-except
+            await buffer.put((_ERROR, exc))
+        else:
+            await buffer.put((_DONE, None))
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            kind, value = await buffer.get()
+            if kind == _DONE:
+                return
+            if kind == _ERROR:
+                raise value
+            yield value
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
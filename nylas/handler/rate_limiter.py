@@ -0,0 +1,304 @@
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Tuple
+from urllib.parse import quote
+
+from nylas.handler.retry import parse_retry_after
+
+APPLICATION_BUCKET = "application"
+"""The key of the bucket shared by every request made with the application's API key."""
+
+DEFAULT_MAX_BUCKETS = 10_000
+"""The default maximum number of buckets kept in memory."""
+
+DEFAULT_IDLE_TIMEOUT = 3600.0
+"""The default number of seconds after which an unused bucket file is deleted."""
+
+_GRANT_PATH = re.compile(r"^/v3/grants/([^/]+)/")
+
+# Bucket state is stored as [tokens, rate, capacity, updated_at] so it serializes compactly.
+_TOKENS, _RATE, _CAPACITY, _UPDATED_AT = range(4)
+
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def grant_bucket_key(path: str) -> Optional[str]:
+    """
+    Get the bucket key for the grant a request path belongs to.
+
+    Args:
+        path: The request path, e.g. /v3/grants/{id}/messages.
+
+    Returns:
+        The grant bucket key, or None if the path is not scoped to a grant.
+    """
+    match = _GRANT_PATH.match(path)
+    if match is None:
+        return None
+    return f"grant:{match.group(1)}"
+
+
+def _header_float(headers, *names) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value.split(",")[0].split(";")[0])
+        except ValueError:
+            continue
+    return None
+
+
+class InMemoryRateLimitBackend:
+    """
+    Rate limit backend that keeps bucket state in the current process.
+
+    Once it holds `max_buckets` buckets, the least recently used ones are dropped; a dropped
+    bucket starts again full, at its configured rate.
+
+    Args:
+        max_buckets: The maximum number of buckets to keep.
+    """
+
+    def __init__(self, max_buckets: int = DEFAULT_MAX_BUCKETS):
+        self.max_buckets = max_buckets
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def update(
+        self, key: str, fn: Callable[[Optional[List[float]]], Tuple[List[float], Any]]
+    ):
+        """
+        Atomically read and replace the state of a bucket.
+
+        Args:
+            key: The bucket key.
+            fn: Called with the current state (None if the bucket is new); returns the new
+                state followed by a value to hand back to the caller.
+
+        Returns:
+            The second value returned by fn.
+        """
+        with self._lock:
+            state, result = fn(self._buckets.get(key))
+            self._buckets[key] = state
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+            return result
+
+
+class FileLockRateLimitBackend:
+    """
+    Rate limit backend that shares bucket state between processes through files.
+
+    Each bucket is stored in its own file in a directory, and every update takes an
+    exclusive lock on that file only, so workers on the same host that point at the same
+    directory share one set of buckets and an update costs the same however many grants
+    there are. Bucket files unused for `idle_timeout` seconds are deleted; a deleted bucket
+    starts again full, at its configured rate. Requires a POSIX platform.
+
+    Args:
+        path: The path of the state directory. It is created if it does not exist.
+        idle_timeout: The number of seconds after which an unused bucket file is deleted.
+    """
+
+    def __init__(self, path: str, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        import fcntl  # pylint: disable=import-outside-toplevel
+
+        self._fcntl = fcntl
+        self.path = path
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._swept_at = time.time()
+        os.makedirs(path, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(os.listdir(self.path))
+
+    def update(
+        self, key: str, fn: Callable[[Optional[List[float]]], Tuple[List[float], Any]]
+    ):
+        """
+        Atomically read and replace the state of a bucket.
+
+        Args:
+            key: The bucket key.
+            fn: Called with the current state (None if the bucket is new); returns the new
+                state followed by a value to hand back to the caller.
+
+        Returns:
+            The second value returned by fn.
+        """
+        path = os.path.join(self.path, quote(key, safe=""))
+        with self._lock, open(
+            os.open(path, os.O_RDWR | os.O_CREAT, 0o600), "r+", encoding="utf-8"
+        ) as f:
+            self._fcntl.flock(f, self._fcntl.LOCK_EX)
+            try:
+                raw = f.read()
+                state, result = fn(json.loads(raw) if raw else None)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                self._fcntl.flock(f, self._fcntl.LOCK_UN)
+            if time.time() - self._swept_at >= self.idle_timeout:
+                self._sweep()
+            return result
+
+    def _sweep(self) -> None:
+        # Delete the bucket files that have not been updated for idle_timeout seconds.
+        now = time.time()
+        self._swept_at = now
+        for entry in os.scandir(self.path):
+            try:
+                if entry.stat().st_mtime < now - self.idle_timeout:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                # Another process swept it first.
+                continue
+
+
+class RateLimiter:
+    """
+    Client-side token bucket rate limiter for requests to the Nylas API.
+
+    Every request takes a token from the application bucket and, for requests under
+    /v3/grants/{id}/, from that grant's bucket too, waiting until both have one available.
+    Refill rates adapt to the API's rate limit headers, are halved whenever the API responds
+    with 429, and recover gradually afterwards.
+
+    Args:
+        application_rate: The sustained requests per second allowed for the application.
+        grant_rate: The sustained requests per second allowed for each grant.
+        burst: The bucket capacity as a multiple of the rate, allowing short bursts.
+        min_rate: The lowest rate a bucket is throttled down to, in requests per second.
+        backend: Where bucket state is stored. Defaults to an in-memory backend; use
+            FileLockRateLimitBackend to share buckets between processes.
+    """
+
+    def __init__(
+        self,
+        application_rate: float = 50.0,
+        grant_rate: float = 10.0,
+        burst: float = 1.0,
+        min_rate: float = 0.1,
+        backend=None,
+    ):
+        self.application_rate = application_rate
+        self.grant_rate = grant_rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.backend = backend if backend is not None else InMemoryRateLimitBackend()
+
+    def reserve(self, path: str) -> float:
+        """
+        Take a token for a request without blocking.
+
+        Args:
+            path: The request path.
+
+        Returns:
+            The number of seconds the caller must wait before sending the request.
+        """
+        delay = self._take(APPLICATION_BUCKET, self.application_rate)
+        grant_key = grant_bucket_key(path)
+        if grant_key is not None:
+            delay = max(delay, self._take(grant_key, self.grant_rate))
+        return delay
+
+    def acquire(self, path: str) -> None:
+        """
+        Block until a request to the given path may be sent.
+
+        Args:
+            path: The request path.
+        """
+        delay = self.reserve(path)
+        if delay > 0:
+            time.sleep(delay)
+
+    def update(self, path: str, status_code: int, headers) -> None:
+        """
+        Adapt the buckets of a request to the API's response.
+
+        The rate limit and Retry-After headers of a request under /v3/grants/{id}/ describe
+        that grant's quota, so they only adapt the grant's bucket; the application bucket's
+        rate is still halved by a 429 response and recovers after it.
+
+        Args:
+            path: The request path.
+            status_code: The HTTP status code of the response.
+            headers: The response headers.
+        """
+        grant_key = grant_bucket_key(path)
+
+        limit = _header_float(headers, "X-RateLimit-Limit", "RateLimit-Limit")
+        remaining = _header_float(
+            headers, "X-RateLimit-Remaining", "RateLimit-Remaining"
+        )
+        reset = _header_float(headers, "X-RateLimit-Reset", "RateLimit-Reset")
+        if reset is not None and reset > _EPOCH_THRESHOLD:
+            # Some APIs send the reset time as a unix timestamp instead of a delay.
+            reset = max(0.0, reset - time.time())
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+
+        def adapter(default_rate: float, scoped: bool):
+            # scoped: whether the response's headers describe this bucket's quota.
+            def adapt(state):
+                now = time.time()
+                state = self._refill(state, default_rate, now)
+                if status_code == 429:
+                    state[_RATE] = max(self.min_rate, state[_RATE] / 2)
+                    state[_TOKENS] = min(state[_TOKENS], 0.0)
+                    if scoped and retry_after:
+                        state[_TOKENS] = -retry_after * state[_RATE]
+                elif scoped and remaining is not None and reset:
+                    # Pace the remaining quota evenly over the rest of the window.
+                    state[_RATE] = max(self.min_rate, remaining / reset)
+                    state[_TOKENS] = min(state[_TOKENS], remaining)
+                elif scoped and limit is not None and reset:
+                    state[_RATE] = max(self.min_rate, limit / reset)
+                else:
+                    # Recover additively towards the configured rate after throttling.
+                    state[_RATE] = min(default_rate, state[_RATE] + default_rate * 0.05)
+                state[_CAPACITY] = max(1.0, state[_RATE] * self.burst)
+                return state, None
+
+            return adapt
+
+        if grant_key is not None:
+            self.backend.update(grant_key, adapter(self.grant_rate, True))
+        self.backend.update(
+            APPLICATION_BUCKET, adapter(self.application_rate, grant_key is None)
+        )
+
+    def _refill(self, state, default_rate: float, now: float) -> List[float]:
+        if state is None:
+            capacity = max(1.0, default_rate * self.burst)
+            return [capacity, default_rate, capacity, now]
+
+        elapsed = max(0.0, now - state[_UPDATED_AT])
+        tokens = min(state[_CAPACITY], state[_TOKENS] + elapsed * state[_RATE])
+        return [tokens, state[_RATE], state[_CAPACITY], now]
+
+    def _take(self, key: str, default_rate: float) -> float:
+        def take(state):
+            state = self._refill(state, default_rate, time.time())
+            # Reserve the token even if it is not available yet so that concurrent callers
+            # queue up behind each other instead of waking up together.
+            state[_TOKENS] -= 1
+            delay = 0.0 if state[_TOKENS] >= 0 else -state[_TOKENS] / state[_RATE]
+            return state, delay
+
+        return self.backend.update(key, take)
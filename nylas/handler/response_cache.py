@@ -0,0 +1,354 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+CACHE_STATUS_HEADER = "X-Nylas-Sdk-Cache"
+"""Response header set to "hit" on responses served from the response cache."""
+
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    "applications": 300.0,
+    "calendars": 60.0,
+    "connectors": 300.0,
+    "folders": 60.0,
+    "grants": 60.0,
+    "webhooks": 300.0,
+}
+"""The default time to live in seconds of cached responses, by resource."""
+
+DEFAULT_MAX_ENTRIES = 1024
+"""The default maximum number of responses a cache backend keeps."""
+
+# A cached response: the raw response body and the response headers.
+CacheEntry = Tuple[bytes, Dict[str, str]]
+
+
+def cache_resource(path: str) -> str:
+    """
+    Get the name of the resource a request path belongs to, used to look up its TTL.
+
+    Args:
+        path: The request path, e.g. /v3/grants/{id}/calendars/{id}.
+
+    Returns:
+        The resource name, e.g. "calendars". Paths directly under /v3/grants/{id} resolve
+        to the resource below the grant, and /v3/grants/{id} itself to "grants".
+    """
+    segments = [segment for segment in path.split("/") if segment]
+    if segments and segments[0] == "v3":
+        segments = segments[1:]
+    if len(segments) > 2 and segments[0] == "grants":
+        segments = segments[2:]
+    return segments[0] if segments else ""
+
+
+def request_key(method: str, url: str, credentials: Optional[str]) -> str:
+    """
+    Build a key identifying a request by method, URL and credentials.
+
+    Args:
+        method: The HTTP method.
+        url: The full request URL, including the query string.
+        credentials: The Authorization header of the request, if any. Only a fingerprint of
+            it is part of the key.
+
+    Returns:
+        The request key.
+    """
+    fingerprint = hashlib.sha256((credentials or "").encode("utf-8")).hexdigest()
+    return f"{fingerprint[:32]} {method.upper()} {url}"
+
+
+def _parent_path(path: str) -> str:
+    return path.rstrip("/").rsplit("/", 1)[0]
+
+
+class InMemoryCacheBackend:
+    """
+    Cache backend that keeps responses in the current process, evicting the least
+    recently used entries once it is full.
+
+    Args:
+        max_entries: The maximum number of responses to keep.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, CacheEntry, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Get a cached response.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached response, or None if it is missing or expired.
+        """
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is None:
+                return None
+            if stored[2] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return stored[1]
+
+    def set(self, key: str, path: str, entry: CacheEntry, ttl: float) -> None:
+        """
+        Cache a response.
+
+        Args:
+            key: The cache key.
+            path: The request path, used for invalidation.
+            entry: The response to cache.
+            ttl: How long the response stays valid, in seconds.
+        """
+        with self._lock:
+            self._entries[key] = (path, entry, time.time() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: str, subtree: bool = False) -> None:
+        """
+        Remove the cached responses of a path.
+
+        Args:
+            path: The request path.
+            subtree: Whether to also remove the responses of every path below it.
+        """
+        prefix = path.rstrip("/") + "/"
+        with self._lock:
+            stale = [
+                key
+                for key, (entry_path, _, _) in self._entries.items()
+                if entry_path == path or (subtree and entry_path.startswith(prefix))
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SqliteCacheBackend:
+    """
+    Cache backend that shares responses between processes on the same host through an
+    SQLite database file, evicting the least recently used entries once it is full.
+
+    Args:
+        path: The path of the database file. It is created if it does not exist.
+        max_entries: The maximum number of responses to keep.
+    """
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        import sqlite3  # pylint: disable=import-outside-toplevel
+
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, path TEXT NOT NULL, body BLOB NOT NULL, "
+                "headers TEXT NOT NULL, expires_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_path ON responses (path)"
+            )
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Get a cached response.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached response, or None if it is missing or expired.
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT body, headers FROM responses WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET used_at = ? WHERE key = ?", (now, key)
+            )
+        return bytes(row[0]), _decode_headers(row[1])
+
+    def set(self, key: str, path: str, entry: CacheEntry, ttl: float) -> None:
+        """
+        Cache a response.
+
+        Args:
+            key: The cache key.
+            path: The request path, used for invalidation.
+            entry: The response to cache.
+            ttl: How long the response stays valid, in seconds.
+        """
+        now = time.time()
+        body, headers = entry
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, path, body, _encode_headers(headers), now + ttl, now),
+            )
+            self._connection.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                "ORDER BY expires_at <= ?, used_at DESC LIMIT -1 OFFSET ?)",
+                (now, self.max_entries),
+            )
+
+    def invalidate(self, path: str, subtree: bool = False) -> None:
+        """
+        Remove the cached responses of a path.
+
+        Args:
+            path: The request path.
+            subtree: Whether to also remove the responses of every path below it.
+        """
+        with self._lock, self._connection:
+            if subtree:
+                prefix = path.rstrip("/") + "/"
+                self._connection.execute(
+                    "DELETE FROM responses WHERE path = ? OR substr(path, 1, ?) = ?",
+                    (path, len(prefix), prefix),
+                )
+            else:
+                self._connection.execute(
+                    "DELETE FROM responses WHERE path = ?", (path,)
+                )
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+
+def _encode_headers(headers: Dict[str, str]) -> str:
+    return "\n".join(f"{name}: {value}" for name, value in headers.items())
+
+
+def _decode_headers(encoded: str) -> Dict[str, str]:
+    return dict(line.split(": ", 1) for line in encoded.split("\n") if line)
+
+
+class ResponseCache:
+    """
+    Opt-in cache for GET responses of slow-changing resources.
+
+    Responses are keyed by method, URL (including the query) and a fingerprint of the
+    credentials the request was made with, and cached for the TTL of their resource; GETs to
+    resources without a TTL are never cached. When the client sends any other request, the
+    cached responses of its path, of every path below it and of its parent collection are
+    invalidated, so e.g. updating a calendar invalidates both `calendars.find` and
+    `calendars.list` for that grant.
+
+    Args:
+        ttls: The time to live in seconds of cached responses, by resource name as returned
+            by cache_resource(). Defaults to DEFAULT_CACHE_TTLS.
+        backend: Where responses are stored. Defaults to an InMemoryCacheBackend; use
+            SqliteCacheBackend to share cached responses between processes.
+
+    Attributes:
+        hits: The number of requests served from the cache.
+        misses: The number of cacheable requests that were not in the cache.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, backend=None):
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.backend = backend if backend is not None else InMemoryCacheBackend()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """
+        Get how long responses of a path are cached.
+
+        Args:
+            path: The request path.
+
+        Returns:
+            The TTL in seconds, or None if responses of the path are not cached.
+        """
+        ttl = self.ttls.get(cache_resource(path))
+        return ttl if ttl else None
+
+    def key(self, method: str, url: str, credentials: Optional[str]) -> str:
+        """
+        Build the cache key of a request.
+
+        Args:
+            method: The HTTP method.
+            url: The full request URL, including the query string.
+            credentials: The Authorization header of the request, if any.
+
+        Returns:
+            The cache key.
+        """
+        return request_key(method, url, credentials)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Get a cached response, counting the lookup as a hit or a miss.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached response body and headers, or None.
+        """
+        entry = self.backend.get(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def set(self, key: str, path: str, entry: CacheEntry) -> None:
+        """
+        Cache a response for the TTL of its resource.
+
+        Args:
+            key: The cache key.
+            path: The request path.
+            entry: The response body and headers.
+        """
+        ttl = self.ttl_for(path)
+        if ttl is not None:
+            self.backend.set(key, path, entry, ttl)
+
+    def invalidate(self, path: str) -> None:
+        """
+        Invalidate the cached responses affected by a change to a path.
+
+        Args:
+            path: The path of the create, update or delete request.
+        """
+        self.backend.invalidate(path, subtree=True)
+        self.backend.invalidate(_parent_path(path))
+
+    def clear(self) -> None:
+        """Remove every cached response and reset the counters."""
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
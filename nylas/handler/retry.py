@@ -0,0 +1,141 @@
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+RETRY_COUNT_HEADER = "X-Nylas-Sdk-Retry-Count"
+"""Response header the SDK sets to report how many times a request was retried."""
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+"""HTTP status codes that are retried by default."""
+
+DEFAULT_RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+"""Idempotent HTTP methods that are retried by default."""
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """
+    Parse a Retry-After header value into a number of seconds to wait.
+
+    Args:
+        value: The header value, either delay-seconds or an HTTP-date.
+        now: The current unix time, used when the value is an HTTP-date.
+
+    Returns:
+        The number of seconds to wait, or None if the value is missing or invalid.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Policy for automatically retrying failed requests to the Nylas API.
+
+    Idempotent methods are retried on the configured status codes and on connection
+    errors, waiting with exponential backoff and full jitter between attempts, or for as
+    long as the server asks via the Retry-After header. POST requests are only retried when
+    `retry_post` is enabled, in which case each POST is sent with an idempotency key header
+    so the API can deduplicate repeated attempts.
+
+    Attributes:
+        max_attempts: The maximum number of attempts per request, including the first one.
+        total_timeout: The time budget across all attempts and waits, in seconds.
+            Set to None to only bound retries by max_attempts.
+        backoff_factor: The base delay of the exponential backoff, in seconds.
+        max_backoff: The maximum delay between two attempts, in seconds.
+        retry_statuses: The HTTP status codes to retry.
+        retry_methods: The HTTP methods to retry.
+        retry_post: Whether to retry POST requests, keyed by an idempotency header.
+        idempotency_header: The header used to send the idempotency key of POST requests.
+        respect_retry_after: Whether to wait for the duration requested by Retry-After.
+    """
+
+    max_attempts: int = 3
+    total_timeout: Optional[float] = 60.0
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    retry_statuses: FrozenSet[int] = field(default=DEFAULT_RETRY_STATUSES)
+    retry_methods: FrozenSet[str] = field(default=DEFAULT_RETRY_METHODS)
+    retry_post: bool = False
+    idempotency_header: str = "Idempotency-Key"
+    respect_retry_after: bool = True
+
+    def is_retryable_request(self, method: str, headers: dict) -> bool:
+        """
+        Check whether a request may be retried at all.
+
+        Args:
+            method: The HTTP method of the request.
+            headers: The headers of the request.
+
+        Returns:
+            True if the request can safely be sent more than once.
+        """
+        method = method.upper()
+        if method == "POST":
+            return self.retry_post and self.idempotency_header in headers
+        return method in self.retry_methods
+
+    def backoff(self, retry_number: int) -> float:
+        """
+        Compute the jittered exponential backoff before a retry.
+
+        Args:
+            retry_number: The number of the upcoming retry, starting at 1.
+
+        Returns:
+            The number of seconds to wait.
+        """
+        ceiling = min(self.max_backoff, self.backoff_factor * (2 ** (retry_number - 1)))
+        return random.uniform(0, ceiling)
+
+    def next_delay(
+        self,
+        retry_number: int,
+        started_at: float,
+        retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry and how long to wait first.
+
+        Args:
+            retry_number: The number of the upcoming retry, starting at 1.
+            started_at: The monotonic time the first attempt was sent.
+            retry_after: The Retry-After header of the failed response, if any.
+
+        Returns:
+            The number of seconds to wait, or None if the request should not be retried.
+        """
+        if retry_number >= self.max_attempts:
+            return None
+
+        delay = None
+        if self.respect_retry_after:
+            delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = self.backoff(retry_number)
+
+        if self.total_timeout is not None:
+            remaining = self.total_timeout - (time.monotonic() - started_at)
+            if delay >= remaining:
+                return None
+
+        return delay
@@ -0,0 +1,259 @@
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from nylas.models.response import LazyList, ListResponse, Response
+
+DEFAULT_MAX_ENTRIES = 256
+"""The default maximum number of responses a RevalidationCache keeps."""
+
+
+def content_digest(content: bytes) -> str:
+    """
+    Hash a response body, to detect an unchanged response the server sent no validators for.
+
+    Args:
+        content: The raw response body.
+
+    Returns:
+        The hex digest of the body.
+    """
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+class StoredResponse:
+    """
+    A response body kept by a RevalidationCache, with the validators it is revalidated with.
+
+    The raw body is kept rather than the JSON returned with the response, which its caller
+    may change. The body is parsed again the first time the response is revalidated as
+    unchanged, and every later hit shares that JSON and the result it was decoded into.
+
+    Attributes:
+        content: The raw response body.
+        headers: The response headers.
+        etag: The ETag response header, if any.
+        last_modified: The Last-Modified response header, if any.
+        digest: The content_digest() of the response body.
+        response_json: The body parsed on the first hit, or None.
+        decoded: The results the body was decoded into, by the function decoding it. It is
+            shared with the responses this one is revalidated into.
+    """
+
+    __slots__ = (
+        "content",
+        "headers",
+        "etag",
+        "last_modified",
+        "digest",
+        "response_json",
+        "decoded",
+    )
+
+    def __init__(self, content: bytes, headers, digest: str):
+        self.content = content
+        self.headers = headers
+        self.etag: Optional[str] = headers.get("ETag")
+        self.last_modified: Optional[str] = headers.get("Last-Modified")
+        self.digest = digest
+        self.response_json: Any = None
+        self.decoded: Dict[Callable, Any] = {}
+
+
+class RevalidatedResponse(tuple):
+    """
+    A response revalidated as unchanged, unpacking like the (json, headers) tuple returned by
+    HttpClient._execute().
+
+    The JSON is a shallow copy of the stored JSON, with the request ID of the response that
+    was actually sent. decode() returns a copy of the result the stored response was decoded
+    into before, so an unchanged response is neither parsed nor decoded again.
+    """
+
+    stored: StoredResponse
+
+    def __new__(cls, stored: StoredResponse, headers):
+        response_json = stored.response_json
+        if isinstance(response_json, dict):
+            response_json = dict(response_json)
+            request_id = headers.get("X-Request-Id")
+            if request_id:
+                response_json["request_id"] = request_id
+        instance = super().__new__(cls, (response_json, headers))
+        instance.stored = stored
+        return instance
+
+    def decode(self, decode: Callable[[Dict, Any], Any]) -> Any:
+        """
+        Decode the response, copying the result it was decoded into before, if any.
+
+        The models of a Response or ListResponse are copied shallowly, so each call can
+        change their fields; values nested in them are shared between calls. Other results
+        are decoded again.
+
+        Args:
+            decode: Callable taking the response JSON and headers and returning the result.
+
+        Returns:
+            The decoded response, with the headers and request ID of this response.
+        """
+        result = self.stored.decoded.get(decode)
+        if result is None:
+            result = decode(*self)
+            if not isinstance(result, (Response, ListResponse)):
+                return result
+            self.stored.decoded[decode] = result
+        return _copy_result(result, *self)
+
+
+def _copy_result(result, response_json, headers):
+    request_id = (
+        response_json.get("request_id") if isinstance(response_json, dict) else None
+    )
+    if isinstance(result, ListResponse):
+        data = result.data
+        if isinstance(data, LazyList):
+            data = copy.copy(data)
+        else:
+            data = [copy.copy(item) for item in data]
+        return ListResponse(
+            data, request_id or result.request_id, result.next_cursor, headers
+        )
+    return Response(copy.copy(result.data), request_id or result.request_id, headers)
+
+
+class RevalidationCache:
+    """
+    Opt-in store of GET responses that are revalidated instead of downloaded again.
+
+    The next identical GET (same URL and credentials) is sent with If-None-Match and
+    If-Modified-Since headers built from the stored ETag and Last-Modified validators. When
+    the API answers 304 Not Modified, the stored body is used instead of downloading it
+    again; a response without validators whose body is identical to the stored one is
+    recognized by its digest. Either way, the stored response is neither parsed nor decoded
+    again: resources return a copy of the Response or ListResponse it was decoded into,
+    with the headers and request ID of the response that was actually sent.
+
+    The least recently used responses are evicted once max_entries are stored.
+
+    Args:
+        max_entries: The maximum number of responses to keep.
+
+    Attributes:
+        hits: The number of responses served from the store after revalidation.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self._entries: "OrderedDict[str, StoredResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[StoredResponse]:
+        """
+        Get the stored response of a request.
+
+        Args:
+            key: The request key.
+
+        Returns:
+            The stored response, or None.
+        """
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is not None:
+                self._entries.move_to_end(key)
+            return stored
+
+    def conditional_headers(self, stored: StoredResponse) -> Dict[str, str]:
+        """
+        Build the headers that make a request conditional on a stored response.
+
+        Args:
+            stored: The stored response.
+
+        Returns:
+            The If-None-Match and If-Modified-Since headers the stored response has
+            validators for.
+        """
+        headers = {}
+        if stored.etag:
+            headers["If-None-Match"] = stored.etag
+        if stored.last_modified:
+            headers["If-Modified-Since"] = stored.last_modified
+        return headers
+
+    def resolve(
+        self,
+        key: str,
+        stored: Optional[StoredResponse],
+        status_code: int,
+        content: bytes,
+        headers,
+        parse: Callable[[], Tuple[Dict, Any]],
+        loads: Callable[[bytes], Any] = json.loads,
+    ) -> Tuple[Dict, Any]:
+        """
+        Resolve the response to a request, from the store when it is unchanged.
+
+        Args:
+            key: The request key.
+            stored: The response stored for the request when it was sent, if any.
+            status_code: The status code of the response.
+            content: The raw response body.
+            headers: The response headers.
+            parse: Validates and parses the response body into its JSON and headers.
+            loads: Parses a stored response body.
+
+        Returns:
+            The response JSON and headers: a RevalidatedResponse if the response is
+            unchanged, otherwise parsed from the response, which is stored if it succeeded.
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        digest = content_digest(content) if status_code == 200 else None
+        if stored is not None and (status_code == 304 or digest == stored.digest):
+            return self._hit(key, stored, status_code, headers, loads)
+        response_json, headers = parse()
+        if digest is not None:
+            self._store(key, StoredResponse(content, headers, digest))
+        return response_json, headers
+
+    def clear(self) -> None:
+        """Remove every stored response and reset the counter."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+
+    def _hit(self, key: str, stored: StoredResponse, status_code, headers, loads):
+        if status_code == 304:
+            # A 304 carries the current headers of the stored response, except its body's.
+            merged = stored.headers.copy()
+            for name, value in headers.items():
+                if name.lower() != "content-length":
+                    merged[name] = value
+            current = StoredResponse(stored.content, merged, stored.digest)
+            current.response_json, current.decoded = (
+                stored.response_json,
+                stored.decoded,
+            )
+            stored = current
+            self._store(key, stored)
+            headers = merged.copy()
+        if stored.response_json is None:
+            stored.response_json = loads(stored.content)
+        with self._lock:
+            self.hits += 1
+        return RevalidatedResponse(stored, headers)
+
+    def _store(self, key: str, stored: StoredResponse) -> None:
+        with self._lock:
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,126 @@
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# The outcome waiters receive when the task making the call is cancelled, telling them to
+# make the call themselves.
+_LEADER_CANCELLED = object()
+
+
+class _Call:
+    """An in-flight call and the outcome its waiters receive."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical requests into one in-flight call.
+
+    While a call for a key is in flight, every other caller asking for the same key waits for
+    it and receives its result, or its exception, instead of sending the request again. The
+    key is forgotten as soon as the call completes, so nothing is cached: a request made after
+    the call returned is sent again. A SingleFlight can be shared by several clients and is
+    thread-safe; do() coalesces calls across threads and ado() across tasks. When the task
+    making a call is cancelled, the tasks waiting for it make the call again, one of them
+    taking its place.
+
+    Attributes:
+        coalesced: The number of calls that were served by another caller's request.
+    """
+
+    def __init__(self):
+        self.coalesced = 0
+        self._calls: Dict[str, _Call] = {}
+        self._tasks: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, call: Callable[[], Any]) -> Any:
+        """
+        Run a call, or wait for the in-flight call with the same key.
+
+        Args:
+            key: The key identifying the request.
+            call: Sends the request and returns its result.
+
+        Returns:
+            The result of the call.
+        """
+        with self._lock:
+            flight = self._calls.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = call()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            flight.done.set()
+        return flight.result
+
+    async def ado(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await a call, or the in-flight call with the same key.
+
+        Args:
+            key: The key identifying the request.
+            call: Returns an awaitable that sends the request and returns its result.
+
+        Returns:
+            The result of the call.
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        while True:
+            with self._lock:
+                future = self._tasks.get(key)
+                leader = future is None
+                if leader:
+                    future = self._tasks[key] = (
+                        asyncio.get_running_loop().create_future()
+                    )
+                else:
+                    self.coalesced += 1
+            if leader:
+                break
+            # Shielded so that a cancelled waiter does not cancel the other waiters.
+            result = await asyncio.shield(future)
+            if result is not _LEADER_CANCELLED:
+                return result
+            # Not served by the call after all: make it again, or wait for another waiter's.
+            with self._lock:
+                self.coalesced -= 1
+
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.set_result(_LEADER_CANCELLED)
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark the exception as retrieved in case no other task waited for it.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                del self._tasks[key]
+        return result
@@ -0,0 +1,242 @@
+"""
+Prometheus and OpenTelemetry adapters for request hooks.
+
+Both record every request reported to a client's `Hooks`, labeled by method and templated
+path so that the number of series stays bounded. `PrometheusMetrics` requires
+`prometheus-client` (`pip install nylas[prometheus]`) and `OpenTelemetryTracing` requires
+`opentelemetry-api` (`pip install nylas[opentelemetry]`); they are only imported once an
+adapter is created.
+"""
+
+from typing import Tuple
+
+from nylas._client_sdk_version import __VERSION__
+from nylas.handler.hooks import Hooks, RequestInfo
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+"""The default histogram buckets for request and phase durations, in seconds."""
+
+_SPAN_STATE = "opentelemetry_span"
+
+
+def _status_label(info: RequestInfo) -> str:
+    return str(info.status_code) if info.status_code is not None else "none"
+
+
+class PrometheusMetrics:
+    """
+    Records the requests of a client as Prometheus metrics.
+
+    Metrics, prefixed with `namespace`:
+
+    * `_request_duration_seconds`: histogram of request durations, labeled by method, path
+      and status. Failed requests are labeled with their status if they got a response.
+    * `_request_phase_seconds`: histogram of the time spent in each phase (connect, tls,
+      ttfb, download, parse, decode), labeled by method, path and phase.
+    * `_request_body_bytes_total` and `_response_body_bytes_total`: counters of the bytes
+      sent and received, labeled by method and path.
+    * `_request_errors_total`: counter of failed requests, labeled by method, path and the
+      exception type.
+    * `_request_retries_total`: counter of retried attempts, labeled by method and path.
+
+    Args:
+        registry: The registry to register the metrics with; the default registry if unset.
+        namespace: The prefix of the metric names.
+        buckets: The histogram buckets, in seconds.
+    """
+
+    def __init__(
+        self,
+        registry=None,
+        namespace: str = "nylas",
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        try:
+            # pylint: disable-next=import-outside-toplevel
+            from prometheus_client import REGISTRY, Counter, Histogram
+        except ImportError as exc:
+            raise ImportError(
+                "PrometheusMetrics requires prometheus-client. "
+                "Install it with `pip install nylas[prometheus]`."
+            ) from exc
+
+        registry = registry if registry is not None else REGISTRY
+        self.duration = Histogram(
+            "request_duration_seconds",
+            "Duration of Nylas API requests.",
+            ["method", "path", "status"],
+            namespace=namespace,
+            buckets=buckets,
+            registry=registry,
+        )
+        self.phases = Histogram(
+            "request_phase_seconds",
+            "Time spent in each phase of Nylas API requests.",
+            ["method", "path", "phase"],
+            namespace=namespace,
+            buckets=buckets,
+            registry=registry,
+        )
+        self.bytes_out = Counter(
+            "request_body_bytes",
+            "Bytes of request bodies sent to the Nylas API.",
+            ["method", "path"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.bytes_in = Counter(
+            "response_body_bytes",
+            "Bytes of response bodies received from the Nylas API.",
+            ["method", "path"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.errors = Counter(
+            "request_errors",
+            "Failed Nylas API requests.",
+            ["method", "path", "error"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.retries = Counter(
+            "request_retries",
+            "Retried attempts of Nylas API requests.",
+            ["method", "path"],
+            namespace=namespace,
+            registry=registry,
+        )
+
+    def register(self, hooks: Hooks) -> None:
+        """
+        Record the requests reported to hooks, such as a client's `hooks`.
+
+        Args:
+            hooks: The hooks to register with.
+        """
+        hooks.on_response(self._on_response)
+        hooks.on_error(self._on_error)
+        hooks.on_retry(self._on_retry)
+
+    def _on_response(self, info: RequestInfo) -> None:
+        self._observe(info)
+        if info.bytes_out:
+            self.bytes_out.labels(info.method, info.path).inc(info.bytes_out)
+        if info.bytes_in:
+            self.bytes_in.labels(info.method, info.path).inc(info.bytes_in)
+
+    def _on_error(self, info: RequestInfo) -> None:
+        self._observe(info)
+        self.errors.labels(info.method, info.path, type(info.error).__name__).inc()
+
+    def _on_retry(self, info: RequestInfo) -> None:
+        self.retries.labels(info.method, info.path).inc()
+
+    def _observe(self, info: RequestInfo) -> None:
+        self.duration.labels(info.method, info.path, _status_label(info)).observe(
+            info.duration
+        )
+        for phase, seconds in info.timings.items():
+            self.phases.labels(info.method, info.path, phase).observe(seconds)
+
+
+class OpenTelemetryTracing:
+    """
+    Records each request of a client as an OpenTelemetry client span.
+
+    Spans are named `{method} {path}` with the templated path, start when the request is
+    sent and end once its response is decoded or it fails. They carry the HTTP semantic
+    convention attributes (`http.request.method`, `url.full`, `url.template`,
+    `http.response.status_code`, body sizes), the Nylas request ID as `nylas.request_id` and
+    the phase timings as `nylas.timing.<phase>` attributes in seconds. Retries are recorded
+    as `retry` events; failed requests record the exception and an error status.
+
+    Args:
+        tracer_provider: The tracer provider to get the tracer from; the global one if unset.
+    """
+
+    def __init__(self, tracer_provider=None):
+        try:
+            # pylint: disable-next=import-outside-toplevel
+            from opentelemetry import trace
+        except ImportError as exc:
+            raise ImportError(
+                "OpenTelemetryTracing requires opentelemetry-api. "
+                "Install it with `pip install nylas[opentelemetry]`."
+            ) from exc
+
+        self._trace = trace
+        self.tracer = trace.get_tracer(
+            "nylas", __VERSION__, tracer_provider=tracer_provider
+        )
+
+    def register(self, hooks: Hooks) -> None:
+        """
+        Trace the requests reported to hooks, such as a client's `hooks`.
+
+        Args:
+            hooks: The hooks to register with.
+        """
+        hooks.on_request(self._on_request)
+        hooks.on_response(self._on_response)
+        hooks.on_error(self._on_error)
+        hooks.on_retry(self._on_retry)
+
+    def _on_request(self, info: RequestInfo) -> None:
+        info.state[_SPAN_STATE] = self.tracer.start_span(
+            f"{info.method} {info.path}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={
+                "http.request.method": info.method,
+                "url.full": info.url,
+                "url.template": info.path,
+            },
+        )
+
+    def _on_response(self, info: RequestInfo) -> None:
+        span = self._end_span(info)
+        if span is None:
+            return
+        if info.status_code is not None and info.status_code >= 400:
+            span.set_status(self._trace.StatusCode.ERROR)
+        span.end()
+
+    def _on_error(self, info: RequestInfo) -> None:
+        span = self._end_span(info)
+        if span is not None:
+            span.set_attribute("error.type", type(info.error).__name__)
+            span.record_exception(info.error)
+            span.set_status(self._trace.StatusCode.ERROR, str(info.error))
+            span.end()
+
+    def _on_retry(self, info: RequestInfo) -> None:
+        span = info.state.get(_SPAN_STATE)
+        if span is None:
+            return
+        attributes = {
+            "nylas.retry": info.retries,
+            "nylas.retry_delay": info.retry_delay,
+        }
+        if info.status_code is not None:
+            attributes["http.response.status_code"] = info.status_code
+        if info.error is not None:
+            attributes["error.type"] = type(info.error).__name__
+        span.add_event("retry", attributes)
+
+    def _end_span(self, info: RequestInfo):
+        # Sets the attributes known once the request is over; the caller ends the span.
+        span = info.state.pop(_SPAN_STATE, None)
+        if span is None:
+            return None
+        if info.status_code is not None:
+            span.set_attribute("http.response.status_code", info.status_code)
+        if info.request_id is not None:
+            span.set_attribute("nylas.request_id", info.request_id)
+        if info.bytes_out:
+            span.set_attribute("http.request.body.size", info.bytes_out)
+        if info.bytes_in is not None:
+            span.set_attribute("http.response.body.size", info.bytes_in)
+        if info.retries:
+            span.set_attribute("http.request.resend_count", info.retries)
+        for phase, seconds in info.timings.items():
+            span.set_attribute(f"nylas.timing.{phase}", seconds)
+        return span
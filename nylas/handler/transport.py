@@ -0,0 +1,280 @@
+"""
+Pluggable transports for the HTTP clients.
+
+A transport sends a fully built request and returns its response. `HttpClient` uses the
+requests transport adapter interface (`requests.adapters.BaseAdapter`): `send()` sends a
+prepared request and returns a `requests.Response`, streamed or read eagerly, and `close()`
+releases its resources. Request building, retries, rate limiting, caching and response
+validation all happen before and after the transport, so every transport gets them. The
+default transport is requests' pooled `HTTPAdapter`; `HTTP2Adapter` is another.
+`AsyncHttpClient` takes an httpx async transport instead.
+
+`LocalTransport` implements both interfaces and answers requests with Python callables
+instead of a network, for tests, load tests and for benchmarking the SDK's own overhead.
+"""
+
+import gzip
+import http.client
+import io
+import json
+import re
+import threading
+from typing import Callable, Dict, List, Optional, Pattern, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+_PATH_PARAMETER = re.compile(r"\{(\w+)\}")
+
+
+def _compile_path(path: str) -> Pattern:
+    pattern = ""
+    position = 0
+    for match in _PATH_PARAMETER.finditer(path):
+        pattern += re.escape(path[position : match.start()])
+        pattern += f"(?P<{match.group(1)}>[^/]+)"
+        position = match.end()
+    return re.compile(pattern + re.escape(path[position:]) + "$")
+
+
+def _dumps(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+class LocalRequest:
+    """
+    A request received by a LocalTransport route.
+
+    Attributes:
+        method: The HTTP method, in upper case.
+        url: The full request URL.
+        path: The path of the URL.
+        query: The query parameters, each mapped to the list of its values.
+        headers: The request headers.
+        body: The request body as sent, or an empty bytes object.
+        params: The values of the route's `{name}` path parameters.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        headers,
+        body: bytes,
+        params: Optional[Dict[str, str]] = None,
+    ):
+        parsed = urlparse(url)
+        self.method = method.upper()
+        self.url = url
+        self.path = parsed.path
+        self.query = parse_qs(parsed.query)
+        self.headers = CaseInsensitiveDict(headers)
+        self.body = body
+        self.params = params or {}
+
+    def json(self):
+        """
+        Parse the request body as JSON, decompressing it first if it was gzipped.
+
+        Returns:
+            The parsed body, or None if the request has no body.
+        """
+        body = self.body
+        if not body:
+            return None
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        return json.loads(body)
+
+
+class LocalResponse:
+    """
+    A response returned by a LocalTransport route.
+
+    Args:
+        status_code: The HTTP status code.
+        json: A JSON-serializable body. Sent with a JSON content type.
+        content: A raw body, used when `json` is not set.
+        headers: Additional response headers.
+    """
+
+    def __init__(
+        self,
+        status_code: int = 200,
+        json=None,  # pylint: disable=redefined-outer-name
+        content: bytes = b"",
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        if json is not None:
+            content = _dumps(json)
+            self.headers.setdefault("Content-Type", "application/json")
+        self.content = content
+        self.headers.setdefault("Content-Length", str(len(content)))
+
+
+Handler = Callable[[LocalRequest], Union[LocalResponse, dict, list, bytes]]
+
+
+class LocalTransport(BaseAdapter):
+    """
+    In-memory transport that routes requests to Python callables.
+
+    Routes are matched in the order they were added, by method and by a path template in
+    which `{name}` matches one path segment, for example `/v3/grants/{grant_id}/events`. A
+    handler receives a LocalRequest and returns a LocalResponse, or a dict or list to answer
+    200 with it as JSON, or bytes to answer 200 with them as the body. Requests that match
+    no route are answered with a 404 Nylas API error. Exceptions raised by a handler
+    propagate to the caller.
+
+    Use it as `transport` for `Client` (or `AsyncClient`), where it replaces the network for
+    every host:
+
+        transport = LocalTransport()
+        transport.add_route("GET", "/v3/grants/{grant_id}", lambda request: {...})
+        nylas = Client(api_key="key", transport=transport)
+
+    Args:
+        routes: Routes to add, as (method, path template, handler) tuples.
+
+    Attributes:
+        calls: The number of requests the transport has answered.
+    """
+
+    def __init__(self, routes: Optional[List[Tuple[str, str, Handler]]] = None):
+        super().__init__()
+        self._routes: List[Tuple[str, Pattern, Handler]] = []
+        self._lock = threading.Lock()
+        self.calls = 0
+        for method, path, handler in routes or ():
+            self.add_route(method, path, handler)
+
+    def add_route(self, method: str, path: str, handler: Handler) -> None:
+        """
+        Answer requests to a path with a handler.
+
+        Args:
+            method: The HTTP method to match, or "*" to match any.
+            path: The path template to match.
+            handler: The callable that answers matching requests.
+        """
+        self._routes.append((method.upper(), _compile_path(path), handler))
+
+    def route(self, method: str, path: str) -> Callable[[Handler], Handler]:
+        """
+        Decorator form of add_route().
+
+        Args:
+            method: The HTTP method to match, or "*" to match any.
+            path: The path template to match.
+
+        Returns:
+            A decorator that adds the decorated handler and returns it unchanged.
+        """
+
+        def decorator(handler: Handler) -> Handler:
+            self.add_route(method, path, handler)
+            return handler
+
+        return decorator
+
+    def handle(self, method: str, url: str, headers, body: bytes) -> LocalResponse:
+        """
+        Answer a request with the first matching route.
+
+        Args:
+            method: The HTTP method.
+            url: The full request URL.
+            headers: The request headers.
+            body: The request body.
+
+        Returns:
+            The response.
+        """
+        with self._lock:
+            self.calls += 1
+        request = LocalRequest(method, url, headers, body)
+        for route_method, pattern, handler in self._routes:
+            if route_method not in ("*", request.method):
+                continue
+            match = pattern.match(request.path)
+            if match is None:
+                continue
+            request.params = match.groupdict()
+            result = handler(request)
+            if isinstance(result, LocalResponse):
+                return result
+            if isinstance(result, bytes):
+                return LocalResponse(content=result)
+            return LocalResponse(json=result)
+        return LocalResponse(
+            404,
+            json={
+                "request_id": "local",
+                "error": {
+                    "type": "not_found_error",
+                    "message": f"No route for {request.method} {request.path}",
+                },
+            },
+        )
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ) -> requests.Response:
+        # pylint: disable=too-many-arguments,too-many-positional-arguments,unused-argument
+        body = request.body
+        if hasattr(body, "read"):
+            body = body.read()
+        elif body is not None and not isinstance(body, (bytes, str)):
+            body = b"".join(body)
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        answer = self.handle(request.method, request.url, request.headers, body or b"")
+
+        response = requests.Response()
+        response.status_code = answer.status_code
+        response.headers = CaseInsensitiveDict(answer.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = http.client.responses.get(answer.status_code, "")
+        response.raw = io.BytesIO(answer.content)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self) -> None:
+        pass
+
+    async def handle_async_request(self, request):
+        """
+        Answer an httpx request, as an httpx async transport.
+
+        Args:
+            request: The httpx.Request to answer.
+
+        Returns:
+            The httpx.Response.
+        """
+        import httpx  # pylint: disable=import-outside-toplevel
+
+        body = await request.aread()
+        answer = self.handle(request.method, str(request.url), request.headers, body)
+        return httpx.Response(
+            answer.status_code,
+            headers=list(answer.headers.items()),
+            content=answer.content,
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        """Close the transport, as an httpx async transport."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
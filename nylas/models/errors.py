@@ -119,6 +119,29 @@ class NylasApiError(AbstractNylasApiError):
         self.provider_error: Optional[dict] = api_error.error.provider_error
         self.headers: CaseInsensitiveDict = headers
 
+class NylasInvalidGrantError(NylasApiError):
+    """
+    Error thrown without sending a request when its grant recently failed as invalid.
+
+    Attributes:
+        grant_id: The ID of the invalid grant.
+    """
+
+    def __init__(
+        self,
+        grant_id: str,
+        api_error: NylasApiErrorResponse,
+        status_code: Optional[int] = None,
+    ):
+        """
+        Args:
+            grant_id: The ID of the invalid grant.
+            api_error: The error details the grant last failed with.
+            status_code: The HTTP status code the grant last failed with.
+        """
+        super().__init__(api_error, status_code)
+        self.grant_id: str = grant_id
+
 class NylasOAuthError(AbstractNylasApiError):
     """
     Class representation of an OAuth error returned by the Nylas API.
@@ -169,3 +192,32 @@ class NylasSdkTimeoutError(AbstractNylasSdkError):
         self.url: str = url
         self.timeout: int = timeout
         self.headers: CaseInsensitiveDict = headers
+
+class NylasUploadError(AbstractNylasSdkError):
+    """
+    Error thrown when the bytes of a file cannot be uploaded to an attachment upload session.
+
+    Attributes:
+        attachment_id: The ID of the upload session.
+        offset: The first byte of the chunk that failed.
+        status_code: The HTTP status code of the failed chunk, if there was a response.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        attachment_id: Optional[str] = None,
+        offset: Optional[int] = None,
+        status_code: Optional[int] = None,
+    ):
+        """
+        Args:
+            message: The error message.
+            attachment_id: The ID of the upload session.
+            offset: The first byte of the chunk that failed.
+            status_code: The HTTP status code of the failed chunk, if there was a response.
+        """
+        super().__init__(message)
+        self.attachment_id: Optional[str] = attachment_id
+        self.offset: Optional[int] = offset
+        self.status_code: Optional[int] = status_code
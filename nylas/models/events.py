@@ -5,6 +5,7 @@ from dataclasses_json import dataclass_json, config
 from typing_extensions import TypedDict, NotRequired
 
 from nylas.models.list_query_params import ListQueryParams
+from nylas.utils.decoder import decode
 
 Status = Literal["confirmed", "tentative", "cancelled"]
 """ Literal representing the status of an Event. """
@@ -178,16 +179,16 @@ def _decode_when(when: dict) -> When:
         raise ValueError("Invalid when object, no 'object' field found.")
 
     if when["object"] == "time":
-        return Time.from_dict(when)
+        return decode(Time, when)
 
     if when["object"] == "timespan":
-        return Timespan.from_dict(when)
+        return decode(Timespan, when)
 
     if when["object"] == "date":
-        return Date.from_dict(when)
+        return decode(Date, when)
 
     if when["object"] == "datespan":
-        return Datespan.from_dict(when)
+        return decode(Datespan, when)
 
     raise ValueError(
         f"Invalid when object, unknown 'object' field found: {when['object']}"
@@ -271,11 +272,11 @@ def _decode_conferencing(conferencing: dict) -> Union[Conferencing, None]:
 
     # Handle details case - must have provider to be valid
     if "details" in conferencing and "provider" in conferencing:
-        return Details.from_dict(conferencing)
+        return decode(Details, conferencing)
 
     # Handle autocreate case - must have provider to be valid
     if "autocreate" in conferencing and "provider" in conferencing:
-        return Autocreate.from_dict(conferencing)
+        return decode(Autocreate, conferencing)
 
     # Handle case where provider exists but details/autocreate doesn't
     if "provider" in conferencing:
@@ -288,7 +289,7 @@ def _decode_conferencing(conferencing: dict) -> Union[Conferencing, None]:
                 else {}
             ),
         }
-        return Details.from_dict(details_dict)
+        return decode(Details, details_dict)
 
     # Handle unknown or incomplete conferencing objects by returning None
     # This provides backwards compatibility for malformed conferencing data
@@ -1,10 +1,25 @@
+import copy
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import TypeVar, Generic, Optional, List
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
 
 from dataclasses_json import DataClassJsonMixin
 
 from requests.structures import CaseInsensitiveDict
 
+from nylas.utils.decoder import decode, get_decoder
+
 T = TypeVar("T", bound=DataClassJsonMixin)
 
 
@@ -40,7 +55,13 @@ class Response(tuple, Generic[T]):
         return instance
 
     @classmethod
-    def from_dict(cls, resp: dict, generic_type, headers: Optional[CaseInsensitiveDict] = None):
+    def from_dict(
+        cls,
+        resp: dict,
+        generic_type,
+        headers: Optional[CaseInsensitiveDict] = None,
+        interner=None,
+    ):
         """
         Convert a dictionary to a response object.
 
@@ -48,15 +69,106 @@ class Response(tuple, Generic[T]):
             resp: The dictionary to convert.
             generic_type: The type to deserialize the data object into.
             headers: The headers returned from the API.
+            interner: A StringInterner to deduplicate repeated string values with.
+        """
+
+        if interner is not None:
+            interner.intern_item(resp["data"])
+        return cls(
+            data=decode(generic_type, resp["data"]),
+            request_id=resp["request_id"],
+            headers=headers,
+        )
+
+    @classmethod
+    def from_raw(cls, resp: dict, headers: Optional[CaseInsensitiveDict] = None):
+        """
+        Convert a dictionary to a response object without decoding the data into a model.
+
+        Args:
+            resp: The dictionary to convert.
+            headers: The headers returned from the API.
         """
 
         return cls(
-            data=generic_type.from_dict(resp["data"]),
+            data=resp["data"],
             request_id=resp["request_id"],
             headers=headers,
         )
 
 
+_PENDING = object()
+
+
+def _list_items(resp: dict):
+    raw_data = resp.get("data", [])
+    if isinstance(raw_data, dict):
+        return raw_data.get("items", []), resp.get(
+            "next_cursor", raw_data.get("next_cursor")
+        )
+    return raw_data, resp.get("next_cursor")
+
+
+class LazyList(Sequence, Generic[T]):
+    """
+    A read-only list of models that are decoded from their raw JSON when first accessed.
+
+    Each item is decoded at most once, the first time it is indexed or iterated over; the
+    decoded model is cached. Items that are never accessed are never decoded.
+
+    Attributes:
+        raw: The raw JSON objects of the items.
+    """
+
+    __slots__ = ("raw", "_decode", "_items")
+
+    def __init__(self, raw: List[dict], decode_item: Callable[[dict], T]):
+        """
+        Initialize the lazy list.
+
+        Args:
+            raw: The raw JSON objects of the items.
+            decode_item: The function decoding one raw JSON object into its model.
+        """
+        self.raw = raw
+        self._decode = decode_item
+        self._items = [_PENDING] * len(raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        item = self._items[index]
+        if item is _PENDING:
+            item = self._items[index] = self._decode(self.raw[index])
+        return item
+
+    def __iter__(self):
+        for index in range(len(self.raw)):
+            yield self[index]
+
+    def __copy__(self):
+        # The copy shares the raw JSON, and gets its own copy of each item decoded so far.
+        clone = LazyList.__new__(LazyList)
+        clone.raw = self.raw
+        clone._decode = self._decode
+        clone._items = [
+            item if item is _PENDING else copy.copy(item) for item in self._items
+        ]
+        return clone
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazyList({list(self)!r})"
+
+
 class ListResponse(tuple, Generic[T]):
     """
     List response object returned from the Nylas API.
@@ -100,7 +212,14 @@ class ListResponse(tuple, Generic[T]):
         return instance
 
     @classmethod
-    def from_dict(cls, resp: dict, generic_type, headers: Optional[CaseInsensitiveDict] = None):
+    def from_dict(
+        cls,
+        resp: dict,
+        generic_type,
+        headers: Optional[CaseInsensitiveDict] = None,
+        lazy: bool = False,
+        interner=None,
+    ):
         """
         Convert a dictionary to a response object.
 
@@ -108,19 +227,18 @@ class ListResponse(tuple, Generic[T]):
             resp: The dictionary to convert.
             generic_type: The type to deserialize the data objects into.
             headers: The headers returned from the API.
+            lazy: Whether to return the data as a LazyList that decodes items on access.
+            interner: A StringInterner to deduplicate repeated string values with.
         """
 
-        raw_data = resp.get("data", [])
-        if isinstance(raw_data, dict):
-            next_cursor = resp.get("next_cursor", raw_data.get("next_cursor"))
-            data = raw_data.get("items", [])
+        data, next_cursor = _list_items(resp)
+        if interner is not None:
+            interner.intern_items(data)
+        decode_item = get_decoder(generic_type, infer_missing=True)
+        if lazy:
+            converted_data = LazyList(data, decode_item)
         else:
-            next_cursor = resp.get("next_cursor")
-            data = raw_data
-
-        converted_data = []
-        for item in data:
-            converted_data.append(generic_type.from_dict(item, infer_missing=True))
+            converted_data = [decode_item(item) for item in data]
 
         return cls(
             data=converted_data,
@@ -129,6 +247,238 @@ class ListResponse(tuple, Generic[T]):
             headers=headers,
         )
 
+    @classmethod
+    def from_raw(cls, resp: dict, headers: Optional[CaseInsensitiveDict] = None):
+        """
+        Convert a dictionary to a response object without decoding the items into models.
+
+        Args:
+            resp: The dictionary to convert.
+            headers: The headers returned from the API.
+        """
+
+        data, next_cursor = _list_items(resp)
+        return cls(
+            data=data,
+            request_id=resp["request_id"],
+            next_cursor=next_cursor,
+            headers=headers,
+        )
+
+
+class _StreamedList(Generic[T]):
+    # The state shared by the sync and async streamed list responses.
+
+    def __init__(
+        self,
+        parser,
+        decode_item: Callable[[Any], T],
+        headers: Optional[CaseInsensitiveDict] = None,
+    ):
+        self.request_id: Optional[str] = None
+        self.next_cursor: Optional[str] = None
+        self.headers = headers
+        self.complete = False
+        self.count = 0
+        self._parser = parser
+        self._decode = decode_item
+        self._skip = False
+        self._leftover: List[Any] = []
+
+    def _feed(self, chunk: bytes) -> List[Any]:
+        items = self._parser.feed(chunk)
+        fields = self._parser.fields
+        self.request_id = fields.get("request_id", self.request_id)
+        self.next_cursor = fields.get("next_cursor", self.next_cursor)
+        # Endpoints that wrap the items in an object are parsed whole.
+        wrapped = fields.get("data")
+        if isinstance(wrapped, dict):
+            del fields["data"]
+            items = items + wrapped.get("items", [])
+            if self.next_cursor is None:
+                self.next_cursor = wrapped.get("next_cursor")
+        self.count += len(items)
+        return items
+
+    def _end(self) -> None:
+        self._parser.close()
+        self.complete = True
+
+
+class StreamedListResponse(_StreamedList[T]):
+    """
+    List response whose items are read from the response body and decoded one at a time.
+
+    Returned by `list()` with the "stream" response format. Iterating over the response (or
+    its `data`) yields each item as soon as it has been received, so that only one item is
+    held in memory instead of the whole page. The items can be iterated over only once.
+
+    `request_id` and `next_cursor` are set as they are read from the body. The API sends
+    `next_cursor` after the items, so it is only known once they have all been iterated
+    over; call finish() to skip the remaining items without decoding them. The connection
+    is released once the body has been read or the response is closed.
+
+    Attributes:
+        request_id: The request ID, once read.
+        next_cursor: The cursor to use to get the next page of data, once read.
+        headers: The headers returned from the API.
+        complete: Whether the whole body has been read.
+        count: The number of items read from the body so far, including skipped ones.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        parser,
+        decode_item: Callable[[Any], T],
+        headers: Optional[CaseInsensitiveDict] = None,
+        close: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Initialize the response object.
+
+        Args:
+            chunks: The chunks of the response body.
+            parser: The JsonListParser to split the body into items with.
+            decode_item: The function decoding one parsed item into its model.
+            headers: The headers returned from the API.
+            close: Callable releasing the connection the body is read from.
+        """
+        super().__init__(parser, decode_item, headers)
+        self._close = close
+        self._items = self._read(chunks)
+
+    @property
+    def data(self) -> Iterator[T]:
+        """An iterator over the items that have not been iterated over yet."""
+        return self._items
+
+    def __iter__(self) -> Iterator[T]:
+        return self._items
+
+    def _read(self, chunks: Iterable[bytes]) -> Iterator[T]:
+        try:
+            for chunk in chunks:
+                for item in self._feed(chunk):
+                    if not self._skip:
+                        yield self._decode(item)
+            self._end()
+        finally:
+            self._release()
+
+    def finish(self) -> "StreamedListResponse[T]":
+        """
+        Read the rest of the body without decoding the remaining items.
+
+        Returns:
+            The response, with `request_id` and `next_cursor` set.
+        """
+        self._skip = True
+        self._parser.parse_items = False
+        for _ in self._items:
+            pass
+        return self
+
+    def close(self) -> None:
+        """Stop reading the body and release its connection."""
+        self._items.close()
+        self._release()
+
+    def _release(self) -> None:
+        if self._close is not None:
+            close, self._close = self._close, None
+            close()
+
+    def __enter__(self) -> "StreamedListResponse[T]":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class AsyncStreamedListResponse(_StreamedList[T]):
+    """
+    Async version of StreamedListResponse, returned by `list()` of an AsyncClient with the
+    "stream" response format. Iterate over it with `async for`, and await finish() and
+    aclose() instead.
+
+    Attributes:
+        request_id: The request ID, once read.
+        next_cursor: The cursor to use to get the next page of data, once read.
+        headers: The headers returned from the API.
+        complete: Whether the whole body has been read.
+        count: The number of items read from the body so far, including skipped ones.
+    """
+
+    def __init__(
+        self,
+        chunks: AsyncIterable[bytes],
+        parser,
+        decode_item: Callable[[Any], T],
+        headers: Optional[CaseInsensitiveDict] = None,
+        aclose: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        Initialize the response object.
+
+        Args:
+            chunks: The chunks of the response body.
+            parser: The JsonListParser to split the body into items with.
+            decode_item: The function decoding one parsed item into its model.
+            headers: The headers returned from the API.
+            aclose: Coroutine function releasing the connection the body is read from.
+        """
+        super().__init__(parser, decode_item, headers)
+        self._aclose = aclose
+        self._items = self._read(chunks)
+
+    @property
+    def data(self) -> AsyncIterator[T]:
+        """An async iterator over the items that have not been iterated over yet."""
+        return self._items
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self._items
+
+    async def _read(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[T]:
+        try:
+            async for chunk in chunks:
+                for item in self._feed(chunk):
+                    if not self._skip:
+                        yield self._decode(item)
+            self._end()
+        finally:
+            await self._release()
+
+    async def finish(self) -> "AsyncStreamedListResponse[T]":
+        """
+        Read the rest of the body without decoding the remaining items.
+
+        Returns:
+            The response, with `request_id` and `next_cursor` set.
+        """
+        self._skip = True
+        self._parser.parse_items = False
+        async for _ in self._items:
+            pass
+        return self
+
+    async def aclose(self) -> None:
+        """Stop reading the body and release its connection."""
+        await self._items.aclose()
+        await self._release()
+
+    async def _release(self) -> None:
+        if self._aclose is not None:
+            aclose, self._aclose = self._aclose, None
+            await aclose()
+
+    async def __aenter__(self) -> "AsyncStreamedListResponse[T]":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
 
 @dataclass
 class DeleteResponse:
@@ -9,6 +9,7 @@ from nylas.models.events import EmailName
 from nylas.models.list_query_params import ListQueryParams
 
 from nylas.models.messages import Message
+from nylas.utils.decoder import decode
 
 
 def _decode_draft_or_message(json: dict) -> Union[Message, Draft]:
@@ -25,10 +26,10 @@ def _decode_draft_or_message(json: dict) -> Union[Message, Draft]:
         raise ValueError("Invalid when object, no 'object' field found.")
 
     if json["object"] == "draft":
-        return Draft.from_dict(json)
+        return decode(Draft, json)
 
     if json["object"] == "message":
-        return Message.from_dict(json)
+        return decode(Message, json)
 
     raise ValueError(f"Invalid object, unknown 'object' field found: {json['object']}")
 
@@ -37,10 +37,12 @@ class Applications(UpdatablePatchApiResource):
             Response: The application information.
         """
 
-        json_response, headers = self._http_client._execute(
-            method="GET", path="/v3/applications", overrides=overrides
+        return self._request(
+            self._decoder(ApplicationDetails, overrides),
+            method="GET",
+            path="/v3/applications",
+            overrides=overrides,
         )
-        return Response.from_dict(json_response, ApplicationDetails, headers)
 
     def update(
         self,
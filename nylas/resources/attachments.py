@@ -1,3 +1,7 @@
+import inspect
+import os
+from typing import IO, Optional, Union
+
 from requests import Response
 
 from nylas.config import RequestOverrides
@@ -5,6 +9,11 @@ from nylas.handler.api_resources import (
     FindableApiResource,
     CreatableApiResource,
 )
+from nylas.handler.chunked_upload import (
+    DEFAULT_CHUNK_SIZE,
+    ChunkedUpload,
+    ProgressCallback,
+)
 from nylas.models.attachments import (
     Attachment,
     FindAttachmentQueryParams,
@@ -175,3 +184,82 @@ class Attachments(
             request_body={},
             overrides=overrides,
         )
+
+    def upload_file(
+        self,
+        identifier: str,
+        file: Union[str, os.PathLike, IO[bytes]],
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        size: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        sha256: Optional[str] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        overrides: RequestOverrides = None,
+    ) -> NylasResponse[AttachmentUploadSessionComplete]:
+        """
+        Upload a large file (up to 150 MB) as an attachment through an upload session.
+
+        Creates the upload session, PUTs the file to its pre-signed URL in chunks read one
+        at a time, retrying failed chunks with the client's retry policy (or a default one),
+        checks the size and SHA-256 of the bytes read, and completes the session. Memory use
+        is bounded by `chunk_size` whatever the size of the file.
+
+        Args:
+            identifier: The identifier of the Grant to act upon.
+            file: The path of the file, or a binary file object read from its current
+                position.
+            filename: The name of the attachment. Defaults to the name of the file.
+            content_type: The MIME type of the attachment. Guessed from its name by default.
+            size: The number of bytes to upload. Defaults to the rest of the file, and is
+                required for file objects that cannot seek.
+            chunk_size: The number of bytes per chunk, a multiple of 320 KiB.
+            sha256: The expected SHA-256 hex digest of the file. The session is not
+                completed if the bytes read do not match it.
+            on_progress: Called with the number of bytes uploaded and the size after each
+                chunk.
+            overrides: The request overrides to use for the Nylas API requests.
+
+        Returns:
+            The completed session status. Use its `attachment_id` in messages.send() or
+            drafts.create().
+
+        Raises:
+            NylasUploadError: A chunk could not be uploaded, or the file does not match its
+                size or SHA-256 digest.
+        """
+        upload = ChunkedUpload(
+            self._http_client,
+            file,
+            filename=filename,
+            content_type=content_type,
+            size=size,
+            chunk_size=chunk_size,
+            sha256=sha256,
+            on_progress=on_progress,
+            timeout=self._http_client._resolve_timeout(overrides),
+        )
+        if inspect.iscoroutinefunction(self._http_client._execute):
+            return self._aupload_file(identifier, upload, overrides)
+        with upload:
+            session = self.create_upload_session(
+                identifier, upload.session_request(), overrides
+            ).data
+            upload.run(session)
+            return self.complete_upload_session(
+                identifier, session.attachment_id, overrides
+            )
+
+    async def _aupload_file(
+        self, identifier: str, upload: ChunkedUpload, overrides: RequestOverrides
+    ) -> NylasResponse[AttachmentUploadSessionComplete]:
+        with upload:
+            session = (
+                await self.create_upload_session(
+                    identifier, upload.session_request(), overrides
+                )
+            ).data
+            await upload.arun(session)
+            return await self.complete_upload_session(
+                identifier, session.attachment_id, overrides
+            )
@@ -117,13 +117,13 @@ class Auth(Resource):
             The created Grant.
         """
 
-        json_response, headers = self._http_client._execute(
+        return self._request(
+            self._decoder(Grant, overrides),
             method="POST",
             path="/v3/connect/custom",
             request_body=request_body,
             overrides=overrides,
         )
-        return Response.from_dict(json_response, Grant, headers)
 
     def refresh_access_token(
         self, request: TokenExchangeRequest, overrides: RequestOverrides = None
@@ -228,15 +228,14 @@ class Auth(Resource):
         Returns:
             True: If the token was revoked successfully.
         """
-        self._http_client._execute(
+        return self._request(
+            lambda *_: True,
             method="POST",
             path="/v3/connect/revoke",
             query_params={"token": token},
             overrides=overrides,
         )
 
-        return True
-
     def detect_provider(
         self, params: ProviderDetectParams, overrides: RequestOverrides = None
     ) -> Response[ProviderDetectResponse]:
@@ -251,13 +250,13 @@ class Auth(Resource):
             The detected provider, if found.
         """
 
-        json_response, headers = self._http_client._execute(
+        return self._request(
+            self._decoder(ProviderDetectResponse, overrides),
             method="POST",
             path="/v3/providers/detect",
             query_params=params,
             overrides=overrides,
         )
-        return Response.from_dict(json_response, ProviderDetectResponse, headers)
 
     def _url_auth_builder(self, query: dict) -> str:
         base = f"{self._http_client.api_server}/v3/connect/auth"
@@ -266,21 +265,21 @@ class Auth(Resource):
     def _get_token(
         self, request_body: dict, overrides: RequestOverrides
     ) -> CodeExchangeResponse:
-        json_response, _ = self._http_client._execute(
+        return self._request(
+            self._model_decoder(CodeExchangeResponse, overrides),
             method="POST",
             path="/v3/connect/token",
             request_body=request_body,
             overrides=overrides,
         )
-        return CodeExchangeResponse.from_dict(json_response)
 
     def _get_token_info(
         self, query_params: dict, overrides: RequestOverrides
     ) -> Response[TokenInfoResponse]:
-        json_response, headers = self._http_client._execute(
+        return self._request(
+            self._decoder(TokenInfoResponse, overrides),
             method="GET",
             path="/v3/connect/tokeninfo",
             query_params=query_params,
             overrides=overrides,
         )
-        return Response.from_dict(json_response, TokenInfoResponse, headers)
@@ -23,6 +23,7 @@ from nylas.models.calendars import (
     FindCalendarQueryParams,
 )
 from nylas.models.response import Response, ListResponse, DeleteResponse
+from nylas.resources.resource import model_type
 
 
 class Calendars(
@@ -175,7 +176,8 @@ class Calendars(
         Returns:
             Response: The availability response from the API.
         """
-        json_response, headers = self._http_client._execute(
+        return self._request(
+            self._decoder(GetAvailabilityResponse, overrides),
             "POST",
             "/v3/calendars/availability",
             None,
@@ -184,8 +186,6 @@ class Calendars(
             overrides=overrides,
         )
 
-        return Response.from_dict(json_response, GetAvailabilityResponse, headers)
-
     def get_free_busy(
         self,
         identifier: str,
@@ -203,7 +203,26 @@ class Calendars(
         Returns:
             Response: The free/busy response from the API.
         """
-        json_response, headers = self._http_client._execute(
+
+        response_format = self._response_format(overrides)
+        free_busy = model_type(response_format, FreeBusy)
+        free_busy_error = model_type(response_format, FreeBusyError)
+
+        def decode(json_response, headers):
+            if response_format == "raw":
+                return Response.from_raw(json_response, headers)
+            data = []
+            request_id = json_response["request_id"]
+            for item in json_response["data"]:
+                if item.get("object") == "error":
+                    data.append(free_busy_error.from_dict(item))
+                else:
+                    data.append(free_busy.from_dict(item))
+
+            return Response(data, request_id, headers)
+
+        return self._request(
+            decode,
             "POST",
             f"/v3/grants/{identifier}/calendars/free-busy",
             None,
@@ -211,13 +230,3 @@ class Calendars(
             request_body,
             overrides=overrides,
         )
-
-        data = []
-        request_id = json_response["request_id"]
-        for item in json_response["data"]:
-            if item.get("object") == "error":
-                data.append(FreeBusyError.from_dict(item))
-            else:
-                data.append(FreeBusy.from_dict(item))
-
-        return Response(data, request_id, headers)
@@ -172,11 +172,10 @@ class Contacts(
         Returns:
             The list of contact groups.
         """
-        json_response, headers = self._http_client._execute(
+        return self._request(
+            self._list_decoder(ContactGroup, overrides),
             method="GET",
             path=f"/v3/grants/{identifier}/contacts/groups",
             query_params=query_params,
             overrides=overrides,
         )
-
-        return ListResponse.from_dict(json_response, ContactGroup, headers)
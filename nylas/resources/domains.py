@@ -222,7 +222,8 @@ class Domains(
         exec_kwargs = {"overrides": merged}
         if serialized is not None:
             exec_kwargs["serialized_json_body"] = serialized
-        res, headers = self._http_client._execute(
+        return self._request(
+            self._decoder(DomainVerificationDetails, overrides),
             "POST",
             path,
             None,
@@ -230,7 +231,6 @@ class Domains(
             None if serialized is not None else body,
             **exec_kwargs,
         )
-        return Response.from_dict(res, DomainVerificationDetails, headers)
 
     def verify(
         self,
@@ -263,7 +263,8 @@ class Domains(
         exec_kwargs = {"overrides": merged}
         if serialized is not None:
             exec_kwargs["serialized_json_body"] = serialized
-        res, headers = self._http_client._execute(
+        return self._request(
+            self._decoder(DomainVerificationDetails, overrides),
             "POST",
             path,
             None,
@@ -271,4 +272,3 @@ class Domains(
             None if serialized is not None else body,
             **exec_kwargs,
         )
-        return Response.from_dict(res, DomainVerificationDetails, headers)
@@ -114,15 +114,14 @@ class Drafts(
             for attachment in request_body.get("attachments", [])
         )
         if attachment_size >= MAXIMUM_JSON_ATTACHMENT_SIZE:
-            json_response = self._http_client._execute(
+            return self._request(
+                self._decoder(Draft, overrides),
                 method="POST",
                 path=path,
                 data=_build_form_request(request_body),
                 overrides=overrides,
             )
 
-            return Response.from_dict(json_response, Draft)
-
         # Encode the content of the attachments to base64
         for attachment in request_body.get("attachments", []):
             if "content" in attachment and issubclass(
@@ -164,15 +163,14 @@ class Drafts(
             for attachment in request_body.get("attachments", [])
         )
         if attachment_size >= MAXIMUM_JSON_ATTACHMENT_SIZE:
-            json_response = self._http_client._execute(
+            return self._request(
+                self._decoder(Draft, overrides),
                 method="PUT",
                 path=path,
                 data=_build_form_request(request_body),
                 overrides=overrides,
             )
 
-            return Response.from_dict(json_response, Draft)
-
         # Encode the content of the attachments to base64
         for attachment in request_body.get("attachments", []):
             if "content" in attachment and issubclass(
@@ -223,10 +221,9 @@ class Drafts(
             draft_id: The identifier of the draft to send.
             overrides: The request overrides to use for the request.
         """
-        json_response, headers = self._http_client._execute(
+        return self._request(
+            self._decoder(Message, overrides),
             method="POST",
             path=f"/v3/grants/{identifier}/drafts/{urllib.parse.quote(draft_id, safe='')}",
             overrides=overrides,
         )
-
-        return Response.from_dict(json_response, Message, headers)
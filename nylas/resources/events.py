@@ -225,12 +225,11 @@ class Events(
         Returns:
             Response: The RSVP response from the API.
         """
-        json_response, headers = self._http_client._execute(
+        return self._request(
+            RequestIdOnlyResponse.from_dict,
             method="POST",
             path=f"/v3/grants/{identifier}/events/{event_id}/send-rsvp",
             query_params=query_params,
             request_body=request_body,
             overrides=overrides,
         )
-
-        return RequestIdOnlyResponse.from_dict(json_response, headers)
@@ -1,3 +1,6 @@
+import inspect
+from typing import Any, Callable, Optional, Union
+
 from nylas.config import RequestOverrides
 from nylas.handler.api_resources import (
     ListableApiResource,
@@ -5,12 +8,27 @@ from nylas.handler.api_resources import (
     UpdatableApiResource,
     DestroyableApiResource,
 )
+from nylas.handler.fan_out import (
+    DEFAULT_PAGE_SIZE,
+    AsyncGrantFanOut,
+    FanOutProgress,
+    GrantFanOut,
+)
 from nylas.models.grants import (
     Grant,
     ListGrantsQueryParams,
     UpdateGrantRequest,
 )
-from nylas.models.response import Response, ListResponse, DeleteResponse
+from nylas.models.response import (
+    AsyncStreamedListResponse,
+    DeleteResponse,
+    ListResponse,
+    Response,
+    StreamedListResponse,
+)
+
+DEFAULT_GRANTS_PAGE_SIZE = 10
+"""The number of grants the API returns per page when no limit is given."""
 
 
 def _normalize_grants_query_params(query_params: ListGrantsQueryParams = None) -> dict:
@@ -73,6 +91,21 @@ class Grants(
             overrides=overrides,
         )
 
+    def _next_page_params(self, page: ListResponse, params: dict):
+        if page.next_cursor:
+            return super()._next_page_params(page, params)
+
+        # Grants are paginated by offset rather than by cursor.
+        page_size = params.get("limit", DEFAULT_GRANTS_PAGE_SIZE)
+        if isinstance(page, (StreamedListResponse, AsyncStreamedListResponse)):
+            # The items of a streamed page have been read by now, but not kept.
+            count = page.count
+        else:
+            count = len(page.data)
+        if count < page_size:
+            return None
+        return {**params, "offset": params.get("offset", 0) + count}
+
     def find(
         self, grant_id: str, overrides: RequestOverrides = None
     ) -> Response[Grant]:
@@ -132,3 +165,66 @@ class Grants(
         """
 
         return super().destroy(path=f"/v3/grants/{grant_id}", overrides=overrides)
+
+    def fan_out(
+        self,
+        operation: Callable[[Grant], Any],
+        grant_status: Optional[str] = None,
+        provider: Optional[str] = None,
+        query_params: ListGrantsQueryParams = None,
+        where: Optional[Callable[[Grant], bool]] = None,
+        max_concurrency: Optional[int] = None,
+        checkpoint=None,
+        on_progress: Optional[Callable[[FanOutProgress], None]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        overrides: RequestOverrides = None,
+    ) -> Union[GrantFanOut, AsyncGrantFanOut]:
+        """
+        Prepare to call an operation with every Grant of the application, concurrently.
+
+        The grants are listed page by page and handed to the operation as they arrive, with
+        at most `max_concurrency` of them in flight. Iterate over `fan_out.results()` for
+        each grant's GrantResult as it completes, or call `fan_out.run()` for a FanOutReport
+        of the whole run. A failing grant does not stop the others. Pass a FileCheckpoint to
+        record the grants that succeeded, so that running again after a crash skips them.
+
+        Args:
+            operation: Called with each Grant, e.g. a function syncing its messages. With
+                an AsyncClient it may be a coroutine function.
+            grant_status: Only process grants with this status, e.g. "valid".
+            provider: Only process grants of this provider, e.g. "google".
+            query_params: Other query parameters to list the grants with.
+            where: Called with each listed Grant; grants it returns False for are skipped.
+            max_concurrency: The maximum number of grants processed at once. Defaults to
+                the client's `pool_maxsize`, or `max_connections` for an AsyncClient.
+            checkpoint: A FileCheckpoint recording the grants that succeeded, which are
+                skipped when it already has them.
+            on_progress: Called with the FanOutProgress after each grant is processed.
+            page_size: The number of grants to list per page.
+            overrides: The request overrides to list the grants with. The grants are
+                always decoded into Grant models, whatever the response format.
+
+        Returns:
+            The GrantFanOut, or an AsyncGrantFanOut for an AsyncClient.
+        """
+        is_async = inspect.iscoroutinefunction(self._http_client._execute)
+        if max_concurrency is None:
+            max_concurrency = (
+                self._http_client.max_connections
+                if is_async
+                else self._http_client.pool_maxsize
+            )
+        fan_out_type = AsyncGrantFanOut if is_async else GrantFanOut
+        return fan_out_type(
+            self,
+            operation,
+            grant_status=grant_status,
+            provider=provider,
+            query_params=_normalize_grants_query_params(query_params),
+            where=where,
+            max_concurrency=max_concurrency,
+            checkpoint=checkpoint,
+            on_progress=on_progress,
+            page_size=page_size,
+            overrides=overrides,
+        )
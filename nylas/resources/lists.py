@@ -115,7 +115,8 @@ class Lists(
         overrides: RequestOverrides = None,
     ) -> Response[NylasList]:
         """Remove items from a list."""
-        json_response, headers = self._http_client._execute(
+        return self._request(
+            self._decoder(NylasList, overrides),
             "DELETE",
             f"/v3/lists/{list_id}/items",
             None,
@@ -123,4 +124,3 @@ class Lists(
             request_body,
             overrides=overrides,
         )
-        return Response.from_dict(json_response, NylasList, headers)
@@ -21,6 +21,7 @@ from nylas.models.messages import (
     CleanMessagesResponse,
 )
 from nylas.models.response import Response, ListResponse, DeleteResponse
+from nylas.resources.resource import model_type
 from nylas.resources.smart_compose import SmartCompose
 from nylas.utils.file_utils import (
     _build_form_request,
@@ -195,7 +196,8 @@ class Messages(
 
             json_body = request_body
 
-        json_response, headers = self._http_client._execute(
+        return self._request(
+            self._decoder(Message, overrides),
             method="POST",
             path=path,
             request_body=json_body,
@@ -203,8 +205,6 @@ class Messages(
             overrides=overrides,
         )
 
-        return Response.from_dict(json_response, Message, headers)
-
     def list_scheduled_messages(
         self, identifier: str, overrides: RequestOverrides = None
     ) -> Response[List[ScheduledMessage]]:
@@ -218,19 +218,27 @@ class Messages(
         Returns:
             Response: The list of scheduled messages.
         """
-        json_response, headers = self._http_client._execute(
+
+        response_format = self._response_format(overrides)
+        scheduled_message = model_type(response_format, ScheduledMessage)
+
+        def decode(json_response, headers):
+            if response_format == "raw":
+                return Response.from_raw(json_response, headers)
+            data = []
+            request_id = json_response["request_id"]
+            for item in json_response["data"]:
+                data.append(scheduled_message.from_dict(item))
+
+            return Response(data, request_id, headers)
+
+        return self._request(
+            decode,
             method="GET",
             path=f"/v3/grants/{identifier}/messages/schedules",
             overrides=overrides,
         )
 
-        data = []
-        request_id = json_response["request_id"]
-        for item in json_response["data"]:
-            data.append(ScheduledMessage.from_dict(item))
-
-        return Response(data, request_id, headers)
-
     def find_scheduled_message(
         self, identifier: str, schedule_id: str, overrides: RequestOverrides = None
     ) -> Response[ScheduledMessage]:
@@ -245,14 +253,13 @@ class Messages(
         Returns:
             Response: The scheduled message.
         """
-        json_response, headers = self._http_client._execute(
+        return self._request(
+            self._decoder(ScheduledMessage, overrides),
             method="GET",
             path=f"/v3/grants/{identifier}/messages/schedules/{schedule_id}",
             overrides=overrides,
         )
 
-        return Response.from_dict(json_response, ScheduledMessage, headers)
-
     def stop_scheduled_message(
         self, identifier: str, schedule_id: str, overrides: RequestOverrides = None
     ) -> Response[StopScheduledMessageResponse]:
@@ -267,14 +274,13 @@ class Messages(
         Returns:
             Response: The confirmation of the stopped scheduled message.
         """
-        json_response, headers = self._http_client._execute(
+        return self._request(
+            self._decoder(StopScheduledMessageResponse, overrides),
             method="DELETE",
             path=f"/v3/grants/{identifier}/messages/schedules/{schedule_id}",
             overrides=overrides,
         )
 
-        return Response.from_dict(json_response, StopScheduledMessageResponse, headers)
-
     def clean_messages(
         self,
         identifier: str,
@@ -292,11 +298,10 @@ class Messages(
         Returns:
             ListResponse: The list of cleaned messages.
         """
-        json_response, headers = self._http_client._execute(
+        return self._request(
+            self._list_decoder(CleanMessagesResponse, overrides),
             method="PUT",
             path=f"/v3/grants/{identifier}/messages/clean",
             request_body=request_body,
             overrides=overrides,
         )
-
-        return ListResponse.from_dict(json_response, CleanMessagesResponse, headers)
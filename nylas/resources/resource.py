@@ -1,4 +1,98 @@
+import functools
+import inspect
+from dataclasses import is_dataclass
+
+from nylas.config import DEFAULT_RESPONSE_FORMAT
+from nylas.handler.hooks import PendingDecode, decode_observed
 from nylas.handler.http_client import HttpClient
+from nylas.handler.revalidation import RevalidatedResponse
+from nylas.models.response import ListResponse, Response
+from nylas.utils.slots import slotted
+
+
+def model_type(response_format: str, response_type):
+    """
+    Get the class to decode models of a type into in a response format.
+
+    Args:
+        response_format: The response format of the request.
+        response_type: The model class of the response.
+
+    Returns:
+        The slotted version of dataclass models in the "slotted" format, else the class.
+    """
+    if response_format == "slotted" and is_dataclass(response_type):
+        return slotted(response_type)
+    return response_type
+
+
+# Decoders are cached so that they are not built again for every request.
+@functools.lru_cache(maxsize=256)
+def response_decoder(response_format: str, response_type, interner=None):
+    """
+    Build the decoder of a response wrapping a single model.
+
+    Args:
+        response_format: The response format of the request.
+        response_type: The model class of the data.
+        interner: The StringInterner to deduplicate strings with, if any.
+
+    Returns:
+        A callable taking the response JSON and headers and returning a Response.
+    """
+    if response_format == "raw":
+        return Response.from_raw
+    response_type = model_type(response_format, response_type)
+    return lambda response_json, response_headers: Response.from_dict(
+        response_json, response_type, response_headers, interner=interner
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def list_response_decoder(response_format: str, response_type, interner=None):
+    """
+    Build the decoder of a response wrapping a list of models.
+
+    Args:
+        response_format: The response format of the request.
+        response_type: The model class of the items.
+        interner: The StringInterner to deduplicate strings with, if any.
+
+    Returns:
+        A callable taking the response JSON and headers and returning a ListResponse.
+    """
+    if response_format == "raw":
+        return ListResponse.from_raw
+    response_type = model_type(response_format, response_type)
+    lazy = response_format == "lazy"
+    return lambda response_json, response_headers: ListResponse.from_dict(
+        response_json,
+        response_type,
+        response_headers,
+        lazy=lazy,
+        interner=interner,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def model_decoder(response_format: str, response_type):
+    """
+    Build the decoder of a response whose whole body is one model.
+
+    Args:
+        response_format: The response format of the request.
+        response_type: The model class of the body.
+
+    Returns:
+        A callable taking the response JSON and headers and returning the model, or the
+        JSON itself in the "raw" format.
+    """
+    if response_format == "raw":
+        return lambda response_json, response_headers: response_json
+    response_type = model_type(response_format, response_type)
+    return lambda response_json, response_headers: response_type.from_dict(
+        response_json
+    )
 
 
 class Resource:
@@ -6,3 +100,103 @@ class Resource:
 
     def __init__(self, http_client: HttpClient):
         self._http_client = http_client
+
+    def _request(self, decode, *args, **kwargs):
+        """
+        Execute a request and decode its JSON response.
+
+        When the resource is bound to an async HTTP client the request is not awaited here;
+        instead a coroutine is returned that awaits the request before decoding it.
+
+        Args:
+            decode: Callable taking the response JSON and headers and returning the result.
+            *args: Positional arguments passed through to the HTTP client.
+            **kwargs: Keyword arguments passed through to the HTTP client.
+
+        Returns:
+            The decoded response, or a coroutine resolving to it for async clients.
+        """
+        with PendingDecode() as pending:
+            result = self._http_client._execute(*args, **kwargs)
+        if inspect.isawaitable(result):
+            return _decode_async(result, decode)
+
+        return decode_observed(pending, lambda: _decode(result, decode))
+
+    def _response_format(self, overrides=None) -> str:
+        """
+        Get the format to decode a response in.
+
+        Args:
+            overrides: The request overrides, which may set a per-request format.
+
+        Returns:
+            The response format of the request, falling back to the client's default.
+        """
+        if overrides and overrides.get("response_format"):
+            return overrides["response_format"]
+        return getattr(self._http_client, "response_format", DEFAULT_RESPONSE_FORMAT)
+
+    def _string_interner(self):
+        """
+        Get the interner that deduplicates repeated strings in decoded responses.
+
+        Returns:
+            The client's StringInterner, or None if interning is disabled.
+        """
+        return getattr(self._http_client, "string_interner", None)
+
+    def _decoder(self, response_type, overrides=None):
+        """
+        Get the decoder of a response wrapping a single model, in the request's format.
+
+        Args:
+            response_type: The model class of the data.
+            overrides: The request overrides, which may set a per-request format.
+
+        Returns:
+            A callable taking the response JSON and headers and returning a Response.
+        """
+        return response_decoder(
+            self._response_format(overrides), response_type, self._string_interner()
+        )
+
+    def _list_decoder(self, response_type, overrides=None):
+        """
+        Get the decoder of a response wrapping a list of models, in the request's format.
+
+        Args:
+            response_type: The model class of the items.
+            overrides: The request overrides, which may set a per-request format.
+
+        Returns:
+            A callable taking the response JSON and headers and returning a ListResponse.
+        """
+        return list_response_decoder(
+            self._response_format(overrides), response_type, self._string_interner()
+        )
+
+    def _model_decoder(self, response_type, overrides=None):
+        """
+        Get the decoder of a response whose whole body is one model, in the request's format.
+
+        Args:
+            response_type: The model class of the body.
+            overrides: The request overrides, which may set a per-request format.
+
+        Returns:
+            A callable taking the response JSON and headers and returning the model.
+        """
+        return model_decoder(self._response_format(overrides), response_type)
+
+
+def _decode(result, decode):
+    if isinstance(result, RevalidatedResponse):
+        return result.decode(decode)
+    return decode(*result)
+
+
+async def _decode_async(result, decode):
+    with PendingDecode() as pending:
+        result = await result
+    return decode_observed(pending, lambda: _decode(result, decode))
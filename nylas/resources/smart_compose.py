@@ -29,15 +29,14 @@ class SmartCompose(Resource):
         Returns:
             The generated message.
         """
-        res, headers = self._http_client._execute(
+        return self._request(
+            self._decoder(ComposeMessageResponse, overrides),
             method="POST",
             path=f"/v3/grants/{identifier}/messages/smart-compose",
             request_body=request_body,
             overrides=overrides,
         )
 
-        return Response.from_dict(res, ComposeMessageResponse, headers)
-
     def compose_message_reply(
         self,
         identifier: str,
@@ -57,11 +56,10 @@ class SmartCompose(Resource):
         Returns:
             The generated message reply.
         """
-        res, headers = self._http_client._execute(
+        return self._request(
+            self._decoder(ComposeMessageResponse, overrides),
             method="POST",
             path=f"/v3/grants/{identifier}/messages/{message_id}/smart-compose",
             request_body=request_body,
             overrides=overrides,
         )
-
-        return Response.from_dict(res, ComposeMessageResponse, headers)
@@ -62,12 +62,11 @@ class TransactionalSend(Resource):
 
             json_body = request_body
 
-        json_response, headers = self._http_client._execute(
+        return self._request(
+            self._decoder(Message, overrides),
             method="POST",
             path=path,
             request_body=json_body,
             data=form_data,
             overrides=overrides,
         )
-
-        return Response.from_dict(json_response, Message, headers)
@@ -139,13 +139,13 @@ class Webhooks(
         Returns:
             The updated webhook destination
         """
-        res, headers = self._http_client._execute(
+        return self._request(
+            self._decoder(WebhookWithSecret, overrides),
             method="PUT",
             path=f"/v3/webhooks/{webhook_id}/rotate-secret",
             request_body={},
             overrides=overrides,
         )
-        return Response.from_dict(res, WebhookWithSecret, headers)
 
     def ip_addresses(
         self, overrides: RequestOverrides = None
@@ -159,10 +159,12 @@ class Webhooks(
         Returns:
             The list of IP addresses that Nylas sends webhooks from
         """
-        res, headers = self._http_client._execute(
-            method="GET", path="/v3/webhooks/ip-addresses", overrides=overrides
+        return self._request(
+            self._decoder(WebhookIpAddressesResponse, overrides),
+            method="GET",
+            path="/v3/webhooks/ip-addresses",
+            overrides=overrides,
         )
-        return Response.from_dict(res, WebhookIpAddressesResponse, headers)
 
 
 def extract_challenge_parameter(url: str) -> str:
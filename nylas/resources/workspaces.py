@@ -147,13 +147,13 @@ class Workspaces(
         Returns:
             The started auto-group job.
         """
-        res, headers = self._http_client._execute(
+        return self._request(
+            self._decoder(WorkspaceAutoGroupResponse, overrides),
             method="POST",
             path="/v3/workspaces/auto-group",
             request_body=request_body,
             overrides=overrides,
         )
-        return Response.from_dict(res, WorkspaceAutoGroupResponse, headers)
 
     def manual_assign(
         self,
@@ -172,10 +172,10 @@ class Workspaces(
         Returns:
             The grants that were assigned and removed.
         """
-        res, headers = self._http_client._execute(
+        return self._request(
+            self._decoder(WorkspaceManualAssignResponse, overrides),
             method="POST",
             path=f"/v3/workspaces/{workspace_id}/manual-assign",
             request_body=request_body,
             overrides=overrides,
         )
-        return Response.from_dict(res, WorkspaceManualAssignResponse, headers)
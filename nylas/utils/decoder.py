@@ -0,0 +1,356 @@
+"""
+Compiled decoders for `@dataclass_json` models.
+
+`Model.from_dict` walks the model's type hints reflectively for every object it decodes.
+`decode` instead generates a decode function specialized to each model the first time the
+model is seen and caches it, so large list responses only pay for the type inspection once.
+
+The generated functions mirror the decisions dataclasses_json makes for each field: letter
+case and `field_name` overrides, custom `decoder`s, defaults and `infer_missing`, nested
+dataclasses, Optional, List, Dict and Enum fields, and primitive coercion. Fields with
+types that are not specialized are delegated to dataclasses_json's own helpers, and models
+that cannot be compiled fall back to `from_dict`, so the results are always the same.
+"""
+
+import functools
+import threading
+import warnings
+from dataclasses import MISSING, fields, is_dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Tuple, get_type_hints
+from uuid import UUID
+
+from dataclasses_json import DataClassJsonMixin
+
+try:
+    from dataclasses_json import cfg
+    from dataclasses_json.core import (
+        _decode_dataclass,
+        _decode_generic,
+        _decode_letter_case_overrides,
+        _decode_type,
+        _is_supported_generic,
+        _resolve_collection_type_to_decode_to,
+        _support_extended_types,
+        _user_overrides_or_exts,
+    )
+    from dataclasses_json.utils import (
+        _get_type_args,
+        _get_type_origin,
+        _is_collection,
+        _is_counter,
+        _is_generic_dataclass,
+        _is_mapping,
+        _is_new_type,
+        _is_optional,
+        _is_tuple,
+        _issubclass_safe,
+    )
+except ImportError:  # pragma: no cover - depends on the dataclasses_json version
+    _decode_dataclass = None
+
+_DECODERS: Dict[Tuple[type, bool], Callable[[Any], Any]] = {}
+_COMPILING: Dict[Tuple[type, bool], bool] = {}
+_LOCK = threading.RLock()
+
+_PRIMITIVES = (int, float, str, bool)
+_EXTENDED_TYPES = (datetime, Decimal, UUID)
+
+
+def decode(cls, data, infer_missing: bool = False):
+    """
+    Decode a JSON object into a `@dataclass_json` model.
+
+    Equivalent to `cls.from_dict(data, infer_missing=infer_missing)`, using a decode function
+    compiled for the model on first use.
+
+    Args:
+        cls: The model class to decode into.
+        data: The JSON object to decode.
+        infer_missing: Whether to default missing fields without a default to None.
+
+    Returns:
+        The decoded model.
+    """
+    decoder = _DECODERS.get((cls, infer_missing))
+    if decoder is None:
+        decoder = get_decoder(cls, infer_missing)
+    return decoder(data)
+
+
+def get_decoder(cls, infer_missing: bool = False) -> Callable[[Any], Any]:
+    """
+    Get the compiled decode function of a model, compiling it if needed.
+
+    Models that override `from_dict` are not compiled; their own `from_dict` is returned
+    instead so that the override keeps being used.
+
+    Args:
+        cls: The model class to decode into.
+        infer_missing: Whether to default missing fields without a default to None.
+
+    Returns:
+        A function taking a JSON object and returning the decoded model.
+    """
+    key = (cls, infer_missing)
+    decoder = _DECODERS.get(key)
+    if decoder is not None:
+        return decoder
+
+    if not _is_compilable(cls):
+        decoder = _from_dict_decoder(cls, infer_missing)
+        _DECODERS[key] = decoder
+        return decoder
+
+    return _dataclass_decoder(cls, infer_missing)
+
+
+def _from_dict_decoder(cls, infer_missing: bool):
+    if infer_missing:
+        return lambda data: cls.from_dict(data, infer_missing=True)
+    return cls.from_dict
+
+
+def _is_compilable(cls) -> bool:
+    if _decode_dataclass is None or not is_dataclass(cls):
+        return False
+    from_dict = getattr(cls, "from_dict", None)
+    return getattr(from_dict, "__func__", None) is DataClassJsonMixin.from_dict.__func__
+
+
+def _dataclass_decoder(cls, infer_missing: bool):
+    key = (cls, infer_missing)
+    with _LOCK:
+        decoder = _DECODERS.get(key)
+        if decoder is not None:
+            return decoder
+        if key in _COMPILING:
+            # Recursive model: resolve the decoder lazily once compilation has finished.
+            return lambda data: (  # pylint: disable=unnecessary-lambda
+                _DECODERS[key](data)
+            )
+
+        _COMPILING[key] = True
+        try:
+            try:
+                decoder = _Compiler(cls, infer_missing).compile()
+            except Exception:  # pylint: disable=broad-except
+                # Types the compiler cannot handle keep using dataclasses_json directly.
+                decoder = functools.partial(
+                    _decode_dataclass, cls, infer_missing=infer_missing
+                )
+            _DECODERS[key] = decoder
+        finally:
+            del _COMPILING[key]
+        return decoder
+
+
+def _warn_none(cls_name: str, field_name: str, infer_missing: bool) -> None:
+    warning = (
+        f"value of non-optional type {field_name} detected when decoding {cls_name}"
+    )
+    if infer_missing:
+        warnings.warn(
+            f"Missing {warning} and was defaulted to None by "
+            f"infer_missing=True. "
+            f"Set infer_missing=False (the default) to prevent "
+            f"this behavior.",
+            RuntimeWarning,
+        )
+    else:
+        warnings.warn(f"'NoneType' object {warning}.", RuntimeWarning)
+
+
+class _Compiler:
+    """Generates the source of the decode function of one dataclass."""
+
+    def __init__(self, cls, infer_missing: bool):
+        self.cls = cls
+        self.infer_missing = infer_missing
+        self.namespace = {
+            "_cls": cls,
+            "_MISSING": MISSING,
+            "_is_dataclass": is_dataclass,
+            "_warn_none": _warn_none,
+        }
+        self._names = 0
+
+    def compile(self):
+        """Generate, compile and return the decode function."""
+        cls = self.cls
+        overrides = _user_overrides_or_exts(cls)
+        all_fields = fields(cls)
+        decode_names = _decode_letter_case_overrides(
+            [field.name for field in all_fields], overrides
+        )
+        types = get_type_hints(cls)
+
+        self.namespace["_decode_dataclass"] = _decode_dataclass
+        lines = [
+            "def decode(kvs):",
+            "    if type(kvs) is not dict:",
+            "        # Instances of the model, None and other mappings take the generic path.",
+            f"        return _decode_dataclass(_cls, kvs, {self.infer_missing})",
+        ]
+        if decode_names:
+            self.namespace["_decode_names"] = decode_names
+            lines.append(
+                "    kvs = {_decode_names.get(k, k): v for k, v in kvs.items()}"
+            )
+
+        init_args = []
+        for field in all_fields:
+            if not field.init:
+                continue
+            var = self._name("v")
+            lines += self._field_lines(field, var, types[field.name], overrides)
+            init_args.append(f"{field.name}={var}")
+
+        lines.append(f"    return _cls({', '.join(init_args)})")
+        source = "\n".join(lines)
+        code = compile(source, f"<decoder {cls.__qualname__}>", "exec")
+        exec(code, self.namespace)  # pylint: disable=exec-used
+        decoder = self.namespace["decode"]
+        decoder.__qualname__ = f"decode_{cls.__name__}"
+        return decoder
+
+    def _name(self, prefix: str) -> str:
+        self._names += 1
+        return f"_{prefix}{self._names}"
+
+    def _ref(self, value, prefix: str = "r") -> str:
+        name = self._name(prefix)
+        self.namespace[name] = value
+        return name
+
+    def _field_lines(  # pylint: disable=too-many-branches
+        self, field, var: str, field_type, overrides
+    ):
+        name = repr(field.name)
+        if field.default is not MISSING:
+            lines = [f"    {var} = kvs.get({name}, {self._ref(field.default, 'd')})"]
+        elif field.default_factory is not MISSING:
+            factory = self._ref(field.default_factory, "f")
+            lines = [f"    {var} = kvs[{name}] if {name} in kvs else {factory}()"]
+        elif self.infer_missing:
+            lines = [f"    {var} = kvs.get({name})"]
+        else:
+            lines = [f"    {var} = kvs[{name}]"]
+
+        while _is_new_type(field_type):
+            field_type = field_type.__supertype__
+
+        optional = _is_optional(field_type)
+        if field.name in overrides and overrides[field.name].decoder is not None:
+            decoder = self._ref(overrides[field.name].decoder, "c")
+            field_type_ref = self._ref(field_type, "t")
+            convert = f"{var} if type({var}) is {field_type_ref} else {decoder}({var})"
+        elif is_dataclass(field_type):
+            nested = self._ref(_dataclass_decoder(field_type, self.infer_missing), "n")
+            convert = (
+                f"{nested}({var}) if type({var}) is dict"
+                f" else ({var} if _is_dataclass({var}) else {nested}({var}))"
+            )
+        elif _is_supported_generic(field_type) and field_type != str:
+            convert = self._generic(field_type, var)
+        else:
+            convert = self._extended(field_type, var)
+
+        if optional:
+            if convert != var:
+                lines += [
+                    f"    if {var} is not None:",
+                    f"        {var} = {convert}",
+                ]
+        else:
+            cls_name, field_name = repr(self.cls.__name__), repr(field.name)
+            lines += [
+                f"    if {var} is None:",
+                f"        _warn_none({cls_name}, {field_name}, {self.infer_missing})",
+            ]
+            if convert != var:
+                lines += ["    else:", f"        {var} = {convert}"]
+        return lines
+
+    def _decode_type(self, type_, expr: str) -> str:
+        """Expression equivalent to dataclasses_json's _decode_type(type_, expr)."""
+        if type_ in cfg.global_config.decoders:
+            return self._fallback(_decode_type, type_, expr)
+        if _is_supported_generic(type_):
+            return f"(None if {expr} is None else {self._generic(type_, expr)})"
+        if is_dataclass(type_):
+            nested = self._ref(_dataclass_decoder(type_, self.infer_missing), "n")
+            return f"{nested}({expr})"
+        return self._extended(type_, expr)
+
+    def _generic(  # pylint: disable=too-many-return-statements
+        self, type_, expr: str
+    ) -> str:
+        """
+        Expression equivalent to dataclasses_json's _decode_generic(type_, expr) for a value
+        that is known not to be None.
+        """
+        if _issubclass_safe(type_, Enum):
+            return f"{self._ref(type_, 't')}({expr})"
+
+        if _is_collection(type_):
+            target = _resolve_collection_type_to_decode_to(type_)
+            if _is_mapping(type_) and not _is_counter(type_):
+                args = _get_type_args(type_, (Any, Any))
+                if (
+                    len(args) == 2
+                    and args[0] in (str, Any)
+                    and not isinstance(args[1], str)
+                ):
+                    key, value = self._name("k"), self._name("x")
+                    key_expr = key if args[0] is Any else f"str({key})"
+                    mapping = (
+                        f"{{{key_expr}: {self._decode_type(args[1], value)}"
+                        f" for {key}, {value} in {expr}.items()}}"
+                    )
+                    if target is dict:
+                        return mapping
+                    return f"{self._ref(target, 't')}({mapping})"
+            elif not _is_tuple(type_) and target is list:
+                args = _get_type_args(type_)
+                if (
+                    isinstance(args, tuple)
+                    and len(args) == 1
+                    and not isinstance(args[0], str)
+                ):
+                    item = self._name("x")
+                    return f"[{self._decode_type(args[0], item)} for {item} in {expr}]"
+            return self._fallback(_decode_generic, type_, expr)
+
+        if _is_generic_dataclass(type_):
+            origin = _get_type_origin(type_)
+            nested = self._ref(_dataclass_decoder(origin, self.infer_missing), "n")
+            return f"{nested}({expr})"
+
+        args = _get_type_args(type_)
+        if not isinstance(args, tuple):
+            # Bare Any and other types without arguments are passed through unchanged.
+            return expr
+        if _is_optional(type_) and len(args) == 2:
+            return self._decode_type(args[0], expr)
+        return self._fallback(_decode_generic, type_, expr)
+
+    def _extended(self, type_, expr: str) -> str:
+        """Expression equivalent to dataclasses_json's _support_extended_types(type_, expr)."""
+        if _issubclass_safe(type_, _EXTENDED_TYPES):
+            return self._fallback(
+                _support_extended_types, type_, expr, pass_missing=False
+            )
+        if _issubclass_safe(type_, _PRIMITIVES):
+            type_ref = self._ref(type_, "t")
+            return f"({expr} if isinstance({expr}, {type_ref}) else {type_ref}({expr}))"
+        return expr
+
+    def _fallback(self, function, type_, expr: str, pass_missing: bool = True) -> str:
+        function_ref = self._ref(function, "g")
+        type_ref = self._ref(type_, "t")
+        if pass_missing:
+            return f"{function_ref}({type_ref}, {expr}, {self.infer_missing})"
+        return f"{function_ref}({type_ref}, {expr})"
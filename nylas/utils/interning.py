@@ -0,0 +1,136 @@
+"""
+Deduplication of repeated string values in decoded API responses.
+
+Every string in a parsed JSON response is a separate object, even though values such as
+grant and calendar IDs, object type names, folder IDs and participant emails repeat across
+every item of a page and across pages. A `StringInterner` replaces those values by one
+shared instance kept in a bounded table before the items are decoded into models, so
+long-running sync workers hold one copy of each instead of one per occurrence.
+"""
+
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+DEFAULT_INTERNED_FIELDS = frozenset(
+    {
+        "object",
+        "grant_id",
+        "calendar_id",
+        "thread_id",
+        "folders",
+        "email",
+        "name",
+        "status",
+        "type",
+        "provider",
+        "content_type",
+        "timezone",
+        "start_timezone",
+        "end_timezone",
+        "visibility",
+        "source",
+    }
+)
+"""The fields whose string values are interned by default."""
+
+DEFAULT_MAX_SIZE = 65536
+"""The default maximum number of distinct strings a StringInterner keeps."""
+
+
+class StringInterner:
+    """
+    Bounded intern table for repeated string values in API responses.
+
+    String values of the configured fields, and strings in lists held by those fields, are
+    replaced by a shared instance wherever they appear in an item, including in nested
+    objects such as participants and headers. Once the table is full, the oldest entries
+    are evicted. An interner can be shared by several clients and is thread-safe.
+
+    Args:
+        fields: The JSON field names whose string values are interned.
+        max_size: The maximum number of distinct strings to keep.
+    """
+
+    def __init__(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.fields: FrozenSet[str] = (
+            frozenset(fields) if fields is not None else DEFAULT_INTERNED_FIELDS
+        )
+        self.max_size = max_size
+        self._table: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def intern(self, value: str) -> str:
+        """
+        Get the shared instance of a string, adding it to the table if needed.
+
+        Args:
+            value: The string to intern.
+
+        Returns:
+            The shared instance equal to value.
+        """
+        shared = self._table.get(value)
+        if shared is not None:
+            return shared
+        with self._lock:
+            shared = self._table.setdefault(value, value)
+            if len(self._table) > self.max_size:
+                del self._table[next(iter(self._table))]
+        return shared
+
+    def intern_item(self, item: Any) -> Any:
+        """
+        Intern the configured fields of a parsed JSON value in place.
+
+        Args:
+            item: A parsed JSON object, list or scalar.
+
+        Returns:
+            The same value, for chaining.
+        """
+        if isinstance(item, dict):
+            self._intern_object(item)
+        elif isinstance(item, list):
+            for value in item:
+                self.intern_item(value)
+        return item
+
+    def intern_items(self, items: list) -> list:
+        """
+        Intern the configured fields of every item of a list in place.
+
+        Args:
+            items: The parsed JSON items.
+
+        Returns:
+            The same list, for chaining.
+        """
+        for item in items:
+            self.intern_item(item)
+        return items
+
+    def _intern_object(self, obj: dict) -> None:
+        fields = self.fields
+        for key, value in obj.items():
+            if isinstance(value, str):
+                if key in fields:
+                    obj[key] = self.intern(value)
+            elif isinstance(value, dict):
+                self._intern_object(value)
+            elif isinstance(value, list):
+                if key in fields:
+                    value[:] = [
+                        self.intern(v) if isinstance(v, str) else v for v in value
+                    ]
+                for element in value:
+                    if isinstance(element, (dict, list)):
+                        self.intern_item(element)
@@ -0,0 +1,148 @@
+"""
+Slotted variants of `@dataclass_json` models.
+
+Model instances keep their attributes in a per-instance `__dict__`, which dominates their
+memory footprint when hundreds of thousands of them are held at once. `slotted(Model)`
+returns a copy of a model class that stores its fields in `__slots__` instead. The variant
+keeps the model's name, fields, defaults, `to_dict`/`from_dict`/`to_json`/`from_json` and
+custom field decoders. Nested dataclass fields (e.g. `Message.headers`) and models returned
+by custom field decoders (e.g. `Thread.latest_draft_or_message`) become slotted variants
+too. TypedDict fields such as `EmailName` are plain dicts and are unchanged.
+
+Variants are distinct classes: `isinstance(slotted(Message).from_dict(...), Message)` is
+False, instances do not compare equal to instances of the original model, and arbitrary
+attributes cannot be set on them.
+"""
+
+import copy
+import threading
+import types
+from dataclasses import fields, is_dataclass
+from typing import Dict, get_type_hints
+
+_SLOTTED: Dict[type, type] = {}
+_LOCK = threading.RLock()
+
+
+def slotted(cls: type) -> type:
+    """
+    Get the slotted variant of a `@dataclass_json` model, creating it on first use.
+
+    Args:
+        cls: The model class.
+
+    Returns:
+        The slotted variant of the model. Variants are cached, so every call with the same
+        model returns the same class.
+    """
+    variant = _SLOTTED.get(cls)
+    if variant is not None:
+        return variant
+    if not (isinstance(cls, type) and is_dataclass(cls)):
+        raise TypeError(f"slotted() expects a dataclass, got {cls!r}")
+
+    with _LOCK:
+        variant = _SLOTTED.get(cls)
+        if variant is None:
+            variant = _build_variant(cls)
+        return variant
+
+
+def _build_variant(cls: type) -> type:
+    bases = tuple(
+        slotted(base) if is_dataclass(base) else base for base in cls.__bases__
+    )
+    inherited_slots = {
+        name for base in bases for klass in base.__mro__ for name in _slots_of(klass)
+    }
+    field_names = [field.name for field in fields(cls)]
+
+    # Field defaults live on the class as attributes, which would shadow the slots; the
+    # generated __init__ keeps its own reference to them.
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in field_names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = tuple(
+        name for name in field_names if name not in inherited_slots
+    )
+    variant = type(cls)(cls.__name__, bases, namespace)
+    variant.__qualname__ = cls.__qualname__
+
+    # Register before resolving field types so that recursive models refer to themselves.
+    _SLOTTED[cls] = variant
+    _SLOTTED[variant] = variant
+    try:
+        hints = get_type_hints(cls)
+        variant.__annotations__ = {
+            name: _slotted_type(hints.get(name, annotation))
+            for name, annotation in cls.__dict__.get("__annotations__", {}).items()
+        }
+        variant_fields = {}
+        for name, field in cls.__dict__["__dataclass_fields__"].items():
+            field = copy.copy(field)
+            field.type = _slotted_type(hints.get(name, field.type))
+            field.metadata = _slotted_metadata(field.metadata)
+            variant_fields[name] = field
+        variant.__dataclass_fields__ = variant_fields
+    except Exception:
+        del _SLOTTED[cls], _SLOTTED[variant]
+        raise
+    return variant
+
+
+def _slotted_metadata(metadata):
+    options = metadata.get("dataclasses_json")
+    decoder = options.get("decoder") if options else None
+    if decoder is None:
+        return metadata
+    options = {**options, "decoder": lambda value: as_slotted(decoder(value))}
+    return types.MappingProxyType({**metadata, "dataclasses_json": options})
+
+
+def as_slotted(value):
+    """
+    Convert model instances to their slotted variants.
+
+    Lists of models and models nested in fields are converted as well; other values are
+    returned unchanged.
+
+    Args:
+        value: A model instance, a list, or any other value.
+
+    Returns:
+        The converted value.
+    """
+    if isinstance(value, list):
+        return [as_slotted(item) for item in value]
+    if not is_dataclass(value) or isinstance(value, type):
+        return value
+    variant = slotted(type(value))
+    if isinstance(value, variant):
+        return value
+    instance = object.__new__(variant)
+    for field in fields(variant):
+        object.__setattr__(instance, field.name, as_slotted(getattr(value, field.name)))
+    return instance
+
+
+def _slots_of(klass: type):
+    slots = klass.__dict__.get("__slots__", ())
+    return (slots,) if isinstance(slots, str) else slots
+
+
+def _slotted_type(type_):
+    """Replace the dataclasses in a type hint, e.g. Optional[List[Model]], by their variants."""
+    if isinstance(type_, type) and is_dataclass(type_):
+        return slotted(type_)
+
+    args = getattr(type_, "__args__", None)
+    if not isinstance(args, tuple) or not args:
+        return type_
+    new_args = tuple(_slotted_type(arg) for arg in args)
+    if all(new is old for new, old in zip(new_args, args)):
+        return type_
+    if hasattr(type_, "copy_with"):
+        return type_.copy_with(new_args)
+    return type_.__origin__[new_args]
@@ -23,7 +23,28 @@ RUN_DEPENDENCIES = [
     "cryptography>=42.0.0",
 ]
 
-TEST_DEPENDENCIES = ["pytest>=7.4.0", "pytest-cov>=4.1.0", "setuptools>=69.0.3"]
+TEST_DEPENDENCIES = [
+    "pytest>=7.4.0",
+    "pytest-cov>=4.1.0",
+    "setuptools>=69.0.3",
+    "httpx>=0.24.0",
+    "orjson>=3.8.0",
+    "h2>=4.1.0",
+    "prometheus-client>=0.16.0",
+    "opentelemetry-sdk>=1.20.0",
+]
+
+ASYNC_DEPENDENCIES = ["httpx>=0.24.0"]
+
+ORJSON_DEPENDENCIES = ["orjson>=3.8.0"]
+
+BROTLI_DEPENDENCIES = ["brotli>=1.0.9"]
+
+HTTP2_DEPENDENCIES = ["httpx[http2]>=0.24.0"]
+
+PROMETHEUS_DEPENDENCIES = ["prometheus-client>=0.16.0"]
+
+OPENTELEMETRY_DEPENDENCIES = ["opentelemetry-api>=1.20.0"]
 
 DOCS_DEPENDENCIES = [
     "mkdocs>=1.5.2",
@@ -115,6 +136,12 @@ def main():
         dependency_links=[],
         extras_require={
             "test": TEST_DEPENDENCIES,
+            "async": ASYNC_DEPENDENCIES,
+            "orjson": ORJSON_DEPENDENCIES,
+            "brotli": BROTLI_DEPENDENCIES,
+            "http2": HTTP2_DEPENDENCIES,
+            "prometheus": PROMETHEUS_DEPENDENCIES,
+            "opentelemetry": OPENTELEMETRY_DEPENDENCIES,
             "docs": DOCS_DEPENDENCIES,
             "release": RELEASE_DEPENDENCIES,
         },
@@ -5,6 +5,7 @@ import requests
 from nylas.models.response import Response, ListResponse
 
 from nylas.handler.http_client import HttpClient
+from nylas.handler.json_codec import StdlibJsonCodec
 
 from nylas import Client
 
@@ -22,6 +23,7 @@ def http_client():
         api_server="https://test.nylas.com",
         api_key="test-key",
         timeout=30,
+        json_codec=StdlibJsonCodec(),
     )
 
 
@@ -40,13 +42,17 @@ def patched_request():
     mock_response.json.return_value = {"foo": "bar"}
     mock_response.status_code = 200
 
-    with patch("requests.request", return_value=mock_response) as mock_request:
+    with patch(
+        "requests.Session.request", return_value=mock_response
+    ) as mock_request:
         yield mock_request
 
 
 @pytest.fixture
 def mock_session_timeout():
-    with patch("requests.request", side_effect=requests.exceptions.Timeout):
+    with patch(
+        "requests.Session.request", side_effect=requests.exceptions.Timeout
+    ):
         yield
 
 
@@ -0,0 +1,254 @@
+"""
+Local HTTP/2 stand-in for the Nylas API, used by the HTTP/2 transport tests and by
+benchmarks/bench_http2.py.
+
+The server speaks HTTP/2 over TLS (negotiated with ALPN), or only HTTP/1.1 to exercise the
+fallback, and answers every request with the same JSON body after an optional delay. Delayed responses are scheduled rather than slept
+on, so concurrent streams on one connection are answered in parallel, as with the real API.
+"""
+
+import datetime
+import heapq
+import json
+import os
+import socket
+import socketserver
+import ssl
+import tempfile
+import threading
+import time
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.settings
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+
+def _write_self_signed_cert(directory: str):
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.DNSName("localhost")]), critical=False
+        )
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+    return cert_path, key_path
+
+
+class _H2Handler(socketserver.BaseRequestHandler):
+    payload = b"{}"
+    latency = 0.0
+    max_streams = 100
+
+    def handle(self):
+        sock = self.request
+        self.server.record_connection(sock.selected_alpn_protocol())
+        if sock.selected_alpn_protocol() != "h2":
+            self._handle_http1(sock)
+            return
+        conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        conn.initiate_connection()
+        conn.update_settings(
+            {h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: self.max_streams}
+        )
+        sock.sendall(conn.data_to_send())
+        scheduled = []
+        outgoing = {}
+        while True:
+            timeout = None
+            if scheduled:
+                timeout = scheduled[0][0] - time.monotonic()
+            data = None
+            if timeout is None or timeout > 0:
+                sock.settimeout(timeout)
+                try:
+                    data = sock.recv(65536)
+                except socket.timeout:
+                    pass
+                except (ConnectionError, ssl.SSLError):
+                    return
+            if data == b"":
+                return
+            if data:
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.DataReceived):
+                        conn.acknowledge_received_data(
+                            event.flow_controlled_length, event.stream_id
+                        )
+                    elif isinstance(event, h2.events.StreamEnded):
+                        self.server.record_stream(event.stream_id)
+                        due = time.monotonic() + self.latency
+                        heapq.heappush(scheduled, (due, event.stream_id))
+                    elif isinstance(event, h2.events.WindowUpdated):
+                        self._flush(conn, outgoing)
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        return
+            while scheduled and scheduled[0][0] <= time.monotonic():
+                _, stream_id = heapq.heappop(scheduled)
+                conn.send_headers(
+                    stream_id,
+                    [
+                        (":status", "200"),
+                        ("content-type", "application/json"),
+                        ("content-length", str(len(self.payload))),
+                    ],
+                )
+                outgoing[stream_id] = memoryview(self.payload)
+                self.server.record_stream_done()
+            self._flush(conn, outgoing)
+            sock.sendall(conn.data_to_send())
+
+    def _handle_http1(self, sock):
+        reader = sock.makefile("rb")
+        while True:
+            length = 0
+            line = reader.readline()
+            if not line:
+                return
+            while line not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value)
+                line = reader.readline()
+            reader.read(length)
+            time.sleep(self.latency)
+            sock.sendall(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                + f"Content-Length: {len(self.payload)}\r\n\r\n".encode()
+                + self.payload
+            )
+
+    @staticmethod
+    def _flush(conn, outgoing):
+        for stream_id in list(outgoing):
+            body = outgoing[stream_id]
+            while body:
+                size = min(
+                    conn.local_flow_control_window(stream_id),
+                    conn.max_outbound_frame_size,
+                    len(body),
+                )
+                if size <= 0:
+                    break
+                conn.send_data(
+                    stream_id, bytes(body[:size]), end_stream=size == len(body)
+                )
+                body = body[size:]
+            if body:
+                outgoing[stream_id] = body
+            else:
+                del outgoing[stream_id]
+
+
+class _TLSServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, handler, context):
+        super().__init__(("localhost", 0), handler)
+        self.context = context
+        self.protocols = []
+        self.max_open_streams = 0
+        self._open_streams = 0
+        self._lock = threading.Lock()
+
+    def get_request(self):
+        sock, address = self.socket.accept()
+        return self.context.wrap_socket(sock, server_side=True), address
+
+    def record_connection(self, protocol):
+        with self._lock:
+            self.protocols.append(protocol)
+
+    def record_stream(self, _stream_id):
+        with self._lock:
+            self._open_streams += 1
+            self.max_open_streams = max(self.max_open_streams, self._open_streams)
+
+    def record_stream_done(self):
+        with self._lock:
+            self._open_streams -= 1
+
+
+class LocalH2Server:
+    """
+    A threaded HTTP/2 server on localhost that returns the same JSON body for every request.
+
+    Args:
+        payload: The JSON body to answer with.
+        latency: Seconds to wait before answering each request.
+        max_streams: The SETTINGS_MAX_CONCURRENT_STREAMS the server advertises.
+        http2: Whether to offer HTTP/2; if False, only HTTP/1.1 is spoken.
+
+    Attributes:
+        url: The base URL of the running server.
+        cert_path: The path to the self-signed certificate, usable as a `verify` bundle.
+        protocols: The ALPN protocol negotiated by each connection, in order.
+        max_open_streams: The largest number of requests that were in flight at once.
+    """
+
+    def __init__(
+        self,
+        payload: dict = None,
+        latency: float = 0.0,
+        max_streams: int = 100,
+        http2: bool = True,
+    ):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.cert_path, key_path = _write_self_signed_cert(self._tmpdir.name)
+        body = json.dumps(payload or {"request_id": "h2", "data": {}}).encode()
+        handler = type(
+            "Handler",
+            (_H2Handler,),
+            {"payload": body, "latency": latency, "max_streams": max_streams},
+        )
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(self.cert_path, key_path)
+        context.set_alpn_protocols(["h2"] if http2 else ["http/1.1"])
+        self._server = _TLSServer(handler, context)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self.url = f"https://localhost:{self._server.server_address[1]}"
+
+    @property
+    def protocols(self):
+        return list(self._server.protocols)
+
+    @property
+    def max_open_streams(self):
+        return self._server.max_open_streams
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+        self._tmpdir.cleanup()
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import patch, Mock
 
 import pytest
@@ -12,13 +13,18 @@ from nylas.handler.api_resources import (
 from nylas.handler.http_client import (
     HttpClient,
 )
+from nylas.handler.transport import LocalTransport
 from nylas.models.calendars import Calendar
+from nylas.models.errors import NylasApiError
 from nylas.models.response import (
+    LazyList,
     ListResponse,
     Response,
     DeleteResponse,
     RequestIdOnlyResponse,
+    StreamedListResponse,
 )
+from nylas.utils.slots import slotted
 
 
 class MockResource(
@@ -265,3 +271,441 @@ class TestApiResource:
             {"foo": "bar"},
             overrides=None,
         )
+
+
+class TestAsyncApiResource:
+    def test_list_resource_awaits_async_client(self):
+        async def execute(*args, **kwargs):
+            return (
+                {
+                    "request_id": "abc-123",
+                    "data": [
+                        {
+                            "id": "calendar-123",
+                            "grant_id": "grant-123",
+                            "name": "Mock Calendar",
+                            "read_only": False,
+                            "is_owned_by_user": True,
+                        }
+                    ],
+                },
+                {"X-Test-Header": "test"},
+            )
+
+        mock_http_client = Mock()
+        mock_http_client._execute.side_effect = execute
+        resource = MockResource(mock_http_client)
+
+        pending = resource.list(path="/foo", response_type=Calendar)
+        response = asyncio.run(pending)
+
+        assert type(response) is ListResponse
+        assert response.data[0].id == "calendar-123"
+        assert response.headers == {"X-Test-Header": "test"}
+
+
+def _calendar_page(ids, next_cursor=None):
+    return (
+        {
+            "request_id": "abc-123",
+            "data": [
+                {
+                    "id": calendar_id,
+                    "grant_id": "grant-123",
+                    "name": "Mock Calendar",
+                    "read_only": False,
+                    "is_owned_by_user": True,
+                }
+                for calendar_id in ids
+            ],
+            "next_cursor": next_cursor,
+        },
+        {},
+    )
+
+
+class TestPagination:
+    def test_iter_pages_follows_cursors(self):
+        mock_http_client = Mock()
+        mock_http_client._execute.side_effect = [
+            _calendar_page(["1", "2"], "cursor-1"),
+            _calendar_page(["3"]),
+        ]
+        resource = MockResource(mock_http_client)
+
+        pages = list(
+            resource.iter_pages(
+                path="/foo", response_type=Calendar, query_params={"query": "param"}
+            )
+        )
+
+        assert [len(page.data) for page in pages] == [2, 1]
+        calls = mock_http_client._execute.call_args_list
+        assert calls[0].args[3] == {"query": "param"}
+        assert calls[1].args[3] == {"query": "param", "page_token": "cursor-1"}
+
+    def test_iter_pages_is_lazy(self):
+        mock_http_client = Mock()
+        mock_http_client._execute.side_effect = [
+            _calendar_page(["1"], "cursor-1"),
+            _calendar_page(["2"]),
+        ]
+        resource = MockResource(mock_http_client)
+
+        pages = resource.iter_pages(path="/foo", response_type=Calendar)
+        next(pages)
+
+        assert mock_http_client._execute.call_count == 1
+
+    def test_iter_pages_caps_limit(self):
+        mock_http_client = Mock()
+        mock_http_client._execute.side_effect = [_calendar_page(["1"])]
+        resource = MockResource(mock_http_client)
+
+        list(resource.iter_pages(path="/foo", response_type=Calendar, limit=500))
+
+        assert mock_http_client._execute.call_args.args[3] == {"limit": 200}
+
+    def test_list_all_yields_items_across_pages(self):
+        mock_http_client = Mock()
+        mock_http_client._execute.side_effect = [
+            _calendar_page(["1", "2"], "cursor-1"),
+            _calendar_page(["3"], "cursor-2"),
+            _calendar_page([]),
+        ]
+        resource = MockResource(mock_http_client)
+
+        items = list(resource.list_all(path="/foo", response_type=Calendar))
+
+        assert [item.id for item in items] == ["1", "2", "3"]
+        assert mock_http_client._execute.call_count == 3
+
+    def test_list_all_stops_at_max_items(self):
+        mock_http_client = Mock()
+        mock_http_client._execute.side_effect = [
+            _calendar_page(["1", "2"], "cursor-1"),
+            _calendar_page(["3", "4"], "cursor-2"),
+        ]
+        resource = MockResource(mock_http_client)
+
+        items = list(
+            resource.list_all(path="/foo", response_type=Calendar, max_items=3)
+        )
+
+        assert [item.id for item in items] == ["1", "2", "3"]
+        assert mock_http_client._execute.call_count == 2
+        assert mock_http_client._execute.call_args.args[3] == {
+            "limit": 3,
+            "page_token": "cursor-1",
+        }
+
+    def test_list_all_with_list_method(self):
+        mock_http_client = Mock()
+        mock_http_client._execute.side_effect = [
+            _calendar_page(["1"], "cursor-1"),
+            _calendar_page(["2"]),
+        ]
+        resource = MockResource(mock_http_client)
+        seen = []
+
+        def list_items(list_id, query_params=None):
+            seen.append((list_id, query_params))
+            return resource.list(
+                path=f"/lists/{list_id}",
+                response_type=Calendar,
+                query_params=query_params,
+            )
+
+        items = list(resource.list_all("list-123", list_method=list_items))
+
+        assert [item.id for item in items] == ["1", "2"]
+        assert seen == [("list-123", None), ("list-123", {"page_token": "cursor-1"})]
+
+    def test_alist_all_awaits_async_client(self):
+        pages = [_calendar_page(["1"], "cursor-1"), _calendar_page(["2"])]
+
+        async def execute(*args, **kwargs):
+            return pages.pop(0)
+
+        mock_http_client = Mock()
+        mock_http_client._execute.side_effect = execute
+        resource = MockResource(mock_http_client)
+
+        async def collect():
+            return [
+                item.id
+                async for item in resource.alist_all(
+                    path="/foo", response_type=Calendar
+                )
+            ]
+
+        assert asyncio.run(collect()) == ["1", "2"]
+
+    def test_iter_pages_with_prefetch(self):
+        mock_http_client = Mock()
+        mock_http_client._execute.side_effect = [
+            _calendar_page(["1"], "cursor-1"),
+            _calendar_page(["2"], "cursor-2"),
+            _calendar_page(["3"]),
+        ]
+        resource = MockResource(mock_http_client)
+
+        items = list(resource.list_all(path="/foo", response_type=Calendar, prefetch=1))
+
+        assert [item.id for item in items] == ["1", "2", "3"]
+        assert mock_http_client._execute.call_count == 3
+
+    def test_alist_all_with_prefetch(self):
+        pages = [_calendar_page(["1"], "cursor-1"), _calendar_page(["2"])]
+
+        async def execute(*args, **kwargs):
+            return pages.pop(0)
+
+        mock_http_client = Mock()
+        mock_http_client._execute.side_effect = execute
+        resource = MockResource(mock_http_client)
+
+        async def collect():
+            return [
+                item.id
+                async for item in resource.alist_all(
+                    path="/foo", response_type=Calendar, prefetch=2
+                )
+            ]
+
+        assert asyncio.run(collect()) == ["1", "2"]
+
+
+class TestResponseFormat:
+    def test_lazy_list_from_overrides(self):
+        mock_http_client = Mock()
+        mock_http_client._execute.return_value = _calendar_page(["1", "2"])
+        resource = MockResource(mock_http_client)
+
+        response = resource.list(
+            path="/foo",
+            response_type=Calendar,
+            overrides={"response_format": "lazy"},
+        )
+
+        assert isinstance(response.data, LazyList)
+        assert response.data.raw[0]["id"] == "1"
+        assert response.data[1].id == "2"
+
+    def test_lazy_list_from_client_default(self):
+        mock_http_client = Mock()
+        mock_http_client.response_format = "lazy"
+        mock_http_client._execute.return_value = _calendar_page(["1"])
+        resource = MockResource(mock_http_client)
+
+        response = resource.list(path="/foo", response_type=Calendar)
+
+        assert isinstance(response.data, LazyList)
+
+    def test_overrides_take_precedence_over_client_default(self):
+        mock_http_client = Mock()
+        mock_http_client.response_format = "lazy"
+        mock_http_client._execute.return_value = _calendar_page(["1"])
+        resource = MockResource(mock_http_client)
+
+        response = resource.list(
+            path="/foo",
+            response_type=Calendar,
+            overrides={"response_format": "model"},
+        )
+
+        assert type(response.data) is list
+
+    def test_raw_list_skips_models(self):
+        mock_http_client = Mock()
+        mock_http_client._execute.return_value = _calendar_page(["1", "2"], "cursor-1")
+        resource = MockResource(mock_http_client)
+
+        response = resource.list(
+            path="/foo",
+            response_type=Calendar,
+            overrides={"response_format": "raw"},
+        )
+
+        assert type(response) is ListResponse
+        assert [item["id"] for item in response.data] == ["1", "2"]
+        assert response.next_cursor == "cursor-1"
+        assert response.request_id == "abc-123"
+
+    def test_raw_find_skips_models(self):
+        mock_http_client = Mock()
+        mock_http_client.response_format = "raw"
+        mock_http_client._execute.return_value = (
+            {"request_id": "abc-123", "data": {"id": "calendar-123"}},
+            {"X-Test-Header": "test"},
+        )
+        resource = MockResource(mock_http_client)
+
+        response = resource.find(path="/foo", response_type=Calendar)
+
+        assert type(response) is Response
+        assert response.data == {"id": "calendar-123"}
+        assert response.request_id == "abc-123"
+        assert response.headers == {"X-Test-Header": "test"}
+
+    def test_raw_create_and_update_skip_models(self):
+        mock_http_client = Mock()
+        mock_http_client._execute.return_value = (
+            {"request_id": "abc-123", "data": {"id": "calendar-123"}},
+            {},
+        )
+        resource = MockResource(mock_http_client)
+        overrides = {"response_format": "raw"}
+
+        created = resource.create(
+            path="/foo", response_type=Calendar, request_body={}, overrides=overrides
+        )
+        updated = resource.update(
+            path="/foo", response_type=Calendar, request_body={}, overrides=overrides
+        )
+
+        assert created.data == {"id": "calendar-123"}
+        assert updated.data == {"id": "calendar-123"}
+
+    def test_slotted_list_decodes_slotted_models(self):
+        mock_http_client = Mock()
+        mock_http_client._execute.return_value = _calendar_page(["1", "2"])
+        resource = MockResource(mock_http_client)
+
+        response = resource.list(
+            path="/foo",
+            response_type=Calendar,
+            overrides={"response_format": "slotted"},
+        )
+
+        assert [type(item) for item in response.data] == [slotted(Calendar)] * 2
+        assert not hasattr(response.data[0], "__dict__")
+        assert response.data[1].id == "2"
+
+    def test_slotted_find_from_client_default(self):
+        mock_http_client = Mock()
+        mock_http_client.response_format = "slotted"
+        page, headers = _calendar_page(["calendar-123"])
+        mock_http_client._execute.return_value = (
+            {"request_id": "abc-123", "data": page["data"][0]},
+            headers,
+        )
+        resource = MockResource(mock_http_client)
+
+        response = resource.find(path="/foo", response_type=Calendar)
+
+        assert type(response.data) is slotted(Calendar)
+        assert response.data.id == "calendar-123"
+
+
+def _streaming_resource(http_client_class=HttpClient):
+    def list_calendars(request):
+        cursor = request.query.get("page_token", [None])[0]
+        if cursor is None:
+            return _calendar_page(["1", "2"], "cursor-1")[0]
+        return _calendar_page(["3"])[0]
+
+    transport = LocalTransport([("GET", "/calendars", list_calendars)])
+    http_client = http_client_class(
+        "https://test.nylas.com", "test-key", 30, transport=transport
+    )
+    return MockResource(http_client), transport
+
+
+class TestStreamedList:
+    _STREAM = {"response_format": "stream"}
+
+    def test_list_yields_decoded_items(self):
+        resource, _ = _streaming_resource()
+
+        response = resource.list(
+            path="/calendars", response_type=Calendar, overrides=self._STREAM
+        )
+
+        assert isinstance(response, StreamedListResponse)
+        assert response.next_cursor is None
+        items = list(response)
+        assert [type(item) for item in items] == [Calendar, Calendar]
+        assert [item.id for item in items] == ["1", "2"]
+        assert response.request_id == "abc-123"
+        assert response.next_cursor == "cursor-1"
+        assert response.complete
+        assert list(response.data) == []
+
+    def test_finish_skips_the_remaining_items(self):
+        resource, _ = _streaming_resource()
+
+        with resource.list(
+            path="/calendars", response_type=Calendar, overrides=self._STREAM
+        ) as response:
+            assert next(iter(response)).id == "1"
+            assert response.finish().next_cursor == "cursor-1"
+
+    def test_list_all_follows_cursors(self):
+        resource, transport = _streaming_resource()
+
+        items = resource.list_all(
+            path="/calendars", response_type=Calendar, overrides=self._STREAM
+        )
+
+        assert [item.id for item in items] == ["1", "2", "3"]
+        assert transport.calls == 2
+
+    def test_iter_pages_reads_unread_pages_for_their_cursor(self):
+        resource, transport = _streaming_resource()
+
+        pages = list(
+            resource.iter_pages(
+                path="/calendars", response_type=Calendar, overrides=self._STREAM
+            )
+        )
+
+        assert len(pages) == 2
+        assert transport.calls == 2
+
+    def test_prefetch_is_not_supported(self):
+        resource, _ = _streaming_resource()
+
+        with pytest.raises(ValueError, match="prefetch"):
+            resource.iter_pages(
+                path="/calendars",
+                response_type=Calendar,
+                overrides=self._STREAM,
+                prefetch=1,
+            )
+
+    def test_error_responses_raise(self):
+        resource, _ = _streaming_resource()
+
+        with pytest.raises(NylasApiError) as exc_info:
+            resource.list(
+                path="/missing", response_type=Calendar, overrides=self._STREAM
+            )
+
+        assert exc_info.value.status_code == 404
+
+    def test_async_list(self):
+        pytest.importorskip("httpx")
+        from nylas.handler.async_http_client import AsyncHttpClient
+
+        resource, _ = _streaming_resource(AsyncHttpClient)
+
+        async def run():
+            response = await resource.list(
+                path="/calendars", response_type=Calendar, overrides=self._STREAM
+            )
+            ids = [item.id async for item in response]
+            all_ids = [
+                item.id
+                async for item in resource.alist_all(
+                    path="/calendars", response_type=Calendar, overrides=self._STREAM
+                )
+            ]
+            await resource._http_client.close()
+            return ids, response.next_cursor, all_ids
+
+        ids, next_cursor, all_ids = asyncio.run(run())
+
+        assert ids == ["1", "2"]
+        assert next_cursor == "cursor-1"
+        assert all_ids == ["1", "2", "3"]
@@ -0,0 +1,330 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from nylas.handler.async_http_client import AsyncHttpClient
+from nylas.handler.compression import Compression
+from nylas.handler.json_codec import StdlibJsonCodec
+from nylas.handler.rate_limiter import RateLimiter
+from nylas.handler.response_cache import CACHE_STATUS_HEADER, ResponseCache
+from nylas.handler.retry import RetryPolicy, RETRY_COUNT_HEADER
+from nylas.handler.revalidation import RevalidationCache
+from nylas.handler.single_flight import SingleFlight
+from nylas.models.errors import NylasApiError, NylasSdkTimeoutError
+
+
+def _client_with_transport(handler):
+    http_client = AsyncHttpClient(
+        api_server="https://test.nylas.com",
+        api_key="test-key",
+        timeout=30,
+        json_codec=StdlibJsonCodec(),
+    )
+    http_client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return http_client
+
+
+class TestAsyncHttpClient:
+    def test_async_http_client_init(self):
+        http_client = AsyncHttpClient(
+            api_server="https://test.nylas.com",
+            api_key="test-key",
+            timeout=60,
+            max_connections=250,
+        )
+
+        assert http_client.api_server == "https://test.nylas.com"
+        assert http_client.api_key == "test-key"
+        assert http_client.timeout == 60
+        assert http_client.max_connections == 250
+        assert isinstance(http_client.session, httpx.AsyncClient)
+
+    def test_execute(self, patched_version_and_sys):
+        captured = {}
+
+        def handler(request):
+            captured["request"] = request
+            return httpx.Response(
+                200, json={"foo": "bar"}, headers={"X-Test-Header": "test"}
+            )
+
+        http_client = _client_with_transport(handler)
+        response_json, response_headers = asyncio.run(
+            http_client._execute(
+                method="POST",
+                path="/foo",
+                headers={"test": "header"},
+                query_params={"query": "param"},
+                request_body={"title": "Réunion d'équipe"},
+            )
+        )
+
+        request = captured["request"]
+        assert response_json == {"foo": "bar"}
+        assert response_headers["x-test-header"] == "test"
+        assert request.method == "POST"
+        assert str(request.url) == "https://test.nylas.com/foo?query=param"
+        assert request.headers["Authorization"] == "Bearer test-key"
+        assert request.headers["User-Agent"] == "Nylas Python SDK 2.0.0 - 1.2.3"
+        assert request.headers["Content-type"] == "application/json"
+        assert request.headers["test"] == "header"
+        assert request.content == '{"title": "Réunion d\'équipe"}'.encode("utf-8")
+
+    def test_execute_with_serialized_json_body(self):
+        captured = {}
+
+        def handler(request):
+            captured["content"] = request.content
+            return httpx.Response(200, json={"ok": True})
+
+        http_client = _client_with_transport(handler)
+        asyncio.run(
+            http_client._execute(
+                method="POST",
+                path="/v3/admin/domains",
+                serialized_json_body=b'{"a":1,"b":2}',
+            )
+        )
+
+        assert captured["content"] == b'{"a":1,"b":2}'
+
+    def test_execute_api_error(self):
+        def handler(request):
+            return httpx.Response(
+                400,
+                json={
+                    "request_id": "123",
+                    "error": {
+                        "type": "api_error",
+                        "message": "The request is invalid.",
+                    },
+                },
+            )
+
+        http_client = _client_with_transport(handler)
+        with pytest.raises(NylasApiError) as e:
+            asyncio.run(http_client._execute(method="GET", path="/foo"))
+
+        assert str(e.value) == "The request is invalid."
+        assert e.value.status_code == 400
+        assert e.value.request_id == "123"
+
+    def test_execute_timeout(self):
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        http_client = _client_with_transport(handler)
+        with pytest.raises(NylasSdkTimeoutError) as e:
+            asyncio.run(http_client._execute(method="GET", path="/foo"))
+
+        assert e.value.url == "https://test.nylas.com/foo"
+        assert e.value.timeout == 30
+
+    def test_execute_download_request(self):
+        http_client = _client_with_transport(
+            lambda request: httpx.Response(200, content=b"mock data")
+        )
+
+        response = asyncio.run(http_client._execute_download_request(path="/foo"))
+
+        assert response == b"mock data"
+
+    def test_execute_download_request_with_stream(self):
+        http_client = _client_with_transport(
+            lambda request: httpx.Response(200, content=b"mock data")
+        )
+
+        async def download():
+            response = await http_client._execute_download_request(
+                path="/foo", stream=True
+            )
+            chunks = [chunk async for chunk in response.aiter_bytes()]
+            await response.aclose()
+            return b"".join(chunks)
+
+        assert asyncio.run(download()) == b"mock data"
+
+    def test_close(self):
+        http_client = AsyncHttpClient(
+            api_server="https://test.nylas.com", api_key="test-key", timeout=30
+        )
+
+        async def use_and_close():
+            async with http_client as entered:
+                assert entered is http_client
+
+        asyncio.run(use_and_close())
+        assert http_client.session.is_closed
+
+    def test_execute_retries(self):
+        statuses = iter([503, 429, 200])
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            status = next(statuses)
+            return httpx.Response(
+                status,
+                json={"foo": "bar"} if status == 200 else {},
+                headers={"Retry-After": "0"},
+            )
+
+        http_client = _client_with_transport(handler)
+        http_client.retry_policy = RetryPolicy(total_timeout=None)
+
+        response_json, response_headers = asyncio.run(
+            http_client._execute(method="GET", path="/foo")
+        )
+
+        assert response_json == {"foo": "bar"}
+        assert response_headers[RETRY_COUNT_HEADER] == "2"
+        assert len(seen) == 3
+
+    def test_execute_retries_connection_errors(self):
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("connection reset", request=request)
+            return httpx.Response(200, json={"foo": "bar"})
+
+        http_client = _client_with_transport(handler)
+        http_client.retry_policy = RetryPolicy(backoff_factor=0, total_timeout=None)
+
+        response_json, _ = asyncio.run(http_client._execute(method="GET", path="/foo"))
+
+        assert response_json == {"foo": "bar"}
+        assert len(attempts) == 2
+
+    def test_execute_waits_for_rate_limiter(self):
+        http_client = _client_with_transport(
+            lambda request: httpx.Response(200, json={"foo": "bar"})
+        )
+        http_client.rate_limiter = RateLimiter()
+
+        with patch.object(
+            http_client.rate_limiter, "reserve", return_value=0.25
+        ) as reserve, patch("asyncio.sleep") as sleep:
+            asyncio.run(http_client._execute(method="GET", path="/v3/grants/a/events"))
+
+        reserve.assert_called_once_with("/v3/grants/a/events")
+        sleep.assert_called_once_with(0.25)
+
+
+class TestAsyncResponseCache:
+    def test_get_is_served_from_cache_until_invalidated(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request.method)
+            return httpx.Response(200, json={"request_id": "abc-123", "data": {}})
+
+        http_client = _client_with_transport(handler)
+        http_client.response_cache = ResponseCache()
+        path = "/v3/grants/abc/calendars/primary"
+
+        async def run():
+            await http_client._execute(method="GET", path=path)
+            _, headers = await http_client._execute(method="GET", path=path)
+            await http_client._execute(method="DELETE", path=path)
+            await http_client._execute(method="GET", path=path)
+            return headers
+
+        headers = asyncio.run(run())
+
+        assert headers[CACHE_STATUS_HEADER] == "hit"
+        assert requests == ["GET", "DELETE", "GET"]
+
+
+class TestAsyncSingleFlight:
+    def test_identical_gets_are_coalesced(self):
+        requests = []
+
+        async def handler(request):
+            requests.append(request.method)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"request_id": "abc-123", "data": {}})
+
+        http_client = _client_with_transport(handler)
+        http_client.single_flight = SingleFlight()
+
+        async def run():
+            return await asyncio.gather(
+                *(
+                    http_client._execute(method="GET", path="/v3/grants/abc")
+                    for _ in range(3)
+                )
+            )
+
+        results = asyncio.run(run())
+
+        assert requests == ["GET"]
+        assert [result[0] for result in results] == [
+            {"request_id": "abc-123", "data": {}}
+        ] * 3
+        assert http_client.single_flight.coalesced == 2
+
+
+class TestAsyncRevalidation:
+    def test_stored_response_is_served_on_304(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                json={"request_id": "abc-123", "data": []},
+                headers={"ETag": '"v1"'},
+            )
+
+        http_client = _client_with_transport(handler)
+        http_client.revalidation_cache = RevalidationCache()
+        path = "/v3/grants/abc/calendars"
+
+        async def run():
+            first = await http_client._execute(method="GET", path=path)
+            second = await http_client._execute(method="GET", path=path)
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert seen == [None, '"v1"']
+        assert second == first
+        assert second[0] is not first[0]
+        assert http_client.revalidation_cache.hits == 1
+
+
+class TestAsyncCompression:
+    def test_decompresses_responses_and_records_sizes(self):
+        import gzip
+
+        body = json.dumps({"request_id": "abc-123", "data": ["x" * 1000]}).encode()
+        compressed = gzip.compress(body)
+        captured = {}
+
+        def handler(request):
+            captured["accept_encoding"] = request.headers["Accept-Encoding"]
+            return httpx.Response(
+                200,
+                stream=httpx.ByteStream(compressed),
+                headers={"Content-Encoding": "gzip"},
+            )
+
+        http_client = _client_with_transport(handler)
+        http_client.compression = Compression()
+
+        response_json, _ = asyncio.run(
+            http_client._execute(method="GET", path="/v3/grants/abc/messages")
+        )
+
+        assert response_json == json.loads(body)
+        assert captured["accept_encoding"] == http_client.compression.accept_encoding
+        assert http_client.compression.response_wire_bytes == len(compressed)
+        assert http_client.compression.response_decoded_bytes == len(body)
@@ -0,0 +1,181 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from nylas import Client
+from nylas.handler.batch import AsyncBatch, Batch, BatchResult
+from nylas.handler.transport import LocalTransport
+from nylas.models.errors import NylasApiError
+
+_CALENDAR = {
+    "request_id": "abc-123",
+    "data": {
+        "id": "primary",
+        "grant_id": "abc",
+        "name": "Primary",
+        "read_only": False,
+        "is_owned_by_user": True,
+    },
+}
+
+
+class _Tracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def call(self, value, delay=0.01):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            time.sleep(delay)
+            return value
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def _fail():
+    raise ValueError("boom")
+
+
+class TestBatchResult:
+    def test_unwrap(self):
+        assert BatchResult(0, "value").unwrap() == "value"
+        error = BatchResult(1, error=ValueError("boom"))
+
+        assert not error.ok
+        with pytest.raises(ValueError, match="boom"):
+            error.unwrap()
+
+
+class TestBatch:
+    def test_run_returns_results_in_order(self):
+        tracker = _Tracker()
+        batch = Batch(max_concurrency=4)
+        for index in range(10):
+            assert batch.add(tracker.call, index, delay=0.01 * (10 - index)) == index
+
+        results = batch.run()
+
+        assert [result.value for result in results] == list(range(10))
+        assert [result.index for result in results] == list(range(10))
+        assert tracker.peak <= 4
+
+    def test_results_as_completed(self):
+        tracker = _Tracker()
+        batch = Batch(max_concurrency=2)
+        batch.add(tracker.call, "slow", delay=0.2)
+        batch.add(tracker.call, "fast", delay=0)
+
+        assert [result.value for result in batch.results()] == ["fast", "slow"]
+
+    def test_failures_do_not_abort_the_batch(self):
+        batch = Batch([lambda: 1, _fail, lambda: 3], max_concurrency=2)
+
+        results = batch.run()
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert isinstance(results[1].error, ValueError)
+        assert results[2].value == 3
+
+    def test_concurrency_is_bounded(self):
+        tracker = _Tracker()
+        batch = Batch(max_concurrency=3)
+        for index in range(20):
+            batch.add(tracker.call, index)
+
+        assert len(list(batch.results())) == 20
+        assert tracker.peak == 3
+
+    def test_closing_early_cancels_pending_calls(self):
+        started = []
+        batch = Batch(max_concurrency=1)
+        for index in range(10):
+            batch.add(started.append, index)
+
+        results = batch.results(ordered=True)
+        next(results)
+        results.close()
+        time.sleep(0.05)
+
+        assert len(started) < 10
+
+    def test_empty_batch(self):
+        assert Batch().run() == []
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            Batch(max_concurrency=0)
+
+
+class TestClientBatch:
+    def test_runs_sdk_calls(self):
+        transport = LocalTransport(
+            [("GET", "/v3/grants/abc/calendars/primary", lambda r: _CALENDAR)]
+        )
+        client = Client(api_key="test-key", transport=transport, pool_maxsize=5)
+        batch = client.batch()
+        batch.add(client.calendars.find, "abc", "primary")
+        batch.add(client.calendars.find, "abc", "missing")
+
+        found, missing = batch.run()
+
+        assert batch.max_concurrency == 5
+        assert found.value.data.id == "primary"
+        assert isinstance(missing.error, NylasApiError)
+        assert missing.error.status_code == 404
+
+
+class TestAsyncBatch:
+    def test_run_returns_results_in_order(self):
+        running = {"now": 0, "peak": 0}
+
+        async def call(value, delay):
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(delay)
+            running["now"] -= 1
+            if value is None:
+                raise ValueError("boom")
+            return value
+
+        batch = AsyncBatch(max_concurrency=3)
+        for index in range(8):
+            batch.add(call, index if index != 5 else None, 0.01 * (8 - index))
+
+        async def run():
+            ordered = await batch.run()
+            completed = [result.index async for result in batch.results()]
+            return ordered, completed
+
+        ordered, completed = asyncio.run(run())
+
+        assert [result.value for result in ordered] == [0, 1, 2, 3, 4, None, 6, 7]
+        assert isinstance(ordered[5].error, ValueError)
+        assert sorted(completed) == list(range(8))
+        assert completed != list(range(8))
+        assert running["peak"] == 3
+
+    def test_async_client_batch(self):
+        pytest.importorskip("httpx")
+        from nylas import AsyncClient
+
+        transport = LocalTransport(
+            [("GET", "/v3/grants/abc/calendars/primary", lambda r: _CALENDAR)]
+        )
+
+        async def run():
+            async with AsyncClient(api_key="test-key", transport=transport) as client:
+                batch = client.batch(max_concurrency=2)
+                for _ in range(3):
+                    batch.add(client.calendars.find, "abc", "primary")
+                return await batch.run()
+
+        results = asyncio.run(run())
+
+        assert [result.value.data.id for result in results] == ["primary"] * 3
@@ -0,0 +1,227 @@
+import asyncio
+import hashlib
+import io
+
+import pytest
+
+from nylas import Client
+from nylas.handler.chunked_upload import CHUNK_ALIGNMENT, MAX_STALLED_CHUNKS
+from nylas.handler.retry import RetryPolicy
+from nylas.handler.transport import LocalResponse, LocalTransport
+from nylas.models.errors import NylasUploadError
+
+_DATA = bytes(range(256)) * (CHUNK_ALIGNMENT * 5 // 256) + b"tail"
+
+
+class _UploadApi:
+    def __init__(self, failures=(), drop=None, stall=False):
+        # Statuses to answer the next PUTs with, a chunk start whose second half to drop,
+        # and whether to keep expecting the first byte whatever is sent.
+        self.failures = list(failures)
+        self.drop = drop
+        self.stall = stall
+        self.received = bytearray()
+        self.ranges = []
+        self.sessions = []
+        self.completed = []
+        self.transport = LocalTransport(
+            [
+                ("POST", "/v3/grants/{grant_id}/attachment-uploads", self.create),
+                ("PUT", "/upload/{attachment_id}", self.put),
+                (
+                    "POST",
+                    "/v3/grants/{grant_id}/attachment-uploads/{attachment_id}/complete",
+                    self.complete,
+                ),
+            ]
+        )
+
+    def create(self, request):
+        self.sessions.append(request.json())
+        return {
+            "request_id": "abc-123",
+            "data": {
+                "attachment_id": "upload-1",
+                "method": "PUT",
+                "url": "https://storage.example.com/upload/upload-1",
+                "headers": {"X-Upload-Token": "secret"},
+            },
+        }
+
+    def put(self, request):
+        assert request.headers["X-Upload-Token"] == "secret"
+        assert "Authorization" not in request.headers
+        if self.failures:
+            return LocalResponse(self.failures.pop(0))
+        content_range = request.headers["Content-Range"]
+        self.ranges.append(content_range)
+        if self.stall:
+            return LocalResponse(202, json={"nextExpectedRanges": ["0-"]})
+        span, size = content_range[len("bytes ") :].split("/")
+        start, end = (int(value) for value in span.split("-"))
+        assert start == len(self.received)
+        body = request.body
+        if start == self.drop:
+            self.drop = None
+            body = body[: len(body) // 2]
+        self.received += body
+        if len(self.received) == int(size):
+            return LocalResponse(201, json={"id": "uploaded"})
+        return LocalResponse(
+            202, json={"nextExpectedRanges": [f"{len(self.received)}-"]}
+        )
+
+    def complete(self, request):
+        self.completed.append(request.path)
+        return {
+            "request_id": "abc-123",
+            "data": {"attachment_id": "upload-1", "status": "ready"},
+        }
+
+
+def _client(api, **kwargs):
+    return Client(
+        api_key="test-key",
+        transport=api.transport,
+        retry_policy=RetryPolicy(backoff_factor=0),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def path(tmp_path):
+    file = tmp_path / "report.pdf"
+    file.write_bytes(_DATA)
+    return str(file)
+
+
+class TestUploadFile:
+    def test_uploads_file_in_chunks(self, path):
+        api = _UploadApi()
+        progress = []
+
+        response = _client(api).attachments.upload_file(
+            "abc",
+            path,
+            chunk_size=2 * CHUNK_ALIGNMENT,
+            sha256=hashlib.sha256(_DATA).hexdigest(),
+            on_progress=lambda sent, size: progress.append(sent),
+        )
+
+        assert response.data.status == "ready"
+        assert bytes(api.received) == _DATA
+        assert api.sessions == [
+            {
+                "filename": "report.pdf",
+                "content_type": "application/pdf",
+                "size": 1638404,
+            }
+        ]
+        assert api.ranges == [
+            "bytes 0-655359/1638404",
+            "bytes 655360-1310719/1638404",
+            "bytes 1310720-1638403/1638404",
+        ]
+        assert progress == [655360, 1310720, 1638404]
+        assert api.completed == ["/v3/grants/abc/attachment-uploads/upload-1/complete"]
+
+    def test_retries_failed_chunks(self, path):
+        api = _UploadApi(failures=[503, 500])
+
+        _client(api).attachments.upload_file("abc", path)
+
+        assert bytes(api.received) == _DATA
+
+    def test_resumes_from_next_expected_range(self, path):
+        api = _UploadApi(drop=0)
+
+        _client(api).attachments.upload_file(
+            "abc", path, chunk_size=2 * CHUNK_ALIGNMENT
+        )
+
+        assert bytes(api.received) == _DATA
+        assert api.ranges[1] == "bytes 327680-983039/1638404"
+
+    def test_upload_url_that_never_advances(self, path):
+        api = _UploadApi(stall=True)
+
+        with pytest.raises(
+            NylasUploadError, match="expected bytes 0\\+ again"
+        ) as error:
+            _client(api).attachments.upload_file("abc", path)
+
+        assert error.value.offset == 0
+        assert len(api.ranges) == MAX_STALLED_CHUNKS
+        assert api.completed == []
+
+    def test_unretryable_failure(self, path):
+        api = _UploadApi(failures=[400])
+
+        with pytest.raises(NylasUploadError) as error:
+            _client(api).attachments.upload_file("abc", path)
+
+        assert error.value.status_code == 400
+        assert error.value.attachment_id == "upload-1"
+        assert error.value.offset == 0
+        assert api.completed == []
+
+    def test_hash_mismatch_does_not_complete(self, path):
+        api = _UploadApi()
+
+        with pytest.raises(NylasUploadError, match="SHA-256"):
+            _client(api).attachments.upload_file("abc", path, sha256="0" * 64)
+
+        assert api.completed == []
+
+    def test_stream_that_cannot_seek(self):
+        class _Pipe(io.RawIOBase):
+            def __init__(self):
+                self._data = io.BytesIO(_DATA)
+
+            def readable(self):
+                return True
+
+            def readinto(self, buffer):
+                return self._data.readinto(buffer)
+
+        api = _UploadApi()
+        attachments = _client(api).attachments
+
+        with pytest.raises(ValueError, match="size is required"):
+            attachments.upload_file("abc", _Pipe(), filename="data.bin")
+        attachments.upload_file("abc", _Pipe(), filename="data.bin", size=len(_DATA))
+
+        assert bytes(api.received) == _DATA
+        assert api.sessions[0]["content_type"] == "application/octet-stream"
+
+    def test_file_shorter_than_size(self):
+        api = _UploadApi()
+
+        with pytest.raises(NylasUploadError, match="ended after"):
+            _client(api).attachments.upload_file(
+                "abc", io.BytesIO(b"short"), filename="a.txt", size=10
+            )
+
+    def test_chunk_size_must_be_aligned(self, path):
+        with pytest.raises(ValueError, match="chunk_size"):
+            _client(_UploadApi()).attachments.upload_file("abc", path, chunk_size=1000)
+
+    def test_async_client(self, path):
+        pytest.importorskip("httpx")
+        from nylas import AsyncClient
+
+        api = _UploadApi(failures=[503], drop=CHUNK_ALIGNMENT * 3)
+
+        async def run():
+            async with AsyncClient(
+                api_key="test-key",
+                transport=api.transport,
+                retry_policy=RetryPolicy(backoff_factor=0),
+            ) as client:
+                return await client.attachments.upload_file(
+                    "abc", path, chunk_size=3 * CHUNK_ALIGNMENT
+                )
+
+        assert asyncio.run(run()).data.status == "ready"
+        assert bytes(api.received) == _DATA
+        assert api.sessions[0]["size"] == len(_DATA)
@@ -0,0 +1,148 @@
+import gzip
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from nylas import Client
+from nylas.handler import compression as compression_module
+from nylas.handler.compression import Compression, accept_encoding
+from nylas.handler.http_client import HttpClient
+from nylas.handler.json_codec import StdlibJsonCodec
+
+
+def _mock_response(content=b'{"request_id": "abc-123"}', wire_size=None):
+    response = Mock()
+    response.status_code = 200
+    response.content = content
+    response.headers = {}
+    response.raw.tell.return_value = (
+        wire_size if wire_size is not None else len(content)
+    )
+    return response
+
+
+@pytest.fixture
+def http_client():
+    return HttpClient(
+        api_server="https://test.nylas.com",
+        api_key="test-key",
+        timeout=30,
+        json_codec=StdlibJsonCodec(),
+        compression=Compression(compress_requests=True, min_request_size=64),
+    )
+
+
+class TestCompression:
+    def test_accept_encoding(self):
+        with patch.object(compression_module, "brotli", None):
+            assert accept_encoding() == "gzip, deflate"
+        with patch.object(compression_module, "brotli", object()):
+            assert accept_encoding() == "br, gzip, deflate"
+
+    def test_compress(self):
+        compression = Compression(compress_requests=True, min_request_size=10)
+        body = b'{"subject": "' + b"a" * 100 + b'"}'
+
+        compressed = compression.compress(body)
+
+        assert gzip.decompress(compressed) == body
+        assert len(compressed) < len(body)
+        assert compression.compress(b"{}") is None
+
+    def test_requests_are_not_compressed_by_default(self):
+        assert Compression().compress(b"a" * 100_000) is None
+
+    def test_counters(self):
+        compression = Compression()
+        assert compression.response_ratio is None
+
+        compression.record_request(100, 40)
+        compression.record_response(25, 100)
+        compression.record_response(25, 100)
+
+        assert (compression.request_bytes, compression.request_wire_bytes) == (100, 40)
+        assert compression.response_wire_bytes == 50
+        assert compression.response_decoded_bytes == 200
+        assert compression.response_ratio == 0.25
+
+
+class TestHttpClientCompression:
+    def test_negotiates_compressed_responses(self, http_client, patched_request):
+        patched_request.return_value = _mock_response()
+
+        http_client._execute(method="GET", path="/v3/grants/abc/messages")
+
+        headers = patched_request.call_args[1]["headers"]
+        assert headers["Accept-Encoding"] == http_client.compression.accept_encoding
+        assert "Content-Encoding" not in headers
+
+    def test_keeps_explicit_accept_encoding(self, http_client, patched_request):
+        patched_request.return_value = _mock_response()
+
+        http_client._execute(
+            method="GET",
+            path="/v3/grants/abc/messages",
+            headers={"Accept-Encoding": "identity"},
+        )
+
+        assert patched_request.call_args[1]["headers"]["Accept-Encoding"] == "identity"
+
+    def test_compresses_large_request_bodies(self, http_client, patched_request):
+        patched_request.return_value = _mock_response()
+        body = {"subject": "Quarterly report", "body": "report " * 100}
+
+        http_client._execute(
+            method="POST", path="/v3/grants/abc/messages/send", request_body=body
+        )
+
+        kwargs = patched_request.call_args[1]
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(kwargs["data"])) == body
+        compression = http_client.compression
+        assert compression.request_wire_bytes == len(kwargs["data"])
+        assert compression.request_bytes == len(json.dumps(body).encode())
+
+    def test_small_request_bodies_are_sent_as_is(self, http_client, patched_request):
+        patched_request.return_value = _mock_response()
+
+        http_client._execute(
+            method="POST", path="/v3/grants/abc/messages/send", request_body={"a": 1}
+        )
+
+        kwargs = patched_request.call_args[1]
+        assert "Content-Encoding" not in kwargs["headers"]
+        assert kwargs["data"] == b'{"a": 1}'
+
+    def test_serialized_json_body_is_never_compressed(
+        self, http_client, patched_request
+    ):
+        patched_request.return_value = _mock_response()
+        signed = b'{"body":"' + b"a" * 200 + b'"}'
+
+        http_client._execute(
+            method="POST",
+            path="/v3/admin/domains",
+            request_body={"body": "a" * 200},
+            serialized_json_body=signed,
+        )
+
+        kwargs = patched_request.call_args[1]
+        assert "Content-Encoding" not in kwargs["headers"]
+        assert kwargs["data"] == signed
+
+    def test_records_response_sizes(self, http_client, patched_request):
+        content = json.dumps({"request_id": "abc-123", "data": ["x" * 500]}).encode()
+        patched_request.return_value = _mock_response(content, wire_size=120)
+
+        http_client._execute(method="GET", path="/v3/grants/abc/messages")
+
+        assert http_client.compression.response_wire_bytes == 120
+        assert http_client.compression.response_decoded_bytes == len(content)
+
+    def test_client_compression(self):
+        compression = Compression()
+        client = Client(api_key="test-key", compression=compression)
+
+        assert client.http_client.compression is compression
+        assert Client(api_key="test-key").http_client.compression is None
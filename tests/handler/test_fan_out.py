@@ -0,0 +1,217 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from nylas import Client
+from nylas.handler.fan_out import FileCheckpoint, GrantFanOut
+from nylas.handler.transport import LocalTransport
+
+
+def _grants_transport(count=25, seen=None):
+    grants = [
+        {
+            "id": f"grant-{index}",
+            "provider": "google" if index % 2 else "microsoft",
+            "grant_status": "valid",
+            "email": f"user{index}@example.com",
+        }
+        for index in range(count)
+    ]
+
+    def list_grants(request):
+        if seen is not None:
+            seen.append(request.query)
+        offset = int(request.query.get("offset", ["0"])[0])
+        limit = int(request.query["limit"][0])
+        return {"request_id": "abc-123", "data": grants[offset : offset + limit]}
+
+    return LocalTransport([("GET", "/v3/grants", list_grants)])
+
+
+def _client(**kwargs):
+    return Client(api_key="test-key", transport=_grants_transport(**kwargs))
+
+
+class TestFileCheckpoint:
+    def test_records_and_reloads(self, tmp_path):
+        path = str(tmp_path / "checkpoint")
+        with FileCheckpoint(path) as checkpoint:
+            checkpoint.mark_done("a")
+            checkpoint.mark_done("b")
+            checkpoint.mark_done("a")
+
+        reloaded = FileCheckpoint(path)
+
+        assert "a" in reloaded and "b" in reloaded and "c" not in reloaded
+        assert len(reloaded) == 2
+        with open(path, encoding="utf-8") as f:
+            assert f.read() == "a\nb\n"
+
+
+class TestGrantFanOut:
+    def test_processes_every_grant_across_pages(self):
+        seen = []
+        client = _client(seen=seen)
+        fan_out = client.grants.fan_out(
+            lambda grant: grant.email, grant_status="valid", page_size=10
+        )
+
+        results = list(fan_out.results())
+
+        assert isinstance(fan_out, GrantFanOut)
+        assert sorted(result.grant.id for result in results) == sorted(
+            f"grant-{index}" for index in range(25)
+        )
+        assert all(result.value == result.grant.email for result in results)
+        assert [query.get("offset") for query in seen] == [None, ["10"], ["20"]]
+        assert seen[0]["grant_status"] == ["valid"]
+
+    def test_filters_grants(self):
+        client = _client()
+        fan_out = client.grants.fan_out(
+            lambda grant: None, where=lambda grant: grant.provider == "google"
+        )
+
+        report = fan_out.run()
+
+        assert report.succeeded == 12
+        assert report.filtered == 13
+        assert fan_out.progress.listed == 25
+
+    def test_concurrency_is_bounded(self):
+        lock = threading.Lock()
+        running = {"now": 0, "peak": 0}
+
+        def operation(grant):
+            with lock:
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+            time.sleep(0.01)
+            with lock:
+                running["now"] -= 1
+
+        _client().grants.fan_out(operation, max_concurrency=3).run()
+
+        assert running["peak"] == 3
+
+    def test_errors_are_aggregated(self):
+        def operation(grant):
+            if grant.id.endswith("7"):
+                raise ValueError(grant.id)
+            return grant.id
+
+        report = _client().grants.fan_out(operation).run()
+
+        assert not report.ok
+        assert report.succeeded == 23
+        assert sorted(report.errors) == ["grant-17", "grant-7"]
+        assert isinstance(report.errors["grant-7"], ValueError)
+
+    def test_reports_progress(self):
+        snapshots = []
+        _client(count=5).grants.fan_out(
+            lambda grant: None,
+            on_progress=lambda progress: snapshots.append(
+                (progress.succeeded, progress.in_flight)
+            ),
+            max_concurrency=1,
+        ).run()
+
+        assert snapshots == [(1, 1), (2, 1), (3, 1), (4, 1), (5, 0)]
+
+    def test_resumes_from_checkpoint(self, tmp_path):
+        path = str(tmp_path / "checkpoint")
+        processed = []
+
+        def crash_after_ten(grant):
+            if len(processed) >= 10:
+                raise RuntimeError("crashed")
+            processed.append(grant.id)
+
+        with FileCheckpoint(path) as checkpoint:
+            first = _client().grants.fan_out(
+                crash_after_ten, checkpoint=checkpoint, max_concurrency=1
+            )
+            assert first.run().succeeded == 10
+
+        resumed = []
+        with FileCheckpoint(path) as checkpoint:
+            report = (
+                _client()
+                .grants.fan_out(
+                    lambda grant: resumed.append(grant.id), checkpoint=checkpoint
+                )
+                .run()
+            )
+
+        assert report.skipped == 10
+        assert report.succeeded == 15
+        assert sorted(processed + resumed) == sorted(
+            f"grant-{index}" for index in range(25)
+        )
+
+    @pytest.mark.parametrize("response_format", ["stream", "raw", "lazy"])
+    def test_lists_models_whatever_the_response_format(self, tmp_path, response_format):
+        client = Client(
+            api_key="test-key",
+            transport=_grants_transport(),
+            response_format=response_format,
+        )
+
+        with FileCheckpoint(str(tmp_path / "checkpoint")) as checkpoint:
+            checkpoint.mark_done("grant-0")
+            report = client.grants.fan_out(
+                lambda grant: grant.email,
+                checkpoint=checkpoint,
+                overrides={"headers": {"X-Test": "1"}},
+            ).run()
+
+        assert report.ok
+        assert report.skipped == 1
+        assert report.succeeded == 24
+
+    def test_closing_early_stops_listing(self):
+        seen = []
+        results = (
+            _client(count=100, seen=seen)
+            .grants.fan_out(lambda grant: None, max_concurrency=1, page_size=10)
+            .results()
+        )
+        next(results)
+        results.close()
+
+        assert len(seen) <= 3
+
+
+class TestAsyncGrantFanOut:
+    def test_runs_coroutine_operation(self, tmp_path):
+        pytest.importorskip("httpx")
+        seen = []
+        from nylas import AsyncClient
+
+        async def operation(grant):
+            await asyncio.sleep(0)
+            if grant.id == "grant-3":
+                raise ValueError("boom")
+            return grant.id
+
+        async def run():
+            async with AsyncClient(
+                api_key="test-key", transport=_grants_transport(seen=seen)
+            ) as client:
+                with FileCheckpoint(str(tmp_path / "checkpoint")) as checkpoint:
+                    return await client.grants.fan_out(
+                        operation,
+                        provider="google",
+                        checkpoint=checkpoint,
+                        max_concurrency=4,
+                    ).run()
+
+        report = asyncio.run(run())
+
+        assert seen[0]["provider"] == ["google"]
+        assert report.succeeded == 24
+        assert list(report.errors) == ["grant-3"]
+        assert len(FileCheckpoint(str(tmp_path / "checkpoint"))) == 24
@@ -0,0 +1,254 @@
+import asyncio
+
+import pytest
+
+from nylas import Client
+from nylas.handler import hooks as hooks_module
+from nylas.handler.hooks import Hooks, RequestInfo, template_path
+from nylas.handler.http_client import HttpClient, _UNOBSERVED
+from nylas.handler.retry import RetryPolicy
+from nylas.handler.transport import LocalResponse, LocalTransport
+from nylas.models.errors import NylasApiError
+
+_CALENDAR = {
+    "request_id": "abc-123",
+    "data": {
+        "id": "primary",
+        "grant_id": "abc",
+        "name": "Primary",
+        "read_only": False,
+        "is_owned_by_user": True,
+    },
+}
+
+
+def _record(hooks):
+    events = []
+    for name in ("on_request", "on_response", "on_error", "on_retry"):
+        getattr(hooks, name)(
+            lambda info, name=name: events.append((name, info.status_code))
+        )
+    return events
+
+
+class TestHooks:
+    def test_template_path(self):
+        assert template_path("/v3/grants/abc/messages/123") == (
+            "/v3/grants/{id}/messages/{id}"
+        )
+        assert template_path("/v3/grants/me/events/free-busy") == (
+            "/v3/grants/me/events/free-busy"
+        )
+        assert template_path("/v3/connect/token") == "/v3/connect/token"
+
+    def test_registration(self):
+        hooks = Hooks()
+        assert not hooks
+
+        @hooks.on_response
+        def callback(info):
+            pass
+
+        assert hooks
+        assert callback is not None
+
+    def test_unobserved_without_hooks(self):
+        http_client = HttpClient("https://test.nylas.com", "test-key", 30)
+
+        assert http_client._observe("GET", "/v3/grants", {"url": "x"}) is _UNOBSERVED
+
+    def test_timings(self):
+        info = RequestInfo(Hooks(), "get", "https://a/v3/grants/abc", "/v3/grants/abc")
+        info.ttfb = 0.5
+        info.decode = 0.1
+
+        assert info.method == "GET"
+        assert info.path == "/v3/grants/{id}"
+        assert info.timings == {"ttfb": 0.5, "decode": 0.1}
+
+
+class TestClientHooks:
+    def test_response_is_reported_after_decoding(self):
+        transport = LocalTransport(
+            [("GET", "/v3/grants/{grant_id}/calendars/{id}", lambda r: _CALENDAR)]
+        )
+        client = Client(api_key="test-key", transport=transport)
+        events = _record(client.hooks)
+        infos = []
+        client.on_response(infos.append)
+
+        calendar = client.calendars.find("abc", "primary")
+
+        assert calendar.data.id == "primary"
+        assert events == [("on_request", None), ("on_response", 200)]
+        info = infos[0]
+        assert info.method == "GET"
+        assert info.path == "/v3/grants/{id}/calendars/{id}"
+        assert info.request_id == "abc-123"
+        assert info.bytes_in > 0
+        assert info.bytes_out == 0
+        assert {"ttfb", "download", "parse", "decode"} <= set(info.timings)
+        assert info.duration >= sum(info.timings.values())
+
+    def test_request_body_size(self):
+        transport = LocalTransport(
+            [("POST", "/v3/grants/{grant_id}/calendars", lambda r: _CALENDAR)]
+        )
+        client = Client(api_key="test-key", transport=transport)
+        infos = []
+        client.on_response(infos.append)
+
+        client.calendars.create("abc", request_body={"name": "Primary"})
+
+        encoded = client.http_client.json_codec.dumps({"name": "Primary"})
+        assert infos[0].bytes_out == len(encoded)
+
+    def test_errors_are_reported(self):
+        client = Client(api_key="test-key", transport=LocalTransport())
+        events = _record(client.hooks)
+        errors = []
+        client.on_error(errors.append)
+
+        with pytest.raises(NylasApiError):
+            client.calendars.find("abc", "primary")
+
+        assert events == [("on_request", None), ("on_error", 404)]
+        assert isinstance(errors[0].error, NylasApiError)
+        assert errors[0].request_id == "local"
+
+    def test_retries_are_reported(self):
+        statuses = iter([503, 200])
+        transport = LocalTransport(
+            [
+                (
+                    "GET",
+                    "/v3/grants/{grant_id}/calendars/{id}",
+                    lambda r: LocalResponse(next(statuses), json=_CALENDAR),
+                )
+            ]
+        )
+        client = Client(
+            api_key="test-key",
+            transport=transport,
+            retry_policy=RetryPolicy(backoff_factor=0, max_backoff=0),
+        )
+        events = _record(client.hooks)
+        infos = []
+        client.on_response(infos.append)
+
+        client.calendars.find("abc", "primary")
+
+        assert events == [
+            ("on_request", None),
+            ("on_retry", 503),
+            ("on_response", 200),
+        ]
+        assert infos[0].retries == 1
+
+    def test_downloads_are_reported(self):
+        transport = LocalTransport(
+            [
+                (
+                    "GET",
+                    "/v3/grants/{grant_id}/attachments/{id}/download",
+                    lambda r: b"a" * 10,
+                )
+            ]
+        )
+        http_client = HttpClient(
+            "https://test.nylas.com", "test-key", 30, transport=transport
+        )
+        infos = []
+        http_client.hooks.on_response(infos.append)
+
+        http_client._execute_download_request("/v3/grants/abc/attachments/1/download")
+
+        assert infos[0].path == "/v3/grants/{id}/attachments/{id}/download"
+        assert infos[0].bytes_in == 10
+
+    def test_connect_and_tls_are_timed_for_new_connections(self, monkeypatch):
+        pytest.importorskip("h2")
+        from h2_server import LocalH2Server
+
+        with LocalH2Server(_CALENDAR, http2=False) as server:
+            monkeypatch.setenv("REQUESTS_CA_BUNDLE", server.cert_path)
+            infos = []
+            with Client(api_key="test-key", api_uri=server.url) as client:
+                client.on_response(infos.append)
+                for _ in range(2):
+                    client.calendars.find("abc", "primary")
+
+        assert infos[0].connect is not None and infos[0].tls is not None
+        assert infos[1].connect is None and infos[1].tls is None
+        assert infos[1].ttfb is not None
+
+    def test_connections_are_not_timed_without_hooks(self, monkeypatch):
+        pytest.importorskip("h2")
+        from h2_server import LocalH2Server
+
+        timed = []
+        perf_counter = hooks_module.time.perf_counter
+
+        def counting_perf_counter():
+            timed.append(True)
+            return perf_counter()
+
+        with LocalH2Server(_CALENDAR, http2=False) as server:
+            monkeypatch.setenv("REQUESTS_CA_BUNDLE", server.cert_path)
+            monkeypatch.setattr(
+                hooks_module.time, "perf_counter", counting_perf_counter
+            )
+            with Client(api_key="test-key", api_uri=server.url) as client:
+                calendar = client.calendars.find("abc", "primary")
+
+        assert calendar.data.id == "primary"
+        assert timed == []
+
+
+class TestAsyncClientHooks:
+    def test_response_is_reported_after_decoding(self):
+        pytest.importorskip("httpx")
+        from nylas import AsyncClient
+
+        transport = LocalTransport(
+            [("GET", "/v3/grants/{grant_id}/calendars/{id}", lambda r: _CALENDAR)]
+        )
+        infos = []
+
+        async def run():
+            async with AsyncClient(api_key="test-key", transport=transport) as client:
+                client.on_response(infos.append)
+                return await client.calendars.find("abc", "primary")
+
+        calendar = asyncio.run(run())
+
+        assert calendar.data.id == "primary"
+        assert infos[0].path == "/v3/grants/{id}/calendars/{id}"
+        assert infos[0].status_code == 200
+        assert {"parse", "decode"} <= set(infos[0].timings)
+
+    def test_trace_timings(self):
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        import ssl
+
+        from h2_server import LocalH2Server
+        from nylas import AsyncClient
+
+        infos = []
+        with LocalH2Server(_CALENDAR, http2=False) as server:
+
+            async def run():
+                client = AsyncClient(api_key="test-key", api_uri=server.url)
+                client.http_client.session = httpx.AsyncClient(
+                    verify=ssl.create_default_context(cafile=server.cert_path)
+                )
+                client.on_response(infos.append)
+                async with client:
+                    await client.calendars.find("abc", "primary")
+
+            asyncio.run(run())
+
+        assert {"connect", "tls", "ttfb", "download", "parse", "decode"} <= set(
+            infos[0].timings
+        )
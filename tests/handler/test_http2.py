@@ -0,0 +1,234 @@
+import asyncio
+import json
+import ssl
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+import requests
+
+pytest.importorskip("h2")
+httpx = pytest.importorskip("httpx")
+
+from h2_server import LocalH2Server
+from nylas import Client
+from nylas.handler.async_http_client import AsyncHttpClient
+from nylas.handler.http2 import HTTP2Adapter, _StreamedBody, require_http2
+from nylas.handler.http_client import HttpClient
+from nylas.models.errors import NylasSdkTimeoutError
+
+_GRANT = {"request_id": "abc-123", "data": {"id": "grant-1", "provider": "google"}}
+
+
+def _http_client(server, monkeypatch, **kwargs):
+    monkeypatch.setenv("REQUESTS_CA_BUNDLE", server.cert_path)
+    return HttpClient(server.url, "test-key", 10, http2=True, **kwargs)
+
+
+class TestHTTP2Adapter:
+    def test_missing_dependencies(self):
+        with patch("importlib.util.find_spec", return_value=None):
+            with pytest.raises(ImportError, match="nylas\\[http2\\]"):
+                require_http2()
+
+    def test_only_https_is_sent_over_http2(self):
+        http_client = HttpClient("https://test.nylas.com", "test-key", 10, http2=True)
+
+        assert isinstance(http_client.session.get_adapter("https://a"), HTTP2Adapter)
+        assert not isinstance(http_client.session.get_adapter("http://a"), HTTP2Adapter)
+        assert not isinstance(
+            HttpClient("https://test.nylas.com", "test-key", 10).session.get_adapter(
+                "https://a"
+            ),
+            HTTP2Adapter,
+        )
+
+    def test_client_http2(self):
+        client = Client(api_key="test-key", http2=True, http2_max_streams=8)
+        adapter = client.http_client.session.get_adapter("https://api.us.nylas.com")
+
+        assert client.http_client.http2 is True
+        assert adapter.max_streams == 8
+
+    def test_request_over_http2(self, monkeypatch):
+        with LocalH2Server(_GRANT) as server:
+            http_client = _http_client(server, monkeypatch)
+            with http_client:
+                response_json, headers = http_client._execute(
+                    "POST", "/v3/grants/grant-1", request_body={"scope": ["calendar"]}
+                )
+
+        assert response_json == _GRANT
+        assert headers["content-type"] == "application/json"
+        assert server.protocols == ["h2"]
+
+    def test_streamed_download(self, monkeypatch):
+        with LocalH2Server(_GRANT) as server:
+            http_client = _http_client(server, monkeypatch)
+            with http_client:
+                response = http_client._execute_download_request(
+                    "/v3/grants/grant-1/attachments/a/download", stream=True
+                )
+                content = b"".join(response.iter_content(chunk_size=8))
+                response.close()
+
+        assert content == json.dumps(_GRANT).encode()
+        assert response.raw.version == 20
+
+    def test_body_received_whole_is_not_copied(self):
+        response = httpx.Response(200, content=b"0123456789")
+        response.read()
+
+        assert _StreamedBody(response, None, lambda: None).read() is response.content
+        body = _StreamedBody(response, None, lambda: None)
+        assert [body.read(4) for _ in range(4)] == [b"0123", b"4567", b"89", b""]
+
+    def test_falls_back_to_http1(self, monkeypatch):
+        with LocalH2Server(_GRANT, http2=False) as server:
+            http_client = _http_client(server, monkeypatch)
+            with http_client:
+                for _ in range(2):
+                    response_json, _ = http_client._execute("GET", "/v3/grants/grant-1")
+
+        assert response_json == _GRANT
+        assert server.protocols == ["http/1.1"]
+
+    def test_concurrent_requests_share_one_connection(self, monkeypatch):
+        with LocalH2Server(_GRANT, latency=0.2) as server:
+            http_client = _http_client(server, monkeypatch)
+            http_client._execute("GET", "/v3/grants/grant-1")
+            started = time.monotonic()
+            with http_client, ThreadPoolExecutor(max_workers=20) as pool:
+                results = list(
+                    pool.map(
+                        lambda i: http_client._execute("GET", f"/v3/grants/grant-{i}"),
+                        range(20),
+                    )
+                )
+            elapsed = time.monotonic() - started
+
+        assert all(result[0] == _GRANT for result in results)
+        assert server.protocols == ["h2"]
+        assert server.max_open_streams > 1
+        assert elapsed < 20 * 0.2 / 2
+
+    def test_streams_per_connection_are_limited(self, monkeypatch):
+        with LocalH2Server(_GRANT, latency=0.05) as server:
+            http_client = _http_client(
+                server, monkeypatch, pool_maxsize=4, http2_max_streams=3
+            )
+            with http_client, ThreadPoolExecutor(max_workers=10) as pool:
+                list(
+                    pool.map(
+                        lambda _: http_client._execute("GET", "/v3/grants/grant-1"),
+                        range(10),
+                    )
+                )
+
+        assert server.protocols == ["h2"]
+        assert server.max_open_streams <= 3
+
+    def test_streams_are_limited_per_host(self):
+        adapter = HTTP2Adapter(max_connections=2, max_streams=3)
+
+        first = adapter._host_streams(("https", "a.example.com", None))
+
+        assert first is adapter._host_streams(("https", "a.example.com", None))
+        assert first is not adapter._host_streams(("https", "b.example.com", None))
+        assert all(first.acquire(blocking=False) for _ in range(3))
+        assert not first.acquire(blocking=False)
+
+    def test_waiting_for_a_stream_times_out(self, monkeypatch):
+        with LocalH2Server(_GRANT) as server:
+            http_client = _http_client(
+                server, monkeypatch, pool_maxsize=1, http2_max_streams=1
+            )
+            with http_client:
+                download = http_client._execute_download_request(
+                    "/v3/grants/grant-1/attachments/a/download", stream=True
+                )
+                started = time.monotonic()
+                with pytest.raises(NylasSdkTimeoutError):
+                    http_client._execute(
+                        "GET", "/v3/grants/grant-1", overrides={"timeout": 0.2}
+                    )
+                elapsed = time.monotonic() - started
+                download.close()
+                response_json, _ = http_client._execute("GET", "/v3/grants/grant-1")
+
+        assert elapsed < 2
+        assert response_json == _GRANT
+
+    def test_proxied_requests_are_sent_over_http1(self):
+        http_client = HttpClient("https://test.nylas.com", "test-key", 10, http2=True)
+        http_client.session.proxies = {"https": "http://proxy.example.com:3128"}
+        adapter = http_client.session.get_adapter("https://test.nylas.com")
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(_GRANT).encode()
+
+        with patch.object(adapter.fallback, "send", return_value=response) as send:
+            response_json, _ = http_client._execute("GET", "/v3/grants/grant-1")
+
+        assert response_json == _GRANT
+        assert send.call_args.kwargs["proxies"]["https"] == (
+            "http://proxy.example.com:3128"
+        )
+        assert adapter.fallback is http_client.session.get_adapter("http://a")
+
+    def test_connection_errors_are_requests_errors(self):
+        http_client = HttpClient("https://localhost:1", "test-key", 10, http2=True)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            http_client._execute("GET", "/v3/grants/grant-1")
+
+
+class TestAsyncHTTP2:
+    def test_concurrent_requests_over_http2(self):
+        with LocalH2Server(_GRANT, latency=0.1) as server:
+            http_client = AsyncHttpClient(server.url, "test-key", 10, http2=True)
+
+            async def run():
+                http_client.session = httpx.AsyncClient(
+                    http2=True,
+                    verify=ssl.create_default_context(cafile=server.cert_path),
+                )
+                async with http_client:
+                    return await asyncio.gather(
+                        *(
+                            http_client._execute("GET", f"/v3/grants/grant-{i}")
+                            for i in range(10)
+                        )
+                    )
+
+            results = asyncio.run(run())
+
+        assert all(result[0] == _GRANT for result in results)
+        assert server.protocols == ["h2"]
+        assert server.max_open_streams > 1
+
+    def test_streams_per_connection_are_limited(self):
+        with LocalH2Server(_GRANT, latency=0.05) as server:
+            http_client = AsyncHttpClient(
+                server.url, "test-key", 10, http2=True, http2_max_streams=3
+            )
+
+            async def run():
+                http_client.session = httpx.AsyncClient(
+                    http2=True,
+                    verify=ssl.create_default_context(cafile=server.cert_path),
+                )
+                async with http_client:
+                    await asyncio.gather(
+                        *(
+                            http_client._execute("GET", "/v3/grants/grant-1")
+                            for _ in range(10)
+                        )
+                    )
+
+            asyncio.run(run())
+
+        assert server.protocols == ["h2"]
+        assert server.max_open_streams == 3
@@ -1,12 +1,18 @@
-from unittest.mock import Mock
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import Mock, patch
 
 import pytest
+import requests
 
 from nylas.handler.http_client import (
     HttpClient,
     _build_query_params,
     _validate_response,
 )
+from nylas.handler.json_codec import StdlibJsonCodec
+from nylas.handler.retry import RetryPolicy, RETRY_COUNT_HEADER
 from nylas.models.errors import NylasApiError, NylasOAuthError
 
 
@@ -26,6 +32,68 @@ class TestHttpClient:
         assert http_client.api_server == "https://test.nylas.com"
         assert http_client.api_key == "test-key"
         assert http_client.timeout == 60
+        assert http_client.pool_maxsize == 10
+
+    def test_http_client_pooled_session(self):
+        http_client = HttpClient(
+            api_server="https://test.nylas.com",
+            api_key="test-key",
+            timeout=60,
+            pool_connections=2,
+            pool_maxsize=25,
+        )
+
+        adapter = http_client.session.get_adapter("https://test.nylas.com/foo")
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 25
+
+    def test_http_client_reuses_session(self, http_client, patched_request):
+        patched_request.return_value.content = b'{"foo": "bar"}'
+        session = http_client.session
+        http_client._execute(method="GET", path="/foo")
+        http_client._execute(method="GET", path="/bar")
+
+        assert http_client.session is session
+        assert patched_request.call_count == 2
+
+    def test_http_client_does_not_keep_cookies(self):
+        cookies = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # pylint: disable=invalid-name
+                cookies.append(self.headers.get("Cookie"))
+                body = b'{"request_id": "abc-123"}'
+                self.send_response(200)
+                self.send_header("Set-Cookie", "session=abc; Path=/")
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            with HttpClient(
+                f"http://127.0.0.1:{server.server_port}", "test-key", 30
+            ) as http_client:
+                http_client._execute(method="GET", path="/foo")
+                http_client._execute(method="GET", path="/foo")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert cookies == [None, None]
+        assert len(http_client.session.cookies) == 0
+
+    def test_http_client_close(self, http_client):
+        with patch.object(http_client.session, "close") as mock_close:
+            with http_client as entered:
+                assert entered is http_client
+        mock_close.assert_called_once()
 
     def test_build_headers_default(self, http_client, patched_version_and_sys):
         headers = http_client._build_headers()
@@ -217,7 +285,7 @@ class TestHttpClient:
     def test_validate_response(self):
         response = Mock()
         response.status_code = 200
-        response.json.return_value = {"foo": "bar"}
+        response.content = json.dumps({"foo": "bar"}).encode()
         response.url = "https://test.nylas.com/foo"
         response.headers = {"X-Test-Header": "test"}
 
@@ -228,14 +296,16 @@ class TestHttpClient:
     def test_validate_response_400_error(self):
         response = Mock()
         response.status_code = 400
-        response.json.return_value = {
-            "request_id": "123",
-            "error": {
-                "type": "api_error",
-                "message": "The request is invalid.",
-                "provider_error": {"foo": "bar"},
-            },
-        }
+        response.content = json.dumps(
+            {
+                "request_id": "123",
+                "error": {
+                    "type": "api_error",
+                    "message": "The request is invalid.",
+                    "provider_error": {"foo": "bar"},
+                },
+            }
+        ).encode()
         response.url = "https://test.nylas.com/foo"
 
         with pytest.raises(Exception) as e:
@@ -250,12 +320,14 @@ class TestHttpClient:
     def test_validate_response_auth_error(self):
         response = Mock()
         response.status_code = 401
-        response.json.return_value = {
-            "error": "invalid_request",
-            "error_description": "The request is invalid.",
-            "error_uri": "https://docs.nylas.com/reference#authentication-errors",
-            "error_code": 100241,
-        }
+        response.content = json.dumps(
+            {
+                "error": "invalid_request",
+                "error_description": "The request is invalid.",
+                "error_uri": "https://docs.nylas.com/reference#authentication-errors",
+                "error_code": 100241,
+            }
+        ).encode()
         response.url = "https://test.nylas.com/connect/token"
 
         with pytest.raises(Exception) as e:
@@ -269,10 +341,12 @@ class TestHttpClient:
     def test_validate_response_400_keyerror(self):
         response = Mock()
         response.status_code = 400
-        response.json.return_value = {
-            "request_id": "123",
-            "foo": "bar",
-        }
+        response.content = json.dumps(
+            {
+                "request_id": "123",
+                "foo": "bar",
+            }
+        ).encode()
         response.url = "https://test.nylas.com/foo"
 
         with pytest.raises(Exception) as e:
@@ -285,7 +359,7 @@ class TestHttpClient:
 
     def test_execute(self, http_client, patched_version_and_sys, patched_request):
         mock_response = Mock()
-        mock_response.json.return_value = {"foo": "bar"}
+        mock_response.content = json.dumps({"foo": "bar"}).encode()
         mock_response.headers = {"X-Test-Header": "test"}
         mock_response.status_code = 200
         patched_request.return_value = mock_response
@@ -319,7 +393,7 @@ class TestHttpClient:
     ):
         """Pre-serialized body bytes are sent as-is (e.g. Nylas service account signing)."""
         mock_response = Mock()
-        mock_response.json.return_value = {"ok": True}
+        mock_response.content = json.dumps({"ok": True}).encode()
         mock_response.headers = {}
         mock_response.status_code = 200
         patched_request.return_value = mock_response
@@ -361,7 +435,7 @@ class TestHttpClient:
         self, http_client, patched_version_and_sys, patched_request
     ):
         mock_response = Mock()
-        mock_response.json.return_value = {"foo": "bar"}
+        mock_response.content = json.dumps({"foo": "bar"}).encode()
         mock_response.headers = {"X-Test-Header": "test"}
         mock_response.status_code = 200
         patched_request.return_value = mock_response
@@ -408,7 +482,7 @@ class TestHttpClient:
     def test_validate_response_with_headers(self):
         response = Mock()
         response.status_code = 200
-        response.json.return_value = {"foo": "bar"}
+        response.content = json.dumps({"foo": "bar"}).encode()
         response.url = "https://test.nylas.com/foo"
         response.headers = {"X-Test-Header": "test"}
 
@@ -419,14 +493,16 @@ class TestHttpClient:
     def test_validate_response_400_error_with_headers(self):
         response = Mock()
         response.status_code = 400
-        response.json.return_value = {
-            "request_id": "123",
-            "error": {
-                "type": "api_error",
-                "message": "The request is invalid.",
-                "provider_error": {"foo": "bar"},
-            },
-        }
+        response.content = json.dumps(
+            {
+                "request_id": "123",
+                "error": {
+                    "type": "api_error",
+                    "message": "The request is invalid.",
+                    "provider_error": {"foo": "bar"},
+                },
+            }
+        ).encode()
         response.url = "https://test.nylas.com/foo"
         response.headers = {"X-Test-Header": "test"}
 
@@ -437,12 +513,14 @@ class TestHttpClient:
     def test_validate_response_auth_error_with_headers(self):
         response = Mock()
         response.status_code = 401
-        response.json.return_value = {
-            "error": "invalid_request",
-            "error_description": "The request is invalid.",
-            "error_uri": "https://docs.nylas.com/reference#authentication-errors",
-            "error_code": 100241,
-        }
+        response.content = json.dumps(
+            {
+                "error": "invalid_request",
+                "error_description": "The request is invalid.",
+                "error_uri": "https://docs.nylas.com/reference#authentication-errors",
+                "error_code": 100241,
+            }
+        ).encode()
         response.url = "https://test.nylas.com/connect/token"
         response.headers = {"X-Test-Header": "test"}
 
@@ -454,7 +532,7 @@ class TestHttpClient:
         self, http_client, patched_version_and_sys, patched_request
     ):
         mock_response = Mock()
-        mock_response.json.return_value = {"foo": "bar"}
+        mock_response.content = json.dumps({"foo": "bar"}).encode()
         mock_response.headers = {"X-Test-Header": "test"}
         mock_response.status_code = 200
         patched_request.return_value = mock_response
@@ -488,7 +566,7 @@ class TestHttpClient:
     ):
         """Test that UTF-8 characters are preserved in JSON requests (not escaped)."""
         mock_response = Mock()
-        mock_response.json.return_value = {"success": True}
+        mock_response.content = json.dumps({"success": True}).encode()
         mock_response.headers = {"X-Test-Header": "test"}
         mock_response.status_code = 200
         patched_request.return_value = mock_response
@@ -527,7 +605,7 @@ class TestHttpClient:
     ):
         """Test that None request_body is handled correctly."""
         mock_response = Mock()
-        mock_response.json.return_value = {"success": True}
+        mock_response.content = json.dumps({"success": True}).encode()
         mock_response.headers = {"X-Test-Header": "test"}
         mock_response.status_code = 200
         patched_request.return_value = mock_response
@@ -551,7 +629,7 @@ class TestHttpClient:
     ):
         """Test that both None request_body and None data are handled correctly."""
         mock_response = Mock()
-        mock_response.json.return_value = {"success": True}
+        mock_response.content = json.dumps({"success": True}).encode()
         mock_response.headers = {"X-Test-Header": "test"}
         mock_response.status_code = 200
         patched_request.return_value = mock_response
@@ -575,7 +653,7 @@ class TestHttpClient:
     ):
         """Test that emoji and various international characters are preserved."""
         mock_response = Mock()
-        mock_response.json.return_value = {"success": True}
+        mock_response.content = json.dumps({"success": True}).encode()
         mock_response.headers = {"X-Test-Header": "test"}
         mock_response.status_code = 200
         patched_request.return_value = mock_response
@@ -617,7 +695,7 @@ class TestHttpClient:
         This character caused UnicodeEncodeError: 'latin-1' codec can't encode character '\\u2019'.
         """
         mock_response = Mock()
-        mock_response.json.return_value = {"success": True}
+        mock_response.content = json.dumps({"success": True}).encode()
         mock_response.headers = {"X-Test-Header": "test"}
         mock_response.status_code = 200
         patched_request.return_value = mock_response
@@ -655,7 +733,7 @@ class TestHttpClient:
         if not handled properly.
         """
         mock_response = Mock()
-        mock_response.json.return_value = {"success": True}
+        mock_response.content = json.dumps({"success": True}).encode()
         mock_response.headers = {"X-Test-Header": "test"}
         mock_response.status_code = 200
         patched_request.return_value = mock_response
@@ -698,7 +776,7 @@ class TestHttpClient:
         allow_nan=True to maintain backward compatibility.
         """
         mock_response = Mock()
-        mock_response.json.return_value = {"success": True}
+        mock_response.content = json.dumps({"success": True}).encode()
         mock_response.headers = {"X-Test-Header": "test"}
         mock_response.status_code = 200
         patched_request.return_value = mock_response
@@ -735,7 +813,7 @@ class TestHttpClient:
     ):
         """Test that multipart/form-data is not affected by the change."""
         mock_response = Mock()
-        mock_response.json.return_value = {"success": True}
+        mock_response.content = json.dumps({"success": True}).encode()
         mock_response.headers = {"X-Test-Header": "test"}
         mock_response.status_code = 200
         patched_request.return_value = mock_response
@@ -755,3 +833,151 @@ class TestHttpClient:
         call_kwargs = patched_request.call_args[1]
         # Should use the multipart data, not JSON
         assert call_kwargs["data"] == mock_data
+
+
+def _mock_response(status_code, json_data=None, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.content = json.dumps(json_data if json_data is not None else {}).encode()
+    response.headers = headers if headers is not None else {}
+    response.url = "https://test.nylas.com/foo"
+    return response
+
+
+class TestHttpClientRetries:
+    @pytest.fixture
+    def retrying_http_client(self):
+        return HttpClient(
+            api_server="https://test.nylas.com",
+            api_key="test-key",
+            timeout=30,
+            retry_policy=RetryPolicy(max_attempts=3, total_timeout=None),
+        )
+
+    def test_retries_retryable_status(self, retrying_http_client, patched_request):
+        patched_request.side_effect = [
+            _mock_response(503),
+            _mock_response(429, headers={"Retry-After": "2"}),
+            _mock_response(200, {"foo": "bar"}),
+        ]
+
+        with patch("time.sleep") as mock_sleep:
+            response_json, response_headers = retrying_http_client._execute(
+                method="GET", path="/foo"
+            )
+
+        assert response_json == {"foo": "bar"}
+        assert response_headers[RETRY_COUNT_HEADER] == "2"
+        assert patched_request.call_count == 3
+        assert mock_sleep.call_count == 2
+        assert mock_sleep.call_args_list[1][0][0] == 2.0
+
+    def test_raises_last_error_when_attempts_exhausted(
+        self, retrying_http_client, patched_request
+    ):
+        patched_request.side_effect = [
+            _mock_response(
+                503,
+                {
+                    "request_id": "abc",
+                    "error": {"type": "service_unavailable", "message": "Try later"},
+                },
+            )
+            for _ in range(3)
+        ]
+
+        with patch("time.sleep"), pytest.raises(NylasApiError) as e:
+            retrying_http_client._execute(method="GET", path="/foo")
+
+        assert e.value.status_code == 503
+        assert e.value.headers[RETRY_COUNT_HEADER] == "2"
+        assert patched_request.call_count == 3
+
+    def test_retries_connection_errors(self, retrying_http_client, patched_request):
+        patched_request.side_effect = [
+            requests.exceptions.ConnectionError("connection reset"),
+            _mock_response(200, {"foo": "bar"}),
+        ]
+
+        with patch("time.sleep"):
+            response_json, _ = retrying_http_client._execute(method="GET", path="/foo")
+
+        assert response_json == {"foo": "bar"}
+        assert patched_request.call_count == 2
+
+    def test_does_not_retry_non_retryable_status(
+        self, retrying_http_client, patched_request
+    ):
+        patched_request.side_effect = [
+            _mock_response(
+                400,
+                {"request_id": "abc", "error": {"type": "bad", "message": "Bad"}},
+            )
+        ]
+
+        with pytest.raises(NylasApiError):
+            retrying_http_client._execute(method="GET", path="/foo")
+        assert patched_request.call_count == 1
+
+    def test_does_not_retry_post_by_default(
+        self, retrying_http_client, patched_request
+    ):
+        patched_request.side_effect = [
+            _mock_response(
+                503,
+                {"request_id": "abc", "error": {"type": "x", "message": "Down"}},
+            )
+        ]
+
+        with pytest.raises(NylasApiError):
+            retrying_http_client._execute(
+                method="POST", path="/foo", request_body={"a": 1}
+            )
+        assert patched_request.call_count == 1
+        assert "Idempotency-Key" not in patched_request.call_args[1]["headers"]
+
+    def test_retries_post_with_idempotency_key(self, patched_request):
+        http_client = HttpClient(
+            api_server="https://test.nylas.com",
+            api_key="test-key",
+            timeout=30,
+            retry_policy=RetryPolicy(retry_post=True, total_timeout=None),
+            json_codec=StdlibJsonCodec(),
+        )
+        patched_request.side_effect = [
+            _mock_response(502),
+            _mock_response(200, {"foo": "bar"}),
+        ]
+
+        with patch("time.sleep"):
+            http_client._execute(method="POST", path="/foo", request_body={"a": 1})
+
+        first, second = patched_request.call_args_list
+        key = first[1]["headers"]["Idempotency-Key"]
+        assert key
+        assert second[1]["headers"]["Idempotency-Key"] == key
+        assert second[1]["data"] == b'{"a": 1}'
+
+    def test_does_not_retry_streamed_multipart_body(self, patched_request):
+        http_client = HttpClient(
+            api_server="https://test.nylas.com",
+            api_key="test-key",
+            timeout=30,
+            retry_policy=RetryPolicy(retry_methods=frozenset({"PUT"})),
+        )
+        patched_request.side_effect = [
+            _mock_response(
+                503, {"request_id": "a", "error": {"type": "x", "message": "x"}}
+            )
+        ]
+
+        with pytest.raises(NylasApiError):
+            http_client._execute(method="PUT", path="/foo", data=TestData("multipart"))
+        assert patched_request.call_count == 1
+
+    def test_no_retry_count_header_without_policy(self, http_client, patched_request):
+        patched_request.return_value = _mock_response(200, {"foo": "bar"})
+
+        _, response_headers = http_client._execute(method="GET", path="/foo")
+
+        assert RETRY_COUNT_HEADER not in response_headers
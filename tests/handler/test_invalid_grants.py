@@ -0,0 +1,158 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from nylas import Client
+from nylas.handler.invalid_grants import InvalidGrantCache
+from nylas.handler.transport import LocalResponse, LocalTransport
+from nylas.models.errors import NylasApiError, NylasInvalidGrantError
+
+_EXPIRED = LocalResponse(
+    401,
+    json={
+        "request_id": "abc-123",
+        "error": {"type": "grant.expired", "message": "Grant has expired."},
+    },
+)
+
+
+class _Api:
+    def __init__(self):
+        self.valid = False
+        self.calls = 0
+        self.transport = LocalTransport(
+            [
+                ("GET", "/v3/grants/{grant_id}/calendars", self.list_calendars),
+                ("GET", "/v3/grants/{grant_id}", self.find_grant),
+                ("GET", "/v3/grants/{grant_id}/messages/{id}", self.not_found),
+            ]
+        )
+
+    def list_calendars(self, request):
+        self.calls += 1
+        if not self.valid:
+            return _EXPIRED
+        return {"request_id": "abc-123", "data": []}
+
+    def find_grant(self, request):
+        status = "valid" if self.valid else "invalid"
+        return {
+            "request_id": "abc-123",
+            "data": {"id": "abc", "provider": "google", "grant_status": status},
+        }
+
+    def not_found(self, request):
+        self.calls += 1
+        return LocalResponse(
+            404,
+            json={
+                "request_id": "abc-123",
+                "error": {"type": "not_found_error", "message": "Not found."},
+            },
+        )
+
+
+@pytest.fixture
+def api():
+    return _Api()
+
+
+@pytest.fixture
+def client(api):
+    return Client(
+        api_key="test-key",
+        transport=api.transport,
+        invalid_grant_cache=InvalidGrantCache(ttl=60),
+    )
+
+
+class TestInvalidGrantCache:
+    def test_invalid_grant_fails_locally(self, api, client):
+        with pytest.raises(NylasApiError) as first:
+            client.calendars.list("abc")
+        with pytest.raises(NylasInvalidGrantError) as second:
+            client.calendars.list("abc")
+
+        assert not isinstance(first.value, NylasInvalidGrantError)
+        assert api.calls == 1
+        assert second.value.grant_id == "abc"
+        assert second.value.type == "grant.expired"
+        assert second.value.status_code == 401
+        assert str(second.value) == "Grant has expired."
+        assert client.http_client.invalid_grant_cache.short_circuited == 1
+
+    def test_other_grants_and_errors_are_not_remembered(self, api, client):
+        with pytest.raises(NylasApiError):
+            client.messages.find("abc", "missing")
+        with pytest.raises(NylasApiError):
+            client.calendars.list("other")
+        api.valid = True
+
+        assert "abc" not in client.http_client.invalid_grant_cache
+        assert client.calendars.list("abc").data == []
+
+    def test_entries_expire(self, api, client):
+        with pytest.raises(NylasApiError):
+            client.calendars.list("abc")
+        api.valid = True
+
+        with patch("nylas.handler.invalid_grants.time.monotonic", return_value=10**9):
+            assert client.calendars.list("abc").data == []
+        assert api.calls == 2
+
+    def test_find_showing_valid_grant_forgets_it(self, api, client):
+        with pytest.raises(NylasApiError):
+            client.calendars.list("abc")
+
+        assert client.grants.find("abc").data.grant_status == "invalid"
+        assert "abc" in client.http_client.invalid_grant_cache
+
+        api.valid = True
+        assert client.grants.find("abc").data.grant_status == "valid"
+        assert client.calendars.list("abc").data == []
+
+    def test_webhooks(self):
+        cache = InvalidGrantCache()
+
+        cache.handle_webhook(
+            {"type": "grant.expired", "data": {"object": {"grant_id": "abc"}}}
+        )
+        with pytest.raises(NylasInvalidGrantError, match="has expired"):
+            cache.check("/v3/grants/abc/messages")
+        cache.check("/v3/grants/abc")
+
+        cache.handle_webhook(
+            {"type": "grant.updated", "data": {"object": {"grant_id": "abc"}}}
+        )
+        cache.check("/v3/grants/abc/messages")
+        assert len(cache) == 0
+
+    def test_me_and_max_grants(self):
+        cache = InvalidGrantCache(max_grants=2)
+        for grant_id in ("me", "a", "b", "c"):
+            cache.mark_invalid(grant_id, "grant.expired", "expired")
+
+        cache.check("/v3/grants/me/messages")
+        assert "a" not in cache and "b" in cache and "c" in cache
+
+    def test_async_client(self, api):
+        pytest.importorskip("httpx")
+        from nylas import AsyncClient
+
+        async def run():
+            async with AsyncClient(
+                api_key="test-key",
+                transport=api.transport,
+                invalid_grant_cache=InvalidGrantCache(),
+            ) as client:
+                with pytest.raises(NylasApiError):
+                    await client.calendars.list("abc")
+                with pytest.raises(NylasInvalidGrantError):
+                    await client.calendars.list("abc")
+                api.valid = True
+                await client.grants.find("abc")
+                return await client.calendars.list("abc")
+
+        assert asyncio.run(run()).data == []
+        assert api.calls == 2
@@ -0,0 +1,114 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from nylas.handler.http_client import HttpClient, _encode_json_body, _validate_response
+from nylas.handler.json_codec import (
+    OrjsonJsonCodec,
+    StdlibJsonCodec,
+    default_json_codec,
+)
+
+orjson = pytest.importorskip("orjson")
+
+BODIES = [
+    {"title": "Réunion d'équipe", "emoji": "🎉", "zh": "会议"},
+    {"nested": {"list": [1, 2.5, True, None, "x"]}, "empty": {}},
+    {"big": 2**70},
+    {1: "int key", "nan": float("nan"), "inf": float("inf")},
+]
+
+
+class TestJsonCodecs:
+    def test_default_codec_prefers_orjson(self):
+        assert isinstance(default_json_codec(), OrjsonJsonCodec)
+        http_client = HttpClient("https://test.nylas.com", "test-key", 30)
+        assert isinstance(http_client.json_codec, OrjsonJsonCodec)
+
+    @pytest.mark.parametrize("body", BODIES)
+    @pytest.mark.parametrize("codec", [StdlibJsonCodec(), OrjsonJsonCodec()])
+    def test_dumps_matches_json_dumps(self, codec, body):
+        encoded = codec.dumps(body)
+
+        assert isinstance(encoded, bytes)
+        expected = json.dumps(body, ensure_ascii=False, allow_nan=True)
+        assert repr(json.loads(encoded)) == repr(json.loads(expected))
+
+    @pytest.mark.parametrize("codec", [StdlibJsonCodec(), OrjsonJsonCodec()])
+    def test_dumps_preserves_utf8(self, codec):
+        encoded = codec.dumps({"title": "Réunion d'équipe"})
+
+        assert "Réunion d'équipe".encode("utf-8") in encoded
+        assert b"\\u" not in encoded
+
+    @pytest.mark.parametrize("codec", [StdlibJsonCodec(), OrjsonJsonCodec()])
+    def test_loads(self, codec):
+        data = '{"title": "Réunion", "n": NaN, "items": [1, 2]}'.encode("utf-8")
+
+        value = codec.loads(data)
+
+        assert value["title"] == "Réunion"
+        assert value["items"] == [1, 2]
+        assert value["n"] != value["n"]
+
+    @pytest.mark.parametrize("codec", [StdlibJsonCodec(), OrjsonJsonCodec()])
+    def test_loads_invalid_json(self, codec):
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads(b"not json")
+
+    @pytest.mark.parametrize("codec", [StdlibJsonCodec(), OrjsonJsonCodec()])
+    def test_serialized_json_body_is_sent_unchanged(self, codec):
+        signed = b'{"b":1,"a":"\xc3\xa9"}'
+
+        assert _encode_json_body({"a": 1}, None, signed, codec) is signed
+
+    def test_dumps_with_null_uses_orjson(self, monkeypatch):
+        codec = OrjsonJsonCodec()
+        fallback = Mock(side_effect=AssertionError("fell back to json.dumps"))
+        monkeypatch.setattr(StdlibJsonCodec, "dumps", fallback)
+
+        assert json.loads(codec.dumps({"a": None, "b": "null", "c": [1.5]})) == {
+            "a": None,
+            "b": "null",
+            "c": [1.5],
+        }
+
+    @pytest.mark.parametrize("codec", [StdlibJsonCodec(), OrjsonJsonCodec()])
+    def test_validate_response_malformed_body(self, codec):
+        response = Mock()
+        response.status_code = 200
+        response.content = b"<html>bad gateway</html>"
+        response.headers = {}
+
+        with pytest.raises(requests.exceptions.JSONDecodeError):
+            _validate_response(response, codec)
+
+    def test_validate_response_uses_codec(self):
+        codec = Mock(wraps=StdlibJsonCodec())
+        response = Mock()
+        response.status_code = 200
+        response.content = b'{"foo": "bar"}'
+        response.headers = {}
+
+        response_json, _ = _validate_response(response, codec)
+
+        assert response_json == {"foo": "bar"}
+        codec.loads.assert_called_once_with(b'{"foo": "bar"}')
+
+    def test_custom_codec_is_used_for_request_bodies(self, patched_request):
+        codec = Mock()
+        codec.dumps.return_value = b"{}"
+        codec.loads.return_value = {"foo": "bar"}
+        http_client = HttpClient(
+            "https://test.nylas.com", "test-key", 30, json_codec=codec
+        )
+
+        response_json, _ = http_client._execute(
+            method="POST", path="/foo", request_body={"a": 1}
+        )
+
+        codec.dumps.assert_called_once_with({"a": 1})
+        assert patched_request.call_args[1]["data"] == b"{}"
+        assert response_json == {"foo": "bar"}
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from nylas.handler.json_stream import JsonListParser
+
+_BODY = json.dumps(
+    {
+        "request_id": "abc-123",
+        "data": [
+            {"id": "1", "subject": 'Quote " and ] brackets }', "to": [{"x": [1, 2]}]},
+            {"id": "2", "body": "b" * 1000 + '\\"' + "}" * 100},
+            "plain",
+            3,
+            None,
+        ],
+        "next_cursor": "cursor,}",
+    },
+    indent=1,
+).encode()
+
+
+def _parse(body: bytes, size: int, **kwargs):
+    parser = JsonListParser(loads=json.loads, **kwargs)
+    items = []
+    for start in range(0, len(body), size):
+        items.extend(parser.feed(body[start : start + size]))
+    parser.close()
+    return parser, items
+
+
+class TestJsonListParser:
+    @pytest.mark.parametrize("size", [1, 2, 7, 64, 100_000])
+    def test_splits_items_in_any_chunk_size(self, size):
+        parser, items = _parse(_BODY, size)
+
+        assert items == json.loads(_BODY)["data"]
+        assert parser.fields == {"request_id": "abc-123", "next_cursor": "cursor,}"}
+        assert parser.done
+
+    def test_items_are_returned_as_they_complete(self):
+        parser = JsonListParser(loads=json.loads)
+
+        assert parser.feed(b'{"request_id": "1", "data": [{"id": 1}, {"id"') == [
+            {"id": 1}
+        ]
+        assert parser.fields == {"request_id": "1"}
+        assert parser.feed(b": 2}]") == [{"id": 2}]
+        assert parser.feed(b', "next_cursor": null}') == []
+        assert parser.fields == {"request_id": "1", "next_cursor": None}
+
+    def test_only_holds_the_current_item(self):
+        parser = JsonListParser(loads=json.loads)
+        parser.feed(b'{"data": [')
+        for index in range(100):
+            parser.feed(json.dumps({"id": index, "body": "b" * 1000}).encode() + b",")
+
+        assert len(parser._buffer) < 100
+
+    def test_wrapped_items_are_parsed_whole(self):
+        parser, items = _parse(
+            b'{"data": {"items": [1, 2], "next_cursor": "x"}, "request_id": "1"}', 5
+        )
+
+        assert items == []
+        assert parser.fields["data"] == {"items": [1, 2], "next_cursor": "x"}
+
+    def test_raw_items(self):
+        _, items = _parse(b'{"data": [{"id": 1}, {"id": 2}]}', 3, parse_items=False)
+
+        assert items == [b'{"id": 1}', b' {"id": 2}']
+
+    def test_empty_list(self):
+        parser, items = _parse(b'{"data": [], "request_id": "1"}', 4)
+
+        assert items == []
+        assert parser.fields == {"request_id": "1"}
+
+    def test_truncated_body(self):
+        parser = JsonListParser(loads=json.loads)
+        parser.feed(b'{"data": [{"id": 1}')
+
+        with pytest.raises(ValueError, match="ended before it was complete"):
+            parser.close()
+
+    def test_not_an_object(self):
+        with pytest.raises(ValueError, match="Expected a JSON object"):
+            JsonListParser(loads=json.loads).feed(b"[1, 2]")
+
+    def test_trailing_data(self):
+        with pytest.raises(ValueError, match="after the end"):
+            JsonListParser(loads=json.loads).feed(b'{"data": []} {}')
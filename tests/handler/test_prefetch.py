@@ -0,0 +1,157 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from nylas.handler.prefetch import aprefetching, prefetching
+
+
+def _counting(values, produced):
+    for value in values:
+        produced.append(value)
+        yield value
+
+
+class TestPrefetching:
+    def test_yields_values_in_order(self):
+        assert list(prefetching(iter(range(5)), 2)) == [0, 1, 2, 3, 4]
+
+    def test_lookahead_is_bounded(self):
+        produced = []
+        values = prefetching(_counting(range(10), produced), 2)
+
+        assert next(values) == 0
+        time.sleep(0.2)
+
+        # One value handed over, two buffered and one held by the blocked producer.
+        assert len(produced) <= 4
+        values.close()
+
+    def test_fetches_ahead_of_consumer(self):
+        fetched = threading.Event()
+
+        def source():
+            yield 1
+            fetched.set()
+            yield 2
+
+        values = prefetching(source(), 1)
+        assert next(values) == 1
+        assert fetched.wait(1)
+        assert list(values) == [2]
+
+    def test_reraises_errors(self):
+        def source():
+            yield 1
+            raise RuntimeError("boom")
+
+        values = prefetching(source(), 1)
+        assert next(values) == 1
+        with pytest.raises(RuntimeError, match="boom"):
+            next(values)
+
+    def test_close_stops_producer(self):
+        produced = []
+        values = prefetching(_counting(range(1000), produced), 1)
+        next(values)
+        values.close()
+        time.sleep(0.3)
+        count = len(produced)
+        time.sleep(0.2)
+
+        assert len(produced) == count < 1000
+
+    def test_close_closes_iterator(self):
+        closed = threading.Event()
+
+        def source():
+            try:
+                yield from range(1000)
+            finally:
+                closed.set()
+
+        iterator = source()
+        values = prefetching(iterator, 1)
+        next(values)
+        values.close()
+
+        assert closed.wait(1)
+
+    def test_invalid_lookahead(self):
+        with pytest.raises(ValueError):
+            next(prefetching(iter([1]), 0))
+
+
+class TestAsyncPrefetching:
+    def test_yields_values_in_order(self):
+        async def source():
+            for value in range(5):
+                yield value
+
+        async def collect():
+            return [value async for value in aprefetching(source(), 2)]
+
+        assert asyncio.run(collect()) == [0, 1, 2, 3, 4]
+
+    def test_fetches_while_consumer_is_busy(self):
+        async def source():
+            for value in range(3):
+                await asyncio.sleep(0.05)
+                yield value
+
+        async def consume():
+            start = time.monotonic()
+            async for _ in aprefetching(source(), 1):
+                await asyncio.sleep(0.05)
+            return time.monotonic() - start
+
+        # Sequentially this takes 0.3s; overlapped it takes about 0.2s.
+        assert asyncio.run(consume()) < 0.27
+
+    def test_reraises_errors(self):
+        async def source():
+            yield 1
+            raise RuntimeError("boom")
+
+        async def collect():
+            return [value async for value in aprefetching(source(), 1)]
+
+        with pytest.raises(RuntimeError, match="boom"):
+            asyncio.run(collect())
+
+    def test_close_cancels_producer(self):
+        produced = []
+
+        async def source():
+            for value in range(1000):
+                produced.append(value)
+                yield value
+
+        async def take_one():
+            values = aprefetching(source(), 1)
+            await values.__anext__()
+            await values.aclose()
+            await asyncio.sleep(0.05)
+
+        asyncio.run(take_one())
+        assert len(produced) < 1000
+
+    def test_close_closes_iterator(self):
+        closed = []
+
+        async def source():
+            try:
+                for value in range(1000):
+                    yield value
+            finally:
+                closed.append(True)
+
+        async def take_one():
+            iterator = source()
+            values = aprefetching(iterator, 1)
+            await values.__anext__()
+            await values.aclose()
+            return list(closed)
+
+        assert asyncio.run(take_one()) == [True]
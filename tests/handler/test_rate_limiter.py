@@ -0,0 +1,190 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from nylas.handler.http_client import HttpClient
+from nylas.handler.rate_limiter import (
+    APPLICATION_BUCKET,
+    FileLockRateLimitBackend,
+    InMemoryRateLimitBackend,
+    RateLimiter,
+    grant_bucket_key,
+)
+
+
+def _rate(limiter, key):
+    return limiter.backend.update(key, lambda state: (state, state[1]))
+
+
+class TestGrantBucketKey:
+    def test_grant_path(self):
+        assert grant_bucket_key("/v3/grants/abc-123/messages") == "grant:abc-123"
+
+    def test_non_grant_path(self):
+        assert grant_bucket_key("/v3/grants") is None
+        assert grant_bucket_key("/v3/grants/abc-123") is None
+        assert grant_bucket_key("/v3/webhooks") is None
+
+
+class TestRateLimiter:
+    def test_burst_is_free_then_paced(self):
+        limiter = RateLimiter(application_rate=2, grant_rate=100)
+
+        with patch("time.time", return_value=1000.0):
+            assert limiter.reserve("/v3/webhooks") == 0
+            assert limiter.reserve("/v3/webhooks") == 0
+            assert limiter.reserve("/v3/webhooks") == pytest.approx(0.5)
+            assert limiter.reserve("/v3/webhooks") == pytest.approx(1.0)
+
+    def test_tokens_refill_over_time(self):
+        limiter = RateLimiter(application_rate=1)
+
+        with patch("time.time", return_value=1000.0):
+            assert limiter.reserve("/v3/webhooks") == 0
+        with patch("time.time", return_value=1001.0):
+            assert limiter.reserve("/v3/webhooks") == 0
+
+    def test_grant_requests_use_grant_bucket(self):
+        limiter = RateLimiter(application_rate=100, grant_rate=1)
+
+        with patch("time.time", return_value=1000.0):
+            assert limiter.reserve("/v3/grants/a/messages") == 0
+            assert limiter.reserve("/v3/grants/b/messages") == 0
+            assert limiter.reserve("/v3/grants/a/messages") == pytest.approx(1.0)
+
+    def test_acquire_sleeps_for_reservation(self):
+        limiter = RateLimiter(application_rate=1)
+
+        with patch("time.time", return_value=1000.0), patch("time.sleep") as sleep:
+            limiter.acquire("/v3/webhooks")
+            limiter.acquire("/v3/webhooks")
+
+        sleep.assert_called_once_with(pytest.approx(1.0))
+
+    def test_429_halves_rate_and_honors_retry_after(self):
+        limiter = RateLimiter(grant_rate=10)
+
+        with patch("time.time", return_value=1000.0):
+            limiter.update("/v3/grants/a/events", 429, {"Retry-After": "2"})
+            assert _rate(limiter, "grant:a") == 5
+            assert limiter.reserve("/v3/grants/a/events") == pytest.approx(2.2)
+
+    def test_grant_429_throttles_application_bucket(self):
+        limiter = RateLimiter(application_rate=50, grant_rate=10)
+
+        with patch("time.time", return_value=1000.0):
+            limiter.update(
+                "/v3/grants/a/events",
+                429,
+                {"Retry-After": "2", "X-RateLimit-Remaining": "0"},
+            )
+            assert _rate(limiter, APPLICATION_BUCKET) == 25
+            assert limiter.reserve("/v3/grants/b/events") == pytest.approx(0.04)
+
+        limiter.update("/v3/grants/a/events", 200, {})
+
+        assert _rate(limiter, APPLICATION_BUCKET) == pytest.approx(27.5)
+
+    def test_rate_adapts_to_rate_limit_headers(self):
+        limiter = RateLimiter(application_rate=50)
+
+        limiter.update(
+            "/v3/webhooks",
+            200,
+            {"X-RateLimit-Remaining": "30", "X-RateLimit-Reset": "60"},
+        )
+
+        assert _rate(limiter, APPLICATION_BUCKET) == 0.5
+
+    def test_rate_recovers_after_throttling(self):
+        limiter = RateLimiter(application_rate=10)
+
+        limiter.update("/v3/webhooks", 429, {})
+        limiter.update("/v3/webhooks", 200, {})
+
+        assert _rate(limiter, APPLICATION_BUCKET) == pytest.approx(5.5)
+
+    def test_rate_never_drops_below_minimum(self):
+        limiter = RateLimiter(application_rate=1, min_rate=0.4)
+
+        for _ in range(5):
+            limiter.update("/v3/webhooks", 429, {})
+
+        assert _rate(limiter, APPLICATION_BUCKET) == 0.4
+
+
+class TestRateLimitBackends:
+    def test_in_memory_backend(self):
+        backend = InMemoryRateLimitBackend()
+
+        assert backend.update("key", lambda state: ([1.0], state)) is None
+        assert backend.update("key", lambda state: (state, state)) == [1.0]
+
+    def test_in_memory_backend_drops_least_recently_used(self):
+        backend = InMemoryRateLimitBackend(max_buckets=2)
+        for key in ("a", "b", "a", "c"):
+            backend.update(key, lambda state: ([1.0], None))
+
+        assert len(backend) == 2
+        assert backend.update("b", lambda state: (state or [2.0], state)) is None
+        assert backend.update("a", lambda state: (state, state)) is None
+
+    def test_file_lock_backend_shares_state(self, tmp_path):
+        pytest.importorskip("fcntl")
+        path = str(tmp_path / "buckets")
+        first = RateLimiter(application_rate=1, backend=FileLockRateLimitBackend(path))
+        second = RateLimiter(application_rate=1, backend=FileLockRateLimitBackend(path))
+
+        with patch("time.time", return_value=1000.0):
+            assert first.reserve("/v3/webhooks") == 0
+            assert second.reserve("/v3/webhooks") == pytest.approx(1.0)
+
+    def test_file_lock_backend_stores_and_sweeps_buckets_separately(self, tmp_path):
+        pytest.importorskip("fcntl")
+        with patch("time.time", return_value=1000.0):
+            backend = FileLockRateLimitBackend(
+                str(tmp_path / "buckets"), idle_timeout=60
+            )
+            limiter = RateLimiter(backend=backend)
+            limiter.reserve("/v3/grants/a/messages")
+            limiter.reserve("/v3/grants/b@example.com/messages")
+        assert sorted(os.listdir(backend.path)) == [
+            "application",
+            "grant%3Aa",
+            "grant%3Ab%40example.com",
+        ]
+
+        stale = os.path.join(backend.path, "grant%3Aa")
+        os.utime(stale, (0, 0))
+        limiter.reserve("/v3/webhooks")
+
+        assert len(backend) == 2
+        assert not os.path.exists(stale)
+
+
+class TestHttpClientRateLimiting:
+    def test_execute_acquires_and_updates(self, patched_request):
+        limiter = RateLimiter()
+        http_client = HttpClient(
+            api_server="https://test.nylas.com",
+            api_key="test-key",
+            timeout=30,
+            rate_limiter=limiter,
+        )
+        patched_request.return_value.headers = {"X-RateLimit-Remaining": "5"}
+        patched_request.return_value.content = b'{"foo": "bar"}'
+
+        with patch.object(limiter, "acquire") as acquire, patch.object(
+            limiter, "update"
+        ) as update:
+            http_client._execute(
+                method="GET",
+                path="/v3/grants/abc/messages",
+                query_params={"limit": 5},
+            )
+
+        acquire.assert_called_once_with("/v3/grants/abc/messages")
+        update.assert_called_once_with(
+            "/v3/grants/abc/messages", 200, {"X-RateLimit-Remaining": "5"}
+        )
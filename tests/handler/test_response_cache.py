@@ -0,0 +1,260 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from nylas import Client
+from nylas.handler.http_client import HttpClient
+from nylas.handler.response_cache import (
+    CACHE_STATUS_HEADER,
+    InMemoryCacheBackend,
+    ResponseCache,
+    SqliteCacheBackend,
+    cache_resource,
+)
+
+
+def _mock_response(json_data, status_code=200, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.content = json.dumps(json_data).encode()
+    response.headers = headers if headers is not None else {"X-Test": "1"}
+    response.url = "https://test.nylas.com/foo"
+    return response
+
+
+def _calendar(name="Primary"):
+    return {"request_id": "abc-123", "data": {"id": "primary", "name": name}}
+
+
+@pytest.fixture
+def cache():
+    return ResponseCache()
+
+
+@pytest.fixture
+def cached_http_client(cache):
+    return HttpClient(
+        api_server="https://test.nylas.com",
+        api_key="test-key",
+        timeout=30,
+        response_cache=cache,
+    )
+
+
+class TestCacheResource:
+    @pytest.mark.parametrize(
+        "path, resource",
+        [
+            ("/v3/grants/abc/calendars/primary", "calendars"),
+            ("/v3/grants/abc/folders", "folders"),
+            ("/v3/grants/abc", "grants"),
+            ("/v3/grants", "grants"),
+            ("/v3/connectors/google", "connectors"),
+            ("/v3/applications", "applications"),
+            ("/v3/webhooks/ip-addresses", "webhooks"),
+            ("/", ""),
+        ],
+    )
+    def test_cache_resource(self, path, resource):
+        assert cache_resource(path) == resource
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        yield InMemoryCacheBackend(max_entries=2)
+        return
+    backend = SqliteCacheBackend(str(tmp_path / "cache.db"), max_entries=2)
+    yield backend
+    backend.close()
+
+
+class TestCacheBackends:
+    def test_set_and_get(self, backend):
+        backend.set("key", "/v3/grants", (b"{}", {"X-Test": "1"}), 60)
+
+        assert backend.get("key") == (b"{}", {"X-Test": "1"})
+        assert backend.get("other") is None
+
+    def test_expired_entries_are_missing(self, backend):
+        with patch("time.time", return_value=1000.0):
+            backend.set("key", "/v3/grants", (b"{}", {}), 10)
+        with patch("time.time", return_value=1011.0):
+            assert backend.get("key") is None
+
+    def test_least_recently_used_is_evicted(self, backend):
+        with patch("time.time", side_effect=[1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0]):
+            backend.set("a", "/a", (b"a", {}), 60)
+            backend.set("b", "/b", (b"b", {}), 60)
+            assert backend.get("a") == (b"a", {})
+            backend.set("c", "/c", (b"c", {}), 60)
+            assert backend.get("b") is None
+            assert backend.get("a") == (b"a", {})
+            assert backend.get("c") == (b"c", {})
+
+    def test_invalidate(self, backend):
+        backend.set("list", "/v3/grants/abc/calendars", (b"[]", {}), 60)
+        backend.set("find", "/v3/grants/abc/calendars/primary", (b"{}", {}), 60)
+
+        backend.invalidate("/v3/grants/abc/calendars")
+        assert backend.get("list") is None
+        assert backend.get("find") is not None
+
+        backend.invalidate("/v3/grants/abc", subtree=True)
+        assert backend.get("find") is None
+
+    def test_clear(self, backend):
+        backend.set("key", "/v3/grants", (b"{}", {}), 60)
+        backend.clear()
+
+        assert backend.get("key") is None
+
+    def test_sqlite_backend_is_shared(self, tmp_path):
+        path = str(tmp_path / "shared.db")
+        first, second = SqliteCacheBackend(path), SqliteCacheBackend(path)
+
+        first.set("key", "/v3/grants", (b"{}", {"X-Test": "1"}), 60)
+
+        assert second.get("key") == (b"{}", {"X-Test": "1"})
+        first.close()
+        second.close()
+
+
+class TestResponseCache:
+    def test_key_depends_on_credentials_and_url(self, cache):
+        key = cache.key("GET", "https://api/v3/grants?limit=5", "Bearer a")
+
+        assert key == cache.key("get", "https://api/v3/grants?limit=5", "Bearer a")
+        assert key != cache.key("GET", "https://api/v3/grants?limit=5", "Bearer b")
+        assert key != cache.key("GET", "https://api/v3/grants?limit=6", "Bearer a")
+        assert "Bearer" not in key
+
+    def test_ttl_for(self):
+        cache = ResponseCache(ttls={"calendars": 30, "events": 0})
+
+        assert cache.ttl_for("/v3/grants/abc/calendars") == 30
+        assert cache.ttl_for("/v3/grants/abc/events") is None
+        assert cache.ttl_for("/v3/grants/abc/messages") is None
+
+    def test_counts_hits_and_misses(self, cache):
+        key = cache.key("GET", "https://api/v3/grants", None)
+        cache.get(key)
+        cache.set(key, "/v3/grants", (b"{}", {}))
+        cache.get(key)
+        cache.get(key)
+
+        assert (cache.hits, cache.misses) == (2, 1)
+        cache.clear()
+        assert (cache.hits, cache.misses) == (0, 0)
+
+
+class TestHttpClientResponseCache:
+    def test_get_is_served_from_cache(self, cached_http_client, cache, patched_request):
+        patched_request.return_value = _mock_response(_calendar())
+        path = "/v3/grants/abc/calendars/primary"
+
+        first = cached_http_client._execute(method="GET", path=path)
+        second = cached_http_client._execute(method="GET", path=path)
+
+        assert patched_request.call_count == 1
+        assert first[0] == second[0] == _calendar()
+        assert second[1]["x-test"] == "1"
+        assert second[1][CACHE_STATUS_HEADER] == "hit"
+        assert CACHE_STATUS_HEADER not in first[1]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_query_params_are_part_of_the_key(
+        self, cached_http_client, patched_request
+    ):
+        patched_request.return_value = _mock_response(_calendar())
+        path = "/v3/grants/abc/calendars"
+
+        cached_http_client._execute(method="GET", path=path, query_params={"limit": 1})
+        cached_http_client._execute(method="GET", path=path, query_params={"limit": 2})
+
+        assert patched_request.call_count == 2
+
+    def test_api_key_override_is_part_of_the_key(
+        self, cached_http_client, patched_request
+    ):
+        patched_request.return_value = _mock_response(_calendar())
+        path = "/v3/grants/abc"
+
+        cached_http_client._execute(method="GET", path=path)
+        cached_http_client._execute(
+            method="GET", path=path, overrides={"api_key": "other-key"}
+        )
+
+        assert patched_request.call_count == 2
+
+    def test_uncached_resources_are_not_cached(
+        self, cached_http_client, cache, patched_request
+    ):
+        patched_request.return_value = _mock_response(_calendar())
+
+        for _ in range(2):
+            cached_http_client._execute(method="GET", path="/v3/grants/abc/messages")
+
+        assert patched_request.call_count == 2
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    def test_errors_are_not_cached(self, cached_http_client, patched_request):
+        patched_request.return_value = _mock_response(
+            {"request_id": "abc-123", "error": {"type": "api_error", "message": "no"}},
+            status_code=500,
+        )
+
+        for _ in range(2):
+            with pytest.raises(Exception):
+                cached_http_client._execute(method="GET", path="/v3/grants/abc")
+
+        assert patched_request.call_count == 2
+
+    @pytest.mark.parametrize("method", ["PUT", "PATCH", "DELETE"])
+    def test_writes_invalidate_find_and_list(
+        self, cached_http_client, patched_request, method
+    ):
+        patched_request.return_value = _mock_response(_calendar())
+        find_path = "/v3/grants/abc/calendars/primary"
+        list_path = "/v3/grants/abc/calendars"
+        cached_http_client._execute(method="GET", path=find_path)
+        cached_http_client._execute(method="GET", path=list_path)
+
+        cached_http_client._execute(method=method, path=find_path, request_body={})
+        cached_http_client._execute(method="GET", path=find_path)
+        cached_http_client._execute(method="GET", path=list_path)
+
+        assert patched_request.call_count == 5
+
+    def test_create_invalidates_list(self, cached_http_client, patched_request):
+        patched_request.return_value = _mock_response(_calendar())
+        list_path = "/v3/grants/abc/calendars"
+        cached_http_client._execute(method="GET", path=list_path)
+
+        cached_http_client._execute(method="POST", path=list_path, request_body={})
+        cached_http_client._execute(method="GET", path=list_path)
+
+        assert patched_request.call_count == 3
+
+    def test_client_resources_use_cache(self, patched_request):
+        patched_request.return_value = _mock_response(
+            {
+                "request_id": "abc-123",
+                "data": {
+                    "id": "primary",
+                    "grant_id": "abc",
+                    "name": "Primary",
+                    "read_only": False,
+                    "is_owned_by_user": True,
+                },
+            }
+        )
+        client = Client(api_key="test-key", response_cache=ResponseCache())
+
+        first = client.calendars.find("abc", "primary")
+        second = client.calendars.find("abc", "primary")
+
+        assert patched_request.call_count == 1
+        assert first.data == second.data
+        assert first.data is not second.data
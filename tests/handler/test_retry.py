@@ -0,0 +1,80 @@
+import time
+from unittest.mock import patch
+
+from nylas.handler.retry import RetryPolicy, parse_retry_after
+
+
+class TestParseRetryAfter:
+    def test_parse_seconds(self):
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(" 1.5 ") == 1.5
+
+    def test_parse_http_date(self):
+        delay = parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT", now=1445412480)
+
+        assert delay == 10.0
+
+    def test_parse_http_date_in_the_past(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=1445412490) == 0
+
+    def test_parse_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+        assert parse_retry_after("soon") is None
+
+
+class TestRetryPolicy:
+    def test_defaults(self):
+        policy = RetryPolicy()
+
+        assert policy.max_attempts == 3
+        assert policy.total_timeout == 60.0
+        assert policy.retry_statuses == {429, 502, 503, 504}
+        assert policy.retry_post is False
+
+    def test_is_retryable_request(self):
+        policy = RetryPolicy()
+
+        assert policy.is_retryable_request("GET", {}) is True
+        assert policy.is_retryable_request("delete", {}) is True
+        assert policy.is_retryable_request("PATCH", {}) is False
+        assert policy.is_retryable_request("POST", {"Idempotency-Key": "abc"}) is False
+
+    def test_is_retryable_post_with_idempotency_key(self):
+        policy = RetryPolicy(retry_post=True)
+
+        assert policy.is_retryable_request("POST", {"Idempotency-Key": "abc"}) is True
+        assert policy.is_retryable_request("POST", {}) is False
+
+    def test_backoff_is_jittered_and_capped(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+
+        with patch("random.uniform", side_effect=lambda low, high: high) as uniform:
+            assert policy.backoff(1) == 1
+            assert policy.backoff(2) == 2
+            assert policy.backoff(3) == 4
+            assert policy.backoff(4) == 5
+        assert uniform.call_args[0][0] == 0
+
+    def test_next_delay_stops_after_max_attempts(self):
+        policy = RetryPolicy(max_attempts=2, total_timeout=None)
+
+        assert policy.next_delay(1, time.monotonic()) is not None
+        assert policy.next_delay(2, time.monotonic()) is None
+
+    def test_next_delay_honors_retry_after(self):
+        policy = RetryPolicy()
+
+        assert policy.next_delay(1, time.monotonic(), "7") == 7.0
+
+    def test_next_delay_ignores_retry_after_when_disabled(self):
+        policy = RetryPolicy(respect_retry_after=False, backoff_factor=0.25)
+
+        assert policy.next_delay(1, time.monotonic(), "7") <= 0.25
+
+    def test_next_delay_respects_total_timeout(self):
+        policy = RetryPolicy(total_timeout=5)
+
+        assert policy.next_delay(1, time.monotonic(), "10") is None
+        assert policy.next_delay(1, time.monotonic() - 4.5, "1") is None
+        assert policy.next_delay(1, time.monotonic(), "1") == 1.0
@@ -0,0 +1,290 @@
+import json
+from unittest.mock import Mock
+
+from requests.structures import CaseInsensitiveDict
+
+from nylas import Client
+from nylas.handler.http_client import HttpClient
+from nylas.handler.revalidation import (
+    RevalidatedResponse,
+    RevalidationCache,
+    StoredResponse,
+    content_digest,
+)
+from nylas.models.calendars import Calendar
+from nylas.models.response import Response
+
+
+def _mock_response(json_data=None, status_code=200, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.content = json.dumps(json_data).encode() if json_data is not None else b""
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.url = "https://test.nylas.com/v3/grants/abc/calendars"
+    return response
+
+
+_CALENDARS = {
+    "request_id": "abc-123",
+    "data": [
+        {
+            "id": "primary",
+            "grant_id": "abc",
+            "name": "Primary",
+            "read_only": False,
+            "is_owned_by_user": True,
+        }
+    ],
+}
+
+
+class TestStoredResponse:
+    def test_validators(self):
+        stored = StoredResponse(b"{}", {"ETag": '"v1"'}, "digest")
+
+        assert stored.content == b"{}"
+        assert stored.etag == '"v1"'
+        assert stored.last_modified is None
+
+
+class TestRevalidationCache:
+    def test_conditional_headers(self):
+        cache = RevalidationCache()
+        stored = StoredResponse(
+            b"{}",
+            {"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"},
+            "d",
+        )
+
+        assert cache.conditional_headers(stored) == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 21 Oct 2026 07:28:00 GMT",
+        }
+        assert cache.conditional_headers(StoredResponse(b"{}", {}, "d")) == {}
+
+    def test_resolve_stores_and_reuses_unchanged_content(self):
+        cache = RevalidationCache()
+        parse = Mock(return_value=({"a": 1}, {}))
+
+        first = cache.resolve("key", None, 200, b'{"a": 1}', {}, parse)
+        second = cache.resolve("key", cache.get("key"), 200, b'{"a": 1}', {}, parse)
+
+        assert first == second == ({"a": 1}, {})
+        assert second[0] is not first[0]
+        assert cache.get("key").digest == content_digest(b'{"a": 1}')
+        assert parse.call_count == 1
+        assert cache.hits == 1
+
+    def test_resolve_replaces_changed_content(self):
+        cache = RevalidationCache()
+        cache.resolve("key", None, 200, b"1", {}, lambda: (1, {}))
+
+        changed = cache.resolve("key", cache.get("key"), 200, b"2", {}, lambda: (2, {}))
+
+        assert changed[0] == 2
+        assert cache.get("key").content == b"2"
+        assert cache.hits == 0
+
+    def test_errors_and_other_statuses_are_not_stored(self):
+        cache = RevalidationCache()
+
+        result = cache.resolve("key", None, 202, b"{}", {}, lambda: ({}, {}))
+
+        assert result == ({}, {})
+        assert len(cache) == 0
+
+    def test_not_modified_gets_current_headers_and_request_id(self):
+        cache = RevalidationCache()
+        stored_headers = CaseInsensitiveDict(
+            {"ETag": '"v1"', "Content-Type": "application/json", "Content-Length": "9"}
+        )
+        body = b'{"request_id": "abc-123", "data": []}'
+        cache.resolve(
+            "key", None, 200, body, stored_headers, lambda: ({}, stored_headers)
+        )
+
+        response_json, headers = cache.resolve(
+            "key",
+            cache.get("key"),
+            304,
+            b"",
+            CaseInsensitiveDict(
+                {"X-Request-Id": "def-456", "ETag": '"v2"', "Content-Length": "0"}
+            ),
+            lambda: ({}, {}),
+        )
+
+        assert response_json == {"request_id": "def-456", "data": []}
+        assert headers["X-Request-Id"] == "def-456"
+        assert headers["Content-Type"] == "application/json"
+        assert headers["Content-Length"] == "9"
+        assert cache.get("key").etag == '"v2"'
+
+    def test_hits_copy_the_decoded_result(self):
+        cache = RevalidationCache()
+        body = json.dumps(_CALENDARS).encode()
+        decode = Mock(
+            side_effect=lambda response_json, headers: Response(
+                Calendar.from_dict(response_json["data"][0]),
+                response_json["request_id"],
+                headers,
+            )
+        )
+        cache.resolve("key", None, 200, body, {}, lambda: ({}, {}))
+
+        hits = [
+            cache.resolve(
+                "key",
+                cache.get("key"),
+                304,
+                b"",
+                CaseInsensitiveDict({"X-Request-Id": request_id}),
+                lambda: ({}, {}),
+            )
+            for request_id in ("def-456", "ghi-789")
+        ]
+        first, second = (hit.decode(decode) for hit in hits)
+        first.data.name = "Changed"
+
+        assert all(isinstance(hit, RevalidatedResponse) for hit in hits)
+        assert decode.call_count == 1
+        assert second.data is not first.data
+        assert second.data.name == "Primary"
+        assert (first.request_id, second.request_id) == ("def-456", "ghi-789")
+        assert second.headers["X-Request-Id"] == "ghi-789"
+
+    def test_hits_keep_the_result_of_each_decoder(self):
+        cache = RevalidationCache()
+        cache.resolve("key", None, 200, b"{}", {}, lambda: ({}, {}))
+        hit = cache.resolve("key", cache.get("key"), 200, b"{}", {}, lambda: ({}, {}))
+        decode = Mock(return_value=Response({}, "abc-123", {}))
+        other = Mock(return_value=Response([], "abc-123", {}))
+
+        for decoder in (decode, other, decode, other):
+            hit.decode(decoder)
+
+        assert decode.call_count == 1
+        assert other.call_count == 1
+        assert hit.decode(other).data == []
+
+    def test_least_recently_used_is_evicted(self):
+        cache = RevalidationCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.resolve(key, None, 200, key.encode(), {}, lambda: ({}, {}))
+        cache.get("a")
+
+        cache.resolve("c", None, 200, b"c", {}, lambda: ({}, {}))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_clear(self):
+        cache = RevalidationCache()
+        cache.resolve("key", None, 200, b"{}", {}, lambda: ({}, {}))
+        cache.resolve("key", cache.get("key"), 304, b"", {}, lambda: ({}, {}))
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.hits == 0
+
+
+class TestHttpClientRevalidation:
+    def _http_client(self):
+        return HttpClient(
+            api_server="https://test.nylas.com",
+            api_key="test-key",
+            timeout=30,
+            revalidation_cache=RevalidationCache(),
+        )
+
+    def test_sends_validators_and_serves_stored_response_on_304(self, patched_request):
+        http_client = self._http_client()
+        patched_request.side_effect = [
+            _mock_response(
+                _CALENDARS,
+                headers={
+                    "ETag": '"v1"',
+                    "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT",
+                },
+            ),
+            _mock_response(status_code=304),
+        ]
+        path = "/v3/grants/abc/calendars"
+
+        first = http_client._execute(method="GET", path=path)
+        second = http_client._execute(method="GET", path=path)
+
+        assert "If-None-Match" not in patched_request.call_args_list[0][1]["headers"]
+        headers = patched_request.call_args_list[1][1]["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Wed, 21 Oct 2026 07:28:00 GMT"
+        assert second == first
+        assert second[0] is not first[0]
+        assert second[0] == _CALENDARS
+        assert http_client.revalidation_cache.hits == 1
+
+    def test_falls_back_to_content_hash(self, patched_request):
+        http_client = self._http_client()
+        patched_request.side_effect = [
+            _mock_response(_CALENDARS),
+            _mock_response(_CALENDARS),
+        ]
+        path = "/v3/grants/abc/calendars"
+
+        first = http_client._execute(method="GET", path=path)
+        second = http_client._execute(method="GET", path=path)
+
+        assert "If-None-Match" not in patched_request.call_args_list[1][1]["headers"]
+        assert second == first
+        assert http_client.revalidation_cache.hits == 1
+
+    def test_changed_response_is_parsed(self, patched_request):
+        http_client = self._http_client()
+        changed = dict(_CALENDARS, request_id="def-456")
+        patched_request.side_effect = [
+            _mock_response(_CALENDARS, headers={"ETag": '"v1"'}),
+            _mock_response(changed, headers={"ETag": '"v2"'}),
+        ]
+        path = "/v3/grants/abc/calendars"
+
+        http_client._execute(method="GET", path=path)
+        second = http_client._execute(method="GET", path=path)
+
+        assert second[0] == changed
+        (stored,) = http_client.revalidation_cache._entries.values()
+        assert stored.etag == '"v2"'
+        assert http_client.revalidation_cache.hits == 0
+
+    def test_writes_are_not_revalidated(self, patched_request):
+        http_client = self._http_client()
+        patched_request.return_value = _mock_response({"request_id": "abc-123"})
+
+        for _ in range(2):
+            http_client._execute(
+                method="PUT", path="/v3/grants/abc/calendars/primary", request_body={}
+            )
+
+        assert len(http_client.revalidation_cache) == 0
+
+    def test_unchanged_list_is_copied_for_each_call(self, patched_request):
+        client = Client(api_key="test-key", revalidation_cache=RevalidationCache())
+        patched_request.side_effect = [
+            _mock_response(_CALENDARS, headers={"ETag": '"v1"'}),
+            _mock_response(status_code=304, headers={"X-Request-Id": "def-456"}),
+            _mock_response(status_code=304, headers={"X-Request-Id": "ghi-789"}),
+        ]
+
+        first = client.calendars.list("abc")
+        first.data[0].name = "Changed"
+        second = client.calendars.list("abc")
+        raw = client.calendars.list("abc", overrides={"response_format": "raw"})
+
+        assert isinstance(second.data[0], Calendar)
+        assert second.data[0] is not first.data[0]
+        assert second.data[0].name == "Primary"
+        assert second.request_id == "def-456"
+        assert second.headers["X-Request-Id"] == "def-456"
+        assert raw.data == _CALENDARS["data"]
+        assert raw.request_id == "ghi-789"
@@ -0,0 +1,232 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from nylas import Client
+from nylas.handler.http_client import HttpClient
+from nylas.handler.single_flight import SingleFlight
+from nylas.models.errors import NylasApiError
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for condition"
+        time.sleep(0.001)
+
+
+def _run_concurrently(flight, count, key, call):
+    """Run count callers of flight.do at once, releasing the call once all are waiting."""
+    release = threading.Event()
+
+    def blocking_call():
+        release.wait(5)
+        return call()
+
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        futures = [pool.submit(flight.do, key, blocking_call) for _ in range(count)]
+        _wait_for(lambda: flight.coalesced == count - 1)
+        release.set()
+        return [future.exception() or future.result() for future in futures]
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_call(self):
+        flight = SingleFlight()
+        call = Mock(return_value="result")
+
+        results = _run_concurrently(flight, 5, "key", call)
+
+        assert results == ["result"] * 5
+        assert call.call_count == 1
+        assert flight.coalesced == 4
+
+    def test_exception_is_raised_in_every_caller(self):
+        flight = SingleFlight()
+        error = ValueError("boom")
+        call = Mock(side_effect=error)
+
+        results = _run_concurrently(flight, 3, "key", call)
+
+        assert results == [error] * 3
+        assert call.call_count == 1
+
+    def test_completed_calls_are_not_reused(self):
+        flight = SingleFlight()
+        call = Mock(side_effect=["first", "second"])
+
+        assert flight.do("key", call) == "first"
+        assert flight.do("key", call) == "second"
+        assert flight.coalesced == 0
+
+    def test_different_keys_are_not_coalesced(self):
+        flight = SingleFlight()
+
+        assert flight.do("a", lambda: "a") == "a"
+        assert flight.do("b", lambda: "b") == "b"
+        assert flight.coalesced == 0
+
+    def test_async_calls_share_one_call(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def run():
+            return await asyncio.gather(*(flight.ado("key", call) for _ in range(4)))
+
+        assert asyncio.run(run()) == ["result"] * 4
+        assert len(calls) == 1
+        assert flight.coalesced == 3
+
+    def test_async_exception_is_raised_in_every_caller(self):
+        flight = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def run():
+            return await asyncio.gather(
+                *(flight.ado("key", call) for _ in range(3)), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert flight.coalesced == 2
+
+    def test_waiters_take_over_from_cancelled_caller(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "result"
+
+        async def run():
+            leader = asyncio.ensure_future(flight.ado("key", call))
+            await asyncio.sleep(0)
+            waiters = [asyncio.ensure_future(flight.ado("key", call)) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            results = await asyncio.gather(*waiters)
+            return leader, results
+
+        leader, results = asyncio.run(run())
+
+        assert leader.cancelled()
+        assert results == ["result"] * 3
+        assert len(calls) == 2
+        assert flight.coalesced == 2
+
+
+def _mock_response(json_data, status_code=200):
+    response = Mock()
+    response.status_code = status_code
+    response.content = json.dumps(json_data).encode()
+    response.headers = {"X-Test": "1"}
+    response.url = "https://test.nylas.com/v3/grants/abc"
+    return response
+
+
+class TestHttpClientSingleFlight:
+    def _concurrent_execute(self, http_client, patched_request, calls):
+        release = threading.Event()
+        response = patched_request.return_value
+
+        def request(*args, **kwargs):
+            release.wait(5)
+            return response
+
+        patched_request.return_value = None
+        patched_request.side_effect = request
+        flight = http_client.single_flight
+        with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+            futures = [pool.submit(http_client._execute, **call) for call in calls]
+            _wait_for(
+                lambda: flight.coalesced + patched_request.call_count == len(calls)
+            )
+            release.set()
+            return [future.exception() or future.result() for future in futures]
+
+    @pytest.fixture
+    def http_client(self):
+        return HttpClient(
+            api_server="https://test.nylas.com",
+            api_key="test-key",
+            timeout=30,
+            single_flight=SingleFlight(),
+        )
+
+    def test_identical_gets_are_coalesced(self, http_client, patched_request):
+        patched_request.return_value = _mock_response(
+            {"request_id": "abc-123", "data": {"id": "abc"}}
+        )
+        call = {"method": "GET", "path": "/v3/grants/abc"}
+
+        results = self._concurrent_execute(http_client, patched_request, [call] * 4)
+
+        assert patched_request.call_count == 1
+        assert [result[0] for result in results] == [
+            {"request_id": "abc-123", "data": {"id": "abc"}}
+        ] * 4
+        assert results[0][0] is not results[1][0]
+
+    def test_errors_are_raised_in_every_caller(self, http_client, patched_request):
+        patched_request.return_value = _mock_response(
+            {
+                "request_id": "abc-123",
+                "error": {"type": "not_found_error", "message": "Grant not found"},
+            },
+            status_code=404,
+        )
+        call = {"method": "GET", "path": "/v3/grants/abc"}
+
+        results = self._concurrent_execute(http_client, patched_request, [call] * 3)
+
+        assert patched_request.call_count == 1
+        assert all(isinstance(result, NylasApiError) for result in results)
+
+    def test_requests_with_different_credentials_are_not_coalesced(
+        self, http_client, patched_request
+    ):
+        patched_request.return_value = _mock_response({"request_id": "abc-123"})
+        calls = [
+            {"method": "GET", "path": "/v3/grants/abc"},
+            {
+                "method": "GET",
+                "path": "/v3/grants/abc",
+                "overrides": {"api_key": "other-key"},
+            },
+        ]
+
+        self._concurrent_execute(http_client, patched_request, calls)
+
+        assert patched_request.call_count == 2
+        assert http_client.single_flight.coalesced == 0
+
+    def test_writes_are_not_coalesced(self, http_client, patched_request):
+        patched_request.return_value = _mock_response({"request_id": "abc-123"})
+        call = {"method": "DELETE", "path": "/v3/grants/abc"}
+
+        self._concurrent_execute(http_client, patched_request, [call] * 3)
+
+        assert patched_request.call_count == 3
+        assert http_client.single_flight.coalesced == 0
+
+    def test_client_single_flight(self):
+        flight = SingleFlight()
+        client = Client(api_key="test-key", single_flight=flight)
+
+        assert client.http_client.single_flight is flight
+        assert Client(api_key="test-key").http_client.single_flight is None
@@ -0,0 +1,122 @@
+from unittest.mock import patch
+
+import pytest
+
+from nylas import Client
+from nylas.handler.retry import RetryPolicy
+from nylas.handler.telemetry import OpenTelemetryTracing, PrometheusMetrics
+from nylas.handler.transport import LocalResponse, LocalTransport
+from nylas.models.errors import NylasApiError
+
+_GRANT = {"request_id": "abc-123", "data": {"id": "abc", "provider": "google"}}
+_LABELS = {"method": "GET", "path": "/v3/grants/{id}"}
+
+
+def _client(handler):
+    return Client(
+        api_key="test-key",
+        transport=LocalTransport([("GET", "/v3/grants/{grant_id}", handler)]),
+        retry_policy=RetryPolicy(backoff_factor=0, max_backoff=0),
+    )
+
+
+class TestPrometheusMetrics:
+    def test_missing_dependency(self):
+        with patch.dict("sys.modules", {"prometheus_client": None}):
+            with pytest.raises(ImportError, match="nylas\\[prometheus\\]"):
+                PrometheusMetrics()
+
+    def test_records_requests(self):
+        prometheus_client = pytest.importorskip("prometheus_client")
+        registry = prometheus_client.CollectorRegistry()
+        responses = iter(
+            [
+                LocalResponse(503, json={"request_id": "1"}),
+                LocalResponse(200, json=_GRANT),
+                LocalResponse(404, json={"request_id": "2", "error": {"type": "x"}}),
+            ]
+        )
+        client = _client(lambda r: next(responses))
+        PrometheusMetrics(registry=registry).register(client.hooks)
+
+        client.grants.find("abc")
+        with pytest.raises(NylasApiError):
+            client.grants.find("abc")
+
+        sample = registry.get_sample_value
+        assert (
+            sample("nylas_request_duration_seconds_count", {**_LABELS, "status": "200"})
+            == 1
+        )
+        assert (
+            sample("nylas_request_duration_seconds_count", {**_LABELS, "status": "404"})
+            == 1
+        )
+        assert (
+            sample("nylas_request_phase_seconds_count", {**_LABELS, "phase": "decode"})
+            == 1
+        )
+        assert sample("nylas_response_body_bytes_total", _LABELS) > 0
+        assert sample("nylas_request_retries_total", _LABELS) == 1
+        assert (
+            sample("nylas_request_errors_total", {**_LABELS, "error": "NylasApiError"})
+            == 1
+        )
+
+
+class TestOpenTelemetryTracing:
+    def test_missing_dependency(self):
+        with patch.dict("sys.modules", {"opentelemetry": None}):
+            with pytest.raises(ImportError, match="nylas\\[opentelemetry\\]"):
+                OpenTelemetryTracing()
+
+    def _tracing(self):
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        return OpenTelemetryTracing(tracer_provider=provider), exporter
+
+    def test_records_spans(self):
+        tracing, exporter = self._tracing()
+        statuses = iter([503, 200])
+        client = _client(lambda r: LocalResponse(next(statuses), json=_GRANT))
+        tracing.register(client.hooks)
+
+        client.grants.find("abc")
+
+        (span,) = exporter.get_finished_spans()
+        assert span.name == "GET /v3/grants/{id}"
+        assert span.attributes["url.template"] == "/v3/grants/{id}"
+        assert span.attributes["http.response.status_code"] == 200
+        assert span.attributes["nylas.request_id"] == "abc-123"
+        assert span.attributes["http.request.resend_count"] == 1
+        assert "nylas.timing.decode" in span.attributes
+        assert [event.name for event in span.events] == ["retry"]
+        assert span.events[0].attributes["http.response.status_code"] == 503
+
+    def test_records_errors(self):
+        tracing, exporter = self._tracing()
+        from opentelemetry.trace import StatusCode
+
+        client = _client(
+            lambda r: LocalResponse(
+                400, json={"request_id": "x", "error": {"type": "invalid_request"}}
+            )
+        )
+        tracing.register(client.hooks)
+
+        with pytest.raises(NylasApiError):
+            client.grants.find("abc")
+
+        (span,) = exporter.get_finished_spans()
+        assert span.status.status_code == StatusCode.ERROR
+        assert span.attributes["error.type"] == "NylasApiError"
+        assert span.attributes["http.response.status_code"] == 400
+        assert [event.name for event in span.events] == ["exception"]
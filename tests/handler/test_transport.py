@@ -0,0 +1,190 @@
+import asyncio
+
+import pytest
+
+from nylas import Client
+from nylas.handler.compression import Compression
+from nylas.handler.http_client import HttpClient
+from nylas.handler.retry import RetryPolicy, RETRY_COUNT_HEADER
+from nylas.handler.transport import LocalResponse, LocalTransport
+from nylas.models.calendars import Calendar
+from nylas.models.errors import NylasApiError
+
+_CALENDARS = {
+    "request_id": "abc-123",
+    "data": [
+        {
+            "id": "primary",
+            "grant_id": "abc",
+            "name": "Primary",
+            "read_only": False,
+            "is_owned_by_user": True,
+        }
+    ],
+}
+
+
+def _http_client(transport, **kwargs):
+    return HttpClient(
+        "https://test.nylas.com", "test-key", 30, transport=transport, **kwargs
+    )
+
+
+class TestLocalTransport:
+    def test_routes_by_method_and_path_template(self):
+        transport = LocalTransport()
+        seen = []
+
+        @transport.route("GET", "/v3/grants/{grant_id}/calendars/{calendar_id}")
+        def find_calendar(request):
+            seen.append(request)
+            return {
+                "request_id": "abc-123",
+                "data": {"id": request.params["calendar_id"]},
+            }
+
+        transport.add_route("*", "/v3/grants/{grant_id}", lambda request: {"any": True})
+
+        response_json, headers = _http_client(transport)._execute(
+            "GET", "/v3/grants/abc/calendars/primary", query_params={"select": "id"}
+        )
+
+        assert response_json["data"] == {"id": "primary"}
+        assert headers["Content-Type"] == "application/json"
+        assert seen[0].params == {"grant_id": "abc", "calendar_id": "primary"}
+        assert seen[0].query == {"select": ["id"]}
+        assert seen[0].headers["Authorization"] == "Bearer test-key"
+        assert _http_client(transport)._execute("DELETE", "/v3/grants/abc")[0] == {
+            "any": True
+        }
+        assert transport.calls == 2
+
+    def test_request_body(self):
+        transport = LocalTransport(
+            [
+                (
+                    "POST",
+                    "/v3/grants/{grant_id}/messages/send",
+                    lambda r: {"sent": r.json()},
+                )
+            ]
+        )
+        http_client = _http_client(
+            transport,
+            compression=Compression(compress_requests=True, min_request_size=1),
+        )
+        body = {"subject": "Hello", "body": "hello " * 50}
+
+        response_json, _ = http_client._execute(
+            "POST", "/v3/grants/abc/messages/send", request_body=body
+        )
+
+        assert response_json == {"sent": body}
+
+    def test_unmatched_request_is_a_404_api_error(self):
+        with pytest.raises(NylasApiError) as exc_info:
+            _http_client(LocalTransport())._execute("GET", "/v3/grants/abc")
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.type == "not_found_error"
+
+    def test_streamed_download(self):
+        transport = LocalTransport(
+            [
+                (
+                    "GET",
+                    "/v3/grants/{grant_id}/attachments/{id}/download",
+                    lambda r: b"a" * 100,
+                )
+            ]
+        )
+
+        response = _http_client(transport)._execute_download_request(
+            "/v3/grants/abc/attachments/1/download", stream=True
+        )
+
+        assert b"".join(response.iter_content(chunk_size=16)) == b"a" * 100
+
+    def test_retries_go_through_the_transport(self):
+        statuses = iter([503, 200])
+        transport = LocalTransport(
+            [
+                (
+                    "GET",
+                    "/v3/grants/abc",
+                    lambda r: LocalResponse(next(statuses), json={"request_id": "1"}),
+                )
+            ]
+        )
+        http_client = _http_client(
+            transport, retry_policy=RetryPolicy(backoff_factor=0, max_backoff=0)
+        )
+
+        _, headers = http_client._execute("GET", "/v3/grants/abc")
+
+        assert headers[RETRY_COUNT_HEADER] == "1"
+        assert transport.calls == 2
+
+    def test_client_transport(self):
+        transport = LocalTransport(
+            [("GET", "/v3/grants/{grant_id}/calendars", lambda r: _CALENDARS)]
+        )
+
+        with Client(api_key="test-key", transport=transport) as client:
+            calendars = client.calendars.list("abc")
+
+        assert isinstance(calendars.data[0], Calendar)
+        assert calendars.data[0].id == "primary"
+        assert transport.calls == 1
+
+
+class TestAsyncLocalTransport:
+    def test_async_client_transport(self):
+        pytest.importorskip("httpx")
+        from nylas import AsyncClient
+
+        transport = LocalTransport()
+
+        @transport.route("POST", "/v3/grants/{grant_id}/calendars")
+        def create_calendar(request):
+            return LocalResponse(
+                json={
+                    "request_id": "1",
+                    "data": dict(_CALENDARS["data"][0], **request.json()),
+                },
+                headers={"X-Request-Id": "1"},
+            )
+
+        async def run():
+            async with AsyncClient(api_key="test-key", transport=transport) as client:
+                return await client.calendars.create(
+                    "abc", request_body={"name": "Team"}
+                )
+
+        calendar = asyncio.run(run())
+
+        assert calendar.data.name == "Team"
+        assert transport.calls == 1
+
+    def test_async_client_does_not_keep_cookies(self):
+        pytest.importorskip("httpx")
+        from nylas import AsyncClient
+
+        transport = LocalTransport()
+        cookies = []
+
+        @transport.route("GET", "/v3/grants/{grant_id}/calendars")
+        def list_calendars(request):
+            cookies.append(request.headers.get("Cookie"))
+            return LocalResponse(
+                json=_CALENDARS, headers={"Set-Cookie": "session=abc; Path=/"}
+            )
+
+        async def run():
+            async with AsyncClient(api_key="test-key", transport=transport) as client:
+                for _ in range(2):
+                    await client.calendars.list("abc")
+
+        asyncio.run(run())
+
+        assert cookies == [None, None]
@@ -135,6 +135,14 @@ class TestAuth:
         assert res.grant_id == "grant_123"
         assert res.provider == "google"
 
+    def test_get_token_raw(self, http_client_token_exchange):
+        auth = Auth(http_client_token_exchange)
+
+        res = auth._get_token({}, overrides={"response_format": "raw"})
+
+        assert res["access_token"] == "nylas_access_token"
+        assert res["grant_id"] == "grant_123"
+
     def test_get_token_info(self, http_client_token_info):
         auth = Auth(http_client_token_info)
         req = {
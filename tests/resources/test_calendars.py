@@ -1,6 +1,8 @@
 from nylas.resources.calendars import Calendars
 
 from nylas.models.calendars import Calendar, EventSelection
+from nylas.models.free_busy import FreeBusy, FreeBusyError
+from nylas.utils.slots import slotted
 
 
 class TestCalendar:
@@ -461,3 +463,31 @@ class TestCalendar:
             overrides=None,
         )
 
+    def test_get_free_busy_raw(self, http_client_free_busy):
+        calendars = Calendars(http_client_free_busy)
+
+        res = calendars.get_free_busy(
+            identifier="abc123",
+            request_body={"emails": [], "start_time": 0, "end_time": 1},
+            overrides={"response_format": "raw"},
+        )
+
+        assert res.request_id == "dd3ec9a2-8f15-403d-b269-32b1f1beb9f5"
+        assert res.data[0]["email"] == "user1@example.com"
+        assert res.data[1]["object"] == "error"
+
+    def test_get_free_busy_slotted(self, http_client_free_busy):
+        http_client_free_busy.response_format = "slotted"
+        calendars = Calendars(http_client_free_busy)
+
+        res = calendars.get_free_busy(
+            identifier="abc123",
+            request_body={"emails": [], "start_time": 0, "end_time": 1},
+        )
+
+        assert [type(item) for item in res.data] == [
+            slotted(FreeBusy),
+            slotted(FreeBusyError),
+        ]
+        assert res.data[0].time_slots[0].status == "busy"
+
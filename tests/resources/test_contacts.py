@@ -1,3 +1,5 @@
+from unittest.mock import Mock
+
 from nylas.resources.contacts import Contacts
 
 from nylas.models.contacts import (
@@ -9,6 +11,7 @@ from nylas.models.contacts import (
     PhysicalAddress,
     WebPage,
 )
+from nylas.models.response import LazyList
 
 
 class TestContact:
@@ -278,3 +281,18 @@ class TestContact:
             query_params={"limit": 20},
             overrides=None,
         )
+
+    def test_list_groups_lazy(self):
+        mock_http_client = Mock()
+        mock_http_client._execute.return_value = (
+            {"request_id": "abc-123", "data": [{"id": "group-1", "grant_id": "abc-123", "name": "Friends"}]},
+            {},
+        )
+        contacts = Contacts(mock_http_client)
+
+        res = contacts.list_groups(
+            identifier="abc-123", overrides={"response_format": "lazy"}
+        )
+
+        assert isinstance(res.data, LazyList)
+        assert res.data[0].name == "Friends"
@@ -1,3 +1,10 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from nylas import Client
+from nylas.handler.transport import LocalTransport
 from nylas.models.grants import Grant
 from nylas.resources.grants import Grants
 
@@ -123,6 +130,66 @@ class TestGrants:
             overrides=None,
         )
 
+    def test_list_all_grants_paginates_by_offset(self):
+        def page(ids):
+            return (
+                {
+                    "request_id": "abc-123",
+                    "data": [
+                        {"id": grant_id, "provider": "google", "grant_status": "valid"}
+                        for grant_id in ids
+                    ],
+                },
+                {},
+            )
+
+        http_client = Mock()
+        http_client._execute.side_effect = [page(["1", "2"]), page(["3"])]
+        grants = Grants(http_client)
+
+        items = list(grants.list_all(limit=2))
+
+        assert [grant.id for grant in items] == ["1", "2", "3"]
+        calls = http_client._execute.call_args_list
+        assert calls[0].args[3] == {"limit": 2}
+        assert calls[1].args[3] == {"limit": 2, "offset": 2}
+
+    def test_list_all_grants_streamed(self):
+        def list_grants(request):
+            offset = int(request.query.get("offset", ["0"])[0])
+            return {
+                "request_id": "abc-123",
+                "data": [
+                    {"id": str(grant_id), "provider": "google", "grant_status": "valid"}
+                    for grant_id in range(offset, min(offset + 2, 5))
+                ],
+            }
+
+        transport = LocalTransport([("GET", "/v3/grants", list_grants)])
+        client = Client(
+            api_key="test-key", transport=transport, response_format="stream"
+        )
+
+        items = list(client.grants.list_all(limit=2))
+        pages = list(client.grants.iter_pages(limit=2))
+
+        assert [grant.id for grant in items] == ["0", "1", "2", "3", "4"]
+        assert [page.count for page in pages] == [2, 2, 1]
+        assert transport.calls == 6
+
+        pytest.importorskip("httpx")
+        from nylas import AsyncClient
+
+        async def run():
+            async with AsyncClient(
+                api_key="test-key", transport=transport, response_format="stream"
+            ) as async_client:
+                return [
+                    grant.id async for grant in async_client.grants.alist_all(limit=2)
+                ]
+
+        assert asyncio.run(run()) == ["0", "1", "2", "3", "4"]
+
     def test_find_grant(self, http_client_response):
         grants = Grants(http_client_response)
 
@@ -332,4 +332,5 @@ class TestLists:
             },
             NylasList,
             {"X-Test-Header": "test"},
+            interner=None,
         )
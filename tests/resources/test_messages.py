@@ -323,6 +323,17 @@ class TestMessage:
         assert res.data[1].status.description == "schedule send succeeded"
         assert res.data[1].close_time == 1690579819
 
+    def test_list_scheduled_messages_raw(self, http_client_list_scheduled_messages):
+        messages = Messages(http_client_list_scheduled_messages)
+
+        res = messages.list_scheduled_messages(
+            identifier="abc-123", overrides={"response_format": "raw"}
+        )
+
+        assert res.request_id == "dd3ec9a2-8f15-403d-b269-32b1f1beb9f5"
+        assert res.data[1]["status"]["code"] == "success"
+        assert res.headers == {"X-Test-Header": "test"}
+
     def test_find_scheduled_message(self, http_client_response):
         messages = Messages(http_client_response)
 
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from nylas import AsyncClient
+from nylas.handler.async_http_client import AsyncHttpClient
+from nylas.models.grants import Grant
+from nylas.models.messages import Message
+from nylas.models.response import ListResponse, Response, DeleteResponse
+from nylas.resources.messages import Messages
+
+
+def _handler(request):
+    if request.method == "DELETE":
+        return httpx.Response(200, json={"request_id": "abc-123"})
+    if request.url.path == "/v3/grants/grant-123":
+        return httpx.Response(
+            200,
+            json={
+                "request_id": "abc-123",
+                "data": {"id": "grant-123", "provider": "google"},
+            },
+        )
+    return httpx.Response(
+        200,
+        json={
+            "request_id": "abc-123",
+            "data": [{"id": "message-1", "grant_id": "grant-123", "object": "message"}],
+            "next_cursor": "cursor-2",
+        },
+        headers={"X-Test-Header": "test"},
+    )
+
+
+@pytest.fixture
+def async_client():
+    client = AsyncClient(api_key="test-key", api_uri="https://test.nylas.com")
+    client.http_client.session = httpx.AsyncClient(
+        transport=httpx.MockTransport(_handler)
+    )
+    return client
+
+
+class TestAsyncClient:
+    def test_async_client_init(self):
+        client = AsyncClient(
+            api_key="test-key",
+            api_uri="https://test.nylas.com",
+            timeout=60,
+            max_connections=500,
+        )
+
+        assert client.api_key == "test-key"
+        assert client.api_uri == "https://test.nylas.com"
+        assert type(client.http_client) is AsyncHttpClient
+        assert client.http_client.timeout == 60
+        assert client.http_client.max_connections == 500
+
+    def test_async_client_shares_resources(self, async_client):
+        assert type(async_client.messages) is Messages
+        assert async_client.messages._http_client is async_client.http_client
+
+    def test_list(self, async_client):
+        response = asyncio.run(async_client.messages.list("grant-123"))
+
+        assert type(response) is ListResponse
+        assert type(response.data[0]) is Message
+        assert response.data[0].id == "message-1"
+        assert response.next_cursor == "cursor-2"
+        assert response.headers["X-Test-Header"] == "test"
+
+    def test_find(self, async_client):
+        response = asyncio.run(async_client.grants.find("grant-123"))
+
+        assert type(response) is Response
+        assert type(response.data) is Grant
+        assert response.request_id == "abc-123"
+
+    def test_destroy(self, async_client):
+        response = asyncio.run(async_client.messages.destroy("grant-123", "message-1"))
+
+        assert type(response) is DeleteResponse
+        assert response.request_id == "abc-123"
+
+    def test_concurrent_requests(self, async_client):
+        async def fan_out():
+            return await asyncio.gather(
+                *(async_client.messages.list(f"grant-{i}") for i in range(20))
+            )
+
+        responses = asyncio.run(fan_out())
+
+        assert len(responses) == 20
+        assert all(r.data[0].id == "message-1" for r in responses)
+
+    def test_async_context_manager_closes_session(self, async_client):
+        async def use_and_close():
+            async with async_client as entered:
+                assert entered is async_client
+
+        asyncio.run(use_and_close())
+        assert async_client.http_client.session.is_closed
+
+    def test_sync_context_manager_not_supported(self, async_client):
+        with pytest.raises(TypeError):
+            with async_client:
+                pass
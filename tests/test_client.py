@@ -1,4 +1,12 @@
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
 from nylas import Client
+from nylas.handler.json_codec import StdlibJsonCodec
+from nylas.utils.interning import StringInterner
 from nylas.resources.applications import Applications
 from nylas.resources.attachments import Attachments
 from nylas.resources.auth import Auth
@@ -39,6 +47,45 @@ class TestClient:
         assert client.api_key == "test-key"
         assert client.api_uri == "https://api.us.nylas.com"
         assert client.http_client.timeout == 90
+        assert client.http_client.response_format == "model"
+
+    def test_client_response_format(self):
+        client = Client(api_key="test-key", response_format="lazy")
+
+        assert client.http_client.response_format == "lazy"
+
+    def test_client_json_codec(self):
+        codec = StdlibJsonCodec()
+        client = Client(api_key="test-key", json_codec=codec)
+
+        assert client.http_client.json_codec is codec
+
+    def test_client_string_interner(self):
+        interner = StringInterner()
+        client = Client(api_key="test-key", string_interner=interner)
+
+        assert client.http_client.string_interner is interner
+        assert Client(api_key="test-key").http_client.string_interner is None
+
+    def test_client_response_cache(self):
+        from nylas.handler.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        client = Client(api_key="test-key", response_cache=cache)
+
+        assert client.http_client.response_cache is cache
+        assert Client(api_key="test-key").http_client.response_cache is None
+
+    def test_client_pool_size(self):
+        client = Client(api_key="test-key", pool_maxsize=50)
+
+        assert client.http_client.pool_maxsize == 50
+
+    def test_client_context_manager_closes_session(self):
+        with patch("nylas.handler.http_client.HttpClient.close") as mock_close:
+            with Client(api_key="test-key") as client:
+                assert client.api_key == "test-key"
+        mock_close.assert_called_once()
 
     def test_client_auth_property(self, client):
         assert client.auth is not None
@@ -117,3 +164,57 @@ class TestClient:
 
     def test_notetakers(self, client):
         assert client.notetakers is not None
+
+    def test_resources_are_cached_per_client(self, client):
+        assert client.messages is client.messages
+        assert client.events is not Client(api_key="test-key").events
+
+    def test_resources_follow_replaced_http_client(self, client):
+        messages = client.messages
+        client.http_client = Client(api_key="other-key").http_client
+
+        assert client.messages is not messages
+        assert client.messages._http_client is client.http_client
+
+
+def _imported_modules(code):
+    script = f"import sys\n{code}\nprint(' '.join(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+    return set(output.split())
+
+
+class TestLazyImports:
+    """Guards against regressions in the import cost of `nylas` on cold start."""
+
+    def test_import_nylas_is_lightweight(self):
+        modules = _imported_modules("import nylas")
+
+        assert "nylas.client" not in modules
+        assert "requests" not in modules
+        assert "dataclasses_json" not in modules
+
+    def test_client_does_not_import_resources(self):
+        modules = _imported_modules("from nylas import Client\nClient('test-key')")
+
+        assert "nylas.client" in modules
+        assert not {m for m in modules if m.startswith("nylas.resources")}
+        assert "nylas.models.events" not in modules
+        assert "asyncio" not in modules
+        assert "httpx" not in modules
+
+    def test_resource_access_imports_only_that_resource(self):
+        modules = _imported_modules(
+            "from nylas import Client\nClient('test-key').calendars"
+        )
+
+        assert "nylas.resources.calendars" in modules
+        assert "nylas.resources.messages" not in modules
+        assert "nylas.models.messages" not in modules
+
+    def test_unknown_attribute(self):
+        import nylas
+
+        with pytest.raises(AttributeError):
+            nylas.NotAClient  # pylint: disable=pointless-statement
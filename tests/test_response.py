@@ -1,4 +1,4 @@
-from nylas.models.response import ListResponse
+from nylas.models.response import LazyList, ListResponse, Response
 from nylas.models.rules import Rule
 
 
@@ -32,3 +32,69 @@ class TestListResponse:
         assert parsed.next_cursor == "cursor-2"
         assert len(parsed.data) == 1
         assert parsed.data[0].id == "rule-2"
+
+
+class TestLazyListResponse:
+    def _response(self):
+        return {
+            "request_id": "req-789",
+            "data": [
+                {"id": "rule-1", "name": "Rule One"},
+                {"id": "rule-2", "name": "Rule Two"},
+                {"id": "rule-3", "name": "Rule Three"},
+            ],
+            "next_cursor": "cursor-3",
+        }
+
+    def test_items_are_decoded_on_access(self):
+        decoded = []
+
+        def decode_item(item):
+            decoded.append(item["id"])
+            return Rule.from_dict(item, infer_missing=True)
+
+        items = LazyList(self._response()["data"], decode_item)
+
+        assert len(items) == 3
+        assert decoded == []
+        assert items[1].id == "rule-2"
+        assert items[1] is items[1]
+        assert items[-1].id == "rule-3"
+        assert decoded == ["rule-2", "rule-3"]
+
+    def test_from_dict_lazy(self):
+        parsed = ListResponse.from_dict(self._response(), Rule, lazy=True)
+
+        assert isinstance(parsed.data, LazyList)
+        assert parsed.next_cursor == "cursor-3"
+        assert parsed.data.raw[0] == {"id": "rule-1", "name": "Rule One"}
+        assert [rule.id for rule in parsed.data] == ["rule-1", "rule-2", "rule-3"]
+        assert [rule.id for rule in parsed.data[1:]] == ["rule-2", "rule-3"]
+
+    def test_lazy_data_equals_eager_data(self):
+        lazy = ListResponse.from_dict(self._response(), Rule, lazy=True)
+        eager = ListResponse.from_dict(self._response(), Rule)
+
+        assert lazy.data == eager.data
+
+
+class TestRawResponses:
+    def test_response_from_raw(self):
+        parsed = Response.from_raw(
+            {"request_id": "req-1", "data": {"id": "rule-1"}}, {"X-Test": "1"}
+        )
+
+        assert parsed.data == {"id": "rule-1"}
+        assert parsed.request_id == "req-1"
+        assert parsed.headers == {"X-Test": "1"}
+
+    def test_list_response_from_raw_with_items_wrapper(self):
+        parsed = ListResponse.from_raw(
+            {
+                "request_id": "req-2",
+                "data": {"items": [{"id": "rule-2"}], "next_cursor": "cursor-2"},
+            }
+        )
+
+        assert parsed.data == [{"id": "rule-2"}]
+        assert parsed.next_cursor == "cursor-2"
@@ -0,0 +1,134 @@
+import warnings
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+from dataclasses_json import dataclass_json
+
+from nylas.models.contacts import Contact, SourceType
+from nylas.models.events import Event, Timespan, Details
+from nylas.models.messages import Message
+from nylas.models.response import DeleteResponse
+from nylas.models.threads import Thread
+from nylas.utils.decoder import decode, get_decoder
+
+
+@dataclass_json
+@dataclass
+class Node:
+    name: str
+    children: Optional[List["Node"]] = None
+
+
+def _decode_both(cls, data, infer_missing=False):
+    with warnings.catch_warnings(record=True) as expected_warnings:
+        warnings.simplefilter("always")
+        expected = cls.from_dict(data, infer_missing=infer_missing)
+    with warnings.catch_warnings(record=True) as actual_warnings:
+        warnings.simplefilter("always")
+        actual = decode(cls, data, infer_missing=infer_missing)
+
+    assert [str(w.message) for w in actual_warnings] == [
+        str(w.message) for w in expected_warnings
+    ]
+    return expected, actual
+
+
+class TestDecoder:
+    def test_message_field_name_override(self):
+        data = {
+            "grant_id": "grant-123",
+            "from": [{"email": "from@example.com", "name": "From"}],
+            "to": [{"email": "to@example.com"}],
+            "headers": [{"name": "X-Test", "value": "1"}],
+            "metadata": {"key": "value"},
+            "date": "1705084926",
+        }
+
+        expected, actual = _decode_both(Message, data, infer_missing=True)
+
+        assert actual == expected
+        assert actual.from_ == [{"email": "from@example.com", "name": "From"}]
+        assert actual.date == 1705084926
+
+    def test_event_custom_decoders(self):
+        data = {
+            "id": "event-123",
+            "grant_id": "grant-123",
+            "calendar_id": "primary",
+            "busy": True,
+            "participants": [{"email": "participant@example.com", "status": "yes"}],
+            "when": {"object": "timespan", "start_time": 1, "end_time": 2},
+            "conferencing": {"provider": "Zoom Meeting", "details": {"url": "u"}},
+        }
+
+        expected, actual = _decode_both(Event, data, infer_missing=True)
+
+        assert actual == expected
+        assert isinstance(actual.when, Timespan)
+        assert isinstance(actual.conferencing, Details)
+
+    def test_thread_draft_or_message_decoder(self):
+        data = {
+            "id": "thread-123",
+            "grant_id": "grant-123",
+            "has_drafts": False,
+            "starred": False,
+            "unread": True,
+            "message_ids": ["message-123"],
+            "folders": ["INBOX"],
+            "latest_draft_or_message": {
+                "object": "message",
+                "grant_id": "grant-123",
+                "from": [{"email": "from@example.com"}],
+            },
+        }
+
+        expected, actual = _decode_both(Thread, data, infer_missing=True)
+
+        assert actual == expected
+        assert isinstance(actual.latest_draft_or_message, Message)
+
+    def test_enum_fields(self):
+        data = {"id": "contact-123", "grant_id": "grant-123", "source": "inbox"}
+
+        expected, actual = _decode_both(Contact, data, infer_missing=True)
+
+        assert actual == expected
+        assert actual.source is SourceType.INBOX
+
+    def test_missing_required_fields(self):
+        _, actual = _decode_both(Event, {"id": "event-123"}, infer_missing=True)
+        assert actual.grant_id is None
+
+        with pytest.raises(KeyError, match="grant_id"):
+            decode(Event, {"id": "event-123"})
+
+    def test_none_value_for_required_field_warns(self):
+        data = {"name": None}
+
+        with pytest.warns(RuntimeWarning, match="non-optional type name"):
+            assert decode(Node, data).name is None
+
+    def test_recursive_model(self):
+        data = {"name": "root", "children": [{"name": "leaf", "children": None}]}
+
+        expected, actual = _decode_both(Node, data)
+
+        assert actual == expected
+        assert actual.children[0].name == "leaf"
+
+    def test_decoders_are_cached(self):
+        assert get_decoder(Message, infer_missing=True) is get_decoder(
+            Message, infer_missing=True
+        )
+
+    def test_custom_from_dict_is_preserved(self):
+        response = decode(DeleteResponse, {"request_id": "abc-123"})
+
+        assert response == DeleteResponse(request_id="abc-123")
+
+    def test_model_instances_pass_through(self):
+        node = Node(name="root")
+
+        assert decode(Node, node) is node
@@ -0,0 +1,121 @@
+import json
+
+import pytest
+
+from nylas.models.events import Event
+from nylas.models.response import ListResponse, Response
+from nylas.utils.interning import DEFAULT_INTERNED_FIELDS, StringInterner
+
+
+def _parsed(value):
+    # Round-trip through JSON so that equal strings are distinct objects, as in responses.
+    return json.loads(json.dumps(value))
+
+
+def _event(event_id):
+    return {
+        "id": event_id,
+        "grant_id": "grant-123",
+        "calendar_id": "primary",
+        "object": "event",
+        "busy": True,
+        "participants": [{"email": "participant@example.com", "status": "yes"}],
+        "when": {"object": "timespan", "start_time": 1, "end_time": 2},
+    }
+
+
+class TestStringInterner:
+    def test_intern_returns_shared_instance(self):
+        interner = StringInterner()
+        first, second = _parsed(["grant-123", "grant-123"])
+
+        assert first is not second
+        assert interner.intern(first) is first
+        assert interner.intern(second) is first
+
+    def test_intern_item_dedups_configured_fields(self):
+        interner = StringInterner()
+        items = interner.intern_items(_parsed([_event("1"), _event("2")]))
+
+        assert items[0]["grant_id"] is items[1]["grant_id"]
+        assert items[0]["object"] is items[1]["object"]
+        assert items[0]["when"]["object"] is items[1]["when"]["object"]
+        participants = [item["participants"][0]["email"] for item in items]
+        assert participants[0] is participants[1]
+
+    def test_other_fields_are_left_alone(self):
+        interner = StringInterner(fields=["grant_id"])
+        items = interner.intern_items(_parsed([_event("event-1"), _event("event-1")]))
+
+        assert items[0]["id"] is not items[1]["id"]
+        assert items[0]["calendar_id"] is not items[1]["calendar_id"]
+        assert len(interner) == 1
+
+    def test_lists_of_strings(self):
+        interner = StringInterner()
+        items = interner.intern_items(
+            _parsed([{"folders": ["INBOX", "UNREAD"]}, {"folders": ["INBOX"]}])
+        )
+
+        assert items[0]["folders"][0] is items[1]["folders"][0]
+        assert items[0]["folders"] == ["INBOX", "UNREAD"]
+
+    def test_table_is_bounded(self):
+        interner = StringInterner(max_size=2)
+        for value in ["a", "b", "c"]:
+            interner.intern(value)
+
+        assert len(interner) == 2
+        assert interner._table == {"b": "b", "c": "c"}
+
+    def test_invalid_max_size(self):
+        with pytest.raises(ValueError):
+            StringInterner(max_size=0)
+
+    def test_default_fields(self):
+        assert {"grant_id", "calendar_id", "object", "folders", "email"} <= (
+            StringInterner().fields
+        )
+        assert "id" not in DEFAULT_INTERNED_FIELDS
+
+
+class TestInternedResponses:
+    def test_list_response_shares_strings_across_pages(self):
+        interner = StringInterner()
+        pages = [
+            ListResponse.from_dict(
+                _parsed({"request_id": "abc-123", "data": [_event(event_id)]}),
+                Event,
+                interner=interner,
+            )
+            for event_id in ["1", "2"]
+        ]
+
+        first, second = pages[0].data[0], pages[1].data[0]
+        assert first.grant_id is second.grant_id
+        assert first.participants[0].email is second.participants[0].email
+        assert first == Event.from_dict(_event("1"), infer_missing=True)
+
+    def test_lazy_list_response(self):
+        interner = StringInterner()
+        response = ListResponse.from_dict(
+            _parsed({"request_id": "abc-123", "data": [_event("1"), _event("2")]}),
+            Event,
+            lazy=True,
+            interner=interner,
+        )
+
+        assert response.data[0].calendar_id is response.data[1].calendar_id
+
+    def test_response(self):
+        interner = StringInterner()
+        first, second = (
+            Response.from_dict(
+                _parsed({"request_id": "abc-123", "data": _event(event_id)}),
+                Event,
+                interner=interner,
+            )
+            for event_id in ["1", "2"]
+        )
+
+        assert first.data.grant_id is second.data.grant_id
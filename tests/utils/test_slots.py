@@ -0,0 +1,128 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+from dataclasses_json import dataclass_json
+
+from nylas.models.drafts import Draft
+from nylas.models.events import Event, Participant, Timespan
+from nylas.models.messages import Message, MessageHeader
+from nylas.models.threads import Thread
+from nylas.utils.decoder import decode
+from nylas.utils.slots import as_slotted, slotted
+
+
+@dataclass_json
+@dataclass
+class Node:
+    name: str
+    children: Optional[List["Node"]] = None
+
+
+MESSAGE = {
+    "id": "message-123",
+    "grant_id": "grant-123",
+    "object": "message",
+    "from": [{"email": "from@example.com", "name": "From"}],
+    "to": [{"email": "to@example.com"}],
+    "headers": [{"name": "X-Test", "value": "1"}],
+    "folders": ["INBOX"],
+    "unread": True,
+    "date": 1705084926,
+}
+
+EVENT = {
+    "id": "event-123",
+    "grant_id": "grant-123",
+    "calendar_id": "primary",
+    "busy": True,
+    "participants": [{"email": "participant@example.com", "status": "yes"}],
+    "when": {"object": "timespan", "start_time": 1, "end_time": 2},
+}
+
+THREAD = {
+    "id": "thread-123",
+    "grant_id": "grant-123",
+    "has_drafts": False,
+    "starred": False,
+    "unread": True,
+    "message_ids": ["message-123"],
+    "folders": ["INBOX"],
+    "latest_draft_or_message": MESSAGE,
+}
+
+
+class TestSlotted:
+    @pytest.mark.parametrize(
+        "model, data",
+        [
+            (Message, MESSAGE),
+            (Event, EVENT),
+            (Thread, THREAD),
+        ],
+    )
+    def test_behaves_like_model(self, model, data):
+        expected = model.from_dict(data, infer_missing=True)
+        variant = slotted(model)
+
+        for actual in (
+            variant.from_dict(data, infer_missing=True),
+            decode(variant, data, infer_missing=True),
+        ):
+            assert type(actual) is variant
+            assert not hasattr(actual, "__dict__")
+            assert repr(actual) == repr(expected)
+            assert actual.to_dict() == expected.to_dict()
+            assert actual.to_json() == expected.to_json()
+
+    def test_nested_models_are_slotted(self):
+        message = decode(slotted(Message), MESSAGE, infer_missing=True)
+        event = decode(slotted(Event), EVENT, infer_missing=True)
+        thread = decode(slotted(Thread), THREAD, infer_missing=True)
+
+        assert type(message.headers[0]) is slotted(MessageHeader)
+        assert type(event.participants[0]) is slotted(Participant)
+        assert type(event.when) is slotted(Timespan)
+        assert type(thread.latest_draft_or_message) is slotted(Message)
+        assert message.from_ == [{"email": "from@example.com", "name": "From"}]
+
+    def test_attribute_access_and_assignment(self):
+        message = slotted(Message)(grant_id="grant-123")
+
+        assert message.subject is None
+        message.subject = "Hello"
+        assert message.subject == "Hello"
+        with pytest.raises(AttributeError):
+            message.not_a_field = 1
+
+    def test_variants_are_cached(self):
+        assert slotted(Message) is slotted(Message)
+        assert slotted(slotted(Message)) is slotted(Message)
+        assert slotted(Message).__name__ == "Message"
+
+    def test_inherited_models(self):
+        variant = slotted(Draft)
+
+        assert issubclass(variant, slotted(Message))
+        assert not hasattr(variant(grant_id="grant-123"), "__dict__")
+
+    def test_recursive_model(self):
+        data = {"name": "root", "children": [{"name": "leaf"}]}
+
+        node = slotted(Node).from_dict(data)
+
+        assert type(node.children[0]) is slotted(Node)
+        assert node.to_dict() == Node.from_dict(data).to_dict()
+
+    def test_as_slotted(self):
+        message = Message.from_dict(MESSAGE, infer_missing=True)
+
+        converted = as_slotted([message])[0]
+
+        assert type(converted) is slotted(Message)
+        assert type(converted.headers[0]) is slotted(MessageHeader)
+        assert converted.to_dict() == message.to_dict()
+
+    def test_rejects_non_dataclasses(self):
+        with pytest.raises(TypeError):
+            slotted(dict)